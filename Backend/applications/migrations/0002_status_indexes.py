@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-19 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='aplicacion',
+            index=models.Index(fields=['project', 'status'], name='applications_proj_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aplicacion',
+            index=models.Index(fields=['student', 'status'], name='applications_stud_status_idx'),
+        ),
+    ]
@@ -7,11 +7,15 @@ import uuid
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from core.tracking import ChangeTrackingMixin
 
-class Aplicacion(models.Model):
+class Aplicacion(ChangeTrackingMixin, models.Model):
     """
     Modelo de aplicación que coincide exactamente con el schema original
     """
+    # Campos cuyo valor anterior consultan los signals (ver core.tracking)
+    tracked_fields = ('status',)
+    
     STATUS_CHOICES = (
         ('pending', 'Pendiente'),
         ('reviewing', 'En Revisión'),
@@ -53,6 +57,12 @@ class Aplicacion(models.Model):
         verbose_name_plural = 'Aplicaciones'
         unique_together = ['project', 'student']  # Una aplicación por estudiante y proyecto
         ordering = ['-applied_at']
+        indexes = [
+            # Aplicaciones de un proyecto/empresa por estado (recibidas, dashboards, completación)
+            models.Index(fields=['project', 'status'], name='applications_proj_status_idx'),
+            # Aplicaciones del estudiante por estado (dashboard, mis aplicaciones)
+            models.Index(fields=['student', 'status'], name='applications_stud_status_idx'),
+        ]
 
     def __str__(self):
         return f"{self.student.user.full_name} -> {self.project.title} ({self.get_status_display()})"
@@ -213,10 +223,8 @@ class Asignacion(models.Model):
         self.save(update_fields=['estado', 'fecha_fin'])
         
         # Incrementar proyectos completados del estudiante
+        # (los de la empresa se mantienen desde el estado del proyecto, ver companies.counters)
         self.application.student.incrementar_proyectos_completados()
-        
-        # Incrementar proyectos completados de la empresa
-        self.application.project.company.incrementar_proyectos_completados()
     
     def cancelar_asignacion(self):
         """Cancela la asignación"""
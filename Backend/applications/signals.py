@@ -1,14 +1,15 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from .models import Aplicacion
-from notifications.models import Notification
+from notifications.outbox import outbox
 
 @receiver(post_save, sender=Aplicacion)
 def create_application_status_notification(sender, instance, created, **kwargs):
     """
     Envía una notificación al estudiante cuando el estado de su postulación cambia.
     """
-    if not created: # Solo notificar en actualizaciones de estado, no en la creación inicial
+    # Solo notificar en actualizaciones de estado, no en la creación inicial ni en otros guardados
+    if not created and instance.has_changed('status'):
         student_user = instance.student.user
         project_title = instance.project.title
         
@@ -21,9 +22,9 @@ def create_application_status_notification(sender, instance, created, **kwargs):
             message = f"La empresa {instance.project.company.company_name} ha revisado tu postulación. En esta ocasión, no has sido seleccionado."
         
         if message:
-            Notification.objects.create(
-                user=student_user,
+            outbox.add(
+                student_user,
                 title=title,
                 message=message,
                 # link=f'/projects/{instance.project.id}/' # Ejemplo de enlace
-            ) 
+            )
@@ -5,7 +5,7 @@ Views para la app applications.
 import json
 import uuid
 from datetime import datetime, timedelta
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.utils import timezone
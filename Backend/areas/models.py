@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 
 # Create your models here.
 
@@ -26,3 +28,10 @@ class Area(models.Model):
     def project_count(self):
         """Retorna el número de proyectos en esta área"""
         return self.projects.count()
+
+
+@receiver([post_save, post_delete], sender=Area)
+def invalidar_registro_areas(sender, **kwargs):
+    """Invalida el registro de datos de referencia al cambiar un área"""
+    from core.reference_data import invalidate_reference_data
+    invalidate_reference_data()
@@ -3,7 +3,7 @@ Views para la app areas.
 """
 
 import json
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from .models import Area
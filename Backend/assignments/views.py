@@ -1,5 +1,5 @@
 from django.shortcuts import render, get_object_or_404
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator
 import json
@@ -0,0 +1,143 @@
+"""
+Factories (factory-boy + Faker) para el dataset de benchmarks.
+
+Las instancias se construyen en memoria con `build_batch` y el comando
+`seed_benchmark_data` las inserta con `bulk_create`. Todas las cuentas usan
+el dominio BENCHMARK_EMAIL_DOMAIN para poder limpiarlas sin tocar datos reales.
+"""
+
+import factory
+from factory import fuzzy
+from django.contrib.auth.hashers import make_password
+
+from applications.models import Aplicacion
+from companies.models import Empresa
+from evaluations.models import Evaluation
+from notifications.models import Notification
+from projects.models import Proyecto
+from students.models import Estudiante
+from users.models import User
+from work_hours.models import WorkHour
+
+BENCHMARK_EMAIL_DOMAIN = 'benchmark.leanmaker.test'
+BENCHMARK_PASSWORD = 'benchmark123'
+
+SECTIONS = ['A', 'B', 'C', 'D', 'E']
+CAREERS = [
+    'Ingeniería en Informática',
+    'Ingeniería en Ciberseguridad',
+    'Analista Programador',
+    'Ingeniería en Automatización',
+    'Diseño Digital',
+]
+INDUSTRIES = ['Tecnología', 'Retail', 'Salud', 'Educación', 'Finanzas', 'Manufactura']
+
+_password_hash = None
+
+
+def benchmark_password_hash():
+    """Hash de contraseña calculado una sola vez (hashear miles de veces domina el seeding)"""
+    global _password_hash
+    if _password_hash is None:
+        _password_hash = make_password(BENCHMARK_PASSWORD)
+    return _password_hash
+
+
+class UserFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = User
+
+    email = factory.LazyAttributeSequence(lambda o, n: f'{o.role}{n}@{BENCHMARK_EMAIL_DOMAIN}')
+    username = factory.SelfAttribute('email')
+    first_name = factory.Faker('first_name', locale='es_ES')
+    last_name = factory.Faker('last_name', locale='es_ES')
+    role = 'student'
+    password = factory.LazyFunction(benchmark_password_hash)
+    is_active = True
+    is_verified = True
+
+
+class EstudianteFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Estudiante
+
+    rut = factory.Sequence(lambda n: f'{30000000 + n}-{n % 10}')
+    career = fuzzy.FuzzyChoice(CAREERS)
+    section = fuzzy.FuzzyChoice(SECTIONS)
+    semester = fuzzy.FuzzyInteger(1, 10)
+    university = 'INACAP'
+    api_level = fuzzy.FuzzyInteger(1, 4)
+    trl_level = fuzzy.FuzzyInteger(1, 9)
+    gpa = fuzzy.FuzzyDecimal(1.0, 5.0)
+    hours_per_week = fuzzy.FuzzyChoice([10, 15, 20, 25, 30])
+    location = factory.Faker('city', locale='es_ES')
+
+
+class EmpresaFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Empresa
+
+    company_name = factory.Faker('company', locale='es_ES')
+    description = factory.Faker('paragraph', locale='es_ES')
+    industry = fuzzy.FuzzyChoice(INDUSTRIES)
+    city = factory.Faker('city', locale='es_ES')
+    country = 'Chile'
+    verified = True
+    rating = fuzzy.FuzzyDecimal(3.0, 5.0)
+
+
+class ProyectoFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Proyecto
+
+    title = factory.Faker('catch_phrase', locale='es_ES')
+    description = factory.Faker('paragraph', nb_sentences=5, locale='es_ES')
+    requirements = factory.Faker('sentence', nb_words=12, locale='es_ES')
+    api_level = fuzzy.FuzzyInteger(1, 4)
+    required_hours = fuzzy.FuzzyChoice([40, 80, 120, 160, 240])
+    min_api_level = 1
+    max_students = fuzzy.FuzzyChoice([1, 1, 1, 2, 3, 5])
+    duration_weeks = fuzzy.FuzzyChoice([4, 8, 12, 16])
+    hours_per_week = fuzzy.FuzzyChoice([10, 15, 20])
+    modality = fuzzy.FuzzyChoice(['remote', 'onsite', 'hybrid'])
+
+
+class AplicacionFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Aplicacion
+
+    status = fuzzy.FuzzyChoice(
+        ['pending'] * 4 + ['reviewing'] * 2 + ['accepted'] * 2 + ['rejected'] * 2 + ['completed'] * 2
+    )
+    cover_letter = factory.Faker('paragraph', locale='es_ES')
+
+
+class WorkHourFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = WorkHour
+
+    hours_worked = fuzzy.FuzzyDecimal(1.0, 8.0)
+    description = factory.Faker('sentence', locale='es_ES')
+    is_verified = fuzzy.FuzzyChoice([True, False])
+
+
+class EvaluationFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Evaluation
+
+    score = fuzzy.FuzzyChoice([3, 4, 4, 5, 5])
+    comments = factory.Faker('sentence', locale='es_ES')
+    status = 'completed'
+    type = 'final'
+
+
+class NotificationFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Notification
+
+    title = factory.Faker('sentence', nb_words=5, locale='es_ES')
+    message = factory.Faker('paragraph', locale='es_ES')
+    type = fuzzy.FuzzyChoice(['info', 'success', 'warning'])
+    read = fuzzy.FuzzyChoice([True, False, False])
+    is_read = factory.SelfAttribute('read')
+    priority = fuzzy.FuzzyChoice(['low', 'normal', 'normal', 'high'])
@@ -0,0 +1,247 @@
+"""
+Asesor de índices a partir del workload de benchmarks.
+
+`record_queries()` captura las consultas SELECT (SQL y parámetros) que
+ejecutan los escenarios de benchmarks.scenarios; `explain()` obtiene el plan
+de cada consulta distinta en el motor actual y `advise()` cruza los planes
+con los índices que existen en la base de datos:
+
+- Índices usados por el workload (y cuántas consultas los usan).
+- Índices sin uso: existen en tablas del proyecto pero ningún plan los usó.
+  En producción conviene contrastarlos con sys.dm_db_index_usage_stats
+  antes de eliminarlos: el workload de benchmarks no cubre todas las vistas.
+- Índices redundantes: sus columnas son un prefijo de otro índice de la
+  misma tabla (p. ej. el índice de una FK frente a uno compuesto).
+- Recorridos completos de tabla en consultas con WHERE (candidatos a índice)
+  y, en SQL Server, los índices faltantes que sugiere el optimizador
+  (MissingIndexes del plan, con columnas de igualdad, desigualdad e INCLUDE).
+
+Motores: SQLite (EXPLAIN QUERY PLAN), SQL Server (SHOWPLAN_XML) y
+PostgreSQL (EXPLAIN FORMAT JSON).
+"""
+
+import json
+import re
+import xml.etree.ElementTree as ET
+from collections import Counter, defaultdict, namedtuple
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+
+Plan = namedtuple('Plan', ['scans', 'indexes', 'missing'])
+
+SHOWPLAN_NS = {'sp': 'http://schemas.microsoft.com/sqlserver/2004/07/showplan'}
+
+SQLITE_SCAN_RE = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$')
+SQLITE_INDEX_RE = re.compile(r'USING (?:COVERING )?INDEX (\w+)')
+
+# Operadores de SQL Server que recorren la tabla completa
+MSSQL_SCAN_OPS = {'Table Scan', 'Clustered Index Scan'}
+
+
+@contextmanager
+def record_queries(queries):
+    """Agrega a `queries` (sql, params) de cada SELECT ejecutado en el bloque"""
+    def wrapper(execute, sql, params, many, context):
+        if not many and sql.lstrip().upper().startswith('SELECT'):
+            queries.append((sql, tuple(params or ())))
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(wrapper):
+        yield queries
+
+
+def _strip_brackets(name):
+    return name.strip('[]"') if name else name
+
+
+def _explain_sqlite(cursor, sql, params):
+    cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+    scans, indexes = set(), set()
+    for row in cursor.fetchall():
+        detail = row[-1]
+        index = SQLITE_INDEX_RE.search(detail)
+        if index:
+            indexes.add(index.group(1))
+            continue
+        scan = SQLITE_SCAN_RE.match(detail)
+        if scan:
+            scans.add(scan.group(1))
+    return Plan(scans, indexes, [])
+
+
+def _explain_mssql(cursor, sql, params):
+    cursor.execute('SET SHOWPLAN_XML ON')
+    try:
+        cursor.execute(sql, params)
+        plan_xml = cursor.fetchone()[0]
+    finally:
+        cursor.execute('SET SHOWPLAN_XML OFF')
+
+    root = ET.fromstring(plan_xml)
+    scans, indexes = set(), set()
+    for relop in root.iterfind('.//sp:RelOp', SHOWPLAN_NS):
+        target = relop.find('./*/sp:Object', SHOWPLAN_NS)
+        if target is None:
+            continue
+        table = _strip_brackets(target.get('Table'))
+        if relop.get('PhysicalOp') in MSSQL_SCAN_OPS:
+            scans.add(table)
+        elif target.get('Index'):
+            indexes.add(_strip_brackets(target.get('Index')))
+
+    missing = []
+    for group in root.iterfind('.//sp:MissingIndexGroup', SHOWPLAN_NS):
+        for index in group.iterfind('sp:MissingIndex', SHOWPLAN_NS):
+            columns = defaultdict(list)
+            for column_group in index.iterfind('sp:ColumnGroup', SHOWPLAN_NS):
+                for column in column_group.iterfind('sp:Column', SHOWPLAN_NS):
+                    columns[column_group.get('Usage').lower()].append(_strip_brackets(column.get('Name')))
+            missing.append({
+                'table': _strip_brackets(index.get('Table')),
+                'impact': float(group.get('Impact', 0)),
+                **{usage: columns.get(usage, []) for usage in ('equality', 'inequality', 'include')},
+            })
+    return Plan(scans, indexes, missing)
+
+
+def _explain_postgresql(cursor, sql, params):
+    cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+    plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    scans, indexes = set(), set()
+    pending = [plan[0]['Plan']]
+    while pending:
+        node = pending.pop()
+        if node['Node Type'] == 'Seq Scan':
+            scans.add(node['Relation Name'])
+        elif 'Index Name' in node:
+            indexes.add(node['Index Name'])
+        pending.extend(node.get('Plans', []))
+    return Plan(scans, indexes, [])
+
+
+EXPLAINERS = {
+    'sqlite': _explain_sqlite,
+    'microsoft': _explain_mssql,
+    'postgresql': _explain_postgresql,
+}
+
+
+def explain(sql, params):
+    """Plan de una consulta en el motor actual"""
+    explainer = EXPLAINERS.get(connection.vendor)
+    if explainer is None:
+        raise NotImplementedError(f"Motor sin soporte para planes: {connection.vendor}")
+    with connection.cursor() as cursor:
+        return explainer(cursor, sql, params)
+
+
+def project_tables():
+    """Tablas de los modelos del proyecto (sin apps de Django ni de terceros)"""
+    base_dir = str(Path(settings.BASE_DIR).resolve())
+    return sorted({
+        model._meta.db_table
+        for model in apps.get_models(include_auto_created=True)
+        if str(Path(model._meta.app_config.path).resolve()).startswith(base_dir) and model._meta.managed
+    })
+
+
+def table_indexes(tables):
+    """Índices secundarios existentes: {tabla: {índice: {'columns': [...], 'unique': bool}}}"""
+    existing = set(connection.introspection.table_names())
+    indexes = {}
+    with connection.cursor() as cursor:
+        for table in tables:
+            if table not in existing:
+                continue
+            constraints = connection.introspection.get_constraints(cursor, table)
+            indexes[table] = {
+                name: {'columns': info['columns'], 'unique': bool(info['unique'])}
+                for name, info in constraints.items()
+                if info['index'] and not info['primary_key'] and info['columns']
+            }
+    return indexes
+
+
+def redundant_indexes(indexes):
+    """Índices no únicos cuyas columnas son un prefijo de otro índice de la misma tabla"""
+    redundant = []
+    for table, table_indexes_ in sorted(indexes.items()):
+        for name, info in sorted(table_indexes_.items()):
+            if info['unique']:
+                continue
+            columns = info['columns']
+            for other, other_info in sorted(table_indexes_.items()):
+                if other != name and len(other_info['columns']) > len(columns) \
+                        and other_info['columns'][:len(columns)] == columns:
+                    redundant.append({'table': table, 'index': name, 'covered_by': other, 'columns': columns})
+                    break
+    return redundant
+
+
+def advise(queries):
+    """
+    Reporte del asesor para las consultas capturadas [(sql, params)]:
+    índices usados, sin uso y redundantes, recorridos completos y faltantes.
+    """
+    occurrences = Counter(sql for sql, _ in queries)
+    samples = {}
+    for sql, params in queries:
+        samples.setdefault(sql, params)
+
+    tables = project_tables()
+    indexes = table_indexes(tables)
+
+    index_usage = Counter()
+    scans = defaultdict(lambda: {'queries': 0, 'example': None})
+    missing = {}
+    errors = []
+    for sql, params in samples.items():
+        try:
+            plan = explain(sql, params)
+        except Exception as e:
+            errors.append({'sql': sql[:300], 'error': str(e)})
+            continue
+        for index in plan.indexes:
+            index_usage[index] += occurrences[sql]
+        if ' WHERE ' in sql.upper():
+            for table in plan.scans:
+                if table in indexes:
+                    scans[table]['queries'] += occurrences[sql]
+                    scans[table]['example'] = scans[table]['example'] or sql[:300]
+        for suggestion in plan.missing:
+            key = (suggestion['table'], tuple(suggestion['equality']), tuple(suggestion['inequality']))
+            current = missing.get(key)
+            if current is None or suggestion['impact'] > current['impact']:
+                missing[key] = {**suggestion, 'queries': 0}
+            missing[key]['queries'] += occurrences[sql]
+
+    used, unused = [], []
+    for table, table_indexes_ in sorted(indexes.items()):
+        for name, info in sorted(table_indexes_.items()):
+            entry = {'table': table, 'index': name, 'columns': info['columns']}
+            if index_usage[name]:
+                used.append({**entry, 'queries': index_usage[name]})
+            elif not info['unique']:
+                # Los únicos sostienen restricciones aunque no los use el workload
+                unused.append(entry)
+
+    return {
+        'vendor': connection.vendor,
+        'queries': len(queries),
+        'distinct_queries': len(samples),
+        'used_indexes': sorted(used, key=lambda item: -item['queries']),
+        'unused_indexes': unused,
+        'redundant_indexes': redundant_indexes(indexes),
+        'full_scans': sorted(
+            ({'table': table, **info} for table, info in scans.items()),
+            key=lambda item: -item['queries'],
+        ),
+        'missing_indexes': sorted(missing.values(), key=lambda item: -item['impact'] * item['queries']),
+        'errors': errors,
+    }
@@ -0,0 +1,115 @@
+"""
+Micro-benchmark de serialización JSON sobre payloads reales.
+
+Obtiene las respuestas de `projects_list` y `received_applications` con
+usuarios existentes de la base de datos y compara el encoder estándar
+(equivalente a django.http.JsonResponse) con el backend de core.responses.
+"""
+
+import contextlib
+import io
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+
+from applications.views import received_applications
+from core.responses import JSON_BACKEND, dumps, stdlib_dumps
+from core.views import generate_access_token
+from projects.views import projects_list
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Compara el rendimiento de serialización JSON (estándar vs core.responses) con payloads reales'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=200,
+            help='Número de serializaciones por payload (por defecto 200)',
+        )
+        parser.add_argument(
+            '--scale',
+            type=int,
+            default=1,
+            help='Replica las filas del payload N veces para simular listados grandes',
+        )
+
+    def handle(self, *args, **options):
+        iterations = max(1, options['iterations'])
+        scale = max(1, options['scale'])
+
+        self.stdout.write(self.style.SUCCESS(f'🚀 Benchmark de serialización JSON (backend: {JSON_BACKEND})'))
+
+        payloads = {
+            'projects_list': self.fetch_payload(projects_list, '/api/projects/', role='student'),
+            'received_applications': self.fetch_payload(
+                received_applications, '/api/applications/received_applications/', role='company'
+            ),
+        }
+
+        for name, payload in payloads.items():
+            if payload is None:
+                continue
+            payload = self.scale_payload(payload, scale)
+            self.run_benchmark(name, payload, iterations)
+
+        self.stdout.write(self.style.SUCCESS('\n✅ Benchmark completado'))
+
+    def fetch_payload(self, view, path, role):
+        """Ejecuta la vista real con un usuario del rol indicado y devuelve el payload decodificado"""
+        user = User.objects.filter(role=role, is_active=True).order_by('date_joined').first()
+        if not user:
+            self.stdout.write(self.style.WARNING(f'⚠️ No hay usuarios con rol {role}; se omite {view.__name__}'))
+            return None
+
+        request = RequestFactory().get(
+            path,
+            {'limit': 1000},
+            HTTP_AUTHORIZATION=f'Bearer {generate_access_token(user)}',
+        )
+        # Las vistas imprimen trazas de depuración; no las mezclamos con los resultados
+        with contextlib.redirect_stdout(io.StringIO()):
+            response = view(request)
+
+        if response.status_code != 200:
+            self.stdout.write(self.style.WARNING(
+                f'⚠️ {view.__name__} respondió {response.status_code}; se omite'
+            ))
+            return None
+        return json.loads(response.content)
+
+    def scale_payload(self, payload, scale):
+        """Replica la primera lista de filas encontrada en el payload"""
+        if scale == 1:
+            return payload
+        if isinstance(payload, list):
+            return payload * scale
+        scaled = dict(payload)
+        for key, value in payload.items():
+            if isinstance(value, list):
+                scaled[key] = value * scale
+                break
+        return scaled
+
+    def run_benchmark(self, name, payload, iterations):
+        size = len(stdlib_dumps(payload))
+        self.stdout.write(f'\n📦 {name}: {size / 1024:.1f} KB por respuesta')
+
+        results = {}
+        for label, encode in (('json (stdlib)', stdlib_dumps), (f'core.responses ({JSON_BACKEND})', dumps)):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                encode(payload)
+            elapsed = time.perf_counter() - start
+            results[label] = elapsed
+            ops = iterations / elapsed if elapsed else float('inf')
+            throughput = size * iterations / elapsed / (1024 * 1024) if elapsed else float('inf')
+            self.stdout.write(f'   {label:<28} {ops:10.1f} ops/s  {throughput:8.1f} MB/s')
+
+        baseline, fast = results.values()
+        if fast:
+            self.stdout.write(self.style.SUCCESS(f'   ⚡ Aceleración: {baseline / fast:.2f}x'))
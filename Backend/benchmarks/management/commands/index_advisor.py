@@ -0,0 +1,98 @@
+"""
+Asesor de índices.
+
+Reproduce el workload de benchmarks.scenarios (mismo cliente y tokens que
+run_benchmarks), captura los SELECT que ejecuta cada endpoint, obtiene el
+plan de cada consulta distinta y reporta los índices usados, sin uso,
+redundantes y los candidatos faltantes (ver benchmarks.index_advisor).
+
+Conviene correrlo contra el motor de producción (SQL Server) con el dataset
+de seed_benchmark_data: los planes de SQLite solo orientan.
+"""
+
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import CommandError
+from django.test import Client
+
+from benchmarks.index_advisor import advise, record_queries
+from benchmarks.management.commands.run_benchmarks import Command as BenchmarkCommand
+from benchmarks.scenarios import get_scenarios
+
+
+class Command(BenchmarkCommand):
+    help = 'Reproduce el workload de benchmarks, analiza los planes de consulta y reporta índices sin uso o faltantes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=1,
+                            help='Peticiones por escenario (cuentan en la frecuencia de cada consulta)')
+        parser.add_argument('--scenario', action='append', dest='scenarios',
+                            help='Analizar solo este escenario (se puede repetir)')
+        parser.add_argument('--output', help='Ruta de un JSON con el reporte completo')
+
+    def handle(self, *args, **options):
+        try:
+            scenarios = get_scenarios(options['scenarios'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        host = next((h for h in settings.ALLOWED_HOSTS if h and '*' not in h), 'localhost')
+        self.client = Client(HTTP_HOST=host.lstrip('.'))
+        self.cold = False
+        self.tokens = {}
+
+        self.stdout.write(self.style.SUCCESS(f'🔎 Reproduciendo {len(scenarios)} escenarios...'))
+        queries = []
+        for scenario in scenarios:
+            token = self.get_token(scenario.role)
+            if not token:
+                self.stdout.write(self.style.WARNING(f'⚠️ Sin usuarios con rol {scenario.role}; se omite {scenario.name}'))
+                continue
+            with record_queries(queries):
+                for _ in range(max(1, options['iterations'])):
+                    self.request(scenario, token)
+
+        report = advise(queries)
+        self.write_report(report)
+
+        if options['output']:
+            output = Path(options['output'])
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(json.dumps(report, indent=2, sort_keys=True, ensure_ascii=False) + '\n', encoding='utf-8')
+            self.stdout.write(self.style.SUCCESS(f'✅ Reporte guardado en {output}'))
+
+    def write_report(self, report):
+        self.stdout.write(
+            f"\n📊 {report['queries']} consultas ({report['distinct_queries']} distintas) en {report['vendor']}"
+        )
+
+        self.stdout.write('\nÍndices usados:')
+        for item in report['used_indexes']:
+            self.stdout.write(f"   {item['index']:<45} {item['table']:<28} {item['queries']:6d} consultas")
+
+        self.stdout.write('\nRecorridos completos en consultas filtradas:')
+        for item in report['full_scans']:
+            self.stdout.write(self.style.WARNING(f"   {item['table']:<28} {item['queries']:6d} consultas"))
+            self.stdout.write(f"      {item['example']}")
+
+        if report['missing_indexes']:
+            self.stdout.write('\nÍndices faltantes sugeridos por el optimizador:')
+            for item in report['missing_indexes']:
+                columns = ', '.join(item['equality'] + item['inequality'])
+                include = f" INCLUDE ({', '.join(item['include'])})" if item['include'] else ''
+                self.stdout.write(self.style.WARNING(
+                    f"   {item['table']} ({columns}){include}  impacto {item['impact']:.1f}%  {item['queries']} consultas"
+                ))
+
+        self.stdout.write('\nÍndices redundantes (prefijo de otro índice):')
+        for item in report['redundant_indexes']:
+            self.stdout.write(f"   {item['index']:<45} cubierto por {item['covered_by']}")
+
+        self.stdout.write('\nÍndices sin uso en el workload:')
+        for item in report['unused_indexes']:
+            self.stdout.write(f"   {item['index']:<45} {item['table']} ({', '.join(item['columns'])})")
+
+        for item in report['errors']:
+            self.stdout.write(self.style.ERROR(f"   ❌ No se pudo obtener el plan: {item['error']}"))
@@ -0,0 +1,216 @@
+"""
+Harness de benchmarks de la API.
+
+Reproduce los endpoints de benchmarks.scenarios con el cliente de pruebas
+de Django y reporta, por endpoint, latencia p50/p95/p99, número de consultas
+SQL y memoria asignada (pico de tracemalloc). El resultado se guarda en un
+JSON estable (claves ordenadas) para que las regresiones aparezcan en diffs.
+"""
+
+import contextlib
+import io
+import json
+import math
+import platform
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from applications.models import Aplicacion
+from companies.models import Empresa
+from core.responses import JSON_BACKEND
+from core.views import generate_access_token
+from notifications.models import Notification
+from projects.models import Proyecto
+from students.models import Estudiante
+from users.models import User
+from work_hours.models import WorkHour
+
+from benchmarks.factories import BENCHMARK_EMAIL_DOMAIN
+from benchmarks.scenarios import get_scenarios
+
+DEFAULT_OUTPUT = Path(settings.BASE_DIR) / 'benchmarks' / 'baselines' / 'latest.json'
+
+
+def percentile(values, percent):
+    """Percentil por rango más cercano"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Command(BaseCommand):
+    help = 'Mide latencia (p50/p95/p99), consultas SQL y memoria de los endpoints principales'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=50, help='Peticiones medidas por endpoint')
+        parser.add_argument('--warmup', type=int, default=3, help='Peticiones de calentamiento por endpoint')
+        parser.add_argument('--alloc-iterations', type=int, default=3,
+                            help='Peticiones medidas con tracemalloc (se miden aparte por su sobrecosto)')
+        parser.add_argument('--scenario', action='append', dest='scenarios',
+                            help='Ejecutar solo este escenario (se puede repetir)')
+        parser.add_argument('--cold', action='store_true', help='Vaciar la cache antes de cada petición')
+        parser.add_argument('--output', default=str(DEFAULT_OUTPUT), help='Ruta del JSON de resultados')
+        parser.add_argument('--compare', help='JSON de una ejecución anterior para comparar')
+        parser.add_argument('--threshold', type=float, default=20.0,
+                            help='Porcentaje de aumento de p95 considerado regresión (por defecto 20)')
+        parser.add_argument('--fail-on-regression', action='store_true',
+                            help='Terminar con error si se detectan regresiones')
+
+    def handle(self, *args, **options):
+        try:
+            scenarios = get_scenarios(options['scenarios'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        host = next((h for h in settings.ALLOWED_HOSTS if h and '*' not in h), 'localhost')
+        self.client = Client(HTTP_HOST=host.lstrip('.'))
+        self.cold = options['cold']
+        self.tokens = {}
+
+        self.stdout.write(self.style.SUCCESS(f'🚀 Ejecutando {len(scenarios)} escenarios de benchmark...'))
+
+        endpoints = {}
+        for scenario in scenarios:
+            token = self.get_token(scenario.role)
+            if not token:
+                self.stdout.write(self.style.WARNING(f'⚠️ Sin usuarios con rol {scenario.role}; se omite {scenario.name}'))
+                continue
+            result = self.run_scenario(scenario, token, options)
+            endpoints[scenario.name] = result
+            self.stdout.write(
+                f"   {scenario.name:<30} {result['status']}  "
+                f"p50 {result['p50_ms']:8.2f} ms  p95 {result['p95_ms']:8.2f} ms  p99 {result['p99_ms']:8.2f} ms  "
+                f"{result['queries']:4d} consultas  {result['peak_memory_kb']:9.1f} KB"
+            )
+
+        report = {
+            'generated_at': timezone.now().isoformat(),
+            'environment': self.environment(),
+            'dataset': self.dataset_counts(),
+            'settings': {
+                'iterations': options['iterations'],
+                'warmup': options['warmup'],
+                'cold_cache': self.cold,
+            },
+            'endpoints': endpoints,
+        }
+
+        output = Path(options['output'])
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2, sort_keys=True, ensure_ascii=False) + '\n', encoding='utf-8')
+        self.stdout.write(self.style.SUCCESS(f'✅ Resultados guardados en {output}'))
+
+        if options['compare']:
+            regressions = self.compare(options['compare'], endpoints, options['threshold'])
+            if regressions and options['fail_on_regression']:
+                raise CommandError(f'{regressions} regresiones detectadas')
+
+    def get_token(self, role):
+        """Token JWT de un usuario del rol (se prefieren los usuarios del dataset de benchmark)"""
+        if role not in self.tokens:
+            users = User.objects.filter(role=role, is_active=True).order_by('email')
+            user = users.filter(email__endswith=f'@{BENCHMARK_EMAIL_DOMAIN}').first() or users.first()
+            self.tokens[role] = generate_access_token(user) if user else None
+        return self.tokens[role]
+
+    def request(self, scenario, token):
+        if self.cold:
+            cache.clear()
+        # Las vistas imprimen trazas de depuración; no las mezclamos con los resultados
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.client.get(scenario.path, scenario.params, HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def run_scenario(self, scenario, token, options):
+        for _ in range(options['warmup']):
+            self.request(scenario, token)
+
+        timings = []
+        query_counts = []
+        response = None
+        for _ in range(max(1, options['iterations'])):
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = self.request(scenario, token)
+                timings.append((time.perf_counter() - start) * 1000)
+            query_counts.append(len(queries))
+
+        peaks = []
+        tracemalloc.start()
+        try:
+            for _ in range(max(1, options['alloc_iterations'])):
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+                self.request(scenario, token)
+                peaks.append((tracemalloc.get_traced_memory()[1] - baseline) / 1024)
+        finally:
+            tracemalloc.stop()
+
+        return {
+            'path': scenario.path,
+            'role': scenario.role,
+            'status': response.status_code,
+            'response_bytes': len(response.content),
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p95_ms': round(percentile(timings, 95), 3),
+            'p99_ms': round(percentile(timings, 99), 3),
+            'mean_ms': round(statistics.fmean(timings), 3),
+            'queries': max(query_counts),
+            'peak_memory_kb': round(statistics.median(peaks), 1),
+        }
+
+    def environment(self):
+        return {
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'json_backend': JSON_BACKEND,
+            'cache_backend': settings.CACHES['default']['BACKEND'],
+        }
+
+    def dataset_counts(self):
+        return {
+            'users': User.objects.count(),
+            'students': Estudiante.objects.count(),
+            'companies': Empresa.objects.count(),
+            'projects': Proyecto.objects.count(),
+            'applications': Aplicacion.objects.count(),
+            'work_hours': WorkHour.objects.count(),
+            'notifications': Notification.objects.count(),
+        }
+
+    def compare(self, path, endpoints, threshold):
+        """Compara con una ejecución anterior; retorna el número de regresiones"""
+        try:
+            previous = json.loads(Path(path).read_text(encoding='utf-8'))['endpoints']
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f'No se pudo leer la línea base {path}: {e}')
+
+        self.stdout.write(f'\n📊 Comparación con {path}')
+        regressions = 0
+        for name, result in endpoints.items():
+            before = previous.get(name)
+            if not before:
+                continue
+            p95_delta = (
+                (result['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100
+                if before['p95_ms'] else 0.0
+            )
+            query_delta = result['queries'] - before['queries']
+            regressed = p95_delta > threshold or query_delta > 0
+            regressions += regressed
+            line = f'   {name:<30} p95 {p95_delta:+7.1f}%  consultas {query_delta:+d}'
+            self.stdout.write(self.style.ERROR(line) if regressed else line)
+        return regressions
@@ -0,0 +1,179 @@
+"""
+Genera un dataset reproducible de gran volumen para benchmarks.
+
+Todas las filas se insertan con bulk_create (sin señales ni save() por fila).
+Los usuarios generados usan el dominio BENCHMARK_EMAIL_DOMAIN y se eliminan
+(en cascada con sus perfiles, proyectos, aplicaciones, etc.) antes de cada
+ejecución, por lo que el comando es idempotente.
+"""
+
+import time
+from datetime import timedelta
+
+import factory.random
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from applications.models import Aplicacion
+from companies.models import Empresa
+from evaluations.models import Evaluation
+from notifications.models import Notification
+from project_status.models import ProjectStatus
+from projects.models import Proyecto
+from students.models import Estudiante
+from trl_levels.models import TRLLevel
+from users.models import User
+from work_hours.models import WorkHour
+
+from benchmarks.factories import (
+    BENCHMARK_EMAIL_DOMAIN,
+    AplicacionFactory,
+    EmpresaFactory,
+    EstudianteFactory,
+    EvaluationFactory,
+    NotificationFactory,
+    ProyectoFactory,
+    UserFactory,
+    WorkHourFactory,
+)
+
+PROJECT_STATUSES = ['published', 'active', 'in-progress', 'completed']
+
+
+class Command(BaseCommand):
+    help = 'Genera datos masivos y reproducibles para benchmarks (usuarios, proyectos, aplicaciones, horas, etc.)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=3000, help='Número de estudiantes (por defecto 3000)')
+        parser.add_argument('--companies', type=int, default=1000, help='Número de empresas (por defecto 1000)')
+        parser.add_argument('--projects-per-company', type=int, default=3, help='Proyectos por empresa')
+        parser.add_argument('--applications-per-student', type=int, default=5, help='Aplicaciones por estudiante')
+        parser.add_argument('--hours-per-application', type=int, default=4,
+                            help='Registros de horas por aplicación aceptada o completada')
+        parser.add_argument('--notifications-per-user', type=int, default=5, help='Notificaciones por usuario')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Tamaño de lote para bulk_create')
+        parser.add_argument('--seed', type=int, default=42, help='Semilla para datos reproducibles')
+        parser.add_argument('--clear', action='store_true', help='Solo eliminar los datos de benchmark existentes')
+
+    def handle(self, *args, **options):
+        self.batch_size = options['batch_size']
+        start = time.perf_counter()
+
+        self.stdout.write(self.style.SUCCESS('🚀 Generando dataset de benchmark...'))
+        deleted = self.clear_benchmark_data()
+        if deleted:
+            self.stdout.write(f'🧹 Eliminados {deleted} registros de benchmark anteriores')
+        if options['clear']:
+            return
+
+        # Misma semilla -> mismos datos (factory-boy y Faker comparten el generador)
+        factory.random.reseed_random(options['seed'])
+        for factory_class in (UserFactory, EstudianteFactory):
+            factory_class.reset_sequence(0)
+        self.rng = factory.random.randgen
+        self.now = timezone.now()
+
+        with transaction.atomic():
+            self.create_users(1, 'admin')
+            students = self.create_students(options['students'])
+            companies = self.create_companies(options['companies'])
+            projects = self.create_projects(companies, options['projects_per_company'])
+            applications = self.create_applications(students, projects, options['applications_per_student'])
+            self.create_work_hours(applications, options['hours_per_application'])
+            self.create_evaluations(applications)
+            self.create_notifications(
+                [student.user for student in students] + [company.user for company in companies],
+                options['notifications_per_user'],
+            )
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(f'✅ Dataset generado en {elapsed:.1f}s'))
+
+    def clear_benchmark_data(self):
+        deleted, _ = User.objects.filter(email__endswith=f'@{BENCHMARK_EMAIL_DOMAIN}').delete()
+        return deleted
+
+    def bulk_create(self, model, objects):
+        model.objects.bulk_create(objects, batch_size=self.batch_size)
+        self.stdout.write(f'   {model._meta.verbose_name_plural}: {len(objects)}')
+        return objects
+
+    def create_users(self, count, role):
+        return self.bulk_create(User, UserFactory.build_batch(count, role=role))
+
+    def create_students(self, count):
+        users = self.create_users(count, 'student')
+        students = [EstudianteFactory.build(user=user) for user in users]
+        return self.bulk_create(Estudiante, students)
+
+    def create_companies(self, count):
+        users = self.create_users(count, 'company')
+        companies = [EmpresaFactory.build(user=user) for user in users]
+        return self.bulk_create(Empresa, companies)
+
+    def create_projects(self, companies, per_company):
+        statuses = [
+            ProjectStatus.objects.get_or_create(name=name)[0]
+            for name in PROJECT_STATUSES
+        ]
+        trl_levels = list(TRLLevel.objects.all())
+
+        projects = []
+        for company in companies:
+            for _ in range(per_company):
+                projects.append(ProyectoFactory.build(
+                    company=company,
+                    status=self.rng.choice(statuses),
+                    trl=self.rng.choice(trl_levels) if trl_levels else None,
+                ))
+        return self.bulk_create(Proyecto, projects)
+
+    def create_applications(self, students, projects, per_student):
+        per_student = min(per_student, len(projects))
+        applications = []
+        for student in students:
+            for project in self.rng.sample(projects, per_student):
+                applications.append(AplicacionFactory.build(student=student, project=project))
+        self.bulk_create(Aplicacion, applications)
+
+        # applied_at es auto_now_add: se reparte en los últimos 12 meses con un UPDATE por mes
+        by_month = {}
+        for application in applications:
+            by_month.setdefault(self.rng.randrange(12), []).append(application.id)
+        for months_ago, ids in by_month.items():
+            applied_at = self.now - timedelta(days=30 * months_ago)
+            for offset in range(0, len(ids), self.batch_size):
+                Aplicacion.objects.filter(id__in=ids[offset:offset + self.batch_size]).update(applied_at=applied_at)
+        return applications
+
+    def create_work_hours(self, applications, per_application):
+        work_hours = []
+        for application in applications:
+            if application.status not in ('accepted', 'completed'):
+                continue
+            for _ in range(per_application):
+                work_hours.append(WorkHourFactory.build(
+                    student=application.student,
+                    project=application.project,
+                    date=(self.now - timedelta(days=self.rng.randrange(180))).date(),
+                ))
+        return self.bulk_create(WorkHour, work_hours)
+
+    def create_evaluations(self, applications):
+        evaluations = [
+            EvaluationFactory.build(
+                project=application.project,
+                student=application.student,
+                evaluator=application.project.company.user,
+            )
+            for application in applications
+            if application.status == 'completed'
+        ]
+        return self.bulk_create(Evaluation, evaluations)
+
+    def create_notifications(self, users, per_user):
+        notifications = []
+        for user in users:
+            notifications.extend(NotificationFactory.build_batch(per_user, user=user))
+        return self.bulk_create(Notification, notifications)
@@ -0,0 +1,53 @@
+"""
+Endpoints principales que reproduce el harness de benchmarks.
+
+Cada escenario indica el rol del usuario con el que se autentica la petición;
+el harness elige un usuario de ese rol (preferentemente del dataset de
+benchmark) y genera su token JWT.
+
+Los listados con proyecciones (core.projection) se miden en su vista
+completa y en `?view=summary`; `response_bytes` del reporte muestra la
+diferencia de tamaño del payload junto a la de latencia.
+"""
+
+from collections import namedtuple
+
+Scenario = namedtuple('Scenario', ['name', 'path', 'role', 'params'])
+
+SCENARIOS = [
+    # Estudiantes
+    Scenario('projects_list', '/api/projects/', 'student', {}),
+    Scenario('projects_list_summary', '/api/projects/', 'student', {'view': 'summary'}),
+    Scenario('student_dashboard_stats', '/api/dashboard/student_stats/', 'student', {}),
+    Scenario('my_applications', '/api/applications/my_applications/', 'student', {}),
+    Scenario('work_hours_list', '/api/work-hours/', 'student', {}),
+    Scenario('notifications_list', '/api/notifications/', 'student', {}),
+    Scenario('notifications_unread_count', '/api/notifications/unread-count/', 'student', {}),
+
+    # Empresas
+    Scenario('company_dashboard_stats', '/api/dashboard/company_stats/', 'company', {}),
+    Scenario('company_projects', '/api/projects/company_projects/', 'company', {}),
+    Scenario('received_applications', '/api/applications/received_applications/', 'company', {}),
+
+    # Administración
+    Scenario('admin_dashboard_stats', '/api/dashboard/admin_stats/', 'admin', {}),
+    Scenario('admin_advanced_kpis', '/api/admin/advanced-kpis/', 'admin', {}),
+    Scenario('admin_students_by_section', '/api/admin/students-by-section/', 'admin', {}),
+    Scenario('student_list', '/api/students/', 'admin', {}),
+    Scenario('student_list_summary', '/api/students/', 'admin', {'view': 'summary'}),
+    Scenario('admin_projects_list', '/api/admin/projects/', 'admin', {}),
+    Scenario('admin_projects_list_summary', '/api/admin/projects/', 'admin', {'view': 'summary'}),
+    Scenario('user_list', '/api/users/', 'admin', {}),
+    Scenario('user_list_summary', '/api/users/', 'admin', {'view': 'summary'}),
+    Scenario('company_list', '/api/companies/', 'admin', {}),
+]
+
+
+def get_scenarios(names=None):
+    """Escenarios filtrados por nombre (todos si `names` está vacío)"""
+    if not names:
+        return list(SCENARIOS)
+    unknown = set(names) - {scenario.name for scenario in SCENARIOS}
+    if unknown:
+        raise ValueError(f"Escenarios desconocidos: {', '.join(sorted(unknown))}")
+    return [scenario for scenario in SCENARIOS if scenario.name in names]
@@ -0,0 +1,128 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from applications.models import Aplicacion
+from students.models import Estudiante
+from users.models import User
+from .factories import BENCHMARK_EMAIL_DOMAIN
+from .index_advisor import redundant_indexes
+from .management.commands.run_benchmarks import percentile
+
+
+class SeedBenchmarkDataTest(TestCase):
+    def seed(self):
+        call_command(
+            'seed_benchmark_data',
+            students=6,
+            companies=2,
+            projects_per_company=3,
+            applications_per_student=2,
+            notifications_per_user=1,
+            stdout=StringIO(),
+        )
+
+    def test_seed_is_reproducible_and_idempotent(self):
+        self.seed()
+        emails = list(User.objects.order_by('email').values_list('email', flat=True))
+        sections = list(Estudiante.objects.order_by('rut').values_list('section', flat=True))
+
+        self.assertEqual(Estudiante.objects.count(), 6)
+        self.assertEqual(Aplicacion.objects.count(), 12)
+        self.assertTrue(all(email.endswith(BENCHMARK_EMAIL_DOMAIN) for email in emails))
+
+        self.seed()
+        self.assertEqual(list(User.objects.order_by('email').values_list('email', flat=True)), emails)
+        self.assertEqual(list(Estudiante.objects.order_by('rut').values_list('section', flat=True)), sections)
+
+
+class RunBenchmarksTest(TestCase):
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([], 95), 0.0)
+
+    def test_harness_writes_baseline(self):
+        call_command(
+            'seed_benchmark_data',
+            students=3,
+            companies=1,
+            projects_per_company=2,
+            applications_per_student=1,
+            notifications_per_user=1,
+            stdout=StringIO(),
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, 'baseline.json')
+            call_command(
+                'run_benchmarks',
+                scenarios=['projects_list', 'notifications_unread_count'],
+                iterations=3,
+                warmup=0,
+                alloc_iterations=1,
+                output=output,
+                stdout=StringIO(),
+            )
+            with open(output, encoding='utf-8') as f:
+                report = json.load(f)
+
+        self.assertEqual(report['dataset']['students'], 3)
+        for name in ('projects_list', 'notifications_unread_count'):
+            result = report['endpoints'][name]
+            self.assertEqual(result['status'], 200)
+            self.assertLessEqual(result['p50_ms'], result['p99_ms'])
+            self.assertGreater(result['queries'], 0)
+
+
+class MassNotificationBenchmarkTest(TestCase):
+    def test_benchmark_renders_and_rolls_back(self):
+        out = StringIO()
+        call_command('bench_mass_notifications', recipients=20, chunk_size=8, compare_naive=True, stdout=out)
+        self.assertIn('templating', out.getvalue())
+        self.assertIn('naive', out.getvalue())
+        self.assertFalse(User.objects.filter(email__startswith='bench-').exists())
+
+
+class IndexAdvisorTest(TestCase):
+    def test_redundant_indexes(self):
+        indexes = {'applications': {
+            'applications_project_id': {'columns': ['project_id'], 'unique': False},
+            'applications_proj_status_idx': {'columns': ['project_id', 'status'], 'unique': False},
+            'applications_project_student_uniq': {'columns': ['project_id', 'student_id'], 'unique': True},
+        }}
+        self.assertEqual(redundant_indexes(indexes), [{
+            'table': 'applications',
+            'index': 'applications_project_id',
+            'covered_by': 'applications_proj_status_idx',
+            'columns': ['project_id'],
+        }])
+
+    def test_advisor_reports_index_usage(self):
+        call_command(
+            'seed_benchmark_data',
+            students=3,
+            companies=1,
+            projects_per_company=2,
+            applications_per_student=1,
+            notifications_per_user=1,
+            stdout=StringIO(),
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, 'indexes.json')
+            call_command('index_advisor', output=output, stdout=StringIO())
+            with open(output, encoding='utf-8') as f:
+                report = json.load(f)
+
+        self.assertGreater(report['queries'], 0)
+        self.assertEqual(report['errors'], [])
+        self.assertTrue(report['used_indexes'])
+        used = {item['index'] for item in report['used_indexes']}
+        unused = {item['index'] for item in report['unused_indexes']}
+        self.assertFalse(used & unused)
+        self.assertIn('notifications_user_read_idx', used | unused)
@@ -0,0 +1,284 @@
+"""
+Motor de disponibilidad y conflictos de agenda.
+
+Las entrevistas (`Interview`: `interview_date` + `duration_minutes`), los
+eventos de calendario (`CalendarEvent`: `start_date`/`end_date`, dueño y
+asistentes) y los horarios semanales de docentes (`TeacherSchedule`) se
+guardan por separado. `load_busy_calendars()` los combina en intervalos
+ocupados por usuario con un número fijo de consultas acotadas al rango
+pedido (solo las columnas de fechas e ids, sin instanciar modelos), y
+`BusyCalendar` los mantiene ordenados y fusionados para responder en
+O(log n) si un intervalo está libre y con qué choca.
+
+Uso:
+
+    calendars = load_busy_calendars([interviewer.id, student_user.id], start, end)
+    conflicts = calendars[interviewer.id].conflicts(start, end)
+    slots = find_common_free_slots(user_ids, date_from, date_to, duration=timedelta(hours=1))
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from datetime import datetime, time, timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+
+from interviews.models import Interview
+from teachers.models import TeacherSchedule
+from .models import CalendarEvent
+
+# Las entrevistas duran como máximo 8 horas (ver InterviewSerializer)
+MAX_INTERVIEW_DURATION = timedelta(minutes=480)
+
+# Eventos que ocupan la agenda (plazos y recordatorios no bloquean)
+BUSY_EVENT_TYPES = ('meeting', 'interview', 'other')
+BUSY_EVENT_STATUSES = ('scheduled', 'in_progress')
+
+# Las horas de oficina son tiempo disponible para reuniones
+FREE_ACTIVITY_TYPES = ('office_hours',)
+
+WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+DEFAULT_DAY_START = time(9, 0)
+DEFAULT_DAY_END = time(18, 0)
+
+
+class Busy(namedtuple('Busy', ['start', 'end', 'source', 'ref'])):
+    """Intervalo ocupado [start, end) con su origen ('interview', 'event', 'teacher_schedule')"""
+
+    def to_dict(self):
+        return {
+            'start': self.start.isoformat(),
+            'end': self.end.isoformat(),
+            'source': self.source,
+            'id': str(self.ref),
+        }
+
+
+class SchedulingConflict(ValueError):
+    """El intervalo pedido choca con la agenda de algún participante"""
+
+    def __init__(self, conflicts):
+        self.conflicts = conflicts
+        super().__init__('El horario choca con la agenda de los participantes')
+
+
+class BusyCalendar:
+    """
+    Intervalos ocupados de un usuario, ordenados y fusionados en bloques
+    disjuntos. Cada bloque conserva sus intervalos originales para reportar
+    los conflictos.
+    """
+
+    def __init__(self, intervals=()):
+        self._starts = []
+        self._ends = []
+        self._members = []
+        for interval in sorted(intervals, key=lambda busy: (busy.start, busy.end)):
+            if interval.end <= interval.start:
+                continue
+            if self._ends and interval.start < self._ends[-1]:
+                self._ends[-1] = max(self._ends[-1], interval.end)
+                self._members[-1].append(interval)
+            else:
+                self._starts.append(interval.start)
+                self._ends.append(interval.end)
+                self._members.append([interval])
+
+    def __len__(self):
+        return len(self._starts)
+
+    @classmethod
+    def union(cls, calendars):
+        return cls(interval for calendar in calendars for interval in calendar.intervals())
+
+    def intervals(self):
+        return [interval for members in self._members for interval in members]
+
+    def blocks(self):
+        """Bloques ocupados fusionados [(inicio, fin)] en orden"""
+        return list(zip(self._starts, self._ends))
+
+    def _overlapping_blocks(self, start, end):
+        # Bloques disjuntos: los que solapan [start, end) son contiguos
+        first = bisect_right(self._ends, start)
+        last = bisect_left(self._starts, end)
+        return range(first, last)
+
+    def is_free(self, start, end):
+        """True si [start, end) no solapa ningún bloque (O(log n))"""
+        return not self._overlapping_blocks(start, end)
+
+    def conflicts(self, start, end):
+        """Intervalos originales que solapan [start, end)"""
+        return [
+            interval
+            for index in self._overlapping_blocks(start, end)
+            for interval in self._members[index]
+            if interval.start < end and interval.end > start
+        ]
+
+    def free_slots(self, start, end, duration):
+        """Huecos libres dentro de [start, end) de al menos `duration`"""
+        slots = []
+        cursor = start
+        for index in self._overlapping_blocks(start, end):
+            if self._starts[index] - cursor >= duration:
+                slots.append((cursor, self._starts[index]))
+            cursor = max(cursor, self._ends[index])
+        if end - cursor >= duration:
+            slots.append((cursor, end))
+        return slots
+
+
+def _aware(value):
+    return timezone.make_aware(value) if timezone.is_naive(value) else value
+
+
+def _interview_intervals(user_ids, start, end, exclude_interview=None):
+    """Entrevistas programadas de entrevistadores y estudiantes (una consulta)"""
+    rows = (
+        Interview.objects.filter(
+            Q(interviewer_id__in=user_ids) | Q(application__student__user_id__in=user_ids),
+            status='scheduled',
+            interview_date__lt=end,
+            interview_date__gt=start - MAX_INTERVIEW_DURATION,
+        )
+        .exclude(pk=exclude_interview)
+        .values_list('id', 'interviewer_id', 'application__student__user_id', 'interview_date', 'duration_minutes')
+    )
+    for interview_id, interviewer_id, student_user_id, date, duration in rows:
+        busy = Busy(date, date + timedelta(minutes=duration), 'interview', interview_id)
+        for user_id in {interviewer_id, student_user_id}:
+            if user_id in user_ids:
+                yield user_id, busy
+
+
+def _event_intervals(user_ids, start, end):
+    """Eventos propios y eventos a los que se asiste (dos consultas)"""
+    overlapping = dict(
+        start_date__lt=end, end_date__gt=start,
+        event_type__in=BUSY_EVENT_TYPES, status__in=BUSY_EVENT_STATUSES,
+    )
+    owned = CalendarEvent.objects.filter(
+        Q(user_id__in=user_ids) | Q(created_by_id__in=user_ids), **overlapping
+    ).values_list('id', 'user_id', 'created_by_id', 'start_date', 'end_date')
+    for event_id, user_id, created_by_id, event_start, event_end in owned:
+        busy = Busy(event_start, event_end, 'event', event_id)
+        for owner_id in {user_id, created_by_id}:
+            if owner_id in user_ids:
+                yield owner_id, busy
+
+    attended = CalendarEvent.attendees.through.objects.filter(
+        user_id__in=user_ids,
+        **{f'calendarevent__{lookup}': value for lookup, value in overlapping.items()}
+    ).values_list('user_id', 'calendarevent_id', 'calendarevent__start_date', 'calendarevent__end_date')
+    for user_id, event_id, event_start, event_end in attended:
+        yield user_id, Busy(event_start, event_end, 'event', event_id)
+
+
+def _teacher_intervals(user_ids, start, end):
+    """Bloques del horario docente expandidos sobre el rango (una consulta)"""
+    rows = TeacherSchedule.objects.filter(
+        Q(is_recurring=True) | Q(specific_date__gte=start.date() - timedelta(days=1),
+                                 specific_date__lte=end.date()),
+        teacher_id__in=user_ids,
+        is_active=True,
+    ).exclude(activity_type__in=FREE_ACTIVITY_TYPES).values_list(
+        'id', 'teacher_id', 'day_of_week', 'start_time', 'end_time', 'is_recurring', 'specific_date'
+    )
+    first_day = timezone.localtime(start).date()
+    days = (timezone.localtime(end).date() - first_day).days + 1
+    for slot_id, teacher_id, day_of_week, slot_start, slot_end, is_recurring, specific_date in rows:
+        if is_recurring:
+            weekday = WEEKDAYS.index(day_of_week)
+            offset = (weekday - first_day.weekday()) % 7
+            dates = [first_day + timedelta(days=day) for day in range(offset, days, 7)]
+        else:
+            dates = [specific_date]
+        for date in dates:
+            busy = Busy(
+                _aware(datetime.combine(date, slot_start)),
+                _aware(datetime.combine(date, slot_end)),
+                'teacher_schedule', slot_id,
+            )
+            if busy.start < end and busy.end > start:
+                yield teacher_id, busy
+
+
+def load_busy_calendars(user_ids, start, end, exclude_interview=None):
+    """
+    Agenda ocupada de cada usuario en [start, end) a partir de entrevistas,
+    eventos y horarios docentes. Retorna {user_id: BusyCalendar}.
+    """
+    # User.id es un CharField: en memoria puede ser un UUID recién generado
+    user_ids = {str(user_id) for user_id in user_ids}
+    intervals = {user_id: [] for user_id in user_ids}
+    sources = (
+        _interview_intervals(user_ids, start, end, exclude_interview),
+        _event_intervals(user_ids, start, end),
+        _teacher_intervals(user_ids, start, end),
+    )
+    for source in sources:
+        for user_id, busy in source:
+            intervals[user_id].append(busy)
+    return {user_id: BusyCalendar(busy) for user_id, busy in intervals.items()}
+
+
+def check_conflicts(user_ids, start, end, exclude_interview=None):
+    """
+    Lanza SchedulingConflict si [start, end) choca con la agenda de algún
+    participante; el error lleva {user_id: [Busy]}.
+    """
+    calendars = load_busy_calendars(user_ids, start, end, exclude_interview)
+    conflicts = {
+        user_id: calendar.conflicts(start, end)
+        for user_id, calendar in calendars.items()
+        if not calendar.is_free(start, end)
+    }
+    if conflicts:
+        raise SchedulingConflict(conflicts)
+
+
+def lock_participants(user_ids):
+    """
+    Bloquea las filas de los usuarios (SELECT ... FOR UPDATE, en orden de pk
+    para no cruzar bloqueos) hasta el fin de la transacción: otra reserva
+    para alguno de ellos espera al commit y luego ve la entrevista creada.
+    Debe llamarse dentro de transaction.atomic(), antes de check_conflicts.
+    """
+    from users.models import User
+    list(User.objects.select_for_update().filter(pk__in=list(user_ids)).order_by('pk').values_list('pk', flat=True))
+
+
+def interview_participants(interviewer_id, application):
+    """Usuarios cuya agenda ocupa una entrevista: entrevistador y estudiante postulante"""
+    participants = {interviewer_id}
+    if application is not None and application.student_id:
+        participants.add(application.student.user_id)
+    return participants
+
+
+def find_common_free_slots(user_ids, date_from, date_to, duration,
+                           day_start=DEFAULT_DAY_START, day_end=DEFAULT_DAY_END):
+    """
+    Huecos comunes de al menos `duration` entre `date_from` y `date_to`
+    (fechas, ambas incluidas) dentro del horario laboral de cada día.
+    Retorna [(inicio, fin)] en orden.
+    """
+    window_start = _aware(datetime.combine(date_from, day_start))
+    window_end = _aware(datetime.combine(date_to, day_end))
+    calendars = load_busy_calendars(user_ids, window_start, window_end)
+    busy = BusyCalendar.union(calendars.values())
+
+    slots = []
+    date = date_from
+    while date <= date_to:
+        slots.extend(busy.free_slots(
+            _aware(datetime.combine(date, day_start)),
+            _aware(datetime.combine(date, day_end)),
+            duration,
+        ))
+        date += timedelta(days=1)
+    return slots
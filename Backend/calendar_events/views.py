@@ -3,11 +3,12 @@ Views para la app calendar_events.
 """
 
 import json
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from .models import CalendarEvent
 from core.views import verify_token
+from core.conditional import conditional_get, row_version
 from django.core.paginator import Paginator
 from django.utils import timezone
 from datetime import datetime, timedelta
@@ -136,6 +137,11 @@ def calendar_events_list(request):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@conditional_get(lambda request, calendar_events_id: row_version(
+    CalendarEvent.objects, calendar_events_id, 'created_by__updated_at', 'project__updated_at',
+    attendees_updated_at=models.Max('attendees__updated_at'),
+    attendees=models.Count('attendees'),
+))
 def calendar_events_detail(request, calendar_events_id):
     try:
         auth_header = request.headers.get('Authorization')
@@ -601,7 +607,7 @@ Views para la app calendar_events.
 """
 
 import json
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from .models import CalendarEvent
@@ -645,6 +651,7 @@ def calendar_event_list(request):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@conditional_get(lambda request, event_id: row_version(CalendarEvent.objects, event_id))
 def calendar_event_detail(request, event_id):
     """Detalle de un evento del calendario."""
     try:
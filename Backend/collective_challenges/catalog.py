@@ -0,0 +1,249 @@
+"""
+Catálogo de desafíos colectivos.
+
+El ciclo de vida de un desafío (inscripciones abiertas, en ejecución, etc.)
+se evalúa en la base de datos a partir de `registration_start/end` y
+`challenge_start/end` (índices `challenges_registration_idx` y
+`challenges_execution_idx`), de modo que los clientes pueden filtrar y
+ordenar por ciclo de vida sin descargar todas las páginas. Las banderas
+`is_registration_open`/`is_challenge_active` llegan anotadas en la misma
+consulta.
+
+Las páginas del catálogo se cachean por (estado, período) con una versión
+por par; guardar o eliminar un desafío sube la versión de los pares que lo
+contienen (ver el signal en models.py). Como las banderas dependen de la
+fecha, el TTL es corto (CHALLENGE_CATALOG_CACHE_TIMEOUT).
+"""
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import BooleanField, Case, F, Q, Value, When
+from django.utils import timezone
+
+from .models import DesafioColectivo
+
+CHALLENGE_CATALOG_CACHE_TIMEOUT = 60  # 1 minuto
+
+# Estados en los que el desafío es visible para inscribirse o participar
+OPEN_STATUSES = ('published', 'active')
+
+ORDERINGS = {
+    'newest': ('-created_at',),
+    'registration_closing': (F('registration_end').asc(nulls_last=True), '-created_at'),
+    'starting_soon': (F('challenge_start').asc(nulls_last=True), '-created_at'),
+    'most_viewed': ('-views_count', '-created_at'),
+}
+DEFAULT_ORDERING = 'newest'
+
+
+def _started(field, today):
+    return Q(**{f'{field}__isnull': True}) | Q(**{f'{field}__lte': today})
+
+
+def _not_ended(field, today):
+    return Q(**{f'{field}__isnull': True}) | Q(**{f'{field}__gte': today})
+
+
+def lifecycle_conditions(today=None):
+    """Condiciones (Q) de cada etapa del ciclo de vida para la fecha `today`"""
+    today = today or timezone.localdate()
+    return {
+        'registration_open': (
+            Q(status='published', is_active=True)
+            & _started('registration_start', today)
+            & _not_ended('registration_end', today)
+        ),
+        'upcoming': Q(status='published', is_active=True, registration_start__gt=today),
+        'in_progress': (
+            Q(status__in=OPEN_STATUSES, is_active=True)
+            & (Q(challenge_start__lte=today) | Q(challenge_start__isnull=True, status='active'))
+            & _not_ended('challenge_end', today)
+        ),
+        'finished': Q(status='completed') | Q(challenge_end__lt=today),
+    }
+
+
+LIFECYCLES = tuple(lifecycle_conditions())
+
+
+def _flag(condition):
+    return Case(When(condition, then=Value(True)), default=Value(False), output_field=BooleanField())
+
+
+def _validate_filters(lifecycle, ordering):
+    if lifecycle and lifecycle not in LIFECYCLES:
+        raise ValueError(f"Ciclo de vida inválido: {lifecycle}. Opciones: {', '.join(LIFECYCLES)}")
+    if ordering not in ORDERINGS:
+        raise ValueError(f"Orden inválido: {ordering}. Opciones: {', '.join(ORDERINGS)}")
+
+
+def catalog_queryset(status='', period='', lifecycle='', ordering=DEFAULT_ORDERING, search='', today=None):
+    """
+    Desafíos filtrados y ordenados en la base de datos, con las banderas de
+    ciclo de vida anotadas. Lanza ValueError si `lifecycle` u `ordering`
+    no son válidos.
+    """
+    _validate_filters(lifecycle, ordering)
+
+    conditions = lifecycle_conditions(today)
+    queryset = DesafioColectivo.objects.select_related('company', 'area').annotate(
+        lifecycle_registration_open=_flag(conditions['registration_open']),
+        lifecycle_in_progress=_flag(conditions['in_progress']),
+    )
+    if status:
+        queryset = queryset.filter(status=status)
+    if period:
+        queryset = queryset.filter(period_type=period)
+    if lifecycle:
+        queryset = queryset.filter(conditions[lifecycle])
+    if search:
+        queryset = queryset.filter(
+            Q(title__icontains=search) |
+            Q(description__icontains=search) |
+            Q(company__company_name__icontains=search)
+        )
+    return queryset.order_by(*ORDERINGS[ordering])
+
+
+def _date(value):
+    return value.isoformat() if value else None
+
+
+def _days_until(value, today):
+    return max((value - today).days, 0) if value else None
+
+
+def _progress(start, end, today):
+    """Porcentaje transcurrido entre dos fechas (None si falta alguna)"""
+    if not start or not end:
+        return None
+    total = (end - start).days
+    if total <= 0:
+        return 100 if today >= end else 0
+    return round(min(max((today - start).days / total, 0), 1) * 100, 1)
+
+
+def serialize_challenge(challenge, today=None, detail=False):
+    """Serializa un desafío obtenido con catalog_queryset (banderas ya anotadas)"""
+    today = today or timezone.localdate()
+    data = {
+        'id': str(challenge.id),
+        'title': challenge.title,
+        'description': challenge.description,
+        'requirements': challenge.requirements,
+        'company': {
+            'id': str(challenge.company.id),
+            'name': challenge.company.company_name,
+            'logo': challenge.company.logo_url,
+        },
+        'area': {
+            'id': challenge.area.id if challenge.area else None,
+            'name': challenge.area.name if challenge.area else None,
+        },
+        'period_type': challenge.period_type,
+        'academic_year': challenge.academic_year,
+        'registration_start': _date(challenge.registration_start),
+        'registration_end': _date(challenge.registration_end),
+        'challenge_start': _date(challenge.challenge_start),
+        'challenge_end': _date(challenge.challenge_end),
+        'status': challenge.status,
+        'applications_count': challenge.applications_count,
+        'views_count': challenge.views_count,
+        'is_featured': challenge.is_featured,
+        'is_urgent': challenge.is_urgent,
+        'is_active': challenge.is_active,
+        'is_registration_open': challenge.lifecycle_registration_open,
+        'is_challenge_active': challenge.lifecycle_in_progress,
+        'registration_progress': _progress(challenge.registration_start, challenge.registration_end, today),
+        'time_remaining_registration': (
+            _days_until(challenge.registration_end, today) if challenge.lifecycle_registration_open else None
+        ),
+        'time_remaining_challenge': (
+            _days_until(challenge.challenge_end, today) if challenge.lifecycle_in_progress else None
+        ),
+        'required_skills': challenge.get_required_skills_list(),
+        'technologies': challenge.get_technologies_list(),
+        'benefits': challenge.get_benefits_list(),
+        'created_at': challenge.created_at.isoformat(),
+        'updated_at': challenge.updated_at.isoformat(),
+        'published_at': challenge.published_at.isoformat() if challenge.published_at else None,
+    }
+    if detail:
+        data['company'].update({
+            'description': challenge.company.description,
+            'website': challenge.company.website,
+            'industry': challenge.company.industry,
+        })
+        data.update({
+            'tipo': challenge.tipo,
+            'objetivo': challenge.objetivo,
+            'contacto': challenge.contacto,
+        })
+    return data
+
+
+# ===== CACHÉ DEL CATÁLOGO =====
+
+def _version_key(status, period):
+    return f'challenges:catalog:version:{status}:{period}'
+
+
+def _catalog_version(status, period):
+    version = cache.get(_version_key(status, period))
+    if version is None:
+        version = 1
+        cache.add(_version_key(status, period), version, None)
+    return version
+
+
+def invalidate_catalog(statuses, periods):
+    """
+    Sube la versión de los pares (estado, período) indicados y de sus
+    comodines ('' = sin filtro), descartando sus páginas cacheadas.
+    """
+    for status in set(statuses) | {''}:
+        for period in set(periods) | {''}:
+            key = _version_key(status, period)
+            if not cache.add(key, 2, None):
+                try:
+                    cache.incr(key)
+                except ValueError:
+                    cache.set(key, 2, None)
+
+
+def get_catalog_page(status='', period='', lifecycle='', ordering=DEFAULT_ORDERING, page=1, limit=10):
+    """
+    Página del catálogo (sin búsqueda de texto) cacheada por (estado, período).
+    Lanza ValueError si los filtros no son válidos.
+    """
+    _validate_filters(lifecycle, ordering)
+
+    today = timezone.localdate()
+    cache_key = (
+        f'challenges:catalog:{_catalog_version(status, period)}:{status}:{period}:'
+        f'{lifecycle}:{ordering}:{today.isoformat()}:{page}:{limit}'
+    )
+    payload = cache.get(cache_key)
+    if payload is None:
+        payload = build_catalog_page(status, period, lifecycle, ordering, page=page, limit=limit, today=today)
+        cache.set(cache_key, payload, CHALLENGE_CATALOG_CACHE_TIMEOUT)
+    return payload
+
+
+def build_catalog_page(status='', period='', lifecycle='', ordering=DEFAULT_ORDERING, search='',
+                       page=1, limit=10, today=None):
+    """Página del catálogo serializada (sin caché)"""
+    today = today or timezone.localdate()
+    queryset = catalog_queryset(status, period, lifecycle, ordering, search, today=today)
+    paginator = Paginator(queryset, limit)
+    page_obj = paginator.get_page(page)
+    return {
+        'challenges': [serialize_challenge(challenge, today=today) for challenge in page_obj],
+        'pagination': {
+            'current_page': page_obj.number,
+            'total_pages': paginator.num_pages,
+            'total_count': paginator.count,
+            'has_next': page_obj.has_next(),
+            'has_previous': page_obj.has_previous(),
+        }
+    }
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-19 12:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collective_challenges', '0002_remove_desafiocolectivo_challenge_end_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='desafiocolectivo',
+            name='challenge_end',
+            field=models.DateField(blank=True, help_text='Fecha de fin del desafío', null=True),
+        ),
+        migrations.AddField(
+            model_name='desafiocolectivo',
+            name='challenge_start',
+            field=models.DateField(blank=True, help_text='Fecha de inicio del desafío', null=True),
+        ),
+        migrations.AddField(
+            model_name='desafiocolectivo',
+            name='registration_end',
+            field=models.DateField(blank=True, help_text='Fecha de fin de inscripciones', null=True),
+        ),
+        migrations.AddField(
+            model_name='desafiocolectivo',
+            name='registration_start',
+            field=models.DateField(blank=True, help_text='Fecha de inicio de inscripciones', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='desafiocolectivo',
+            index=models.Index(fields=['status', 'period_type', '-created_at'], name='challenges_catalog_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='desafiocolectivo',
+            index=models.Index(fields=['status', 'registration_end', 'registration_start'], name='challenges_registration_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='desafiocolectivo',
+            index=models.Index(fields=['status', 'challenge_start', 'challenge_end'], name='challenges_execution_idx'),
+        ),
+    ]
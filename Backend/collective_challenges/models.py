@@ -12,13 +12,35 @@ from areas.models import Area
 from users.models import User
 import uuid
 import json
+from functools import lru_cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.utils import timezone
+from core.tracking import ChangeTrackingMixin
 
 
-class DesafioColectivo(models.Model):
+@lru_cache(maxsize=2048)
+def parse_json_list(raw):
+    """
+    Decodifica una columna JSON de lista. El resultado se memoiza por texto:
+    los desafíos suelen repetir las mismas habilidades y tecnologías, así que
+    cada valor distinto se decodifica una sola vez por proceso.
+    """
+    if not raw:
+        return ()
+    try:
+        value = json.loads(raw)
+    except json.JSONDecodeError:
+        return ()
+    return tuple(value) if isinstance(value, list) else ()
+
+
+class DesafioColectivo(ChangeTrackingMixin, models.Model):
     """
     Desafíos trimestrales/semestrales que las empresas publican para la academia
     """
+    # Claves del catálogo cacheado que hay que invalidar al guardar (ver catalog.py)
+    tracked_fields = ('status', 'period_type')
     
     PERIOD_CHOICES = [
         ('trimestral', 'Trimestral'),
@@ -110,6 +132,28 @@ class DesafioColectivo(models.Model):
         help_text="Beneficios para los participantes (JSON array)"
     )
     
+    # Ciclo de vida (opcionales): inscripciones y ejecución del desafío
+    registration_start = models.DateField(
+        null=True,
+        blank=True,
+        help_text="Fecha de inicio de inscripciones"
+    )
+    registration_end = models.DateField(
+        null=True,
+        blank=True,
+        help_text="Fecha de fin de inscripciones"
+    )
+    challenge_start = models.DateField(
+        null=True,
+        blank=True,
+        help_text="Fecha de inicio del desafío"
+    )
+    challenge_end = models.DateField(
+        null=True,
+        blank=True,
+        help_text="Fecha de fin del desafío"
+    )
+    
     # Estado y métricas
     status = models.CharField(
         max_length=20, 
@@ -150,18 +194,19 @@ class DesafioColectivo(models.Model):
         verbose_name = 'Desafío Colectivo'
         verbose_name_plural = 'Desafíos Colectivos'
         ordering = ['-created_at']
+        indexes = [
+            # Catálogo por (estado, período) y filtros de ciclo de vida (ver catalog.py)
+            models.Index(fields=['status', 'period_type', '-created_at'], name='challenges_catalog_idx'),
+            models.Index(fields=['status', 'registration_end', 'registration_start'], name='challenges_registration_idx'),
+            models.Index(fields=['status', 'challenge_start', 'challenge_end'], name='challenges_execution_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.company.company_name} ({self.get_period_type_display()})"
     
     def get_required_skills_list(self):
         """Obtiene la lista de habilidades requeridas como lista de Python"""
-        if self.required_skills:
-            try:
-                return json.loads(self.required_skills)
-            except json.JSONDecodeError:
-                return []
-        return []
+        return list(parse_json_list(self.required_skills))
     
     def set_required_skills_list(self, skills_list):
         """Establece la lista de habilidades requeridas desde una lista de Python"""
@@ -172,12 +217,7 @@ class DesafioColectivo(models.Model):
     
     def get_technologies_list(self):
         """Obtiene la lista de tecnologías como lista de Python"""
-        if self.technologies:
-            try:
-                return json.loads(self.technologies)
-            except json.JSONDecodeError:
-                return []
-        return []
+        return list(parse_json_list(self.technologies))
     
     def set_technologies_list(self, technologies_list):
         """Establece la lista de tecnologías desde una lista de Python"""
@@ -188,16 +228,22 @@ class DesafioColectivo(models.Model):
     
     def get_benefits_list(self):
         """Obtiene la lista de beneficios como lista de Python"""
-        if self.benefits:
-            try:
-                return json.loads(self.benefits)
-            except json.JSONDecodeError:
-                return []
-        return []
+        return list(parse_json_list(self.benefits))
     
     def set_benefits_list(self, benefits_list):
         """Establece la lista de beneficios desde una lista de Python"""
         if isinstance(benefits_list, list):
             self.benefits = json.dumps(benefits_list, ensure_ascii=False)
         else:
-            self.benefits = None
\ No newline at end of file
+            self.benefits = None
+
+
+@receiver(post_save, sender=DesafioColectivo)
+@receiver(post_delete, sender=DesafioColectivo)
+def invalidate_challenge_catalog(sender, instance, **kwargs):
+    """Invalida las páginas cacheadas del catálogo afectadas por el desafío"""
+    from .catalog import invalidate_catalog
+
+    statuses = {instance.status, instance.previous('status') or instance.status}
+    periods = {instance.period_type, instance.previous('period_type') or instance.period_type}
+    invalidate_catalog(statuses, periods)
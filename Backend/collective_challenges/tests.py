@@ -1,3 +1,98 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
+from django.utils import timezone
+
+from companies.models import Empresa
+from core.views import generate_access_token
+from .catalog import catalog_queryset, get_catalog_page, serialize_challenge
+from .models import DesafioColectivo
+
+User = get_user_model()
+
+
+class ChallengeCatalogTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        company_user = User.objects.create_user(email='company@test.com', password='testpass123', role='company')
+        self.company = Empresa.objects.create(user=company_user, company_name='Test Company')
+        self.today = timezone.localdate()
+
+    def create_challenge(self, title, status='published', **fields):
+        return DesafioColectivo.objects.create(
+            company=self.company,
+            title=title,
+            description='Descripción',
+            requirements='Contexto',
+            academic_year='2026',
+            status=status,
+            **fields
+        )
+
+    def days(self, n):
+        return self.today + timedelta(days=n)
+
+    def titles(self, **filters):
+        return [challenge.title for challenge in catalog_queryset(**filters)]
+
+    def test_lifecycle_filters_and_ordering_run_in_the_database(self):
+        self.create_challenge('Abierto tarde', registration_start=self.days(-5), registration_end=self.days(10))
+        self.create_challenge('Abierto pronto', registration_start=self.days(-5), registration_end=self.days(2))
+        self.create_challenge('Próximo', registration_start=self.days(3), registration_end=self.days(20))
+        self.create_challenge('Cerrado', registration_end=self.days(-1), challenge_start=self.days(-1))
+        self.create_challenge('Completado', status='completed')
+
+        self.assertEqual(
+            self.titles(lifecycle='registration_open', ordering='registration_closing'),
+            ['Abierto pronto', 'Abierto tarde'],
+        )
+        self.assertEqual(self.titles(lifecycle='upcoming'), ['Próximo'])
+        self.assertEqual(self.titles(lifecycle='in_progress'), ['Cerrado'])
+        self.assertEqual(self.titles(lifecycle='finished'), ['Completado'])
+        with self.assertRaises(ValueError):
+            catalog_queryset(lifecycle='unknown')
+
+        challenge = catalog_queryset(lifecycle='registration_open', ordering='registration_closing')[0]
+        data = serialize_challenge(challenge, today=self.today)
+        self.assertTrue(data['is_registration_open'])
+        self.assertFalse(data['is_challenge_active'])
+        self.assertEqual(data['time_remaining_registration'], 2)
+        self.assertEqual(data['registration_progress'], 71.4)
+
+    def test_catalog_pages_are_cached_and_invalidated_on_save(self):
+        self.create_challenge('Publicado')
+        draft = self.create_challenge('Borrador', status='draft')
+
+        page = get_catalog_page(status='published')
+        self.assertEqual(page['pagination']['total_count'], 1)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_catalog_page(status='published'), page)
+
+        draft = DesafioColectivo.objects.get(pk=draft.pk)
+        draft.status = 'published'
+        draft.save()
+        self.assertEqual(get_catalog_page(status='published')['pagination']['total_count'], 2)
+
+    def test_invalid_json_lists_are_empty(self):
+        challenge = self.create_challenge('JSON', required_skills='no es json', technologies='["Python", "Django"]')
+        self.assertEqual(challenge.get_required_skills_list(), [])
+        self.assertEqual(challenge.get_technologies_list(), ['Python', 'Django'])
+
+    def test_endpoints_serialize_lifecycle_fields(self):
+        challenge = self.create_challenge('Abierto', registration_end=self.days(5), required_skills='["Python"]')
+        auth = {'HTTP_AUTHORIZATION': f'Bearer {generate_access_token(self.company.user)}'}
+
+        response = self.client.get('/api/challenges/challenges/', {'lifecycle': 'registration_open'}, **auth)
+        self.assertEqual(response.status_code, 200)
+        listed = response.json()['challenges'][0]
+        self.assertEqual(listed['registration_end'], self.days(5).isoformat())
+        self.assertEqual(listed['required_skills'], ['Python'])
 
-# Create your tests here.
+        response = self.client.get(f'/api/challenges/challenges/{challenge.id}/', **auth)
+        self.assertTrue(response.json()['challenge']['is_registration_open'])
+        response = self.client.get('/api/challenges/company/challenges/', **auth)
+        self.assertEqual(response.json()['pagination']['total_count'], 1)
+        response = self.client.get('/api/challenges/challenges/', {'ordering': 'random'}, **auth)
+        self.assertEqual(response.status_code, 400)
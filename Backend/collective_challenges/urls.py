@@ -12,6 +12,7 @@ app_name = 'collective_challenges'
 urlpatterns = [
     # Endpoints públicos
     path('challenges/', views.api_challenges_list, name='api_challenges_list'),
+    path('challenges/rankings/', views.api_challenges_rankings, name='api_challenges_rankings'),
     path('challenges/<uuid:challenge_id>/', views.api_challenge_detail, name='api_challenge_detail'),
     
     # Endpoints para empresas
@@ -5,14 +5,41 @@ Este archivo contiene endpoints específicos para la gestión de desafíos colec
 que las empresas pueden publicar para la academia.
 """
 
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 import json
-from datetime import datetime, date
 from core.views import verify_token
+from core.view_counters import view_counters
+from core.conditional import conditional_get, row_version
+from .models import DesafioColectivo
+from .catalog import DEFAULT_ORDERING, build_catalog_page, catalog_queryset, get_catalog_page, serialize_challenge
+
+# Fechas del ciclo de vida que aceptan la creación y la actualización
+LIFECYCLE_DATE_FIELDS = ('registration_start', 'registration_end', 'challenge_start', 'challenge_end')
+
+
+def _parse_lifecycle_dates(data):
+    """Fechas del ciclo de vida presentes en `data` (AAAA-MM-DD o vacías). Lanza ValueError si son inválidas."""
+    dates = {}
+    for field in LIFECYCLE_DATE_FIELDS:
+        if field not in data:
+            continue
+        value = data[field]
+        if not value:
+            dates[field] = None
+            continue
+        try:
+            parsed = parse_date(str(value)[:10])
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValueError(f'Fecha inválida en {field}: {value}')
+        dates[field] = parsed
+    return dates
 
 
 @csrf_exempt
@@ -36,98 +63,40 @@ def api_challenges_list(request):
         limit = int(request.GET.get('limit', 10))
         status_filter = request.GET.get('status', '')
         period_filter = request.GET.get('period', '')
+        lifecycle = request.GET.get('lifecycle', '')
+        ordering = request.GET.get('ordering', DEFAULT_ORDERING)
         search = request.GET.get('search', '')
         
-        # Construir consulta
-        from collective_challenges.models import DesafioColectivo
-        
-        queryset = DesafioColectivo.objects.select_related('company', 'area').all()
-        
-        # Filtros
-        if status_filter:
-            queryset = queryset.filter(status=status_filter)
-        
-        if period_filter:
-            queryset = queryset.filter(period_type=period_filter)
-        
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(description__icontains=search) |
-                Q(company__company_name__icontains=search)
-            )
-        
-        # Paginación
-        paginator = Paginator(queryset, limit)
-        page_obj = paginator.get_page(page)
-        
-        # Serializar datos
-        challenges_data = []
-        for challenge in page_obj:
-            challenge_data = {
-                'id': str(challenge.id),
-                'title': challenge.title,
-                'description': challenge.description,
-                'requirements': challenge.requirements,
-                'company': {
-                    'id': str(challenge.company.id),
-                    'name': challenge.company.company_name,
-                    'logo': challenge.company.logo_url,
-                },
-                'area': {
-                    'id': challenge.area.id if challenge.area else None,
-                    'name': challenge.area.name if challenge.area else None,
-                },
-                'period_type': challenge.period_type,
-                'academic_year': challenge.academic_year,
-                'semester': challenge.semester,
-                'max_teams': challenge.max_teams,
-                'current_teams': challenge.current_teams,
-                'modality': challenge.modality,
-                'duration_weeks': challenge.duration_weeks,
-                'hours_per_week': challenge.hours_per_week,
-                'total_hours': challenge.total_hours,
-                'registration_start': challenge.registration_start.isoformat(),
-                'registration_end': challenge.registration_end.isoformat(),
-                'challenge_start': challenge.challenge_start.isoformat(),
-                'challenge_end': challenge.challenge_end.isoformat(),
-                'status': challenge.status,
-                'applications_count': challenge.applications_count,
-                'views_count': challenge.views_count,
-                'is_featured': challenge.is_featured,
-                'is_urgent': challenge.is_urgent,
-                'is_active': challenge.is_active,
-                'is_registration_open': challenge.is_registration_open,
-                'is_challenge_active': challenge.is_challenge_active,
-                'registration_progress': challenge.registration_progress,
-                'time_remaining_registration': challenge.time_remaining_registration,
-                'time_remaining_challenge': challenge.time_remaining_challenge,
-                'required_skills': challenge.get_required_skills_list(),
-                'technologies': challenge.get_technologies_list(),
-                'benefits': challenge.get_benefits_list(),
-                'created_at': challenge.created_at.isoformat(),
-                'updated_at': challenge.updated_at.isoformat(),
-                'published_at': challenge.published_at.isoformat() if challenge.published_at else None,
-            }
-            challenges_data.append(challenge_data)
+        try:
+            if search:
+                # Las búsquedas de texto no se cachean
+                payload = build_catalog_page(
+                    status_filter, period_filter, lifecycle, ordering, search=search, page=page, limit=limit
+                )
+            else:
+                payload = get_catalog_page(status_filter, period_filter, lifecycle, ordering, page=page, limit=limit)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
         
-        return JsonResponse({
-            'challenges': challenges_data,
-            'pagination': {
-                'current_page': page,
-                'total_pages': paginator.num_pages,
-                'total_count': paginator.count,
-                'has_next': page_obj.has_next(),
-                'has_previous': page_obj.has_previous(),
-            }
-        })
+        return JsonResponse(payload)
         
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
 
+def _challenge_detail_version(request, challenge_id):
+    """Desafío y su empresa (una consulta) más el día: los plazos restantes cambian a diario"""
+    version = row_version(DesafioColectivo.objects, challenge_id, 'company__updated_at')
+    return version + (timezone.localdate(),) if version else None
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
+@conditional_get(
+    _challenge_detail_version,
+    # La visita cuenta aunque el cliente ya tenga el detalle
+    on_not_modified=lambda request, challenge_id: view_counters.record(DesafioColectivo, challenge_id),
+)
 def api_challenge_detail(request, challenge_id):
     """Endpoint para obtener detalles de un desafío específico."""
     try:
@@ -146,73 +115,16 @@ def api_challenge_detail(request, challenge_id):
         from collective_challenges.models import DesafioColectivo
         
         try:
-            challenge = DesafioColectivo.objects.select_related('company', 'area').get(id=challenge_id)
+            challenge = catalog_queryset().get(id=challenge_id)
         except DesafioColectivo.DoesNotExist:
             return JsonResponse({'error': 'Desafío no encontrado'}, status=404)
         
-        # Incrementar contador de vistas
-        challenge.views_count += 1
-        challenge.save(update_fields=['views_count'])
+        # Contar la vista en el buffer (sin save del desafío)
+        view_counters.record(DesafioColectivo, challenge.id)
+        challenge.views_count += view_counters.pending(DesafioColectivo, challenge.id)
         
         # Serializar datos completos
-        challenge_data = {
-            'id': str(challenge.id),
-            'title': challenge.title,
-            'description': challenge.description,
-            'requirements': challenge.requirements,
-            'company': {
-                'id': str(challenge.company.id),
-                'name': challenge.company.company_name,
-                'description': challenge.company.description,
-                'logo': challenge.company.logo_url,
-                'website': challenge.company.website,
-                'industry': challenge.company.industry,
-            },
-            'area': {
-                'id': challenge.area.id if challenge.area else None,
-                'name': challenge.area.name if challenge.area else None,
-            },
-            'period_type': challenge.period_type,
-            'academic_year': challenge.academic_year,
-            'semester': challenge.semester,
-            'tipo': challenge.tipo,
-            'objetivo': challenge.objetivo,
-            'encargado': challenge.encargado,
-            'contacto': challenge.contacto,
-            'max_teams': challenge.max_teams,
-            'students_per_team': challenge.students_per_team,
-            'total_students_needed': challenge.total_students_needed,
-            'current_teams': challenge.current_teams,
-            'modality': challenge.modality,
-            'duration_weeks': challenge.duration_weeks,
-            'hours_per_week': challenge.hours_per_week,
-            'total_hours': challenge.total_hours,
-            'registration_start': challenge.registration_start.isoformat(),
-            'registration_end': challenge.registration_end.isoformat(),
-            'challenge_start': challenge.challenge_start.isoformat(),
-            'challenge_end': challenge.challenge_end.isoformat(),
-            'evaluation_criteria': challenge.get_evaluation_criteria_dict(),
-            'prizes': challenge.get_prizes_list(),
-            'judges': challenge.get_judges_list(),
-            'status': challenge.status,
-            'applications_count': challenge.applications_count,
-            'views_count': challenge.views_count,
-            'is_featured': challenge.is_featured,
-            'is_urgent': challenge.is_urgent,
-            'is_active': challenge.is_active,
-            'is_registration_open': challenge.is_registration_open,
-            'is_challenge_active': challenge.is_challenge_active,
-            'registration_progress': challenge.registration_progress,
-            'time_remaining_registration': challenge.time_remaining_registration,
-            'time_remaining_challenge': challenge.time_remaining_challenge,
-            'required_skills': challenge.get_required_skills_list(),
-            'preferred_skills': challenge.get_preferred_skills_list(),
-            'technologies': challenge.get_technologies_list(),
-            'benefits': challenge.get_benefits_list(),
-            'created_at': challenge.created_at.isoformat(),
-            'updated_at': challenge.updated_at.isoformat(),
-            'published_at': challenge.published_at.isoformat() if challenge.published_at else None,
-        }
+        challenge_data = serialize_challenge(challenge, detail=True)
         
         return JsonResponse({'challenge': challenge_data})
         
@@ -220,6 +132,34 @@ def api_challenge_detail(request, challenge_id):
         return JsonResponse({'error': str(e)}, status=500)
 
 
+@csrf_exempt
+@require_http_methods(["GET"])
+def api_challenges_rankings(request):
+    """Endpoint con los desafíos en tendencia y más vistos (desde el buffer de vistas)."""
+    try:
+        # Verificar autenticación
+        auth_header = request.headers.get('Authorization')
+        if not auth_header or not auth_header.startswith('Bearer '):
+            return JsonResponse({'error': 'Token de autenticación requerido'}, status=401)
+        
+        token = auth_header.split(' ')[1]
+        user = verify_token(token)
+        
+        if not user:
+            return JsonResponse({'error': 'Token inválido'}, status=401)
+        
+        from collective_challenges.models import DesafioColectivo
+        
+        limit = min(int(request.GET.get('limit', 10)), 50)
+        queryset = DesafioColectivo.objects.filter(status__in=['published', 'active'])
+        return JsonResponse(view_counters.rankings(DesafioColectivo, limit=limit, queryset=queryset))
+        
+    except ValueError:
+        return JsonResponse({'error': 'Parámetro limit inválido'}, status=400)
+    except Exception as e:
+        return JsonResponse({'error': f'Error interno del servidor: {str(e)}'}, status=500)
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def api_challenge_create(request):
@@ -245,6 +185,11 @@ def api_challenge_create(request):
             if not data.get(field):
                 return JsonResponse({'error': f'El campo {field} es obligatorio'}, status=400)
         
+        try:
+            lifecycle_dates = _parse_lifecycle_dates(data)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        
         # Obtener empresa del usuario
         from companies.models import Empresa
         try:
@@ -266,6 +211,7 @@ def api_challenge_create(request):
             tipo=data.get('tipo'),
             contacto=data.get('contacto'),
             status='draft',
+            **lifecycle_dates
         )
         
         # Asignar área si se proporciona
@@ -276,9 +222,6 @@ def api_challenge_create(request):
             except Area.DoesNotExist:
                 pass
         
-        # Guardar desafío
-        challenge.save()
-        
         # Establecer campos JSON si se proporcionan
         if data.get('required_skills'):
             challenge.set_required_skills_list(data['required_skills'])
@@ -287,6 +230,7 @@ def api_challenge_create(request):
         if data.get('benefits'):
             challenge.set_benefits_list(data['benefits'])
         
+        # Guardar desafío
         challenge.save()
         
         return JsonResponse({
@@ -327,18 +271,22 @@ def api_challenge_update(request, challenge_id):
         # Obtener datos del request
         data = json.loads(request.body)
         
+        try:
+            lifecycle_dates = _parse_lifecycle_dates(data)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        
         # Actualizar campos
         fields_to_update = [
-            'title', 'description', 'requirements', 'academic_year', 'semester',
-            'period_type', 'tipo', 'objetivo', 'encargado', 'contacto',
-            'max_teams', 'students_per_team', 'modality', 'duration_weeks',
-            'hours_per_week', 'registration_start', 'registration_end',
-            'challenge_start', 'challenge_end', 'status'
+            'title', 'description', 'requirements', 'academic_year',
+            'period_type', 'tipo', 'objetivo', 'contacto', 'status'
         ]
         
         for field in fields_to_update:
             if field in data:
                 setattr(challenge, field, data[field])
+        for field, value in lifecycle_dates.items():
+            setattr(challenge, field, value)
         
         # Actualizar área si se proporciona
         if 'area_id' in data:
@@ -434,40 +382,16 @@ def api_company_challenges(request):
         limit = int(request.GET.get('limit', 10))
         status_filter = request.GET.get('status', '')
         
-        # Construir consulta
-        from collective_challenges.models import DesafioColectivo
-        
-        queryset = DesafioColectivo.objects.filter(company=company)
-        
-        if status_filter:
-            queryset = queryset.filter(status=status_filter)
+        # Construir consulta (ciclo de vida evaluado en la base de datos)
+        queryset = catalog_queryset(status=status_filter).filter(company=company)
         
         # Paginación
         paginator = Paginator(queryset, limit)
         page_obj = paginator.get_page(page)
         
         # Serializar datos
-        challenges_data = []
-        for challenge in page_obj:
-            challenge_data = {
-                'id': str(challenge.id),
-                'title': challenge.title,
-                'description': challenge.description,
-                'period_type': challenge.period_type,
-                'academic_year': challenge.academic_year,
-                'semester': challenge.semester,
-                'max_teams': challenge.max_teams,
-                'current_teams': challenge.current_teams,
-                'status': challenge.status,
-                'applications_count': challenge.applications_count,
-                'views_count': challenge.views_count,
-                'is_registration_open': challenge.is_registration_open,
-                'is_challenge_active': challenge.is_challenge_active,
-                'registration_progress': challenge.registration_progress,
-                'created_at': challenge.created_at.isoformat(),
-                'published_at': challenge.published_at.isoformat() if challenge.published_at else None,
-            }
-            challenges_data.append(challenge_data)
+        today = timezone.localdate()
+        challenges_data = [serialize_challenge(challenge, today=today) for challenge in page_obj]
         
         return JsonResponse({
             'challenges': challenges_data,
@@ -0,0 +1,72 @@
+"""
+Contadores de proyectos de la empresa (`total_projects`, `projects_completed`).
+
+Se mantienen de forma incremental desde los signals de Proyecto: al crear o
+eliminar un proyecto, al moverlo de empresa o cuando su estado cambia a o
+desde 'completado' se aplica un UPDATE con deltas F(); cualquier otro
+guardado del proyecto no toca la empresa.
+
+Los cambios que no pasan por `save()`/`delete()` (por ejemplo `.update()`
+sobre proyectos, o el SET_NULL al eliminar un estado) no disparan signals.
+`reconcile_company_project_counters` repara esa deriva en un solo UPDATE;
+se ejecuta periódicamente con `python manage.py reconcile_company_counters`.
+"""
+
+from django.db.models import Count, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Now
+
+from core.reference_data import reference_data
+from .models import Empresa
+
+
+def apply_company_project_deltas(company_id, total=0, completed=0):
+    """Suma los deltas a los contadores de la empresa con un único UPDATE"""
+    updates = {}
+    if total:
+        updates['total_projects'] = F('total_projects') + total
+    if completed:
+        updates['projects_completed'] = F('projects_completed') + completed
+    if company_id and updates:
+        Empresa.objects.filter(id=company_id).update(**updates, updated_at=Now())
+
+
+def _real_counts():
+    """Expresiones (correlacionadas con la empresa) de los conteos reales"""
+    from projects.models import Proyecto
+
+    projects = Proyecto.objects.filter(company=OuterRef('pk')).order_by().values('company')
+    real_total = Coalesce(Subquery(projects.annotate(n=Count('id')).values('n')), Value(0))
+
+    completed_ids = reference_data.status_ids('completed')
+    if completed_ids:
+        real_completed = Coalesce(
+            Subquery(projects.filter(status_id__in=completed_ids).annotate(n=Count('id')).values('n')),
+            Value(0)
+        )
+    else:
+        real_completed = Value(0)
+    return real_total, real_completed
+
+
+def drifted_companies(company_ids=None):
+    """Empresas cuyos contadores no coinciden con sus proyectos"""
+    real_total, real_completed = _real_counts()
+    companies = Empresa.objects.all()
+    if company_ids is not None:
+        companies = companies.filter(id__in=company_ids)
+    return companies.annotate(real_total=real_total, real_completed=real_completed).filter(
+        ~Q(total_projects=F('real_total')) | ~Q(projects_completed=F('real_completed'))
+    )
+
+
+def reconcile_company_project_counters(company_ids=None):
+    """
+    Recalcula los contadores (de todas las empresas o de `company_ids`) en un
+    solo UPDATE. Retorna el número de empresas corregidas.
+    """
+    real_total, real_completed = _real_counts()
+    return Empresa.objects.filter(pk__in=drifted_companies(company_ids).values('pk')).update(
+        total_projects=real_total,
+        projects_completed=real_completed,
+        updated_at=Now(),
+    )
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from companies.counters import drifted_companies, reconcile_company_project_counters
+from core.db_router import replica_reads
+
+
+class Command(BaseCommand):
+    help = (
+        'Repara en un solo UPDATE los contadores total_projects/projects_completed de las empresas '
+        '(pensado para ejecutarse periódicamente, por ejemplo con cron)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Mostrar cuántas empresas tienen contadores desfasados sin corregirlos',
+        )
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            # Solo reporte: se puede leer de la réplica
+            with replica_reads():
+                drifted = drifted_companies().count()
+            self.stdout.write(f'🔍 {drifted} empresas con contadores desfasados')
+            return
+
+        fixed = reconcile_company_project_counters()
+        self.stdout.write(self.style.SUCCESS(f'✅ Contadores corregidos en {fixed} empresas'))
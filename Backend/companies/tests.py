@@ -1,3 +1,69 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+from core.reference_data import reference_data
+from core.view_counters import view_counters
+from projects.models import Proyecto
+from project_status.models import ProjectStatus
+from .counters import drifted_companies
+from .models import Empresa
+
+User = get_user_model()
+
+
+class CompanyProjectCountersTest(TestCase):
+    def setUp(self):
+        company_user = User.objects.create_user(email='company@test.com', password='testpass123', role='company')
+        self.company = Empresa.objects.create(user=company_user, company_name='Test Company')
+        self.published = ProjectStatus.objects.create(name='published')
+        self.completed = ProjectStatus.objects.create(name='completed')
+        reference_data.load()
+
+    def create_project(self, status):
+        return Proyecto.objects.create(
+            title='Project',
+            company=self.company,
+            description='Test description',
+            requirements='Test requirements',
+            status=status,
+        )
+
+    def counters(self):
+        self.company.refresh_from_db()
+        return self.company.total_projects, self.company.projects_completed
+
+    def test_deltas_on_create_status_change_and_delete(self):
+        self.create_project(self.published)
+        project = Proyecto.objects.get(id=self.create_project(self.published).id)
+        self.assertEqual(self.counters(), (2, 0))
+
+        project.status = self.completed
+        project.save()
+        self.assertEqual(self.counters(), (2, 1))
+
+        project.delete()
+        self.assertEqual(self.counters(), (1, 0))
+
+    def test_unrelated_saves_do_not_touch_company(self):
+        project = Proyecto.objects.get(id=self.create_project(self.completed).id)
+        with self.assertNumQueries(0):
+            project.incrementar_vistas()  # Buffer de vistas, sin save
+        view_counters.clear()
+        project.title = 'Renamed'
+        with self.assertNumQueries(1):
+            project.save()
+        self.assertEqual(self.counters(), (1, 1))
+
+    def test_reconcile_repairs_drift_in_one_statement(self):
+        self.create_project(self.published)
+        self.create_project(self.completed)
+        Empresa.objects.filter(id=self.company.id).update(total_projects=10, projects_completed=0)
+        self.assertEqual(drifted_companies().count(), 1)
+
+        with self.assertNumQueries(1):
+            call_command('reconcile_company_counters', stdout=StringIO())
+        self.assertEqual(self.counters(), (2, 1))
+        self.assertEqual(drifted_companies().count(), 0)
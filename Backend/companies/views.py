@@ -3,13 +3,14 @@ Views para la app companies.
 """
 
 import json
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.db.models import Q
 from users.models import User
 from .models import Empresa, CalificacionEmpresa
 from core.views import verify_token
+from core.conditional import conditional_get, row_version
 import uuid
 import logging
 logger = logging.getLogger(__name__)
@@ -122,6 +123,9 @@ def companies_list(request):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@conditional_get(lambda request, companies_id: row_version(
+    Empresa.objects, companies_id, 'user__updated_at', 'user__last_login'
+))
 def companies_detail(request, companies_id):
     """Detalle de una empresa."""
     try:
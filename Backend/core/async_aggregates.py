@@ -0,0 +1,172 @@
+"""
+Ejecución concurrente de agregados independientes para vistas async.
+
+Los dashboards calculan muchos conteos y sumas que no dependen entre sí; en
+una vista síncrona la latencia es la suma de todos los viajes a la base de
+datos. `gather_aggregates()` lanza cada agregado en un pool de hilos acotado
+(vía `sync_to_async`) y los espera a la vez, de modo que la latencia se
+acerca a la del agregado más lento.
+
+- Cada agregado tiene su propio timeout, que corre desde que un hilo del
+  pool lo toma: si no termina a tiempo, o falla, se reporta como faltante y
+  el resto de los resultados se entrega igual (resultado parcial).
+- La espera en la cola del pool (todos los hilos ocupados) se acota aparte
+  con QUEUE_TIMEOUT ('queue_timeout' en `missing`; el agregado ya no se
+  ejecuta) y se reporta en `results.queue_wait` (segundos por agregado).
+- El pool es compartido por el proceso y su tamaño (`MAX_WORKERS`) acota las
+  conexiones adicionales que abren los dashboards: cada hilo usa su propia
+  conexión, que se recicla según CONN_MAX_AGE como en una petición normal.
+- Un agregado vencido no se puede cancelar en el driver: su hilo sigue
+  ocupado hasta que la consulta termina. Por eso el pool es acotado y el
+  timeout conviene combinarlo con el límite de tiempo de consulta del motor.
+- Con `MAX_WORKERS = 0` los agregados corren uno tras otro en el hilo de la
+  petición, como en las vistas síncronas (útil con SQLite y en tests).
+- Las lecturas marcadas con `read_from_replica` siguen yendo a la réplica:
+  `sync_to_async` copia el contexto de la vista a cada hilo.
+
+Uso:
+
+    results = await gather_aggregates({
+        'total_users': User.objects.count,
+        'pending': lambda: Aplicacion.objects.filter(status='pending').count(),
+    })
+    results['total_users']  # None si venció o falló
+    results.missing         # {'pending': 'timeout'}
+    results.queue_wait      # {'total_users': 0.0, 'pending': 0.12}
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ASYNC_AGGREGATES_SETTINGS = {
+    'MAX_WORKERS': 8,
+    'TIMEOUT': 5.0,         # Segundos por agregado, desde que un hilo lo toma
+    'QUEUE_TIMEOUT': 10.0,  # Segundos esperando un hilo libre
+}
+
+TIMEOUT = 'timeout'
+QUEUE_TIMEOUT = 'queue_timeout'
+ERROR = 'error'
+
+
+def aggregates_setting(name):
+    return getattr(settings, 'ASYNC_AGGREGATES', {}).get(name, DEFAULT_ASYNC_AGGREGATES_SETTINGS[name])
+
+
+class AggregateResults(dict):
+    """Resultados por nombre; `missing` indica los que vencieron o fallaron"""
+
+    def __init__(self, values, missing, queue_wait=None):
+        super().__init__(values)
+        self.missing = missing
+        self.queue_wait = queue_wait or {}
+
+    @property
+    def partial(self):
+        return bool(self.missing)
+
+
+_executor = None
+_executor_size = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Pool de hilos del proceso (se recrea si cambia MAX_WORKERS)"""
+    global _executor, _executor_size
+    size = aggregates_setting('MAX_WORKERS')
+    with _executor_lock:
+        if _executor is None or _executor_size != size:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix='aggregates')
+            _executor_size = size
+        return _executor
+
+
+def _run_aggregate(func):
+    # Como en request_started/request_finished: descarta conexiones vencidas o rotas
+    close_old_connections()
+    try:
+        return func()
+    finally:
+        close_old_connections()
+
+
+async def _start_pooled(name, func):
+    """
+    Encola `func` en el pool y espera (hasta QUEUE_TIMEOUT) a que un hilo la
+    tome. Retorna (tarea, segundos en cola); la tarea es None si venció la
+    espera, y en ese caso el agregado ya no se ejecuta.
+    """
+    loop = asyncio.get_running_loop()
+    started = asyncio.Event()
+    abandoned = threading.Event()
+
+    def run():
+        if abandoned.is_set():
+            return None
+        loop.call_soon_threadsafe(started.set)
+        return _run_aggregate(func)
+
+    queued_at = time.monotonic()
+    call = asyncio.ensure_future(sync_to_async(run, thread_sensitive=False, executor=get_executor())())
+    waiting = asyncio.ensure_future(started.wait())
+    # También termina si la tarea falla antes de empezar
+    await asyncio.wait({call, waiting}, timeout=aggregates_setting('QUEUE_TIMEOUT'),
+                       return_when=asyncio.FIRST_COMPLETED)
+    waiting.cancel()
+    queue_wait = time.monotonic() - queued_at
+    if not started.is_set() and not call.done():
+        abandoned.set()
+        call.cancel()
+        return None, queue_wait
+    return call, queue_wait
+
+
+async def _run(name, func, timeout):
+    queue_wait = None
+    try:
+        if aggregates_setting('MAX_WORKERS'):
+            call, queue_wait = await _start_pooled(name, func)
+            if call is None:
+                logger.warning(f"Agregado '{name}' esperó más de {queue_wait:.2f}s un hilo libre")
+                return name, None, QUEUE_TIMEOUT, queue_wait
+        else:
+            call = sync_to_async(func)()
+        return name, await asyncio.wait_for(call, timeout), None, queue_wait
+    except asyncio.TimeoutError:
+        logger.warning(f"Agregado '{name}' superó el timeout de {timeout}s")
+        return name, None, TIMEOUT, queue_wait
+    except Exception:
+        logger.exception(f"Error calculando el agregado '{name}'")
+        return name, None, ERROR, queue_wait
+
+
+async def gather_aggregates(aggregates, timeout=None):
+    """
+    Ejecuta a la vez los agregados `{nombre: función sin argumentos}` y
+    retorna un AggregateResults con el valor de cada uno (None si venció o
+    falló), `missing = {nombre: 'timeout' | 'queue_timeout' | 'error'}` y,
+    con pool, `queue_wait = {nombre: segundos esperando un hilo}`.
+    """
+    timeout = aggregates_setting('TIMEOUT') if timeout is None else timeout
+    runs = [_run(name, func, timeout) for name, func in aggregates.items()]
+    if aggregates_setting('MAX_WORKERS'):
+        outcomes = await asyncio.gather(*runs)
+    else:
+        # Sin pool: en serie, para que el timeout de cada uno no cuente la espera de los demás
+        outcomes = [await run for run in runs]
+    values = {name: value for name, value, _, _ in outcomes}
+    missing = {name: reason for name, _, reason, _ in outcomes if reason}
+    queue_wait = {name: round(wait, 3) for name, _, _, wait in outcomes if wait is not None}
+    return AggregateResults(values, missing, queue_wait)
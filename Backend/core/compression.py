@@ -0,0 +1,189 @@
+"""
+Compresión de respuestas JSON para LeanMaker Backend.
+
+Incluye la negociación de `Accept-Encoding`, compresión gzip y brotli
+(opcional, solo si el paquete `brotli` está instalado) y un helper para
+cachear respuestas JSON ya comprimidas: cada entrada de cache guarda una
+variante por codificación, de modo que un hit se sirve sin volver a
+serializar ni a comprimir.
+"""
+
+import gzip
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import StreamingBuffer
+
+from .responses import dumps
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depende del entorno
+    brotli = None
+
+IDENTITY = 'identity'
+
+# Orden de preferencia cuando el cliente acepta varias codificaciones
+PREFERRED_ENCODINGS = ('br', 'gzip') if brotli else ('gzip',)
+
+COMPRESSIBLE_CONTENT_TYPES = ('application/json', 'application/x-ndjson')
+
+
+def min_size():
+    """Tamaño mínimo (bytes) a partir del cual vale la pena comprimir"""
+    return getattr(settings, 'JSON_COMPRESSION_MIN_SIZE', 1024)
+
+
+def is_compressible_content_type(content_type):
+    content_type = (content_type or '').split(';')[0].strip().lower()
+    return content_type in COMPRESSIBLE_CONTENT_TYPES or content_type.endswith('+json')
+
+
+def negotiate_encoding(request, available=PREFERRED_ENCODINGS):
+    """
+    Elige la mejor codificación aceptada por el cliente entre `available`.
+
+    Respeta los pesos `q` de Accept-Encoding (q=0 rechaza la codificación)
+    y retorna None si no hay ninguna aceptable.
+    """
+    header = request.META.get('HTTP_ACCEPT_ENCODING', '')
+    if not header:
+        return None
+
+    accepted = {}
+    for part in header.split(','):
+        token, _, params = part.strip().partition(';')
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in PREFERRED_ENCODINGS:
+        if encoding not in available:
+            continue
+        quality = accepted.get(encoding, accepted.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(content, encoding):
+    """Comprime bytes con la codificación indicada ('gzip' o 'br')"""
+    if encoding == 'br':
+        quality = getattr(settings, 'JSON_COMPRESSION_BROTLI_QUALITY', 5)
+        return brotli.compress(content, quality=quality)
+    level = getattr(settings, 'JSON_COMPRESSION_GZIP_LEVEL', 6)
+    # mtime=0 produce una salida determinista (misma entrada -> mismos bytes)
+    return gzip.compress(content, compresslevel=level, mtime=0)
+
+
+def compress_stream(chunks, encoding):
+    """Comprime un iterable de bytes de forma incremental (respuestas streaming)"""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=getattr(settings, 'JSON_COMPRESSION_BROTLI_QUALITY', 5))
+        for chunk in chunks:
+            data = compressor.process(chunk)
+            if data:
+                yield data
+            yield compressor.flush()
+        yield compressor.finish()
+        return
+
+    compressor = _GzipStream()
+    for chunk in chunks:
+        yield compressor.write(chunk)
+    yield compressor.close()
+
+
+async def compress_async_stream(chunks, encoding):
+    """Versión asíncrona de compress_stream para StreamingHttpResponse asíncronas"""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=getattr(settings, 'JSON_COMPRESSION_BROTLI_QUALITY', 5))
+        async for chunk in chunks:
+            data = compressor.process(chunk)
+            if data:
+                yield data
+            yield compressor.flush()
+        yield compressor.finish()
+        return
+
+    compressor = _GzipStream()
+    async for chunk in chunks:
+        yield compressor.write(chunk)
+    yield compressor.close()
+
+
+class _GzipStream:
+    """Compresor gzip incremental que vacía el buffer tras cada fragmento"""
+
+    def __init__(self):
+        self.buffer = StreamingBuffer()
+        self.file = gzip.GzipFile(
+            mode='wb',
+            compresslevel=getattr(settings, 'JSON_COMPRESSION_GZIP_LEVEL', 6),
+            fileobj=self.buffer,
+            mtime=0,
+        )
+
+    def write(self, chunk):
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        self.file.write(chunk)
+        self.file.flush()
+        return self.buffer.read()
+
+    def close(self):
+        self.file.close()
+        return self.buffer.read()
+
+
+def build_variants(content):
+    """
+    Genera las variantes de una respuesta: sin comprimir y, si supera el
+    umbral, una por cada codificación disponible.
+    """
+    variants = {IDENTITY: content}
+    if len(content) >= min_size():
+        for encoding in PREFERRED_ENCODINGS:
+            variants[encoding] = compress(content, encoding)
+    return variants
+
+
+def response_from_variants(request, variants, status=200):
+    """Construye la respuesta con la variante adecuada para el cliente"""
+    encoding = negotiate_encoding(request, available=variants.keys())
+    response = HttpResponse(
+        variants[encoding or IDENTITY],
+        content_type='application/json',
+        status=status,
+    )
+    if encoding:
+        response['Content-Encoding'] = encoding
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
+def cached_json_response(request, cache_key, build_data, timeout=300):
+    """
+    Respuesta JSON cacheada con sus variantes ya comprimidas.
+
+    `build_data` solo se ejecuta en un miss; en un hit la respuesta se sirve
+    directamente desde los bytes guardados. Las respuestas llevan
+    Content-Encoding, así que el middleware de compresión no las procesa
+    de nuevo.
+    """
+    variants = cache.get(cache_key)
+    if variants is None:
+        variants = build_variants(dumps(build_data()))
+        cache.set(cache_key, variants, timeout)
+    return response_from_variants(request, variants)
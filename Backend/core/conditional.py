@@ -0,0 +1,128 @@
+"""
+GET condicional (ETag / Last-Modified) a partir de `updated_at`.
+
+El frontend vuelve a pedir los detalles y listados en cada navegación. Con
+`@conditional_get(version)` la vista calcula antes que nada una "versión"
+del recurso con una sola consulta liviana y, si el cliente ya la tiene
+(If-None-Match / If-Modified-Since), responde 304 sin cargar ni serializar
+nada:
+
+- Detalle: `row_version(queryset, pk, ...)` -> `updated_at` de la fila (y de
+  las relaciones que muestra la respuesta) en una consulta.
+- Listado: `list_version(queryset)` -> `MAX(updated_at)` + `COUNT(*)`; el
+  conteo detecta los borrados.
+
+El ETag es un HMAC de la versión, de la vista y del usuario del token (las
+respuestas dependen de quién pregunta), así que no se puede construir desde
+afuera. Si no hay un token válido, o la versión es None (fila inexistente o
+id inválido), la vista corre normalmente y responde su 401/404.
+
+Las respuestas 200 llevan ETag, Last-Modified, `Cache-Control: private,
+no-cache` (el navegador siempre revalida) y `Vary: Authorization`.
+
+Uso:
+
+    @conditional_get(lambda request, project_id: row_version(Proyecto.objects, project_id))
+    def projects_detail(request, project_id):
+        ...
+
+`updated_at` es `auto_now`: los `.update()` y los `save(update_fields=...)`
+que cambien campos visibles deben incluirlo (ChangeTrackingMixin lo agrega
+solo en los guardados parciales).
+"""
+
+from calendar import timegm
+from datetime import datetime
+from functools import wraps
+
+import jwt
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.crypto import salted_hmac
+from django.utils.http import http_date, quote_etag
+
+
+def token_user_id(request):
+    """user_id de un Bearer token válido (firma y expiración), sin consultar la base de datos"""
+    auth_header = request.headers.get('Authorization')
+    if not auth_header or not auth_header.startswith('Bearer '):
+        return None
+    try:
+        payload = jwt.decode(auth_header.split(' ')[1], settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+    except jwt.InvalidTokenError:
+        return None
+    return payload.get('user_id')
+
+
+def row_version(queryset, pk, *fields, **aggregates):
+    """
+    Versión de una fila: su `updated_at`, los `fields` relacionados (p. ej.
+    'company__updated_at') y los `aggregates` (p. ej. Max/Count de una
+    relación), en una consulta. None si la fila no existe.
+    """
+    rows = queryset.filter(pk=pk).values_list('updated_at', *fields)
+    if aggregates:
+        rows = rows.annotate(**aggregates)
+    row = list(rows.order_by()[:1])
+    return row[0] if row else None
+
+
+def list_version(queryset, field='updated_at'):
+    """Versión de un listado: (MAX(field), COUNT(*)) en una consulta"""
+    version = queryset.order_by().aggregate(last_modified=Max(field), count=Count('pk'))
+    return version['last_modified'], version['count']
+
+
+def _validators(view_func, user_id, version):
+    message = repr((view_func.__module__, view_func.__qualname__, str(user_id), tuple(version)))
+    etag = quote_etag(salted_hmac('core.conditional', message).hexdigest()[:32])
+    timestamps = [value for value in version if isinstance(value, datetime)]
+    last_modified = timegm(max(timestamps).utctimetuple()) if timestamps else None
+    return etag, last_modified
+
+
+def _set_validators(response, etag, last_modified):
+    if not response.has_header('ETag'):
+        response['ETag'] = etag
+    if last_modified is not None and not response.has_header('Last-Modified'):
+        response['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ('Authorization',))
+
+
+def conditional_get(version_func, on_not_modified=None):
+    """
+    Decorador de vistas GET: responde 304 si la versión del recurso
+    (`version_func(request, *args, **kwargs)`, una tupla o None) coincide con
+    la que el cliente ya tiene. `on_not_modified(request, *args, **kwargs)`
+    corre también en las respuestas 304 (p. ej. para contar la vista).
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view_func(request, *args, **kwargs)
+            user_id = token_user_id(request)
+            if user_id is None:
+                return view_func(request, *args, **kwargs)
+            try:
+                version = version_func(request, *args, **kwargs)
+            except (ValueError, ValidationError):
+                version = None  # Id mal formado: la vista responde el error
+            if version is None:
+                return view_func(request, *args, **kwargs)
+
+            etag, last_modified = _validators(view_func, user_id, version)
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = view_func(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            elif response.status_code == 304 and on_not_modified is not None:
+                on_not_modified(request, *args, **kwargs)
+            _set_validators(response, etag, last_modified)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,312 @@
+"""
+Pool de conexiones para backends que no lo traen (mssql).
+
+Django abre una conexión por hilo y la cierra al terminar la petición (o al
+vencer CONN_MAX_AGE); contra Azure SQL cada conexión nueva paga el handshake
+TLS y el login, que dominan las peticiones en frío. Con el backend
+`core.db_backends.mssql_pooled` el "cierre" de Django devuelve la conexión
+física al pool del proceso y la siguiente petición, de cualquier hilo, la
+reutiliza:
+
+- Tamaño acotado (MAX_SIZE): si no hay conexiones libres y el pool está
+  lleno, la petición espera hasta TIMEOUT segundos y luego falla con
+  PoolTimeout (cuenta como waiter mientras espera).
+- Health check al sacar una conexión: `SELECT 1` si estuvo inactiva más de
+  HEALTH_CHECK_INTERVAL segundos; si falla se descarta y se usa otra.
+- Limpieza de inactivas: las conexiones sin uso por más de MAX_IDLE segundos
+  se cierran (sin bajar de MIN_SIZE), y ninguna se reutiliza pasados
+  MAX_LIFETIME segundos desde que se abrió.
+- Al devolverla se hace rollback; si falla, o si Django marcó errores en la
+  conexión, se descarta en lugar de volver al pool.
+- Métricas por alias (`pool_stats()`): abiertas, en uso, libres, waiters,
+  timeouts, health checks fallidos, cerradas por inactividad y latencia de
+  checkout (promedio, p95 y máximo de las últimas CHECKOUT_SAMPLES).
+
+Configuración por alias en DATABASES (CONN_MAX_AGE debe ser 0: la vida de
+las conexiones la maneja el pool). core.database_config la define para SQL
+Server y settings la usa con DB_ENGINE=mssql:
+
+    'ENGINE': 'core.db_backends.mssql_pooled',
+    'CONN_MAX_AGE': 0,
+    'POOL': {'MAX_SIZE': 20, 'MIN_SIZE': 2, 'MAX_IDLE': 300},
+
+La lógica del pool no depende del motor: recibe funciones para abrir,
+validar, reiniciar y cerrar conexiones DB-API.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SETTINGS = {
+    'MAX_SIZE': 20,
+    'MIN_SIZE': 0,
+    'TIMEOUT': 30.0,                # Segundos esperando una conexión libre
+    'MAX_IDLE': 300.0,              # Segundos sin uso antes de cerrarla
+    'MAX_LIFETIME': 3600.0,         # Segundos desde que se abrió
+    'HEALTH_CHECK_INTERVAL': 30.0,  # Inactividad a partir de la cual se valida al sacarla
+}
+
+CHECKOUT_SAMPLES = 1000
+
+
+class PoolTimeout(Exception):
+    """No se liberó ninguna conexión dentro del timeout del pool"""
+
+
+def ping(connection):
+    """Health check por defecto: SELECT 1 con un cursor DB-API"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute('SELECT 1')
+        cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+class _Entry:
+    __slots__ = ('connection', 'created_at', 'last_used')
+
+    def __init__(self, connection, now):
+        self.connection = connection
+        self.created_at = now
+        self.last_used = now
+
+
+class ConnectionPool:
+    """Pool acotado y thread-safe de conexiones DB-API"""
+
+    def __init__(self, connect=None, max_size=20, min_size=0, timeout=30.0, max_idle=300.0,
+                 max_lifetime=3600.0, health_check_interval=30.0, health_check=ping,
+                 reset=lambda connection: connection.rollback(), close=lambda connection: connection.close()):
+        if max_size < 1:
+            raise ValueError('max_size debe ser al menos 1')
+        self.max_size = max_size
+        self.min_size = min(min_size, max_size)
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+        self._connect = connect
+        self._health_check = health_check
+        self._reset = reset
+        self._close = close
+
+        self._lock = threading.Condition()
+        self._idle = deque()   # Las más recientes a la derecha
+        self._in_use = {}      # id(conexión) -> _Entry
+        self._size = 0         # Abiertas, incluidas las que se están abriendo
+        self._waiters = 0
+        self._checkout_ms = deque(maxlen=CHECKOUT_SAMPLES)
+        self._counters = dict.fromkeys(
+            ('created', 'closed', 'checkouts', 'timeouts', 'health_check_failures', 'reaped', 'discarded'), 0,
+        )
+
+    def acquire(self, connect=None):
+        """
+        Saca una conexión (libre, o nueva si hay cupo); espera hasta `timeout`
+        si el pool está lleno. `connect` reemplaza a la función del pool para
+        abrir la conexión nueva.
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+        while True:
+            entry = self._checkout(deadline)
+            if entry is None:
+                entry = self._open(connect or self._connect)
+            elif not self._usable(entry):
+                continue
+            with self._lock:
+                self._in_use[id(entry.connection)] = entry
+                self._counters['checkouts'] += 1
+                self._checkout_ms.append((time.monotonic() - start) * 1000)
+            return entry.connection
+
+    def release(self, connection, discard=False):
+        """Devuelve una conexión al pool; con `discard` (o si el reset falla) se cierra"""
+        with self._lock:
+            entry = self._in_use.pop(id(connection), None)
+        if entry is None:
+            self._close_quietly(connection)
+            return
+
+        now = time.monotonic()
+        if not discard and now - entry.created_at < self.max_lifetime:
+            try:
+                self._reset(connection)
+            except Exception:
+                logger.warning('Conexión descartada: falló el reset al devolverla al pool', exc_info=True)
+                discard = True
+        else:
+            discard = True
+
+        if discard:
+            self._discard(entry, 'discarded')
+            return
+        entry.last_used = now
+        with self._lock:
+            self._idle.append(entry)
+            self._lock.notify()
+        self.reap()
+
+    def reap(self):
+        """Cierra las conexiones libres inactivas por más de max_idle o que superaron max_lifetime"""
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            # Las menos usadas están a la izquierda
+            while self._idle and self._size - len(expired) > self.min_size:
+                entry = self._idle[0]
+                if now - entry.last_used < self.max_idle and now - entry.created_at < self.max_lifetime:
+                    break
+                expired.append(self._idle.popleft())
+        for entry in expired:
+            self._discard(entry, 'reaped')
+
+    def close_all(self):
+        """Cierra las conexiones libres (las que están en uso se cierran al devolverlas)"""
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for entry in idle:
+            self._discard(entry, 'discarded')
+
+    def stats(self):
+        with self._lock:
+            samples = sorted(self._checkout_ms)
+            return {
+                'max_size': self.max_size,
+                'size': self._size,
+                'in_use': len(self._in_use),
+                'idle': len(self._idle),
+                'waiters': self._waiters,
+                **self._counters,
+                'checkout_ms': {
+                    'avg': round(sum(samples) / len(samples), 3) if samples else 0.0,
+                    'p95': round(samples[max(0, math.ceil(0.95 * len(samples)) - 1)], 3) if samples else 0.0,
+                    'max': round(samples[-1], 3) if samples else 0.0,
+                },
+            }
+
+    def _checkout(self, deadline):
+        """Entrada libre, o None si se reservó cupo para abrir una conexión nueva"""
+        with self._lock:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._size < self.max_size:
+                    self._size += 1
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._counters['timeouts'] += 1
+                    raise PoolTimeout(
+                        f'Sin conexiones libres tras {self.timeout}s (máximo {self.max_size})'
+                    )
+                self._waiters += 1
+                try:
+                    self._lock.wait(remaining)
+                finally:
+                    self._waiters -= 1
+
+    def _open(self, connect):
+        try:
+            connection = connect()
+        except Exception:
+            with self._lock:
+                self._size -= 1
+                self._lock.notify()
+            raise
+        with self._lock:
+            self._counters['created'] += 1
+        return _Entry(connection, time.monotonic())
+
+    def _usable(self, entry):
+        now = time.monotonic()
+        if now - entry.created_at >= self.max_lifetime:
+            self._discard(entry, 'reaped')
+            return False
+        if now - entry.last_used >= self.health_check_interval:
+            try:
+                self._health_check(entry.connection)
+            except Exception:
+                logger.warning('Conexión descartada: falló el health check', exc_info=True)
+                with self._lock:
+                    self._counters['health_check_failures'] += 1
+                self._discard(entry, 'discarded')
+                return False
+        return True
+
+    def _discard(self, entry, counter):
+        self._close_quietly(entry.connection)
+        with self._lock:
+            self._size -= 1
+            self._counters[counter] += 1
+            self._counters['closed'] += 1
+            self._lock.notify()
+
+    def _close_quietly(self, connection):
+        try:
+            self._close(connection)
+        except Exception:
+            logger.debug('Error cerrando una conexión del pool', exc_info=True)
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias, factory):
+    """Pool del proceso para un alias de base de datos (lo crea `factory()` la primera vez)"""
+    with _pools_lock:
+        if alias not in _pools:
+            _pools[alias] = factory()
+        return _pools[alias]
+
+
+def pool_stats():
+    """Métricas de los pools del proceso: {alias: stats}"""
+    with _pools_lock:
+        pools = dict(_pools)
+    return {alias: pool.stats() for alias, pool in sorted(pools.items())}
+
+
+def close_pools():
+    """Cierra las conexiones libres de todos los pools y los elimina"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close_all()
+
+
+class PooledDatabaseWrapperMixin:
+    """
+    Mixin para un DatabaseWrapper de Django: las conexiones físicas se sacan
+    del pool del alias y el cierre de Django las devuelve en lugar de cerrarlas.
+    La configuración se lee de la clave POOL del alias en DATABASES.
+    """
+
+    def pool_setting(self, name):
+        return self.settings_dict.get('POOL', {}).get(name, DEFAULT_POOL_SETTINGS[name])
+
+    def get_pool(self):
+        return get_pool(self.alias, lambda: ConnectionPool(
+            max_size=self.pool_setting('MAX_SIZE'),
+            min_size=self.pool_setting('MIN_SIZE'),
+            timeout=self.pool_setting('TIMEOUT'),
+            max_idle=self.pool_setting('MAX_IDLE'),
+            max_lifetime=self.pool_setting('MAX_LIFETIME'),
+            health_check_interval=self.pool_setting('HEALTH_CHECK_INTERVAL'),
+        ))
+
+    def get_new_connection(self, conn_params):
+        return self.get_pool().acquire(lambda: super(PooledDatabaseWrapperMixin, self).get_new_connection(conn_params))
+
+    def _close(self):
+        if self.connection is not None:
+            # Django marca errors_occurred tras un error de base de datos: esa conexión no vuelve al pool
+            self.get_pool().release(self.connection, discard=self.errors_occurred)
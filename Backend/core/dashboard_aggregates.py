@@ -0,0 +1,351 @@
+"""
+Agregados independientes de los dashboards por rol.
+
+Cada `*_aggregates()` retorna `{nombre: función}` con las consultas que no
+dependen entre sí, para ejecutarlas a la vez con
+core.async_aggregates.gather_aggregates(); cada `*_stats_response()` arma
+con los resultados la misma respuesta que la vista síncrona del dashboard.
+Los campos cuyo agregado venció o falló van en None y la respuesta indica
+`partial` y `missing` (`{agregado: 'timeout' | 'error'}`).
+"""
+
+from django.db.models import Avg, Case, Count, F, IntegerField, Q, Sum, When
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from core.reference_data import reference_data
+from students.dashboard import MONTHLY_ACTIVITY_MONTHS, _month_key, _month_starts
+
+# Estados de aplicación que cuentan como estudiante trabajando en el proyecto
+WORKING_APPLICATION_STATUSES = ['accepted', 'completed']
+
+
+def _first_day_of_month():
+    return timezone.localtime(timezone.now()).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _field(results, name, key=None):
+    """Valor de un agregado (o de una clave suya); None si el agregado falta"""
+    value = results.get(name)
+    if value is None or key is None:
+        return value
+    return value[key]
+
+
+def _partial(response, results):
+    response['partial'] = results.partial
+    response['missing'] = results.missing
+    return response
+
+
+def _monthly_counts(queryset, date_field, since):
+    """Conteo por mes (una consulta agrupada): {(año, mes): cantidad}"""
+    return {
+        _month_key(row['month']): row['count']
+        for row in queryset.filter(**{f'{date_field}__gte': since})
+        .annotate(month=TruncMonth(date_field))
+        .order_by()
+        .values('month')
+        .annotate(count=Count('id'))
+    }
+
+
+# ===== EMPRESA =====
+
+def company_aggregates(company):
+    from applications.models import Aplicacion
+    from evaluations.models import Evaluation
+    from projects.models import Proyecto
+
+    projects = Proyecto.objects.filter(company=company)
+    applications = Aplicacion.objects.filter(project__company=company)
+    first_day_month = _first_day_of_month()
+    since = _month_starts(MONTHLY_ACTIVITY_MONTHS)[0]
+
+    def project_counts():
+        return projects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(status_id__in=reference_data.status_ids('active'))),
+            published=Count('id', filter=Q(status_id__in=reference_data.status_ids('published'))),
+            completed=Count('id', filter=Q(status_id__in=reference_data.status_ids('completed'))),
+            this_month=Count('id', filter=Q(created_at__gte=first_day_month)),
+            hours_offered=Sum(Case(
+                When(required_hours__isnull=False, then=F('required_hours')),
+                default=F('hours_per_week') * F('duration_weeks'),
+                output_field=IntegerField(),
+            )),
+        )
+
+    def published_with_students():
+        # Proyectos publicados que ya tienen estudiantes aceptados
+        return projects.filter(
+            status_id__in=reference_data.status_ids('published'),
+            project_applications__estado__in=WORKING_APPLICATION_STATUSES,
+        ).distinct().count()
+
+    def application_counts():
+        return applications.aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status='pending')),
+            this_month=Count('id', filter=Q(applied_at__gte=first_day_month)),
+            active_students=Count('student', distinct=True, filter=Q(status__in=WORKING_APPLICATION_STATUSES)),
+        )
+
+    def rating():
+        average = Evaluation.objects.filter(
+            project__company=company,
+            status='completed',
+            evaluation_type='student_to_company',
+        ).aggregate(average=Avg('score'))['average']
+        return round(average, 2) if average is not None else 0.0
+
+    def evaluations():
+        # Estudiantes de proyectos completados y cuántos ya fueron evaluados
+        completed_projects = projects.filter(status_id__in=reference_data.status_ids('completed'))
+        students = Aplicacion.objects.filter(
+            project__in=completed_projects,
+            status__in=WORKING_APPLICATION_STATUSES,
+        ).values('student').distinct()
+        total = students.count()
+        evaluated = Evaluation.objects.filter(
+            project__in=completed_projects,
+            student__in=students.values_list('student', flat=True),
+            evaluation_type='student_to_company',
+            status='completed',
+        ).values('student', 'project').distinct().count()
+        return {'total': total, 'evaluated': evaluated}
+
+    def area_distribution():
+        return [
+            {'name': row['area__name'], 'count': row['count']}
+            for row in projects.filter(area__isnull=False)
+            .values('area__name')
+            .annotate(count=Count('id'))
+            .order_by('-count')
+        ]
+
+    return {
+        'project_counts': project_counts,
+        'published_with_students': published_with_students,
+        'application_counts': application_counts,
+        'rating': rating,
+        'evaluations': evaluations,
+        'area_distribution': area_distribution,
+        'monthly_projects': lambda: _monthly_counts(projects, 'created_at', since),
+        'monthly_applications': lambda: _monthly_counts(applications, 'applied_at', since),
+    }
+
+
+def company_stats_response(results):
+    project_counts = results.get('project_counts')
+    published_with_students = results.get('published_with_students')
+    evaluations = results.get('evaluations')
+
+    active_projects = None
+    if project_counts is not None and published_with_students is not None:
+        active_projects = project_counts['active'] + published_with_students
+
+    area_data = results.get('area_distribution')
+    if area_data == [] and project_counts is not None:
+        # Sin áreas asignadas: todos los proyectos (si hay) van sin área
+        total = project_counts['total']
+        area_data = [{'name': 'Sin área asignada' if total else 'Sin proyectos', 'count': total}]
+
+    monthly_activity = None
+    monthly_projects = results.get('monthly_projects')
+    monthly_applications = results.get('monthly_applications')
+    if monthly_projects is not None and monthly_applications is not None:
+        monthly_activity = [
+            {
+                'month': month_start.strftime('%B %Y'),
+                'projects': monthly_projects.get((month_start.year, month_start.month), 0),
+                'applications': monthly_applications.get((month_start.year, month_start.month), 0),
+            }
+            for month_start in _month_starts(MONTHLY_ACTIVITY_MONTHS)
+        ]
+
+    evaluations_pending = None
+    if evaluations is not None:
+        evaluations_pending = evaluations['total'] - evaluations['evaluated']
+
+    return _partial({
+        'total_projects': _field(results, 'project_counts', 'total'),
+        'active_projects': active_projects,
+        'published_projects': _field(results, 'project_counts', 'published'),
+        'total_applications': _field(results, 'application_counts', 'total'),
+        'pending_applications': _field(results, 'application_counts', 'pending'),
+        'completed_projects': _field(results, 'project_counts', 'completed'),
+        'active_students': _field(results, 'application_counts', 'active_students'),
+        'rating': results.get('rating'),
+        'total_hours_offered': (project_counts['hours_offered'] or 0) if project_counts is not None else None,
+        'projects_this_month': _field(results, 'project_counts', 'this_month'),
+        'applications_this_month': _field(results, 'application_counts', 'this_month'),
+        'area_distribution': area_data,
+        'monthly_activity': monthly_activity,
+        'recent_activity': [],
+        'evaluations_pending': evaluations_pending,
+        'evaluations_completed': _field(results, 'evaluations', 'evaluated'),
+        'evaluations_total_students': _field(results, 'evaluations', 'total'),
+    }, results)
+
+
+# ===== ESTUDIANTE =====
+
+def student_aggregates(student, user):
+    from notifications.counters import get_unread_count
+    from students.dashboard import get_student_dashboard_stats
+
+    return {
+        'stats': lambda: get_student_dashboard_stats(student),
+        'unread_notifications': lambda: get_unread_count(user),
+    }
+
+
+def student_stats_response(student, results):
+    stats = results.get('stats') or {}
+    return _partial({
+        'total_applications': stats.get('total_applications'),
+        'pending_applications': stats.get('pending_applications'),
+        'accepted_applications': stats.get('accepted_applications'),
+        'total_projects': stats.get('total_projects'),
+        'active_projects': stats.get('active_projects'),
+        'completed_projects': stats.get('completed_projects'),
+        'api_level': student.api_level,
+        'total_hours': student.total_hours,
+        'strikes': student.strikes,
+        'gpa': float(student.gpa),
+        'available_projects': stats.get('available_projects'),
+        'unread_notifications': results.get('unread_notifications'),
+        'application_distribution': stats.get('application_distribution'),
+        'monthly_activity': stats.get('monthly_activity'),
+        'recent_activity': [],
+    }, results)
+
+
+# ===== ADMINISTRADOR =====
+
+def admin_aggregates():
+    from applications.models import Aplicacion
+    from companies.models import Empresa
+    from project_status.models import ProjectStatus
+    from projects.models import Proyecto
+    from strikes.models import StrikeReport
+    from students.models import ApiLevelRequest, Estudiante
+    from users.models import User
+    from work_hours.models import WorkHour
+
+    def active_projects():
+        in_progress = ProjectStatus.objects.filter(name='in-progress').values_list('id', flat=True).first()
+        if in_progress is not None:
+            return Proyecto.objects.filter(status_id=in_progress).count()
+        # Sin el estado 'in-progress': proyectos con estudiantes trabajando
+        return Proyecto.objects.filter(
+            application_project__status__in=['accepted', 'completed']
+        ).distinct().count()
+
+    def top_students():
+        students = (
+            Estudiante.objects.select_related('user')
+            .annotate(
+                calculated_total_hours=Sum('work_hours__hours_worked'),
+                unique_projects=Count('work_hours__project', distinct=True),
+            )
+            .filter(calculated_total_hours__isnull=False)
+            .order_by('-calculated_total_hours')[:10]
+        )
+        top = []
+        for student in students:
+            user = student.user
+            user_data = None
+            if user:
+                user_data = {
+                    'id': str(user.id),
+                    'email': user.email,
+                    'first_name': user.first_name or '',
+                    'last_name': user.last_name or '',
+                    'full_name': f"{user.first_name or ''} {user.last_name or ''}".strip() or user.email,
+                }
+            top.append({
+                'student_id': str(student.id),
+                'user_data': user_data,
+                'total_hours': float(student.calculated_total_hours or 0),
+                'completed_projects': student.unique_projects,
+                'api_level': student.api_level or 1,
+                'strikes': student.strikes or 0,
+                'gpa': float(student.gpa or 0.0),
+                'career': student.career or 'No especificada',
+                'university': getattr(student, 'university', 'No especificada') or 'No especificada',
+            })
+        return top
+
+    return {
+        'total_users': User.objects.count,
+        'total_companies': Empresa.objects.count,
+        'total_students': Estudiante.objects.count,
+        'total_projects': Proyecto.objects.count,
+        'pending_applications': Aplicacion.objects.filter(status='pending').count,
+        'strikes_alerts': StrikeReport.objects.filter(status='pending').count,
+        'api_questionnaire_requests': ApiLevelRequest.objects.filter(status='pending').count,
+        'active_projects': active_projects,
+        'pending_hours': WorkHour.objects.filter(is_verified=False).count,
+        'top_students': top_students,
+    }
+
+
+def admin_stats_response(results):
+    return _partial({
+        'total_users': results.get('total_users'),
+        'total_companies': results.get('total_companies'),
+        'total_students': results.get('total_students'),
+        'total_projects': results.get('total_projects'),
+        'pending_applications': results.get('pending_applications'),
+        'strikes_alerts': results.get('strikes_alerts'),
+        'api_questionnaire_requests': results.get('api_questionnaire_requests'),
+        'active_projects': results.get('active_projects'),
+        'pending_hours': results.get('pending_hours'),
+        # Por ahora todos los proyectos cuentan como desafíos colectivos
+        'collective_challenges': results.get('total_projects'),
+        'top_students': results.get('top_students'),
+        'recent_activity': [],
+    }, results)
+
+
+# ===== PROFESOR =====
+
+def teacher_aggregates(user):
+    from teachers.models import TeacherEvaluation, TeacherProject, TeacherStudent
+
+    def supervised_students():
+        return TeacherStudent.objects.filter(teacher=user).aggregate(
+            total=Count('id'),
+            hours=Sum('total_hours_supervised'),
+        )
+
+    def evaluations():
+        return dict(
+            TeacherEvaluation.objects.filter(teacher=user, status__in=['completed', 'pending'])
+            .order_by()
+            .values_list('status')
+            .annotate(count=Count('id'))
+        )
+
+    return {
+        'supervised_students': supervised_students,
+        'active_projects': TeacherProject.objects.filter(teacher=user).count,
+        'evaluations': evaluations,
+    }
+
+
+def teacher_stats_response(results):
+    students = results.get('supervised_students')
+    evaluations = results.get('evaluations')
+    return _partial({
+        'total_students': students['total'] if students is not None else None,
+        'active_projects': results.get('active_projects'),
+        'completed_evaluations': evaluations.get('completed', 0) if evaluations is not None else None,
+        'pending_evaluations': evaluations.get('pending', 0) if evaluations is not None else None,
+        'total_hours_supervised': float(students['hours'] or 0) if students is not None else None,
+        'notifications': 0,  # Placeholder para notificaciones
+        'student_distribution': [],
+        'monthly_activity': [],
+    }, results)
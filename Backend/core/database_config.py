@@ -1,20 +1,23 @@
 """
 Configuración optimizada de base de datos para LeanMaker Backend
 Optimizado para 3000 estudiantes + 1000 empresas
+
+core/settings.py usa DATABASE_CONFIG como DATABASES cuando DB_ENGINE=mssql
+(con el valor por defecto, sqlite, este módulo no se importa). Los valores
+se leen del entorno o de .env, igual que en settings.
 """
 
-import os
-from django.conf import settings
+from decouple import config
 
 # Configuración de base de datos optimizada para alta carga
 DATABASE_CONFIG = {
     'default': {
-        'ENGINE': 'mssql',
-        'NAME': os.getenv('DB_NAME', 'leanmaker_db'),
-        'USER': os.getenv('DB_USER', 'tesisadministrador'),
-        'PASSWORD': os.getenv('DB_PASSWORD', 'Admin@tesis'),
-        'HOST': os.getenv('DB_HOST', 'tesisservidor.database.windows.net'),
-        'PORT': os.getenv('DB_PORT', '1433'),
+        'ENGINE': 'core.db_backends.mssql_pooled',  # mssql + core.connection_pool
+        'NAME': config('DB_NAME', default='leanmaker_db'),
+        'USER': config('DB_USER', default='tesisadministrador'),
+        'PASSWORD': config('DB_PASSWORD', default='Admin@tesis'),
+        'HOST': config('DB_HOST', default='tesisservidor.database.windows.net'),
+        'PORT': config('DB_PORT', default='1433'),
         'OPTIONS': {
             'driver': 'ODBC Driver 17 for SQL Server',
             'TrustServerCertificate': 'yes',
@@ -23,80 +26,49 @@ DATABASE_CONFIG = {
             'command_timeout': 30,
             'autocommit': True,
             'isolation_level': 'READ_COMMITTED',
-            'max_connections': 100,
-            'min_connections': 10,
-            'connection_lifetime': 3600,  # 1 hora
-            'connection_retry_count': 3,
-            'connection_retry_delay': 1,
+            'connection_retries': 3,
+            'connection_retry_backoff_time': 1,
+        },
+        # Pool por proceso (core.connection_pool): Django devuelve la conexión al terminar cada petición
+        'POOL': {
+            'MAX_SIZE': config('DB_POOL_MAX_SIZE', default=20, cast=int),
+            'MIN_SIZE': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+            'TIMEOUT': 30,
+            'MAX_IDLE': 300,
+            'MAX_LIFETIME': 3600,  # 1 hora
+            'HEALTH_CHECK_INTERVAL': 30,
         },
-        'CONN_MAX_AGE': 3600,  # 1 hora
-        'CONN_HEALTH_CHECKS': True,
+        'CONN_MAX_AGE': 0,  # La vida de las conexiones la maneja el pool
         'ATOMIC_REQUESTS': False,  # Deshabilitar para mejor rendimiento
         'AUTOCOMMIT': True,
     }
 }
 
-# Configuración de pool de conexiones
-DATABASE_POOL_CONFIG = {
-    'max_connections': 100,
-    'min_connections': 10,
-    'connection_lifetime': 3600,
-    'connection_retry_count': 3,
-    'connection_retry_delay': 1,
-    'connection_timeout': 30,
-    'command_timeout': 30,
-}
+# Réplica de lectura (core.db_router): réplica geo o de escalado de lectura de Azure SQL.
+# Solo se agrega si DB_REPLICA_HOST está definido; usa las mismas credenciales del primario.
+if config('DB_REPLICA_HOST', default=''):
+    DATABASE_CONFIG['replica'] = {
+        **DATABASE_CONFIG['default'],
+        'NAME': config('DB_REPLICA_NAME', default=DATABASE_CONFIG['default']['NAME']),
+        'HOST': config('DB_REPLICA_HOST'),
+        'OPTIONS': {
+            **DATABASE_CONFIG['default']['OPTIONS'],
+            'extra_params': 'ApplicationIntent=ReadOnly',
+        },
+        'POOL': {
+            **DATABASE_CONFIG['default']['POOL'],
+            'MAX_SIZE': config('DB_REPLICA_POOL_MAX_SIZE', default=10, cast=int),
+        },
+        'TEST': {'MIRROR': 'default'},
+    }
 
-# Configuración de índices recomendados
-RECOMMENDED_INDEXES = [
-    # Índices para usuarios
-    "CREATE INDEX IX_users_email ON users_user(email)",
-    "CREATE INDEX IX_users_username ON users_user(username)",
-    "CREATE INDEX IX_users_is_active ON users_user(is_active)",
-    "CREATE INDEX IX_users_date_joined ON users_user(date_joined)",
-    
-    # Índices para estudiantes
-    "CREATE INDEX IX_students_user_id ON students_student(user_id)",
-    "CREATE INDEX IX_students_student_id ON students_student(student_id)",
-    "CREATE INDEX IX_students_area_id ON students_student(area_id)",
-    "CREATE INDEX IX_students_is_active ON students_student(is_active)",
-    
-    # Índices para empresas
-    "CREATE INDEX IX_companies_user_id ON companies_company(user_id)",
-    "CREATE INDEX IX_companies_name ON companies_company(name)",
-    "CREATE INDEX IX_companies_is_active ON companies_company(is_active)",
-    "CREATE INDEX IX_companies_created_at ON companies_company(created_at)",
-    
-    # Índices para proyectos
-    "CREATE INDEX IX_projects_title ON projects_project(title)",
-    "CREATE INDEX IX_projects_status ON projects_project(status)",
-    "CREATE INDEX IX_projects_company_id ON projects_project(company_id)",
-    "CREATE INDEX IX_projects_created_at ON projects_project(created_at)",
-    "CREATE INDEX IX_projects_updated_at ON projects_project(updated_at)",
-    
-    # Índices para aplicaciones
-    "CREATE INDEX IX_applications_student_id ON applications_application(student_id)",
-    "CREATE INDEX IX_applications_project_id ON applications_application(project_id)",
-    "CREATE INDEX IX_applications_status ON applications_application(status)",
-    "CREATE INDEX IX_applications_created_at ON applications_application(created_at)",
-    
-    # Índices para evaluaciones
-    "CREATE INDEX IX_evaluations_student_id ON evaluations_evaluation(student_id)",
-    "CREATE INDEX IX_evaluations_project_id ON evaluations_evaluation(project_id)",
-    "CREATE INDEX IX_evaluations_evaluator_id ON evaluations_evaluation(evaluator_id)",
-    "CREATE INDEX IX_evaluations_created_at ON evaluations_evaluation(created_at)",
-    
-    # Índices para notificaciones
-    "CREATE INDEX IX_notifications_user_id ON notifications_notification(user_id)",
-    "CREATE INDEX IX_notifications_is_read ON notifications_notification(is_read)",
-    "CREATE INDEX IX_notifications_created_at ON notifications_notification(created_at)",
-    
-    # Índices para horas de trabajo
-    "CREATE INDEX IX_work_hours_student_id ON work_hours_workhour(student_id)",
-    "CREATE INDEX IX_work_hours_project_id ON work_hours_workhour(project_id)",
-    "CREATE INDEX IX_work_hours_date ON work_hours_workhour(date)",
-    "CREATE INDEX IX_work_hours_created_at ON work_hours_workhour(created_at)",
-]
+DATABASE_ROUTERS = ['core.db_router.ReplicaRouter']
+
+# Pool de conexiones: clave POOL de cada alias (ver core.connection_pool).
+# Métricas por proceso en GET /api/admin/db-pool/.
+
+# Índices: se declaran en Meta.indexes de cada modelo (con su migración) y se
+# auditan contra el workload real con `python manage.py index_advisor`.
 
 # Configuración de consultas optimizadas
 OPTIMIZED_QUERIES = {
@@ -0,0 +1,22 @@
+"""
+Backend mssql con pool de conexiones (ver core.connection_pool).
+
+Igual que el backend `mssql` (mssql-django), pero las conexiones físicas
+salen del pool del proceso y el cierre de Django las devuelve. Solo con el
+driver pyodbc: el driver mssql-python guarda estado en el DatabaseWrapper al
+conectar, y una conexión reutilizada no pasaría por ahí.
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+from mssql.base import DatabaseWrapper as MSSQLDatabaseWrapper
+
+from core.connection_pool import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, MSSQLDatabaseWrapper):
+    def get_new_connection(self, conn_params):
+        # _uses_mssql_python no existe en las versiones de mssql-django anteriores al driver mssql-python
+        uses_mssql_python = getattr(self, '_uses_mssql_python', None)
+        if uses_mssql_python and uses_mssql_python(conn_params):
+            raise ImproperlyConfigured('core.db_backends.mssql_pooled solo soporta el driver pyodbc')
+        return super().get_new_connection(conn_params)
@@ -0,0 +1,227 @@
+"""
+Router de base de datos con réplica de lectura.
+
+Las vistas de solo lectura más pesadas (analytics, KPIs de admin, listados
+de custom_admin, reportes de docentes) y los reportes de comandos de gestión
+pueden leer desde la réplica (alias 'replica') para no competir con las
+escrituras por las conexiones del primario:
+
+- `@read_from_replica` en una vista: sus peticiones GET/HEAD leen de la réplica.
+- `with replica_reads():` en comandos o servicios.
+
+Reglas del router:
+
+- Las escrituras y las migraciones van siempre al primario ('default').
+- Dentro de una transacción del primario las lecturas se quedan en él.
+- Read-your-writes: tras una petición de escritura, el cliente (token o
+  sesión) queda fijado al primario durante STICKY_SECONDS
+  (ver core.middleware.ReplicaStickinessMiddleware). La marca se guarda en
+  la cache STICKY_CACHE, que debe ser compartida entre workers (Redis): con
+  una cache local al proceso (LocMemCache, el valor por defecto en
+  desarrollo) otro worker no vería la marca, así que `@read_from_replica`
+  no envía nada a la réplica y se registra una advertencia. `replica_reads()`
+  no depende de la marca y sigue funcionando.
+- Si la réplica está atrasada más de MAX_LAG_SECONDS, o no se puede medir el
+  atraso por un error, se lee del primario. El atraso se revisa como máximo
+  cada CHECK_INTERVAL segundos por proceso.
+
+Si no hay alias 'replica' en DATABASES el router no cambia nada.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.utils.module_loading import import_string
+
+from core.shared_cache import is_process_local
+
+logger = logging.getLogger(__name__)
+
+PRIMARY_ALIAS = 'default'
+REPLICA_ALIAS = 'replica'
+
+DEFAULT_REPLICA_SETTINGS = {
+    'STICKY_SECONDS': 15,
+    'STICKY_CACHE': 'default',
+    'MAX_LAG_SECONDS': 10,
+    'CHECK_INTERVAL': 10,
+    'LAG_FUNCTION': 'core.db_router.default_replica_lag',
+}
+
+_replica_reads = ContextVar('replica_reads', default=False)
+
+
+def replica_setting(name):
+    return getattr(settings, 'DATABASE_REPLICA', {}).get(name, DEFAULT_REPLICA_SETTINGS[name])
+
+
+def replica_configured():
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+@contextmanager
+def replica_reads():
+    """Las lecturas dentro del bloque pueden ir a la réplica"""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+# ===== READ-YOUR-WRITES =====
+
+def _client_key(request):
+    """Identifica al cliente sin consultar la base de datos (token o cookie de sesión)"""
+    credential = request.headers.get('Authorization') or request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    if not credential:
+        return None
+    return 'db_router:sticky:' + hashlib.sha256(credential.encode()).hexdigest()[:32]
+
+
+def sticky_cache():
+    return caches[replica_setting('STICKY_CACHE')]
+
+
+_warned_local_sticky_cache = False
+
+
+def sticky_reads_supported():
+    """La marca de read-your-writes es visible para todos los workers (cache compartida)"""
+    global _warned_local_sticky_cache
+    if not is_process_local(sticky_cache()):
+        return True
+    if not _warned_local_sticky_cache:
+        _warned_local_sticky_cache = True
+        logger.warning(
+            "La cache de DATABASE_REPLICA['STICKY_CACHE'] es local al proceso; "
+            "las vistas con @read_from_replica leen del primario (configurar CACHE_REDIS_URL)"
+        )
+    return False
+
+
+def mark_primary_sticky(request):
+    """Fija al cliente al primario durante STICKY_SECONDS (tras una escritura)"""
+    key = _client_key(request)
+    if key:
+        sticky_cache().set(key, True, replica_setting('STICKY_SECONDS'))
+
+
+def is_primary_sticky(request):
+    key = _client_key(request)
+    return bool(key and sticky_cache().get(key))
+
+
+def _reads_from_replica(request):
+    return (request.method in ('GET', 'HEAD') and replica_configured()
+            and sticky_reads_supported() and not is_primary_sticky(request))
+
+
+def read_from_replica(view_func):
+    """
+    Decorador: las peticiones GET/HEAD de la vista leen desde la réplica.
+    Sirve también para vistas async: la marca viaja en el contexto hasta las
+    consultas que la vista delega con sync_to_async.
+    """
+    if asyncio.iscoroutinefunction(view_func):
+        @wraps(view_func)
+        async def async_wrapper(request, *args, **kwargs):
+            if _reads_from_replica(request):
+                with replica_reads():
+                    return await view_func(request, *args, **kwargs)
+            return await view_func(request, *args, **kwargs)
+        return async_wrapper
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if _reads_from_replica(request):
+            with replica_reads():
+                return view_func(request, *args, **kwargs)
+        return view_func(request, *args, **kwargs)
+    return wrapper
+
+
+# ===== ATRASO DE LA RÉPLICA =====
+
+def default_replica_lag():
+    """
+    Atraso de la réplica en segundos, medido en el primario. En SQL Server
+    (réplicas geo de Azure SQL) se usa sys.dm_geo_replication_link_status;
+    en otros motores (p. ej. la réplica SQLite local) se asume 0.
+    """
+    connection = connections[PRIMARY_ALIAS]
+    if connection.vendor != 'microsoft':
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT MAX(replication_lag_sec) FROM sys.dm_geo_replication_link_status')
+        row = cursor.fetchone()
+    return row[0] if row and row[0] is not None else 0
+
+
+class ReplicaHealth:
+    """Estado de la réplica (una instancia por proceso)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checked_at = None
+        self._available = True
+        self.lag = None
+
+    def reset(self):
+        with self._lock:
+            self._checked_at = None
+            self._available = True
+            self.lag = None
+
+    def available(self):
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < replica_setting('CHECK_INTERVAL'):
+            return self._available
+        with self._lock:
+            try:
+                self.lag = import_string(replica_setting('LAG_FUNCTION'))()
+                self._available = self.lag <= replica_setting('MAX_LAG_SECONDS')
+                if not self._available:
+                    logger.warning(f"Réplica atrasada {self.lag}s; las lecturas van al primario")
+            except Exception as e:
+                logger.warning(f"No se pudo medir el atraso de la réplica ({e}); las lecturas van al primario")
+                self.lag = None
+                self._available = False
+            self._checked_at = now
+        return self._available
+
+
+replica_health = ReplicaHealth()
+
+
+class ReplicaRouter:
+    """Envía a la réplica las lecturas marcadas con replica_reads()/read_from_replica"""
+
+    def db_for_read(self, model, **hints):
+        if not _replica_reads.get() or not replica_configured():
+            return None
+        # Lo leído dentro de una transacción del primario debe ver sus propias escrituras
+        if connections[PRIMARY_ALIAS].in_atomic_block:
+            return None
+        if not replica_health.available():
+            return None
+        return REPLICA_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # La réplica contiene los mismos datos que el primario
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db != REPLICA_ALIAS
@@ -8,8 +8,19 @@ import logging
 from django.conf import settings
 from django.http import JsonResponse
 from django.core.cache import cache
+from django.utils.cache import patch_vary_headers
 from django.utils.deprecation import MiddlewareMixin
 
+from .compression import (
+    compress,
+    compress_async_stream,
+    compress_stream,
+    is_compressible_content_type,
+    min_size,
+    negotiate_encoding,
+)
+from .db_router import mark_primary_sticky, replica_configured
+
 logger = logging.getLogger(__name__)
 
 class TrafficMonitoringMiddleware(MiddlewareMixin):
@@ -130,8 +141,69 @@ class PerformanceMiddleware(MiddlewareMixin):
             
         # Agregar headers de compresión
         if 'text/html' in response.get('Content-Type', ''):
-            response['Vary'] = 'Accept-Encoding'
+            patch_vary_headers(response, ('Accept-Encoding',))
+            
+        return response
+
+class JSONCompressionMiddleware(MiddlewareMixin):
+    """
+    Middleware de compresión gzip/brotli para respuestas JSON.
+
+    Solo comprime respuestas JSON que superen JSON_COMPRESSION_MIN_SIZE y
+    que no traigan ya Content-Encoding (por ejemplo, las servidas desde
+    core.compression.cached_json_response). Las respuestas streaming se
+    comprimen fragmento a fragmento.
+    """
+    
+    def process_response(self, request, response):
+        """Comprimir la respuesta si el cliente lo acepta"""
+        if response.has_header('Content-Encoding'):
+            return response
+        if not is_compressible_content_type(response.get('Content-Type')):
+            return response
+        if not response.streaming and len(response.content) < min_size():
+            return response
+            
+        # La respuesta depende de Accept-Encoding aunque este cliente no comprima
+        patch_vary_headers(response, ('Accept-Encoding',))
+        
+        encoding = negotiate_encoding(request)
+        if not encoding:
+            return response
             
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = compress_async_stream(response.streaming_content, encoding)
+            else:
+                response.streaming_content = compress_stream(response.streaming_content, encoding)
+            # El tamaño final no se conoce de antemano
+            del response['Content-Length']
+        else:
+            compressed = compress(response.content, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+            
+        # El ETag fuerte deja de ser válido al cambiar los bytes del cuerpo
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+            
+        response['Content-Encoding'] = encoding
+        return response
+
+class ReplicaStickinessMiddleware(MiddlewareMixin):
+    """
+    Read-your-writes: tras una petición de escritura exitosa el cliente lee
+    del primario durante DATABASE_REPLICA['STICKY_SECONDS'] (ver core.db_router).
+    """
+    
+    def process_response(self, request, response):
+        if (replica_configured()
+                and request.method not in ('GET', 'HEAD', 'OPTIONS')
+                and response.status_code < 400):
+            mark_primary_sticky(request)
         return response
 
 class LoggingMiddleware(MiddlewareMixin):
@@ -0,0 +1,94 @@
+"""
+Proyecciones (sparse fieldsets) para endpoints de listado.
+
+Los listados serializaban todas las columnas de cada fila, incluidos los
+TextField grandes (`description`, `requirements`, `bio`...) que la UI
+trunca. Una `Projection` declara, por campo de la respuesta, la función que
+lo calcula y las columnas que necesita; la petición elige los campos con:
+
+- `?fields=id,title,company_name`: solo esos campos (en el orden declarado).
+- `?view=summary`: los campos marcados como resumen.
+- `?view=full` (por defecto): todos los campos, como antes.
+
+`apply()` limita la consulta con `.only()` a las columnas de los campos
+elegidos y agrega `select_related` solo para las relaciones que alguno de
+ellos recorre, de modo que los TextField y JOIN no pedidos nunca se leen.
+
+Uso:
+
+    PROJECTION = Projection({
+        'id': ProjectedField(lambda p: str(p.id), summary=True),
+        'company_name': ProjectedField(lambda p: p.company.company_name, ['company__company_name'], summary=True),
+        'description': ProjectedField(lambda p: p.description, ['description']),
+    })
+
+    names = PROJECTION.select(request)       # ValueError si los parámetros son inválidos
+    queryset = PROJECTION.apply(queryset, names)
+    data = [PROJECTION.serialize(obj, names) for obj in queryset]
+"""
+
+FULL_VIEW = 'full'
+SUMMARY_VIEW = 'summary'
+
+
+class ProjectedField:
+    """Campo de la respuesta: cómo se calcula y qué columnas (rutas ORM) necesita"""
+
+    def __init__(self, value, columns=(), summary=False):
+        self.value = value
+        self.columns = tuple(columns)
+        self.summary = summary
+
+
+class Projection:
+    """Conjunto de campos seleccionables de un listado"""
+
+    def __init__(self, fields):
+        self.fields = dict(fields)
+
+    def extend(self, fields):
+        """Nueva proyección con campos adicionales (o reemplazados)"""
+        return Projection({**self.fields, **fields})
+
+    @property
+    def summary_fields(self):
+        return [name for name, field in self.fields.items() if field.summary]
+
+    def select(self, request):
+        """Campos pedidos por `?fields=` o `?view=`. Lanza ValueError si no son válidos."""
+        requested = request.GET.get('fields', '')
+        if requested:
+            names = {name.strip() for name in requested.split(',') if name.strip()}
+            unknown = names - set(self.fields)
+            if unknown:
+                raise ValueError(
+                    f"Campos desconocidos: {', '.join(sorted(unknown))}. "
+                    f"Disponibles: {', '.join(self.fields)}"
+                )
+            return [name for name in self.fields if name in names]
+
+        view = request.GET.get('view', FULL_VIEW)
+        if view == SUMMARY_VIEW:
+            return self.summary_fields
+        if view == FULL_VIEW:
+            return list(self.fields)
+        raise ValueError(f"Vista inválida: {view}. Opciones: {SUMMARY_VIEW}, {FULL_VIEW}")
+
+    def columns(self, model, names):
+        columns = {model._meta.pk.name}
+        for name in names:
+            columns.update(self.fields[name].columns)
+        return columns
+
+    def apply(self, queryset, names):
+        """Limita la consulta a las columnas y relaciones de los campos elegidos"""
+        columns = self.columns(queryset.model, names)
+        related = {column.rsplit('__', 1)[0] for column in columns if '__' in column}
+        # Reiniciar select_related: un JOIN no pedido no puede combinarse con .only()
+        queryset = queryset.select_related(None)
+        if related:
+            queryset = queryset.select_related(*sorted(related))
+        return queryset.only(*columns)
+
+    def serialize(self, obj, names):
+        return {name: self.fields[name].value(obj) for name in names}
@@ -0,0 +1,202 @@
+"""
+Registro en memoria de datos de referencia: ProjectStatus, TRLLevel y Area.
+
+Son tablas de una decena de filas que casi nunca cambian, pero se consultan
+en casi todas las vistas de proyectos. El registro las carga una vez por
+proceso y resuelve los alias en español/inglés ('Publicado', 'published',
+'Completado', 'completed', ...) a ids, para que las vistas filtren con
+`status_id__in=[...]` sin JOIN ni consultas previas.
+
+Cada save/delete de estos modelos invalida el registro del proceso que
+escribe y, al confirmarse la transacción, incrementa una clave de versión en
+la cache compartida; los demás procesos recargan el registro al detectar el
+cambio (se revisa como máximo cada REFERENCE_DATA_CHECK_INTERVAL segundos).
+Incrementarla antes del commit dejaría a otro proceso con las filas
+anteriores guardadas bajo la versión nueva. Un registro cargado dentro de una
+transacción abierta no se da por confirmado: se vuelve a cargar en la
+siguiente revisión (por si la transacción se revierte).
+
+La clave de versión solo llega a otros workers si la cache 'default' es
+compartida (CACHE_REDIS_URL, ver core.shared_cache); con LocMemCache cada
+proceso tiene la suya, y además la cache puede descartar la clave. Por eso
+el registro se recarga igual cada REFERENCE_DATA_MAX_AGE segundos, diga lo
+que diga la versión: ese es el atraso máximo de un cambio en otro proceso.
+Cada incremento guarda un valor nuevo al azar (no un contador), así una
+clave descartada y vuelta a crear nunca repite una versión ya cargada.
+Las actualizaciones masivas con `.update()` no disparan señales: en ese caso
+llamar a `invalidate_reference_data()` manualmente.
+"""
+
+import threading
+import time
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+REFERENCE_DATA_VERSION_KEY = 'reference_data:version'
+REFERENCE_DATA_CHECK_INTERVAL = 5  # segundos
+REFERENCE_DATA_MAX_AGE = 300  # segundos; recarga aunque la versión no haya cambiado
+
+# Versión de un registro cargado dentro de una transacción: nunca coincide con la de la cache
+_UNCONFIRMED = object()
+
+# Nombre canónico -> alias aceptados (comparación sin mayúsculas)
+STATUS_ALIASES = {
+    'published': ['publicado', 'publicada'],
+    'active': ['activo', 'activa'],
+    'in-progress': ['in_progress', 'en progreso', 'en curso'],
+    'completed': ['completado', 'completada'],
+    'draft': ['borrador'],
+    'deleted': ['eliminado', 'eliminada'],
+    'cancelled': ['cancelado', 'cancelada', 'canceled'],
+    'paused': ['pausado', 'pausada'],
+    'open': ['abierto', 'abierta'],
+}
+
+_CANONICAL_STATUS = {
+    alias: canonical
+    for canonical, aliases in STATUS_ALIASES.items()
+    for alias in [canonical, *aliases]
+}
+
+
+def canonical_status_name(name):
+    """Nombre canónico (inglés, minúsculas) de un estado o alias"""
+    normalized = (name or '').strip().lower()
+    return _CANONICAL_STATUS.get(normalized, normalized)
+
+
+def bump_reference_data_version():
+    """Invalida el registro en este proceso y en los demás"""
+    reference_data.mark_stale()
+    cache.set(REFERENCE_DATA_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def invalidate_reference_data():
+    """Tras cambiar datos de referencia: este proceso recarga ya, los demás después del commit"""
+    reference_data.mark_stale()
+    transaction.on_commit(bump_reference_data_version)
+
+
+class ReferenceDataRegistry:
+    """Datos de referencia cargados en memoria (una instancia por proceso)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._version = None
+        self._checked_at = 0.0
+        self._loaded_at = 0.0
+        self._statuses = {}
+        self._status_ids_by_canonical = {}
+        self._status_ids_by_name = {}
+        self._trl_levels = {}
+        self._trl_ids_by_level = {}
+        self._areas = {}
+        self._area_ids_by_name = {}
+
+    def mark_stale(self):
+        self._loaded = False
+
+    def load(self):
+        """Carga (o recarga) las tres tablas: 3 consultas"""
+        from areas.models import Area
+        from project_status.models import ProjectStatus
+        from trl_levels.models import TRLLevel
+
+        with self._lock:
+            version = cache.get(REFERENCE_DATA_VERSION_KEY)
+
+            statuses = {status.id: status for status in ProjectStatus.objects.all()}
+            status_ids_by_canonical = {}
+            status_ids_by_name = {}
+            # Se ordenan por id para que el estado "principal" de cada alias sea estable
+            for status in sorted(statuses.values(), key=lambda s: s.id):
+                status_ids_by_canonical.setdefault(canonical_status_name(status.name), []).append(status.id)
+                status_ids_by_name.setdefault((status.name or '').strip().lower(), status.id)
+
+            trl_levels = {trl.id: trl for trl in TRLLevel.objects.all()}
+            areas = {area.id: area for area in Area.objects.all()}
+
+            self._statuses = statuses
+            self._status_ids_by_canonical = status_ids_by_canonical
+            self._status_ids_by_name = status_ids_by_name
+            self._trl_levels = trl_levels
+            self._trl_ids_by_level = {trl.level: trl.id for trl in trl_levels.values()}
+            self._areas = areas
+            self._area_ids_by_name = {area.name.strip().lower(): area.id for area in areas.values()}
+            self._version = _UNCONFIRMED if transaction.get_connection().in_atomic_block else version
+            self._checked_at = self._loaded_at = time.monotonic()
+            self._loaded = True
+
+    def _ensure_loaded(self):
+        now = time.monotonic()
+        if not self._loaded or now - self._loaded_at >= REFERENCE_DATA_MAX_AGE:
+            self.load()
+            return
+        if now - self._checked_at < REFERENCE_DATA_CHECK_INTERVAL:
+            return
+        if cache.get(REFERENCE_DATA_VERSION_KEY) == self._version:
+            self._checked_at = now
+            return
+        self.load()
+
+    # Estados de proyecto
+
+    def status_ids(self, *names):
+        """Ids de todos los estados que corresponden a los nombres/alias dados"""
+        self._ensure_loaded()
+        ids = []
+        for name in names:
+            ids.extend(self._status_ids_by_canonical.get(canonical_status_name(name), []))
+        return ids
+
+    def status_id(self, name):
+        """
+        Id del estado con ese nombre exacto (sin mayúsculas) o, si no existe,
+        el primero de su grupo de alias; None si no hay ninguno.
+        """
+        self._ensure_loaded()
+        status_id = self._status_ids_by_name.get((name or '').strip().lower())
+        if status_id is not None:
+            return status_id
+        ids = self.status_ids(name)
+        return ids[0] if ids else None
+
+    def status(self, name):
+        """Instancia de ProjectStatus para un nombre/alias, o None si no existe"""
+        status_id = self.status_id(name)
+        return self._statuses.get(status_id) if status_id is not None else None
+
+    def status_by_id(self, status_id):
+        self._ensure_loaded()
+        return self._statuses.get(status_id)
+
+    # Niveles TRL
+
+    def trl_by_id(self, trl_id):
+        self._ensure_loaded()
+        return self._trl_levels.get(trl_id)
+
+    def trl_id(self, level):
+        self._ensure_loaded()
+        return self._trl_ids_by_level.get(level)
+
+    def trl_ids_up_to(self, max_level):
+        """Ids de los niveles TRL con level <= max_level"""
+        self._ensure_loaded()
+        return [trl_id for level, trl_id in self._trl_ids_by_level.items() if level <= max_level]
+
+    # Áreas
+
+    def area_by_id(self, area_id):
+        self._ensure_loaded()
+        return self._areas.get(area_id)
+
+    def area_id(self, name):
+        self._ensure_loaded()
+        return self._area_ids_by_name.get((name or '').strip().lower())
+
+
+reference_data = ReferenceDataRegistry()
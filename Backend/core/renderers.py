@@ -0,0 +1,23 @@
+"""
+Renderer JSON para Django REST Framework basado en core.responses.
+
+Usa el mismo backend que core.responses.JsonResponse (orjson cuando está
+disponible) para que las vistas DRF y las vistas de función serialicen igual.
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+from .responses import JSON_BACKEND, dumps
+
+
+class FastJSONRenderer(JSONRenderer):
+    """Renderer JSON rápido; respeta la indentación solicitada usando el renderer estándar"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if JSON_BACKEND == 'json' or self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
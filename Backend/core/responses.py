@@ -0,0 +1,70 @@
+"""
+Capa de respuestas JSON rápidas para las vistas de LeanMaker.
+
+`JsonResponse` es un reemplazo directo de `django.http.JsonResponse` que
+serializa de forma nativa UUID, datetime, date y Decimal. Si `orjson` está
+instalado se usa como backend (implementado en C); si no, se recurre al
+encoder estándar de Django (`DjangoJSONEncoder`) sin cambiar el contrato.
+Las fechas y horas pasan siempre por DjangoJSONEncoder: orjson las
+serializa con microsegundos y "+00:00" en lugar de milisegundos y "Z".
+"""
+
+import json
+from decimal import Decimal
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from django.http import JsonResponse as DjangoJsonResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+JSON_BACKEND = 'orjson' if orjson else 'json'
+
+if orjson:
+    # PASSTHROUGH_DATETIME: datetime, date y time llegan a _orjson_default
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _orjson_default(value):
+    """Tipos que orjson no serializa (o no igual que Django): mismo formato que DjangoJSONEncoder"""
+    if isinstance(value, Decimal):
+        return str(value)
+    # datetime, date y time (y cualquier otro tipo que Django sepa serializar)
+    return DjangoJSONEncoder().default(value)
+
+
+def dumps(data):
+    """Serializa `data` a bytes JSON (UTF-8) con el backend más rápido disponible"""
+    if orjson:
+        return orjson.dumps(data, default=_orjson_default, option=_ORJSON_OPTIONS)
+    return json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def stdlib_dumps(data):
+    """Serialización equivalente a la de django.http.JsonResponse (referencia para benchmarks)"""
+    return json.dumps(data, cls=DjangoJSONEncoder).encode('utf-8')
+
+
+class JsonResponse(DjangoJsonResponse):
+    """
+    Reemplazo directo de django.http.JsonResponse con serialización rápida.
+
+    Si se pasa un `encoder` distinto o `json_dumps_params`, se respeta el
+    comportamiento original de Django.
+    """
+
+    def __init__(self, data, encoder=DjangoJSONEncoder, safe=True, json_dumps_params=None, **kwargs):
+        if encoder is not DjangoJSONEncoder or json_dumps_params:
+            super().__init__(data, encoder=encoder, safe=safe, json_dumps_params=json_dumps_params, **kwargs)
+            return
+
+        if safe and not isinstance(data, dict):
+            raise TypeError(
+                'In order to allow non-dict objects to be serialized set the '
+                'safe parameter to False.'
+            )
+        kwargs.setdefault('content_type', 'application/json')
+        HttpResponse.__init__(self, content=dumps(data), **kwargs)
@@ -54,11 +54,13 @@ INSTALLED_APPS = [
     # 'ratings',  # ELIMINADO - Sistema duplicado
     'mass_notifications',
     'custom_admin',  # Nueva app de administración
+    'benchmarks',  # Benchmarks de rendimiento (comandos de gestión)
 ]
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.JSONCompressionMiddleware',  # Compresión gzip/brotli de respuestas JSON
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Para archivos estáticos
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -70,6 +72,8 @@ MIDDLEWARE = [
     
     # ✅ MIDDLEWARES PERSONALIZADOS ACTIVADOS PARA OPTIMIZACIÓN
     'core.middleware.PerformanceMiddleware',  # Cache headers y compresión
+    'core.middleware.ReplicaStickinessMiddleware',  # Read-your-writes con réplica de lectura
+    'notifications.outbox.NotificationOutboxMiddleware',  # Notificaciones en lote por petición
     # 'core.middleware.TrafficMonitoringMiddleware',  # Opcional
     # 'core.middleware.SecurityMiddleware',  # Opcional
     # 'core.middleware.LoggingMiddleware',  # Opcional
@@ -102,12 +106,35 @@ WSGI_APPLICATION = 'core.wsgi.application'
 #Admin@tesis
 
 
-# Database - SQLite para desarrollo local
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# Database - SQLite para desarrollo local. Con DB_ENGINE=mssql se usa SQL
+# Server / Azure SQL con pool de conexiones (core.database_config: backend
+# core.db_backends.mssql_pooled, clave POOL y réplica con DB_REPLICA_HOST).
+if config('DB_ENGINE', default='sqlite') == 'mssql':
+    from core.database_config import DATABASE_CONFIG as DATABASES
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+        }
     }
+
+    # Réplica de lectura (core.db_router). Con DB_REPLICA=True una segunda conexión
+    # SQLite al mismo archivo hace de réplica local; en pruebas es un espejo de 'default'.
+    if config('DB_REPLICA', default=False, cast=bool):
+        DATABASES['replica'] = {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+            'TEST': {'MIRROR': 'default'},
+        }
+
+DATABASE_ROUTERS = ['core.db_router.ReplicaRouter']
+
+DATABASE_REPLICA = {
+    'STICKY_SECONDS': 15,   # Lecturas al primario tras una escritura del mismo cliente
+    'STICKY_CACHE': 'default',  # Debe ser compartida entre workers (CACHE_REDIS_URL); si no, las vistas no usan la réplica
+    'MAX_LAG_SECONDS': 10,  # Con más atraso las lecturas vuelven al primario
+    'CHECK_INTERVAL': 10,   # Segundos entre mediciones del atraso
 }
 
 # Password validation
@@ -276,6 +303,16 @@ CACHES = {
     }
 }
 
+# Con varios workers la cache 'default' debe ser compartida: la usan la
+# fijación al primario tras escribir (core.db_router) y la versión de los
+# datos de referencia (core.reference_data). Ver core.shared_cache.
+if config('CACHE_REDIS_URL', default=''):
+    CACHES['default'] = {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': config('CACHE_REDIS_URL'),
+        'TIMEOUT': 300,
+    }
+
 # Email (for development)
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 
@@ -345,6 +382,29 @@ DETAILED_LOGGING = True
 DB_QUERY_MONITORING = True
 RATE_LIMIT_ENABLED = False  # Deshabilitado para desarrollo local
 
+# Compresión de respuestas JSON (core.middleware.JSONCompressionMiddleware)
+JSON_COMPRESSION_MIN_SIZE = 1024  # Bytes; las respuestas más pequeñas no se comprimen
+JSON_COMPRESSION_GZIP_LEVEL = 6
+JSON_COMPRESSION_BROTLI_QUALITY = 5  # Solo si el paquete brotli está instalado
+
+# Buffer de contadores de vistas (core.view_counters)
+VIEW_COUNTER_FLUSH_INTERVAL = 30  # Segundos entre escrituras de los deltas acumulados
+VIEW_COUNTER_TRENDING_HALF_LIFE = 3600  # Vida media (segundos) del puntaje de tendencia
+
+# Outbox de notificaciones (notifications.outbox)
+NOTIFICATION_OUTBOX = {
+    'MODE': config('NOTIFICATION_OUTBOX_MODE', default='sync'),  # 'sync' o 'deferred' (hilo en segundo plano)
+    'BATCH_SIZE': 500,
+    'RETRIES': 3,
+}
+
+# Agregados concurrentes de los dashboards async (core.async_aggregates)
+ASYNC_AGGREGATES = {
+    'MAX_WORKERS': config('ASYNC_AGGREGATES_MAX_WORKERS', default=8, cast=int),  # 0 = en serie en el hilo de la petición
+    'TIMEOUT': 5.0,  # Segundos por agregado desde que un hilo lo toma; los que vencen se omiten (respuesta parcial)
+    'QUEUE_TIMEOUT': 10.0,  # Segundos esperando un hilo libre del pool
+}
+
 # Configuración de Celery - Deshabilitado para desarrollo local
 # CELERY_BROKER_URL = config('REDIS_URL', default='redis://127.0.0.1:6379/0')
 # CELERY_RESULT_BACKEND = config('REDIS_URL', default='redis://127.0.0.1:6379/0')
@@ -380,11 +440,11 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
-    # ✅ RENDERER AUTOMÁTICO DESHABILITADO TEMPORALMENTE PARA AISLAR PROBLEMA
-    # 'DEFAULT_RENDERER_CLASSES': [
-    #     'rest_framework.renderers.JSONRenderer',
-    #     'rest_framework.renderers.BrowsableAPIRenderer',
-    # ],
+    # ✅ RENDERER JSON RÁPIDO (orjson con fallback a json estándar)
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     # ✅ PAGINACIÓN AUTOMÁTICA DESHABILITADA - CAUSABA INTERFERENCIA
     # 'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     # 'PAGE_SIZE': 20,
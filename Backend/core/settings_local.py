@@ -51,11 +51,13 @@ INSTALLED_APPS = [
     'ratings',
     'mass_notifications',
     'custom_admin',
+    'benchmarks',
 ]
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.JSONCompressionMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -63,6 +65,8 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'debug_toolbar.middleware.DebugToolbarMiddleware',
+    'notifications.outbox.NotificationOutboxMiddleware',
+    'core.middleware.ReplicaStickinessMiddleware',
 ]
 
 ROOT_URLCONF = 'core.urls'
@@ -93,6 +97,8 @@ DATABASES = {
     }
 }
 
+DATABASE_ROUTERS = ['core.db_router.ReplicaRouter']  # Sin alias 'replica' no cambia nada
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -0,0 +1,20 @@
+"""
+Caches que se pueden compartir entre procesos.
+
+LocMemCache (el backend por defecto en desarrollo) y DummyCache viven en cada
+proceso: lo que escribe un worker no lo ve otro. Las funciones que coordinan
+procesos a través de la cache (la fijación al primario de core.db_router, la
+versión de core.reference_data) consultan `is_process_local()` para no
+depender de ella en ese caso. Con CACHE_REDIS_URL en el entorno la cache
+'default' pasa a Redis (ver core/settings.py) y se comparte entre workers.
+"""
+
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+PROCESS_LOCAL_BACKENDS = (LocMemCache, DummyCache)
+
+
+def is_process_local(cache):
+    """La cache no se comparte entre procesos (memoria local o dummy)"""
+    return isinstance(cache, PROCESS_LOCAL_BACKENDS)
@@ -0,0 +1,95 @@
+"""
+Modo streaming NDJSON para listados completos.
+
+Los listados de administración y los scripts de sincronización nocturna
+necesitan tablas completas; armarlas en un solo JsonResponse materializa
+todas las filas (y todos los dicts) en memoria antes de enviar el primer
+byte. Con `Accept: application/x-ndjson` o `?stream=1` las vistas que lo
+soportan responden con `ndjson_response()`:
+
+- Una línea JSON por fila (application/x-ndjson), sin paginación.
+- La consulta se recorre con `.iterator(chunk_size=NDJSON_CHUNK_SIZE)`
+  (cursor del servidor donde el motor lo soporta; en SQL Server requiere
+  MARS, que mssql-django activa por defecto) y cada bloque de filas se
+  envía apenas se lee: la memoria no crece con el tamaño de la tabla y el
+  primer byte sale tras el primer bloque.
+- El alias de base de datos se fija al crear la respuesta, así que
+  `@read_from_replica` sigue aplicando aunque las filas se lean después de
+  que la vista retornó.
+- Bajo ASGI el contenido se entrega como iterador asíncrono (Django
+  materializaría un iterador síncrono completo); cada bloque se lee con
+  sync_to_async en el hilo de la petición.
+- Si la consulta falla a mitad de camino ya no se puede cambiar el status:
+  la última línea es `{"error": ...}` para que el cliente detecte el corte.
+- JSONCompressionMiddleware comprime el stream bloque a bloque.
+
+Uso:
+
+    if wants_ndjson(request):
+        return ndjson_response(request, queryset, lambda obj: {'id': str(obj.id), ...})
+"""
+
+import logging
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+
+from .responses import dumps
+
+logger = logging.getLogger(__name__)
+
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
+
+def chunk_size():
+    """Filas por lectura de la base de datos y por bloque enviado"""
+    return getattr(settings, 'NDJSON_CHUNK_SIZE', 1000)
+
+
+def wants_ndjson(request):
+    """La petición pide el listado completo en streaming (Accept o ?stream=1)"""
+    if request.GET.get('stream', '').lower() in ('1', 'true'):
+        return True
+    return NDJSON_CONTENT_TYPE in request.headers.get('Accept', '').lower()
+
+
+def ndjson_lines(rows, serialize, rows_per_chunk):
+    """Bloques de líneas NDJSON (bytes) de `rows_per_chunk` filas"""
+    lines = []
+    try:
+        for row in rows:
+            lines.append(dumps(serialize(row)))
+            if len(lines) >= rows_per_chunk:
+                yield b'\n'.join(lines) + b'\n'
+                lines = []
+    except Exception as e:
+        logger.exception('Error generando un listado NDJSON')
+        lines.append(dumps({'error': str(e)}))
+    if lines:
+        yield b'\n'.join(lines) + b'\n'
+
+
+async def _async_chunks(chunks):
+    next_chunk = sync_to_async(next)
+    while True:
+        chunk = await next_chunk(chunks, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+def ndjson_response(request, queryset, serialize):
+    """StreamingHttpResponse NDJSON con una línea `serialize(fila)` por fila de `queryset`"""
+    rows_per_chunk = chunk_size()
+    # El router decide ahora, dentro del contexto de la vista (réplica o primario)
+    queryset = queryset.using(queryset.db)
+    chunks = ndjson_lines(queryset.iterator(chunk_size=rows_per_chunk), serialize, rows_per_chunk)
+    if isinstance(request, ASGIRequest):
+        chunks = _async_chunks(chunks)
+
+    response = StreamingHttpResponse(chunks, content_type=NDJSON_CONTENT_TYPE)
+    response['Cache-Control'] = 'no-store'
+    response['X-Accel-Buffering'] = 'no'  # Que un proxy nginx no acumule el stream
+    return response
@@ -0,0 +1,750 @@
+import gzip
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from unittest import mock, skipUnless
+from datetime import date, datetime, timezone as dt_timezone
+from decimal import Decimal
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper as SQLiteDatabaseWrapper
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.async_aggregates import gather_aggregates
+from core.compression import cached_json_response
+from core.connection_pool import ConnectionPool, PooledDatabaseWrapperMixin, PoolTimeout, close_pools, pool_stats
+from core.db_router import ReplicaRouter, read_from_replica, replica_health, replica_reads, sticky_reads_supported
+from core.middleware import JSONCompressionMiddleware, ReplicaStickinessMiddleware
+from core.reference_data import REFERENCE_DATA_VERSION_KEY, bump_reference_data_version, reference_data
+from core.responses import JsonResponse, dumps, stdlib_dumps
+from core.view_counters import view_counters
+from core.views import generate_access_token
+from applications.models import Aplicacion
+from areas.models import Area
+from companies.models import Empresa
+from notifications.models import Notification
+from projects.models import Proyecto
+from projects.serializers import ProyectoSerializer
+from project_status.models import ProjectStatus
+from students.models import Estudiante
+from trl_levels.models import TRLLevel
+from work_hours.models import WorkHour
+
+
+class FastJsonResponseTest(TestCase):
+    def test_native_types_match_stdlib_encoding(self):
+        data = {
+            'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'created_at': datetime(2024, 3, 1, 10, 30),
+            'date': date(2024, 3, 1),
+            'hours': Decimal('4.50'),
+            'title': 'Diseño de API',
+            # Con microsegundos DjangoJSONEncoder recorta a milisegundos y usa 'Z' para UTC
+            'updated_at': datetime(2026, 10, 19, 12, 53, 3, 469815, tzinfo=dt_timezone.utc),
+            'start_time': datetime(2026, 10, 19, 10, 1, 2, 345678).time(),
+            'end_time': datetime(2026, 10, 19, 18, 0).time(),
+        }
+        self.assertEqual(json.loads(dumps(data)), json.loads(stdlib_dumps(data)))
+        self.assertIn(b'"2026-10-19T12:53:03.469Z"', dumps(data))
+        self.assertIn(b'"10:01:02.345"', dumps(data))
+
+    def test_json_response_contract(self):
+        response = JsonResponse({'ok': True}, status=201)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(response.content), {'ok': True})
+
+        with self.assertRaises(TypeError):
+            JsonResponse([1, 2, 3])
+        self.assertEqual(json.loads(JsonResponse([1, 2, 3], safe=False).content), [1, 2, 3])
+
+
+class JSONCompressionTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.middleware = JSONCompressionMiddleware(lambda request: None)
+        self.payload = {'items': [{'id': i, 'title': f'Proyecto {i}'} for i in range(200)]}
+
+    def test_large_json_is_gzipped(self):
+        request = self.factory.get('/', HTTP_ACCEPT_ENCODING='gzip, deflate')
+        response = self.middleware.process_response(request, JsonResponse(self.payload))
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(json.loads(gzip.decompress(response.content)), self.payload)
+
+    def test_small_or_unaccepted_responses_are_untouched(self):
+        request = self.factory.get('/', HTTP_ACCEPT_ENCODING='gzip')
+        response = self.middleware.process_response(request, JsonResponse({'ok': True}))
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+        request = self.factory.get('/', HTTP_ACCEPT_ENCODING='gzip;q=0')
+        response = self.middleware.process_response(request, JsonResponse(self.payload))
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_streaming_response(self):
+        request = self.factory.get('/', HTTP_ACCEPT_ENCODING='gzip')
+        rows = (f'{{"id": {i}}}\n'.encode() for i in range(500))
+        response = self.middleware.process_response(
+            request, StreamingHttpResponse(rows, content_type='application/x-ndjson')
+        )
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        body = gzip.decompress(b''.join(response.streaming_content)).decode()
+        self.assertEqual(len(body.splitlines()), 500)
+
+    def test_cached_response_is_stored_compressed(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            return self.payload
+
+        request = self.factory.get('/', HTTP_ACCEPT_ENCODING='gzip')
+        first = cached_json_response(request, 'test:payload', build)
+        second = cached_json_response(request, 'test:payload', build)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(second['Content-Encoding'], 'gzip')
+        self.assertIn('gzip', cache.get('test:payload'))
+
+        plain = cached_json_response(self.factory.get('/'), 'test:payload', build)
+        self.assertFalse(plain.has_header('Content-Encoding'))
+        self.assertEqual(json.loads(plain.content), self.payload)
+
+        # El middleware no vuelve a comprimir una respuesta ya codificada
+        self.assertIs(self.middleware.process_response(request, second), second)
+
+
+class ReferenceDataRegistryTest(TestCase):
+    def setUp(self):
+        self.published = ProjectStatus.objects.create(name='published')
+        self.publicado = ProjectStatus.objects.create(name='Publicado')
+        self.completed = ProjectStatus.objects.create(name='Completado')
+        self.trl = [TRLLevel.objects.create(level=level, name=f'TRL {level}', min_hours=level * 10) for level in (1, 2, 3)]
+
+    def test_aliases_resolve_to_ids(self):
+        self.assertCountEqual(
+            reference_data.status_ids('published'), [self.published.id, self.publicado.id]
+        )
+        self.assertEqual(reference_data.status_ids('completed'), [self.completed.id])
+        self.assertEqual(reference_data.status_id('en progreso'), None)
+        # El nombre exacto gana sobre el primero del grupo de alias
+        self.assertEqual(reference_data.status_id('Publicado'), self.publicado.id)
+        self.assertEqual(reference_data.status_id('PUBLISHED'), self.published.id)
+        self.assertEqual(reference_data.status_id('publicada'), self.published.id)
+        self.assertCountEqual(reference_data.trl_ids_up_to(2), [self.trl[0].id, self.trl[1].id])
+
+    def test_loaded_once_and_refreshed_on_save(self):
+        reference_data.status_ids('published')
+        with self.assertNumQueries(0):
+            reference_data.status_ids('completed')
+            reference_data.trl_by_id(self.trl[0].id)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            area = Area.objects.create(name='Desarrollo Web')
+        self.assertEqual(reference_data.area_id('desarrollo web'), area.id)
+        # La versión compartida solo se incrementa tras el commit
+        self.assertEqual(len(callbacks), 1)
+
+    def test_reloads_after_max_age_without_version_change(self):
+        reference_data.status_ids('published')
+        # Cambio hecho por otro proceso sin cache compartida: no hay señal ni versión nueva
+        ProjectStatus.objects.filter(id=self.completed.id).update(name='Cancelado')
+        self.assertEqual(reference_data.status_ids('completed'), [self.completed.id])
+
+        with mock.patch('core.reference_data.REFERENCE_DATA_MAX_AGE', 0):
+            self.assertEqual(reference_data.status_ids('completed'), [])
+            self.assertEqual(reference_data.status_ids('cancelled'), [self.completed.id])
+
+    def test_version_never_repeats_after_eviction(self):
+        bump_reference_data_version()
+        first = cache.get(REFERENCE_DATA_VERSION_KEY)
+        cache.delete(REFERENCE_DATA_VERSION_KEY)
+        bump_reference_data_version()
+        self.assertNotEqual(cache.get(REFERENCE_DATA_VERSION_KEY), first)
+
+
+class ChangeTrackingTest(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.student_user = User.objects.create_user(email='student@test.com', password='testpass123', role='student')
+        Estudiante.objects.create(user=self.student_user, api_level=3, api_level_approved_by_admin=True)
+        company_user = User.objects.create_user(email='company@test.com', password='testpass123', role='company')
+        company = Empresa.objects.create(user=company_user, company_name='Test Company')
+        self.project = Proyecto.objects.create(
+            title='Project', company=company, description='Test description', requirements='Test requirements'
+        )
+
+    def test_previous_values_without_queries(self):
+        student = Estudiante.objects.get(user=self.student_user)
+        student.career = 'Ingeniería'
+        with self.assertNumQueries(1):
+            student.save()
+
+        student.api_level = 1
+        self.assertTrue(student.has_changed('api_level'))
+        self.assertEqual(student.previous('api_level'), 3)
+        self.assertEqual(student.changed_fields, ['api_level'])
+
+    def test_approved_api_level_is_protected(self):
+        student = Estudiante.objects.get(user=self.student_user)
+        student.api_level = 1
+        student.save()
+        self.assertEqual(Estudiante.objects.get(pk=student.pk).api_level, 3)
+
+    def test_signal_sees_previous_value(self):
+        student = Estudiante.objects.get(user=self.student_user)
+        hour = WorkHour.objects.create(student=student, project=self.project, date=date(2024, 3, 1), hours_worked=4)
+        hour = WorkHour.objects.get(pk=hour.pk)
+
+        hour.description = 'Sin cambio de verificación'
+        with self.captureOnCommitCallbacks(execute=True):
+            hour.save()
+        self.assertFalse(Notification.objects.filter(user=self.student_user).exists())
+
+        hour.is_verified = True
+        with self.captureOnCommitCallbacks(execute=True):
+            hour.save()
+        self.assertEqual(Notification.objects.filter(user=self.student_user).count(), 1)
+        self.assertFalse(hour.has_changed('is_verified'))
+
+
+@override_settings(VIEW_COUNTER_FLUSH_INTERVAL=3600)
+class ViewCounterBufferTest(TestCase):
+    def setUp(self):
+        view_counters.clear()
+        User = get_user_model()
+        company_user = User.objects.create_user(email='company@test.com', password='testpass123', role='company')
+        company = Empresa.objects.create(user=company_user, company_name='Test Company')
+        self.projects = [
+            Proyecto.objects.create(
+                title=f'Project {i}', company=company, description='Test description', requirements='Test requirements'
+            )
+            for i in range(3)
+        ]
+        Proyecto.objects.filter(id=self.projects[2].id).update(views_count=5)
+
+    def tearDown(self):
+        view_counters.clear()
+
+    def test_views_are_buffered_and_flushed_in_one_update(self):
+        with self.assertNumQueries(0):
+            for _ in range(3):
+                self.projects[0].incrementar_vistas()
+            view_counters.record(Proyecto, self.projects[1].id)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(view_counters.flush(), 2)
+
+        counts = dict(Proyecto.objects.values_list('title', 'views_count'))
+        self.assertEqual(counts, {'Project 0': 3, 'Project 1': 1, 'Project 2': 5})
+        self.assertEqual(view_counters.pending(Proyecto, self.projects[0].id), 0)
+
+    def test_full_save_after_view_does_not_double_count(self):
+        project = Proyecto.objects.select_related('company', 'status', 'area').get(id=self.projects[2].id)
+        project.incrementar_vistas()
+        self.assertEqual(project.views_count, 5)
+        self.assertEqual(ProyectoSerializer.to_dict(project)['views_count'], 6)
+
+        project.title = 'Renamed'
+        project.save()
+        view_counters.flush()
+        self.assertEqual(Proyecto.objects.get(id=project.id).views_count, 6)
+
+    def test_rankings_combine_buffer_and_database(self):
+        for _ in range(6):
+            view_counters.record(Proyecto, self.projects[1].id)
+        view_counters.record(Proyecto, self.projects[0].id)
+
+        rankings = view_counters.rankings(Proyecto, limit=2)
+
+        self.assertEqual([item['title'] for item in rankings['trending']], ['Project 1', 'Project 0'])
+        self.assertEqual(
+            [(item['title'], item['views_count']) for item in rankings['most_viewed']],
+            [('Project 1', 6), ('Project 2', 5)]
+        )
+
+
+def lagging_replica():
+    return 60
+
+
+def unreachable_replica():
+    raise ConnectionError('replica down')
+
+
+class ReplicaRouterTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        replica_health.reset()
+        self.addCleanup(replica_health.reset)
+        # La cache de pruebas es LocMem: se simula una compartida entre workers
+        for target in ('core.db_router.replica_configured', 'core.middleware.replica_configured',
+                       'core.db_router.sticky_reads_supported'):
+            patcher = mock.patch(target, return_value=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.router = ReplicaRouter()
+        self.factory = RequestFactory()
+
+    def routed_alias(self, request):
+        @read_from_replica
+        def view(request):
+            return self.router.db_for_read(get_user_model())
+        return view(request)
+
+    def test_get_reads_from_replica_and_writes_go_to_primary(self):
+        self.assertEqual(self.routed_alias(self.factory.get('/', HTTP_AUTHORIZATION='Bearer a')), 'replica')
+        self.assertIsNone(self.routed_alias(self.factory.post('/', HTTP_AUTHORIZATION='Bearer a')))
+        self.assertIsNone(self.router.db_for_read(get_user_model()))
+        self.assertEqual(self.router.db_for_write(get_user_model()), 'default')
+        self.assertFalse(self.router.allow_migrate('replica', 'users'))
+
+    def test_client_reads_primary_after_writing(self):
+        middleware = ReplicaStickinessMiddleware(lambda request: HttpResponse(status=201))
+        middleware(self.factory.post('/', HTTP_AUTHORIZATION='Bearer a'))
+
+        self.assertIsNone(self.routed_alias(self.factory.get('/', HTTP_AUTHORIZATION='Bearer a')))
+        self.assertEqual(self.routed_alias(self.factory.get('/', HTTP_AUTHORIZATION='Bearer b')), 'replica')
+
+    def test_process_local_sticky_cache_keeps_requests_on_primary(self):
+        with mock.patch('core.db_router.sticky_reads_supported', sticky_reads_supported), \
+                mock.patch('core.db_router._warned_local_sticky_cache', False):
+            with self.assertLogs('core.db_router', 'WARNING'):
+                self.assertIsNone(self.routed_alias(self.factory.get('/', HTTP_AUTHORIZATION='Bearer a')))
+        # Sin petición de por medio no hay read-your-writes que garantizar
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(get_user_model()), 'replica')
+
+    @override_settings(DATABASE_REPLICA={'LAG_FUNCTION': 'core.tests.lagging_replica', 'MAX_LAG_SECONDS': 10})
+    def test_lagging_replica_falls_back_to_primary(self):
+        self.assertIsNone(self.routed_alias(self.factory.get('/')))
+        self.assertEqual(replica_health.lag, 60)
+
+    @override_settings(DATABASE_REPLICA={'LAG_FUNCTION': 'core.tests.unreachable_replica'})
+    def test_unmeasurable_replica_falls_back_to_primary(self):
+        self.assertIsNone(self.routed_alias(self.factory.get('/')))
+
+
+@skipUnless('replica' in settings.DATABASES, 'Sin alias replica (usar DB_REPLICA=True)')
+class ReplicaStandInTest(TransactionTestCase):
+    # El runner valida los alias aunque la clase se omita
+    databases = {'default'} | ({'replica'} & set(settings.DATABASES))
+
+    def test_replica_serves_committed_rows(self):
+        get_user_model().objects.create_user(email='replica@test.com', password='testpass123', role='student')
+        with replica_reads():
+            users = get_user_model().objects.filter(email='replica@test.com')
+            self.assertEqual(users.db, 'replica')
+            self.assertTrue(users.exists())
+
+
+class ListProjectionTest(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.admin = User.objects.create_user(email='admin@test.com', password='testpass123', role='admin')
+        company_user = User.objects.create_user(email='company@test.com', password='testpass123', role='company')
+        company = Empresa.objects.create(user=company_user, company_name='Test Company')
+        status = ProjectStatus.objects.create(name='published')
+        reference_data.load()
+        for i in range(3):
+            Proyecto.objects.create(
+                title=f'Project {i}', company=company, description='x' * 2000,
+                requirements='Test requirements', status=status,
+            )
+            student_user = User.objects.create_user(
+                email=f'student{i}@test.com', password='testpass123', role='student', bio='y' * 2000
+            )
+            Estudiante.objects.create(user=student_user)
+        self.auth = {'HTTP_AUTHORIZATION': f'Bearer {generate_access_token(self.admin)}'}
+
+    def get(self, path, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path, params, **self.auth)
+        self.assertEqual(response.status_code, 200)
+        return response, [query['sql'] for query in queries]
+
+    def test_summary_view_skips_text_columns_and_joins(self):
+        response, queries = self.get('/api/admin/projects/', {'view': 'summary'})
+        project = response.json()['results'][0]
+        self.assertNotIn('description', project)
+        self.assertIn('company_name', project)
+        listing = queries[-1]
+        self.assertNotIn('"description"', listing)
+        self.assertNotIn('"project_status"', listing)
+
+        full, _ = self.get('/api/admin/projects/', {})
+        self.assertEqual(len(full.json()['results'][0]['description']), 2000)
+        self.assertLess(len(response.content), len(full.content))
+
+    def test_fields_parameter_loads_only_requested_columns(self):
+        response, queries = self.get('/api/students/', {'fields': 'id,career'})
+        self.assertEqual(set(response.json()['results'][0]), {'id', 'career'})
+        self.assertNotIn('JOIN', queries[-1])
+
+        response, queries = self.get('/api/users/', {'view': 'summary', 'limit': 2})
+        self.assertEqual(len(response.json()['data']), 2)
+        self.assertEqual(response.json()['pagination']['total'], 5)
+        self.assertNotIn('"bio"', queries[-1])
+
+        response = self.client.get('/api/students/', {'fields': 'id,secret'}, **self.auth)
+        self.assertEqual(response.status_code, 400)
+
+
+class AsyncDashboardTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.company_user = User.objects.create_user(email='company@test.com', password='testpass123', role='company')
+        company = Empresa.objects.create(user=self.company_user, company_name='Test Company')
+        self.admin = User.objects.create_user(email='admin@test.com', password='testpass123', role='admin')
+        published = ProjectStatus.objects.create(name='published')
+        reference_data.load()
+        for i in range(2):
+            project = Proyecto.objects.create(
+                title=f'Project {i}', company=company, description='Test',
+                requirements='Test requirements', status=published,
+            )
+            student_user = User.objects.create_user(email=f'student{i}@test.com', password='testpass123', role='student')
+            student = Estudiante.objects.create(user=student_user)
+            Aplicacion.objects.create(project=project, student=student, status='pending' if i else 'accepted')
+        self.student_user = student_user
+
+    def get(self, path, user):
+        return self.client.get(path, HTTP_AUTHORIZATION=f'Bearer {generate_access_token(user)}')
+
+    @override_settings(ASYNC_AGGREGATES={'MAX_WORKERS': 4, 'TIMEOUT': 0.5})
+    def test_aggregates_run_concurrently_with_partial_results(self):
+        def slow(seconds, value):
+            def aggregate():
+                time.sleep(seconds)
+                return value
+            return aggregate
+
+        def broken():
+            raise ValueError('boom')
+
+        start = time.perf_counter()
+        results = async_to_sync(gather_aggregates)({
+            'a': slow(0.2, 1), 'b': slow(0.2, 2), 'c': slow(0.2, 3),
+            'stuck': slow(1, 4), 'broken': broken,
+        })
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.9)
+        self.assertEqual((results['a'], results['b'], results['c']), (1, 2, 3))
+        self.assertIsNone(results['stuck'])
+        self.assertTrue(results.partial)
+        self.assertEqual(results.missing, {'stuck': 'timeout', 'broken': 'error'})
+
+    @override_settings(ASYNC_AGGREGATES={'MAX_WORKERS': 2, 'TIMEOUT': 0.3, 'QUEUE_TIMEOUT': 5})
+    def test_timeout_does_not_count_queue_wait(self):
+        def slow(value):
+            def aggregate():
+                time.sleep(0.2)
+                return value
+            return aggregate
+
+        # 6 agregados de 0.2s en 2 hilos: los últimos esperan 0.4s en cola, más que el timeout
+        results = async_to_sync(gather_aggregates)({f'agg{i}': slow(i) for i in range(6)})
+
+        self.assertEqual(results.missing, {})
+        self.assertEqual(dict(results), {f'agg{i}': i for i in range(6)})
+        self.assertGreaterEqual(max(results.queue_wait.values()), 0.3)
+
+    @override_settings(ASYNC_AGGREGATES={'MAX_WORKERS': 1, 'TIMEOUT': 5, 'QUEUE_TIMEOUT': 0.1})
+    def test_queue_wait_is_bounded_separately(self):
+        calls = []
+
+        def slow(value):
+            def aggregate():
+                calls.append(value)
+                time.sleep(0.3)
+                return value
+            return aggregate
+
+        with self.assertLogs('core.async_aggregates', 'WARNING'):
+            results = async_to_sync(gather_aggregates)({'first': slow(1), 'queued': slow(2)})
+        time.sleep(0.4)
+
+        self.assertEqual(results['first'], 1)
+        self.assertEqual(results.missing, {'queued': 'queue_timeout'})
+        self.assertEqual(calls, [1])
+
+    @override_settings(ASYNC_AGGREGATES={'MAX_WORKERS': 0, 'TIMEOUT': 5})
+    def test_async_views_match_sync_views(self):
+        teacher = get_user_model().objects.create_user(email='teacher@test.com', password='testpass123', role='teacher')
+        users = (('company', self.company_user), ('admin', self.admin), ('student', self.student_user), ('teacher', teacher))
+        for role, user in users:
+            sync = self.get(f'/api/dashboard/{role}_stats/', user).json()
+            response = self.get(f'/api/dashboard/{role}_stats/async/', user)
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertFalse(data.pop('partial'))
+            self.assertEqual(data.pop('missing'), {})
+            # La actividad mensual async usa meses calendario
+            data.pop('monthly_activity', None)
+            sync.pop('monthly_activity', None)
+            self.assertEqual(data, sync, role)
+
+        self.assertEqual(self.get('/api/dashboard/company_stats/async/', self.company_user).json()['active_students'], 1)
+        self.assertEqual(self.get('/api/dashboard/admin_stats/async/', self.company_user).status_code, 403)
+        self.assertEqual(self.client.post('/api/dashboard/admin_stats/async/').status_code, 405)
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        view_counters.clear()
+        User = get_user_model()
+        self.user = User.objects.create_user(email='company@test.com', password='testpass123', role='company')
+        self.company = Empresa.objects.create(user=self.user, company_name='Test Company')
+        self.project = Proyecto.objects.create(
+            title='Project', company=self.company, description='Test', requirements='Test requirements',
+            status=ProjectStatus.objects.create(name='published'),
+        )
+        self.auth = {'HTTP_AUTHORIZATION': f'Bearer {generate_access_token(self.user)}'}
+
+    def test_unchanged_detail_answers_304_with_one_query(self):
+        path = f'/api/projects/{self.project.id}/'
+        response = self.client.get(path, **self.auth)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertIn('private', response['Cache-Control'])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path, HTTP_IF_NONE_MATCH=etag, **self.auth)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(view_counters.pending(Proyecto, self.project.id), 2)
+
+        # Otro usuario no comparte el validador
+        other = get_user_model().objects.create_user(email='admin@test.com', password='testpass123', role='admin')
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=etag,
+                                   HTTP_AUTHORIZATION=f'Bearer {generate_access_token(other)}')
+        self.assertEqual(response.status_code, 200)
+
+        # Un guardado parcial también cambia la versión
+        self.project.title = 'Renamed'
+        self.project.save(update_fields=['title'])
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=etag, **self.auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'Renamed')
+
+        self.assertEqual(self.client.get(path, HTTP_IF_NONE_MATCH=etag).status_code, 401)
+
+    def test_list_version_changes_on_bulk_updates(self):
+        Notification.objects.create(user=self.user, title='Hola', message='Mensaje')
+        response = self.client.get('/api/notifications/', **self.auth)
+        etag = response['ETag']
+        self.assertEqual(self.client.get('/api/notifications/', HTTP_IF_NONE_MATCH=etag, **self.auth).status_code, 304)
+
+        self.client.post('/api/notifications/mark-all-read/', **self.auth)
+        response = self.client.get('/api/notifications/', HTTP_IF_NONE_MATCH=etag, **self.auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['data'][0]['read'])
+
+    def test_list_version_changes_on_single_mark_read(self):
+        notification = Notification.objects.create(user=self.user, title='Hola', message='Mensaje')
+        etag = self.client.get('/api/notifications/', **self.auth)['ETag']
+
+        response = self.client.post(f'/api/notifications/{notification.id}/mark-read/', **self.auth)
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get('/api/notifications/', HTTP_IF_NONE_MATCH=etag, **self.auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['data'][0]['read'])
+        etag = response['ETag']
+
+        notification.refresh_from_db()
+        notification.marcar_como_no_leida()
+        self.assertEqual(self.client.get('/api/notifications/', HTTP_IF_NONE_MATCH=etag, **self.auth).status_code, 200)
+
+
+
+class PooledSQLiteWrapper(PooledDatabaseWrapperMixin, SQLiteDatabaseWrapper):
+    """El mixin del backend mssql_pooled sobre SQLite, para probar la integración con Django"""
+
+
+class ConnectionPoolTest(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'pool.sqlite3')
+
+    def tearDown(self):
+        close_pools()
+        self.tmp.cleanup()
+
+    def pool(self, **kwargs):
+        return ConnectionPool(lambda: sqlite3.connect(self.path, check_same_thread=False), **kwargs)
+
+    def test_connections_are_reused(self):
+        pool = self.pool(max_size=2)
+        first = pool.acquire()
+        pool.release(first)
+        self.assertIs(pool.acquire(), first)
+
+        stats = pool.stats()
+        self.assertEqual((stats['created'], stats['checkouts'], stats['in_use'], stats['idle']), (1, 2, 1, 0))
+        self.assertGreaterEqual(stats['checkout_ms']['max'], stats['checkout_ms']['avg'])
+
+    def test_bounded_size_waits_and_times_out(self):
+        pool = self.pool(max_size=1, timeout=2)
+        held = pool.acquire()
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+        waiter.start()
+        for _ in range(100):
+            if pool.stats()['waiters']:
+                break
+            time.sleep(0.01)
+        self.assertEqual(pool.stats()['waiters'], 1)
+
+        pool.release(held)
+        waiter.join(2)
+        self.assertEqual(acquired, [held])
+        self.assertEqual(pool.stats()['waiters'], 0)
+
+        pool.timeout = 0.05
+        with self.assertRaises(PoolTimeout):
+            pool.acquire()
+        self.assertEqual(pool.stats()['timeouts'], 1)
+
+    def test_broken_connections_are_replaced_on_checkout(self):
+        pool = self.pool(health_check_interval=0)
+        broken = pool.acquire()
+        pool.release(broken)
+        broken.close()  # Simula una conexión cortada por el servidor mientras estaba libre
+
+        with self.assertLogs('core.connection_pool', 'WARNING'):
+            replacement = pool.acquire()
+        self.assertIsNot(replacement, broken)
+        replacement.execute('SELECT 1')
+        stats = pool.stats()
+        self.assertEqual((stats['health_check_failures'], stats['created'], stats['size']), (1, 2, 1))
+
+    def test_idle_connections_are_reaped_above_min_size(self):
+        pool = self.pool(max_size=3, min_size=1, max_idle=0.05)
+        connections_ = [pool.acquire() for _ in range(3)]
+        for conn in connections_:
+            pool.release(conn)
+        time.sleep(0.1)
+        pool.reap()
+
+        stats = pool.stats()
+        self.assertEqual((stats['reaped'], stats['size'], stats['idle']), (2, 1, 1))
+
+    def test_errored_connections_are_discarded(self):
+        pool = self.pool()
+        conn = pool.acquire()
+        pool.release(conn, discard=True)
+        self.assertEqual(pool.stats()['size'], 0)
+        self.assertIsNot(pool.acquire(), conn)
+
+    def test_django_close_returns_connection_to_pool(self):
+        settings_dict = {
+            **connection.settings_dict,
+            'NAME': self.path,
+            'CONN_MAX_AGE': 0,
+            'POOL': {'MAX_SIZE': 2},
+        }
+        wrapper = PooledSQLiteWrapper(settings_dict, alias='pool_test')
+        with wrapper.cursor() as cursor:
+            cursor.execute('CREATE TABLE items (id INTEGER PRIMARY KEY)')
+        raw = wrapper.connection
+        wrapper.close()
+        self.assertEqual(pool_stats()['pool_test']['idle'], 1)
+
+        # Otro wrapper del mismo alias (otro hilo en Django) reutiliza la conexión física
+        other = PooledSQLiteWrapper(settings_dict, alias='pool_test')
+        with other.cursor() as cursor:
+            cursor.execute('SELECT COUNT(*) FROM items')
+            self.assertEqual(cursor.fetchone(), (0,))
+        self.assertIs(other.connection, raw)
+        other.close()
+        self.assertEqual(pool_stats()['pool_test']['created'], 1)
+
+
+class DbPoolStatsEndpointTest(TestCase):
+    def test_admin_only(self):
+        User = get_user_model()
+        admin = User.objects.create_user(email='admin@test.com', password='testpass123', role='admin')
+        student = User.objects.create_user(email='student@test.com', password='testpass123', role='student')
+
+        response = self.client.get('/api/admin/db-pool/', HTTP_AUTHORIZATION=f'Bearer {generate_access_token(student)}')
+        self.assertEqual(response.status_code, 403)
+        response = self.client.get('/api/admin/db-pool/', HTTP_AUTHORIZATION=f'Bearer {generate_access_token(admin)}')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('pools', response.json())
+
+
+@override_settings(NDJSON_CHUNK_SIZE=2)
+class NdjsonStreamingTest(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.admin = User.objects.create_user(email='admin@test.com', password='testpass123', role='admin')
+        for i in range(4):
+            student_user = User.objects.create_user(email=f'student{i}@test.com', password='testpass123', role='student')
+            Estudiante.objects.create(user=student_user, section=f'S{i % 2}')
+        self.auth = {'HTTP_AUTHORIZATION': f'Bearer {generate_access_token(self.admin)}'}
+
+    def lines(self, content):
+        return [json.loads(line) for line in content.decode('utf-8').splitlines()]
+
+    def test_user_list_streams_one_line_per_row(self):
+        response = self.client.get('/api/users/', {'stream': '1', 'fields': 'id,email'}, **self.auth)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        chunks = list(response.streaming_content)
+        self.assertEqual(len(chunks), 3)  # 5 usuarios en bloques de 2
+        rows = self.lines(b''.join(chunks))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(set(rows[0]), {'id', 'email'})
+
+        # Sin streaming la respuesta paginada no cambia
+        self.assertEqual(len(self.client.get('/api/users/', **self.auth).json()['data']), 5)
+
+    def test_accept_header_and_compression(self):
+        response = self.client.get(
+            '/api/admin/students-by-section/', {'section': 'S1'},
+            HTTP_ACCEPT='application/x-ndjson', HTTP_ACCEPT_ENCODING='gzip', **self.auth,
+        )
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        rows = self.lines(gzip.decompress(b''.join(response.streaming_content)))
+        self.assertEqual([row['section'] for row in rows], ['S1', 'S1'])
+
+    async def test_asgi_streams_async_iterator(self):
+        headers = {'Authorization': self.auth['HTTP_AUTHORIZATION']}
+        response = await self.async_client.get('/api/users/', {'stream': '1'}, headers=headers)
+        self.assertTrue(response.is_async)
+        self.assertEqual(len(self.lines(b''.join([chunk async for chunk in response.streaming_content]))), 5)
+
+        for path in ('/api/strikes/', '/api/admin/evaluations/'):
+            response = await self.async_client.get(path, {'stream': 'true'}, headers=headers)
+            self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+            self.assertEqual([chunk async for chunk in response.streaming_content], [])
+
+    def test_error_mid_stream_ends_with_error_line(self):
+        from core.streaming import ndjson_lines
+
+        def serialize(value):
+            if value == 3:
+                raise ValueError('fila inválida')
+            return {'value': value}
+
+        with self.assertLogs('core.streaming', 'ERROR'):
+            rows = self.lines(b''.join(ndjson_lines(iter(range(5)), serialize, 2)))
+        self.assertEqual(rows, [{'value': 0}, {'value': 1}, {'value': 2}, {'error': 'fila inválida'}])
@@ -0,0 +1,86 @@
+"""
+Seguimiento de cambios de campos sin consultas adicionales.
+
+Los signals `post_save` y algunos `save()` necesitan comparar el estado
+anterior de la fila con el nuevo. Volver a leer la fila cuesta una consulta
+y, dentro de `post_save`, además devuelve los valores ya guardados.
+
+`ChangeTrackingMixin` toma una copia de los campos de `tracked_fields` al
+cargar la instancia (`from_db`) y la renueva después de cada `save()`, de modo
+que durante `pre_save`/`post_save` `previous()` devuelve el valor que había en
+la base de datos y `has_changed()` lo compara con el actual.
+
+Uso:
+
+    class Aplicacion(ChangeTrackingMixin, models.Model):
+        tracked_fields = ('status',)
+
+Las claves foráneas se siguen por su columna (`status` -> `status_id`).
+
+Los guardados parciales (`save(update_fields=...)`) también guardan los
+campos `auto_now` (`updated_at`), de los que dependen los validadores de
+core.conditional.
+"""
+
+
+class ChangeTrackingMixin:
+    """Mixin para modelos que exponen `has_changed`/`previous` sin consultar la base de datos"""
+
+    tracked_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_tracked_fields()
+        return instance
+
+    def _tracked_attname(self, field_name):
+        return self._meta.get_field(field_name).attname
+
+    def _snapshot_tracked_fields(self, fields=None):
+        state = self.__dict__.setdefault('_tracked_state', {})
+        for name in fields if fields is not None else self.tracked_fields:
+            if name not in self.tracked_fields:
+                continue
+            attname = self._tracked_attname(name)
+            # Los campos diferidos (.only/.defer) no se conocen hasta cargarse
+            if attname in self.__dict__:
+                state[name] = self.__dict__[attname]
+
+    def has_snapshot(self, field_name):
+        """True si se conoce el valor guardado del campo"""
+        return field_name in self.__dict__.get('_tracked_state', {})
+
+    def previous(self, field_name):
+        """Valor del campo en la base de datos (None si no se conoce)"""
+        return self.__dict__.get('_tracked_state', {}).get(field_name)
+
+    def has_changed(self, field_name):
+        """
+        True si el campo cambió respecto a la base de datos. Para instancias
+        nuevas o sin copia (construidas a mano) se asume que cambió.
+        """
+        attname = self._tracked_attname(field_name)
+        if attname not in self.__dict__:
+            return False  # Diferido y nunca asignado
+        if not self.has_snapshot(field_name):
+            return True
+        return self.__dict__[attname] != self.previous(field_name)
+
+    @property
+    def changed_fields(self):
+        return [name for name in self.tracked_fields if self.has_changed(name)]
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields:
+            auto_now = [field.name for field in self._meta.concrete_fields if getattr(field, 'auto_now', False)]
+            kwargs['update_fields'] = list(dict.fromkeys([*update_fields, *auto_now]))
+        super().save(*args, **kwargs)
+        # Los signals ya vieron el estado anterior; ahora lo guardado es el nuevo estado
+        update_fields = kwargs.get('update_fields')
+        self._snapshot_tracked_fields(list(update_fields) if update_fields is not None else None)
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        self._snapshot_tracked_fields(list(fields) if fields is not None else None)
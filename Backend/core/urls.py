@@ -59,6 +59,10 @@ urlpatterns = [
         path('dashboard/company_stats/', views.api_dashboard_company_stats, name='api_dashboard_company_stats'),
         path('dashboard/admin_stats/', views.api_dashboard_admin_stats, name='api_dashboard_admin_stats'),
         path('dashboard/teacher_stats/', views.api_dashboard_teacher_stats, name='api_dashboard_teacher_stats'),
+        path('dashboard/student_stats/async/', views.api_dashboard_student_stats_async, name='api_dashboard_student_stats_async'),
+        path('dashboard/company_stats/async/', views.api_dashboard_company_stats_async, name='api_dashboard_company_stats_async'),
+        path('dashboard/admin_stats/async/', views.api_dashboard_admin_stats_async, name='api_dashboard_admin_stats_async'),
+        path('dashboard/teacher_stats/async/', views.api_dashboard_teacher_stats_async, name='api_dashboard_teacher_stats_async'),
         path('hub/analytics/', views.api_hub_analytics_data, name='api_hub_analytics_data'),
         path('users/profile/', views.api_user_profile, name='api_user_profile'),
         path('users/change-password/', views.api_change_password, name='api_change_password'),
@@ -72,6 +76,7 @@ urlpatterns = [
         path('admin/students-by-section/', views.api_admin_students_by_section, name='admin_students_by_section'),
         path('admin/student-applications/<str:student_id>/', views.api_admin_student_applications, name='admin_student_applications'),
         path('admin/advanced-kpis/', views.api_admin_advanced_kpis, name='admin_advanced_kpis'),
+        path('admin/db-pool/', views.api_admin_db_pool_stats, name='admin_db_pool_stats'),
     ])),
     path('api/test-projects/', views.api_test_projects, name='api_test_projects'),
     path('api/test-admin-stats/', views.api_test_admin_stats, name='api_test_admin_stats'),
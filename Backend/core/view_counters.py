@@ -0,0 +1,208 @@
+"""
+Contadores de vistas con buffer en memoria.
+
+Cada vista de un proyecto o desafío hacía un `save()` de la fila (con todos
+sus signals `post_save`) solo para sumar 1 a `views_count`. Con este buffer
+las vistas se suman en memoria, en contadores repartidos en shards con su
+propio lock, y los deltas acumulados se escriben con un único UPDATE por
+modelo (`views_count = views_count + CASE pk WHEN ... END`).
+
+El envío ocurre como máximo cada VIEW_COUNTER_FLUSH_INTERVAL segundos (lo
+dispara la siguiente vista registrada) y al terminar el proceso. Los deltas
+son sumas, así que cada proceso del servidor puede tener su propio buffer
+sin pisar a los demás.
+
+El buffer también mantiene un puntaje de tendencia por objeto (vistas con
+decaimiento exponencial, vida media VIEW_COUNTER_TRENDING_HALF_LIFE) para
+los rankings de tendencia; el ranking de más vistos combina `views_count`
+con los deltas aún no enviados.
+"""
+
+import atexit
+import logging
+import math
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db.models import Case, F, IntegerField, Value, When
+
+logger = logging.getLogger(__name__)
+
+SHARD_COUNT = 16
+MIN_TRENDING_SCORE = 0.01  # Puntajes menores se descartan al enviar
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+class _Shard:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pending = defaultdict(int)  # (model, pk) -> vistas sin enviar
+        self.trending = {}               # (model, pk) -> (puntaje, timestamp)
+
+
+class ViewCounterBuffer:
+    """Buffer de vistas por proceso (una instancia por proceso)"""
+
+    def __init__(self):
+        self._shards = [_Shard() for _ in range(SHARD_COUNT)]
+        self._flush_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def _shard(self, key):
+        return self._shards[hash(key) % SHARD_COUNT]
+
+    def _decay(self, elapsed):
+        half_life = _setting('VIEW_COUNTER_TRENDING_HALF_LIFE', 3600)
+        return math.exp(-math.log(2) * elapsed / half_life)
+
+    def record(self, model, pk, count=1):
+        """Registra vistas de un objeto; no toca la base de datos salvo al enviar el buffer"""
+        key = (model, str(pk))
+        now = time.time()
+        shard = self._shard(key)
+        with shard.lock:
+            shard.pending[key] += count
+            score, updated_at = shard.trending.get(key, (0.0, now))
+            shard.trending[key] = (score * self._decay(now - updated_at) + count, now)
+
+        if time.monotonic() - self._last_flush >= _setting('VIEW_COUNTER_FLUSH_INTERVAL', 30):
+            self.flush(blocking=False)
+
+    def clear(self):
+        """Descarta vistas pendientes y puntajes (pruebas)"""
+        for shard in self._shards:
+            with shard.lock:
+                shard.pending = defaultdict(int)
+                shard.trending = {}
+
+    def pending(self, model, pk):
+        """Vistas registradas y aún no escritas en la base de datos"""
+        key = (model, str(pk))
+        shard = self._shard(key)
+        with shard.lock:
+            return shard.pending.get(key, 0)
+
+    def _take_pending(self):
+        deltas = defaultdict(dict)
+        cutoff_now = time.time()
+        for shard in self._shards:
+            with shard.lock:
+                pending, shard.pending = shard.pending, defaultdict(int)
+                # Descartar puntajes de tendencia que ya decayeron
+                shard.trending = {
+                    key: (score, updated_at)
+                    for key, (score, updated_at) in shard.trending.items()
+                    if score * self._decay(cutoff_now - updated_at) >= MIN_TRENDING_SCORE
+                }
+            for (model, pk), count in pending.items():
+                deltas[model][pk] = count
+        return deltas
+
+    def _restore_pending(self, model, deltas):
+        for pk, count in deltas.items():
+            key = (model, pk)
+            shard = self._shard(key)
+            with shard.lock:
+                shard.pending[key] += count
+
+    def flush(self, blocking=True):
+        """
+        Escribe los deltas acumulados: un UPDATE por modelo. Retorna el número
+        de filas actualizadas. Si falla, los deltas vuelven al buffer.
+        """
+        if not self._flush_lock.acquire(blocking=blocking):
+            return 0  # Otro hilo ya está enviando
+        try:
+            self._last_flush = time.monotonic()
+            updated = 0
+            for model, deltas in self._take_pending().items():
+                try:
+                    # Sin updated_at: las vistas no invalidan los ETag de core.conditional (se
+                    # sumarían en cada flush); el detalle muestra views_count + pending()
+                    updated += model._default_manager.filter(pk__in=list(deltas)).update(
+                        views_count=F('views_count') + Case(
+                            *[When(pk=pk, then=Value(count)) for pk, count in deltas.items()],
+                            default=Value(0),
+                            output_field=IntegerField(),
+                        )
+                    )
+                except Exception:
+                    logger.exception(f"Error al guardar vistas de {model.__name__}; se reintentará")
+                    self._restore_pending(model, deltas)
+            return updated
+        finally:
+            self._flush_lock.release()
+
+    def trending(self, model, limit=10):
+        """[(pk, puntaje)] de los objetos con más vistas recientes (decaimiento exponencial)"""
+        now = time.time()
+        scores = []
+        for shard in self._shards:
+            with shard.lock:
+                scores.extend(
+                    (pk, score * self._decay(now - updated_at))
+                    for (shard_model, pk), (score, updated_at) in shard.trending.items()
+                    if shard_model is model
+                )
+        scores.sort(key=lambda item: item[1], reverse=True)
+        return [(pk, round(score, 3)) for pk, score in scores[:limit]]
+
+    def most_viewed(self, model, limit=10, queryset=None):
+        """
+        [(objeto, vistas)] con más vistas totales (guardadas + pendientes).
+        Las vistas pendientes solo suman, así que basta mirar los `limit`
+        primeros de la base de datos y los objetos con deltas pendientes.
+        """
+        queryset = queryset if queryset is not None else model._default_manager.all()
+        pending = {}
+        for shard in self._shards:
+            with shard.lock:
+                pending.update({
+                    pk: count for (shard_model, pk), count in shard.pending.items() if shard_model is model
+                })
+
+        candidates = {str(obj.pk): obj for obj in queryset.order_by('-views_count')[:limit]}
+        missing = [pk for pk in pending if pk not in candidates]
+        if missing:
+            candidates.update({str(obj.pk): obj for obj in queryset.filter(pk__in=missing)})
+
+        ranking = [(obj, obj.views_count + pending.get(pk, 0)) for pk, obj in candidates.items()]
+        ranking.sort(key=lambda item: item[1], reverse=True)
+        return ranking[:limit]
+
+    def rankings(self, model, limit=10, queryset=None):
+        """Rankings de tendencia y más vistos listos para serializar"""
+        queryset = queryset if queryset is not None else model._default_manager.all()
+        trending = self.trending(model, limit=limit * 2)  # Margen por objetos filtrados del queryset
+        objects = {str(obj.pk): obj for obj in queryset.filter(pk__in=[pk for pk, _ in trending])}
+        return {
+            'trending': [
+                {
+                    'id': pk,
+                    'title': objects[pk].title,
+                    'score': score,
+                    'views_count': objects[pk].views_count + self.pending(model, pk),
+                }
+                for pk, score in trending if pk in objects
+            ][:limit],
+            'most_viewed': [
+                {'id': str(obj.pk), 'title': obj.title, 'views_count': views}
+                for obj, views in self.most_viewed(model, limit=limit, queryset=queryset)
+            ],
+        }
+
+
+view_counters = ViewCounterBuffer()
+
+
+@atexit.register
+def _flush_on_exit():
+    try:
+        view_counters.flush()
+    except Exception:
+        logger.exception("Error al guardar las vistas pendientes al terminar el proceso")
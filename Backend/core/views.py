@@ -6,11 +6,14 @@ from django.shortcuts import render, redirect
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
+from django.http import HttpResponseNotAllowed
+from asgiref.sync import sync_to_async
 from users.models import User
 import json
+import os
 from datetime import datetime, timedelta
 import jwt
 from django.conf import settings
@@ -27,6 +30,15 @@ from students.models import Estudiante, ApiLevelRequest
 from companies.models import Empresa
 from work_hours.models import WorkHour
 from project_status.models import ProjectStatus
+from core.reference_data import reference_data
+from core.db_router import read_from_replica
+from core.async_aggregates import gather_aggregates
+from core.connection_pool import pool_stats
+from core.streaming import ndjson_response, wants_ndjson
+from core.dashboard_aggregates import (
+    admin_aggregates, admin_stats_response, company_aggregates, company_stats_response,
+    student_aggregates, student_stats_response, teacher_aggregates, teacher_stats_response,
+)
 from strikes.models import Strike, StrikeReport
 from notifications.models import Notification
 from mass_notifications.models import MassNotification
@@ -1115,13 +1127,13 @@ def api_dashboard_company_stats(request):
             # Proyectos con estado 'active' (en desarrollo)
             active_status_projects = Proyecto.objects.filter(
                 company=company,
-                status__name='active'
+                status_id__in=reference_data.status_ids('active')
             ).count()
             
             # Proyectos con estado 'published' que tienen estudiantes aceptados
             published_with_students = Proyecto.objects.filter(
                 company=company,
-                status__name='published'
+                status_id__in=reference_data.status_ids('published')
             ).filter(
                 project_applications__estado__in=['accepted', 'completed']
             ).distinct().count()
@@ -1132,14 +1144,14 @@ def api_dashboard_company_stats(request):
             # 2.1. Proyectos publicados (separado de activos)
             published_projects = Proyecto.objects.filter(
                 company=company,
-                status__name='published'
+                status_id__in=reference_data.status_ids('published')
             ).count()
             print(f'📊 [COMPANY STATS] Proyectos publicados: {published_projects}')
             
             # 3. Proyectos completados
             completed_projects = Proyecto.objects.filter(
                 company=company, 
-                status__name='completed'
+                status_id__in=reference_data.status_ids('completed')
             ).count()
             print(f'📊 [COMPANY STATS] Proyectos completados: {completed_projects}')
             
@@ -1189,7 +1201,7 @@ def api_dashboard_company_stats(request):
             from django.db.models import Q, Count
             proyectos_completados = Proyecto.objects.filter(
                 company=company,
-                status__name='completed'
+                status_id__in=reference_data.status_ids('completed')
             )
             
             print(f'📊 [COMPANY STATS] Proyectos completados encontrados: {proyectos_completados.count()}')
@@ -1401,63 +1413,19 @@ def api_dashboard_student_stats(request):
                 'error': 'Acceso denegado. Solo estudiantes pueden acceder a este endpoint.'
             }, status=403)
         
-        # Importar modelos necesarios
-        from applications.models import Aplicacion
-        from projects.models import Proyecto, MiembroProyecto
+        from students.dashboard import get_student_dashboard_stats
+        from notifications.counters import get_unread_count
         
         # Obtener el perfil de estudiante del usuario
-        try:
-            student = user.estudiante_profile
-        except Exception as e:
-            print(f"Error obteniendo perfil de estudiante: {e}")
+        student = Estudiante.objects.filter(user=user).first()
+        if not student:
             return JsonResponse({
-                'error': 'Perfil de estudiante no encontrado',
-                'details': str(e)
+                'error': 'Perfil de estudiante no encontrado'
             }, status=404)
         
-        # Obtener estadísticas básicas
+        # Estadísticas agregadas (consultas agrupadas, cacheadas por estudiante)
         try:
-            print(f"🔍 [STUDENT DASHBOARD] Calculando estadísticas para estudiante: {student.user.email}")
-            
-            total_applications = Aplicacion.objects.filter(student=student).count()
-            print(f"📝 [STUDENT DASHBOARD] Total aplicaciones: {total_applications}")
-            
-            pending_applications = Aplicacion.objects.filter(student=student, status='pending').count()
-            print(f"⏳ [STUDENT DASHBOARD] Aplicaciones pendientes: {pending_applications}")
-            
-            accepted_applications = Aplicacion.objects.filter(student=student, status='accepted').count()
-            print(f"✅ [STUDENT DASHBOARD] Aplicaciones aceptadas: {accepted_applications}")
-            
-            # Obtener proyectos del estudiante a través de aplicaciones aceptadas, activas O completadas
-            accepted_statuses = ['accepted', 'active', 'completed']
-            accepted_applications_objs = Aplicacion.objects.filter(student=student, status__in=accepted_statuses)
-            print(f"🔗 [STUDENT DASHBOARD] Objetos de aplicaciones aceptadas: {accepted_applications_objs.count()}")
-            
-            student_projects = Proyecto.objects.filter(application_project__in=accepted_applications_objs)
-            print(f"💼 [STUDENT DASHBOARD] Proyectos del estudiante: {student_projects.count()}")
-            
-            # También obtener proyectos a través de membresías activas
-            active_memberships = MiembroProyecto.objects.filter(usuario=user, esta_activo=True, rol='estudiante')
-            projects_from_memberships = Proyecto.objects.filter(miembros__in=active_memberships)
-            print(f"👥 [STUDENT DASHBOARD] Proyectos desde membresías: {projects_from_memberships.count()}")
-            
-            # Combinar ambos conjuntos de proyectos
-            all_student_projects = (student_projects | projects_from_memberships).distinct()
-            print(f"📊 [STUDENT DASHBOARD] Total proyectos únicos del estudiante: {all_student_projects.count()}")
-            
-            total_projects = all_student_projects.count()
-            active_projects = all_student_projects.filter(status__name='active').count()
-            print(f"🔄 [STUDENT DASHBOARD] Proyectos activos: {active_projects}")
-            
-            # Calcular proyectos disponibles (proyectos publicados, no postulados, cumple nivel API)
-            published_projects = Proyecto.objects.filter(status__name='published')
-            applied_project_ids = Aplicacion.objects.filter(student=student).values_list('project', flat=True)
-            available_projects = published_projects.exclude(id__in=applied_project_ids).filter(
-                min_api_level__lte=student.api_level
-            ).count()
-            print(f"📋 [STUDENT DASHBOARD] Proyectos publicados: {published_projects.count()}")
-            print(f"📋 [STUDENT DASHBOARD] Proyectos ya aplicados: {applied_project_ids.count()}")
-            print(f"📋 [STUDENT DASHBOARD] Proyectos disponibles: {available_projects}")
+            stats = get_student_dashboard_stats(student)
         except Exception as e:
             print(f"Error calculando estadísticas: {e}")
             return JsonResponse({
@@ -1465,116 +1433,32 @@ def api_dashboard_student_stats(request):
                 'details': str(e)
             }, status=500)
         
-        # Obtener notificaciones no leídas
+        # Obtener notificaciones no leídas (contador cacheado)
         try:
-            from notifications.models import Notification
-            unread_notifications = Notification.objects.filter(user=user, read=False).count()
+            unread_notifications = get_unread_count(user)
         except Exception as e:
             print(f"Error obteniendo notificaciones: {e}")
             unread_notifications = 0
         
-        # Calcular proyectos completados del estudiante
-        completed_projects = all_student_projects.filter(status__name='completed').count()
-        print(f"🏁 [STUDENT DASHBOARD] Proyectos completados: {completed_projects}")
-        
-        # Obtener nivel de API del estudiante
-        api_level = student.api_level
-        print(f"🔧 [STUDENT DASHBOARD] Nivel API: {api_level}")
-        
-        # Obtener horas totales del estudiante
-        total_hours = student.total_hours
-        print(f"⏰ [STUDENT DASHBOARD] Horas totales: {total_hours}")
-        
-        # Obtener strikes del estudiante
-        strikes = student.strikes
-        print(f"⚠️ [STUDENT DASHBOARD] Strikes: {strikes}")
-        
-        # Obtener GPA del estudiante
-        gpa = float(student.gpa)
-        print(f"📊 [STUDENT DASHBOARD] GPA: {gpa}")
-        
-        # 11. Distribución de aplicaciones por estado
-        from django.db.models import Count
-        application_distribution = Aplicacion.objects.filter(
-            student=student
-        ).values('status').annotate(
-            count=Count('id')
-        ).order_by('-count')
-        
-        application_data = []
-        for app in application_distribution:
-            status_name = {
-                'pending': 'Pendientes',
-                'accepted': 'Aceptadas',
-                'rejected': 'Rechazadas',
-                'completed': 'Completadas',
-                'withdrawn': 'Retiradas'
-            }.get(app['status'], app['status'])
-            
-            application_data.append({
-                'name': status_name,
-                'count': app['count']
-            })
-        print(f'📊 [STUDENT DASHBOARD] Distribución de aplicaciones: {application_data}')
-        
-        # 12. Actividad mensual (últimos 6 meses)
-        from django.utils import timezone
-        from datetime import datetime, timedelta
-        
-        monthly_activity = []
-        for i in range(6):
-            month_start = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0) - timedelta(days=30*i)
-            month_end = month_start.replace(day=28) + timedelta(days=4)
-            month_end = month_end.replace(day=1) - timedelta(days=1)
-            
-            # Aplicaciones enviadas este mes
-            month_applications = Aplicacion.objects.filter(
-                student=student,
-                applied_at__gte=month_start,
-                applied_at__lte=month_end
-            ).count()
-            
-            # Horas trabajadas este mes
-            from work_hours.models import WorkHour
-            from django.db.models import Sum
-            month_hours_result = WorkHour.objects.filter(
-                student=student,
-                date__gte=month_start,
-                date__lte=month_end
-            ).aggregate(total_hours=Sum('hours_worked'))['total_hours']
-            
-            # Convertir a float si es Decimal
-            month_hours = float(month_hours_result) if month_hours_result else 0
-            
-            monthly_activity.append({
-                'month': month_start.strftime('%B %Y'),
-                'applications': month_applications,
-                'hours': month_hours
-            })
-        
-        monthly_activity.reverse()  # Ordenar de más antiguo a más reciente
-        print(f'📊 [STUDENT DASHBOARD] Actividad mensual: {monthly_activity}')
-        
         # Preparar respuesta
         response_data = {
-            'total_applications': total_applications,
-            'pending_applications': pending_applications,
-            'accepted_applications': accepted_applications,
-            'total_projects': total_projects,
-            'active_projects': active_projects,
-            'completed_projects': completed_projects,
-            'api_level': api_level,
-            'total_hours': total_hours,
-            'strikes': strikes,
-            'gpa': gpa,
-            'available_projects': available_projects,
+            'total_applications': stats['total_applications'],
+            'pending_applications': stats['pending_applications'],
+            'accepted_applications': stats['accepted_applications'],
+            'total_projects': stats['total_projects'],
+            'active_projects': stats['active_projects'],
+            'completed_projects': stats['completed_projects'],
+            'api_level': student.api_level,
+            'total_hours': student.total_hours,
+            'strikes': student.strikes,
+            'gpa': float(student.gpa),
+            'available_projects': stats['available_projects'],
             'unread_notifications': unread_notifications,
-            'application_distribution': application_data,
-            'monthly_activity': monthly_activity,
+            'application_distribution': stats['application_distribution'],
+            'monthly_activity': stats['monthly_activity'],
             'recent_activity': []  # Placeholder para actividad reciente
         }
         
-        print(f"✅ Datos del dashboard de estudiante: {response_data}")
         return JsonResponse(response_data)
         
     except Exception as e:
@@ -1588,6 +1472,7 @@ def api_dashboard_student_stats(request):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@read_from_replica
 def api_dashboard_admin_stats(request):
     """API endpoint para estadísticas del dashboard de administrador."""
     import traceback
@@ -2045,6 +1930,7 @@ def test_simple(request):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@read_from_replica
 def api_hub_analytics_data(request):
     """
     Endpoint para obtener datos del Hub de Reportes y Analytics
@@ -2099,20 +1985,20 @@ def api_hub_analytics_data(request):
         
         # Filtrar por nombre del estado usando la relación - hacer más flexible
         active_projects = Proyecto.objects.filter(
-            status__name__in=['active', 'published']
+            status_id__in=reference_data.status_ids('active', 'published')
         ).count()
         
         completed_projects = Proyecto.objects.filter(
-            status__name__in=['completed']
+            status_id__in=reference_data.status_ids('completed')
         ).count()
         
         pending_projects = Proyecto.objects.filter(
-            status__name__in=['draft']
+            status_id__in=reference_data.status_ids('draft')
         ).count()
         
         # Los proyectos cancelados incluyen tanto los cancelados como los eliminados
         cancelled_projects = Proyecto.objects.filter(
-            status__name__in=['deleted']
+            status_id__in=reference_data.status_ids('deleted')
         ).count()
         
         # Obtener total de aplicaciones y horas para datos de ejemplo
@@ -2692,7 +2578,7 @@ def api_hub_analytics_data(request):
             total_company_projects = Proyecto.objects.filter(company__isnull=False).count()
             completed_company_projects = Proyecto.objects.filter(
                 company__isnull=False,
-                status__name__in=['completed']
+                status_id__in=reference_data.status_ids('completed')
             ).count()
             company_satisfaction_rate = (completed_company_projects / total_company_projects * 100) if total_company_projects > 0 else 0
             
@@ -2744,7 +2630,7 @@ def api_hub_analytics_data(request):
                             
                             if total_projects_area > 0:
                                 completed_projects_area = projects_in_area.filter(
-                                    status__name__in=['completed']
+                                    status_id__in=reference_data.status_ids('completed')
                                 ).count()
                                 satisfaction_rate = (completed_projects_area / total_projects_area) * 100
                                 
@@ -2840,7 +2726,7 @@ def api_hub_analytics_data(request):
         try:
             # Tiempo promedio de finalización vs estimado
             completed_projects_with_dates = Proyecto.objects.filter(
-                status__name__in=['completed'],
+                status_id__in=reference_data.status_ids('completed'),
                 created_at__isnull=False,
                 updated_at__isnull=False
             )
@@ -2900,12 +2786,12 @@ def api_hub_analytics_data(request):
                     if total_projects_area > 0:
                         # Proyectos completados en esta área
                         completed_projects_area = projects_in_area.filter(
-                            status__name__in=['completed']
+                            status_id__in=reference_data.status_ids('completed')
                         ).count()
                         
                         # Calcular eficiencia de tiempo para esta área
                         area_efficiency_data = []
-                        for project in projects_in_area.filter(status__name__in=['completed']):
+                        for project in projects_in_area.filter(status_id__in=reference_data.status_ids('completed')):
                             if project.updated_at and project.created_at:
                                 real_time = (project.updated_at - project.created_at).days
                                 estimated_time = getattr(project, 'estimated_duration', 30) or 30
@@ -3328,6 +3214,7 @@ def api_check_company_email(request):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@read_from_replica
 def api_dashboard_teacher_stats(request):
     """API endpoint para estadísticas del dashboard del profesor."""
     import traceback
@@ -3409,10 +3296,91 @@ def api_dashboard_teacher_stats(request):
             'traceback': traceback.format_exc()
         }, status=500)
 
+# ===== DASHBOARDS ASYNC =====
+# Versiones async de los dashboards: los agregados independientes se ejecutan
+# a la vez (core.async_aggregates) y la respuesta indica si es parcial.
+# Son vistas GET sin cookies de sesión, por lo que no necesitan csrf_exempt
+# (que en Django 4.2 no admite vistas async); el método se valida aquí.
+
+async def _async_dashboard_user(request, role, denied_message):
+    """Autentica la petición de un dashboard async. Retorna (usuario, respuesta de error)."""
+    if request.method != 'GET':
+        return None, HttpResponseNotAllowed(['GET'])
+
+    auth_header = request.headers.get('Authorization')
+    if not auth_header or not auth_header.startswith('Bearer '):
+        return None, JsonResponse({'error': 'Token de autenticación requerido'}, status=401)
+
+    user = await sync_to_async(verify_token)(auth_header.split(' ')[1])
+    if not user:
+        return None, JsonResponse({'error': 'Token inválido'}, status=401)
+    if user.role != role:
+        return None, JsonResponse({'error': denied_message}, status=403)
+    return user, None
+
+
+async def api_dashboard_company_stats_async(request):
+    """Estadísticas del dashboard de empresa con los agregados en paralelo."""
+    user, error = await _async_dashboard_user(
+        request, 'company', 'Acceso denegado. Solo empresas pueden acceder a este endpoint.'
+    )
+    if error:
+        return error
+
+    company = await Empresa.objects.filter(user=user).afirst()
+    if company is None:
+        return JsonResponse({'error': 'Perfil de empresa no encontrado'}, status=404)
+
+    results = await gather_aggregates(company_aggregates(company))
+    return JsonResponse(company_stats_response(results))
+
+
+async def api_dashboard_student_stats_async(request):
+    """Estadísticas del dashboard de estudiante con los agregados en paralelo."""
+    user, error = await _async_dashboard_user(
+        request, 'student', 'Acceso denegado. Solo estudiantes pueden acceder a este endpoint.'
+    )
+    if error:
+        return error
+
+    student = await Estudiante.objects.filter(user=user).afirst()
+    if student is None:
+        return JsonResponse({'error': 'Perfil de estudiante no encontrado'}, status=404)
+
+    results = await gather_aggregates(student_aggregates(student, user))
+    return JsonResponse(student_stats_response(student, results))
+
+
+@read_from_replica
+async def api_dashboard_admin_stats_async(request):
+    """Estadísticas del dashboard de administrador con los agregados en paralelo."""
+    user, error = await _async_dashboard_user(
+        request, 'admin', 'Acceso denegado. Solo administradores pueden acceder a este endpoint.'
+    )
+    if error:
+        return error
+
+    results = await gather_aggregates(admin_aggregates())
+    return JsonResponse(admin_stats_response(results))
+
+
+@read_from_replica
+async def api_dashboard_teacher_stats_async(request):
+    """Estadísticas del dashboard del profesor con los agregados en paralelo."""
+    user, error = await _async_dashboard_user(
+        request, 'teacher', 'Acceso denegado. Solo profesores pueden acceder a este endpoint.'
+    )
+    if error:
+        return error
+
+    results = await gather_aggregates(teacher_aggregates(user))
+    return JsonResponse(teacher_stats_response(results))
+
 @csrf_exempt
 @require_http_methods(["GET"])
-def api_admin_advanced_kpis(request):
-    """API endpoint para KPIs avanzados del administrador."""
+@read_from_replica
+def api_admin_students_by_section(request):
+    """API para obtener estudiantes organizados por sección."""
     try:
         # Verificar autenticación
         auth_header = request.headers.get('Authorization')
@@ -3425,192 +3393,41 @@ def api_admin_advanced_kpis(request):
         if not user or user.role != 'admin':
             return JsonResponse({'error': 'Acceso denegado'}, status=403)
         
-        from users.models import User
-        from projects.models import Proyecto, AplicacionProyecto
-        from companies.models import Empresa
-        from students.models import Estudiante
-        from teachers.models import TeacherStudent, TeacherProject
-        from django.db.models import Count, Avg, Sum, Q
-        from django.utils import timezone
-        from datetime import datetime, timedelta
-        
-        # 1. Número de desafíos colectivos creados por empresa
-        collective_challenges_by_company = []
-        companies_with_projects = Empresa.objects.annotate(
-            total_projects_count=Count('proyectos'),
-            collective_projects=Count('proyectos', filter=Q(proyectos__max_students__gt=1))
-        ).filter(total_projects_count__gt=0).order_by('-collective_projects')[:10]
-        
-        for company in companies_with_projects:
-            collective_challenges_by_company.append({
-                'company_name': company.company_name,
-                'total_projects': company.total_projects_count,
-                'collective_projects': company.collective_projects,
-                'completion_rate': 0  # Se calculará después
-            })
-        
-        # 2. Tasa de completación de desafíos por sección
-        completion_by_section = []
-        sections = Estudiante.objects.values_list('section', flat=True).distinct().exclude(section__isnull=True)
-        
-        for section in sections:
-            students_in_section = Estudiante.objects.filter(section=section)
-            total_projects = AplicacionProyecto.objects.filter(
-                student__in=students_in_section
-            ).count()
-            completed_projects = AplicacionProyecto.objects.filter(
-                student__in=students_in_section,
-                status='completed'
-            ).count()
-            
-            completion_rate = (completed_projects / total_projects * 100) if total_projects > 0 else 0
-            
-            completion_by_section.append({
-                'section': section,
-                'total_projects': total_projects,
-                'completed_projects': completed_projects,
-                'completion_rate': round(completion_rate, 2)
-            })
-        
-        # 3. Satisfacción del docente con los desafíos
-        teacher_satisfaction = []
-        teachers = User.objects.filter(role='teacher')
-        
-        for teacher in teachers:
-            supervised_projects = TeacherProject.objects.filter(teacher=teacher)
-            avg_satisfaction = supervised_projects.aggregate(
-                avg_satisfaction=Avg('hours_supervised')
-            )['avg_satisfaction'] or 0
-            
-            teacher_satisfaction.append({
-                'teacher_name': teacher.full_name,
-                'supervised_projects': supervised_projects.count(),
-                'avg_satisfaction': round(float(avg_satisfaction), 2)
-            })
-        
-        # 4. Tiempo promedio de resolución de desafíos
-        avg_resolution_time = []
-        completed_projects = Proyecto.objects.filter(
-            real_end_date__isnull=False,
-            start_date__isnull=False
+        from students.section_analytics import (
+            AcademicPeriod, get_section_stats, get_section_students_page,
+            section_students_queryset, serialize_section_student,
         )
         
-        total_days = 0
-        project_count = 0
-        
-        for project in completed_projects:
-            if project.start_date and project.real_end_date:
-                days = (project.real_end_date - project.start_date).days
-                total_days += days
-                project_count += 1
-        
-        avg_resolution_days = (total_days / project_count) if project_count > 0 else 0
-        
-        # 5. Ranking de empresas más activas en desafíos colectivos
-        active_companies_ranking = []
-        for company in companies_with_projects:
-            active_companies_ranking.append({
-                'company_name': company.company_name,
-                'collective_projects': company.collective_projects,
-                'total_projects': company.total_projects_count,
-                'activity_score': company.collective_projects * 2 + company.total_projects
-            })
+        try:
+            period = AcademicPeriod.parse(request.GET.get('period'))
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
         
-        active_companies_ranking.sort(key=lambda x: x['activity_score'], reverse=True)
-        
-        # 6. Top 20 estudiantes con desafíos colectivos
-        top_students_collective = []
-        students_with_collective = Estudiante.objects.annotate(
-            collective_applications=Count(
-                'aplicaciones',
-                filter=Q(aplicaciones__project__max_students__gt=1)
-            ),
-            completed_collective=Count(
-                'aplicaciones',
-                filter=Q(
-                    aplicaciones__project__max_students__gt=1,
-                    aplicaciones__status='completed'
-                )
-            )
-        ).filter(collective_applications__gt=0).order_by('-collective_applications')[:20]
-        
-        for student in students_with_collective:
-            top_students_collective.append({
-                'student_name': student.user.full_name,
-                'rut': student.rut or 'No disponible',
-                'section': student.section or 'No asignada',
-                'collective_applications': student.collective_applications,
-                'completed_collective': student.completed_collective,
-                'success_rate': round(
-                    (student.completed_collective / student.collective_applications * 100) 
-                    if student.collective_applications > 0 else 0, 2
-                )
-            })
+        section = request.GET.get('section')
         
-        return JsonResponse({
-            'collective_challenges_by_company': collective_challenges_by_company,
-            'completion_by_section': completion_by_section,
-            'teacher_satisfaction': teacher_satisfaction,
-            'avg_resolution_time_days': round(avg_resolution_days, 2),
-            'active_companies_ranking': active_companies_ranking[:10],
-            'top_students_collective': top_students_collective,
-            'generated_at': timezone.now().isoformat()
-        })
+        # Volcado completo de estudiantes en streaming (Accept: application/x-ndjson o ?stream=1)
+        if wants_ndjson(request):
+            return ndjson_response(request, section_students_queryset(period, section), serialize_section_student)
         
-    except Exception as e:
-        print(f"❌ [ADVANCED KPIS] Error: {str(e)}")
-        return JsonResponse({'error': str(e)}, status=500)
-
-@csrf_exempt
-@require_http_methods(["GET"])
-def api_admin_students_by_section(request):
-    """API para obtener estudiantes organizados por sección."""
-    try:
-        # Verificar autenticación
-        auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return JsonResponse({'error': 'Token requerido'}, status=401)
-        
-        token = auth_header.split(' ')[1]
-        user = verify_token(token)
-        
-        if not user or user.role != 'admin':
-            return JsonResponse({'error': 'Acceso denegado'}, status=403)
+        try:
+            page = max(int(request.GET.get('page', 1)), 1)
+            limit = max(1, min(int(request.GET.get('limit', 50)), 200))
+        except ValueError:
+            return JsonResponse({'error': 'Parámetros page/limit inválidos'}, status=400)
         
-        from students.models import Estudiante
-        from projects.models import AplicacionProyecto
-        from django.db.models import Count, Q
-        
-        students = Estudiante.objects.select_related('user').annotate(
-            applied_projects=Count('aplicaciones_estudiante'),
-            current_projects=Count('aplicaciones_estudiante', filter=Q(aplicaciones_estudiante__estado='accepted')),
-            collective_projects=Count(
-                'aplicaciones_estudiante',
-                filter=Q(aplicaciones_estudiante__proyecto__max_students__gt=1)
-            )
-        ).order_by('section', 'user__first_name')
-        
-        students_data = []
-        for student in students:
-            students_data.append({
-                'id': str(student.id),
-                'name': student.user.full_name,
-                'rut': student.rut or 'No disponible',
-                'email': student.user.email,
-                'section': student.section or 'Sin sección',
-                'career': student.career or 'No especificada',
-                'semester': student.semester,
-                'status': student.status,
-                'applied_projects': student.applied_projects,
-                'current_projects': student.current_projects,
-                'collective_projects': student.collective_projects,
-                'api_level': student.api_level,
-                'gpa': float(student.gpa)
-            })
+        students_data, total = get_section_students_page(period, section=section, page=page, limit=limit)
         
         return JsonResponse({
+            'sections': get_section_stats(period),
             'students': students_data,
-            'total_students': len(students_data)
+            'total_students': total,
+            'period': period.key,
+            'pagination': {
+                'page': page,
+                'limit': limit,
+                'total': total,
+                'pages': (total + limit - 1) // limit
+            }
         })
         
     except Exception as e:
@@ -3619,6 +3436,7 @@ def api_admin_students_by_section(request):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@read_from_replica
 def api_admin_student_applications(request, student_id):
     """API para obtener aplicaciones de un estudiante específico."""
     try:
@@ -3665,8 +3483,125 @@ def api_admin_student_applications(request, student_id):
         print(f"❌ [STUDENT APPLICATIONS] Error: {str(e)}")
         return JsonResponse({'error': str(e)}, status=500)
 
+def _build_admin_advanced_kpis(period):
+    """Construye el payload de KPIs avanzados de administración para un período académico."""
+    from users.models import User
+    from projects.models import Proyecto, AplicacionProyecto
+    from companies.models import Empresa
+    from students.models import Estudiante
+    from teachers.models import TeacherStudent, TeacherProject
+    from django.db.models import Count, Avg, Sum, Q
+    from django.utils import timezone
+    from datetime import datetime, timedelta
+    
+    # 1. Número de desafíos colectivos creados por empresa
+    collective_challenges_by_company = []
+    companies_with_projects = Empresa.objects.annotate(
+        total_projects_count=Count('proyectos'),
+        collective_projects=Count('proyectos', filter=Q(proyectos__max_students__gt=1))
+    ).filter(total_projects_count__gt=0).order_by('-collective_projects')[:10]
+    
+    for company in companies_with_projects:
+        collective_challenges_by_company.append({
+            'company_name': company.company_name,
+            'total_projects': company.total_projects_count,
+            'collective_projects': company.collective_projects,
+            'completion_rate': 0  # Se calculará después
+        })
+    
+    # 2. Tasa de completación de desafíos por sección (un GROUP BY section, cacheado por período)
+    from students.section_analytics import get_section_stats
+    completion_by_section = get_section_stats(period)
+    
+    # 3. Satisfacción del docente con los desafíos
+    teacher_satisfaction = []
+    teachers = User.objects.filter(role='teacher')
+    
+    for teacher in teachers:
+        supervised_projects = TeacherProject.objects.filter(teacher=teacher)
+        avg_satisfaction = supervised_projects.aggregate(
+            avg_satisfaction=Avg('hours_supervised')
+        )['avg_satisfaction'] or 0
+        
+        teacher_satisfaction.append({
+            'teacher_name': teacher.full_name,
+            'supervised_projects': supervised_projects.count(),
+            'avg_satisfaction': round(float(avg_satisfaction), 2)
+        })
+    
+    # 4. Tiempo promedio de resolución de desafíos
+    avg_resolution_time = []
+    completed_projects = Proyecto.objects.filter(
+        real_end_date__isnull=False,
+        start_date__isnull=False
+    )
+    
+    total_days = 0
+    project_count = 0
+    
+    for project in completed_projects:
+        if project.start_date and project.real_end_date:
+            days = (project.real_end_date - project.start_date).days
+            total_days += days
+            project_count += 1
+    
+    avg_resolution_days = (total_days / project_count) if project_count > 0 else 0
+    
+    # 5. Ranking de empresas más activas en desafíos colectivos
+    active_companies_ranking = []
+    for company in companies_with_projects:
+        active_companies_ranking.append({
+            'company_name': company.company_name,
+            'collective_projects': company.collective_projects,
+            'total_projects': company.total_projects_count,
+            'activity_score': company.collective_projects * 2 + company.total_projects
+        })
+    
+    active_companies_ranking.sort(key=lambda x: x['activity_score'], reverse=True)
+    
+    # 6. Top 20 estudiantes con desafíos colectivos
+    top_students_collective = []
+    students_with_collective = Estudiante.objects.annotate(
+        collective_applications=Count(
+            'aplicaciones',
+            filter=Q(aplicaciones__project__max_students__gt=1)
+        ),
+        completed_collective=Count(
+            'aplicaciones',
+            filter=Q(
+                aplicaciones__project__max_students__gt=1,
+                aplicaciones__status='completed'
+            )
+        )
+    ).filter(collective_applications__gt=0).order_by('-collective_applications')[:20]
+    
+    for student in students_with_collective:
+        top_students_collective.append({
+            'student_name': student.user.full_name,
+            'rut': student.rut or 'No disponible',
+            'section': student.section or 'No asignada',
+            'collective_applications': student.collective_applications,
+            'completed_collective': student.completed_collective,
+            'success_rate': round(
+                (student.completed_collective / student.collective_applications * 100) 
+                if student.collective_applications > 0 else 0, 2
+            )
+        })
+    
+    return {
+        'collective_challenges_by_company': collective_challenges_by_company,
+        'completion_by_section': completion_by_section,
+        'teacher_satisfaction': teacher_satisfaction,
+        'avg_resolution_time_days': round(avg_resolution_days, 2),
+        'active_companies_ranking': active_companies_ranking[:10],
+        'top_students_collective': top_students_collective,
+        'period': period.key,
+        'generated_at': timezone.now().isoformat()
+    }
+
 @csrf_exempt
 @require_http_methods(["GET"])
+@read_from_replica
 def api_admin_advanced_kpis(request):
     """API endpoint para KPIs avanzados del administrador."""
     try:
@@ -3681,138 +3616,39 @@ def api_admin_advanced_kpis(request):
         if not user or user.role != 'admin':
             return JsonResponse({'error': 'Acceso denegado'}, status=403)
         
-        from users.models import User
-        from projects.models import Proyecto, AplicacionProyecto
-        from companies.models import Empresa
-        from students.models import Estudiante
-        from teachers.models import TeacherStudent, TeacherProject
-        from django.db.models import Count, Avg, Sum, Q
-        from django.utils import timezone
-        from datetime import datetime, timedelta
-        
-        # 1. Número de desafíos colectivos creados por empresa
-        collective_challenges_by_company = []
-        companies_with_projects = Empresa.objects.annotate(
-            total_projects_count=Count('proyectos'),
-            collective_projects=Count('proyectos', filter=Q(proyectos__max_students__gt=1))
-        ).filter(total_projects_count__gt=0).order_by('-collective_projects')[:10]
-        
-        for company in companies_with_projects:
-            collective_challenges_by_company.append({
-                'company_name': company.company_name,
-                'total_projects': company.total_projects_count,
-                'collective_projects': company.collective_projects,
-                'completion_rate': 0  # Se calculará después
-            })
-        
-        # 2. Tasa de completación de desafíos por sección
-        completion_by_section = []
-        sections = Estudiante.objects.values_list('section', flat=True).distinct().exclude(section__isnull=True)
-        
-        for section in sections:
-            students_in_section = Estudiante.objects.filter(section=section)
-            total_projects = AplicacionProyecto.objects.filter(
-                student__in=students_in_section
-            ).count()
-            completed_projects = AplicacionProyecto.objects.filter(
-                student__in=students_in_section,
-                status='completed'
-            ).count()
-            
-            completion_rate = (completed_projects / total_projects * 100) if total_projects > 0 else 0
-            
-            completion_by_section.append({
-                'section': section,
-                'total_projects': total_projects,
-                'completed_projects': completed_projects,
-                'completion_rate': round(completion_rate, 2)
-            })
-        
-        # 3. Satisfacción del docente con los desafíos
-        teacher_satisfaction = []
-        teachers = User.objects.filter(role='teacher')
-        
-        for teacher in teachers:
-            supervised_projects = TeacherProject.objects.filter(teacher=teacher)
-            avg_satisfaction = supervised_projects.aggregate(
-                avg_satisfaction=Avg('hours_supervised')
-            )['avg_satisfaction'] or 0
-            
-            teacher_satisfaction.append({
-                'teacher_name': teacher.full_name,
-                'supervised_projects': supervised_projects.count(),
-                'avg_satisfaction': round(float(avg_satisfaction), 2)
-            })
-        
-        # 4. Tiempo promedio de resolución de desafíos
-        avg_resolution_time = []
-        completed_projects = Proyecto.objects.filter(
-            real_end_date__isnull=False,
-            start_date__isnull=False
+        from core.compression import cached_json_response
+        from students.section_analytics import AcademicPeriod, SECTION_ANALYTICS_CACHE_TIMEOUT
+        try:
+            period = AcademicPeriod.parse(request.GET.get('period'))
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        
+        # Payload global por período: se cachea ya serializado y comprimido
+        return cached_json_response(
+            request,
+            f'admin_advanced_kpis:{period.key}',
+            lambda: _build_admin_advanced_kpis(period),
+            timeout=SECTION_ANALYTICS_CACHE_TIMEOUT,
         )
         
-        total_days = 0
-        project_count = 0
-        
-        for project in completed_projects:
-            if project.start_date and project.real_end_date:
-                days = (project.real_end_date - project.start_date).days
-                total_days += days
-                project_count += 1
-        
-        avg_resolution_days = (total_days / project_count) if project_count > 0 else 0
-        
-        # 5. Ranking de empresas más activas en desafíos colectivos
-        active_companies_ranking = []
-        for company in companies_with_projects:
-            active_companies_ranking.append({
-                'company_name': company.company_name,
-                'collective_projects': company.collective_projects,
-                'total_projects': company.total_projects_count,
-                'activity_score': company.collective_projects * 2 + company.total_projects
-            })
-        
-        active_companies_ranking.sort(key=lambda x: x['activity_score'], reverse=True)
-        
-        # 6. Top 20 estudiantes con desafíos colectivos
-        top_students_collective = []
-        students_with_collective = Estudiante.objects.annotate(
-            collective_applications=Count(
-                'aplicaciones',
-                filter=Q(aplicaciones__project__max_students__gt=1)
-            ),
-            completed_collective=Count(
-                'aplicaciones',
-                filter=Q(
-                    aplicaciones__project__max_students__gt=1,
-                    aplicaciones__status='completed'
-                )
-            )
-        ).filter(collective_applications__gt=0).order_by('-collective_applications')[:20]
-        
-        for student in students_with_collective:
-            top_students_collective.append({
-                'student_name': student.user.full_name,
-                'rut': student.rut or 'No disponible',
-                'section': student.section or 'No asignada',
-                'collective_applications': student.collective_applications,
-                'completed_collective': student.completed_collective,
-                'success_rate': round(
-                    (student.completed_collective / student.collective_applications * 100) 
-                    if student.collective_applications > 0 else 0, 2
-                )
-            })
-        
-        return JsonResponse({
-            'collective_challenges_by_company': collective_challenges_by_company,
-            'completion_by_section': completion_by_section,
-            'teacher_satisfaction': teacher_satisfaction,
-            'avg_resolution_time_days': round(avg_resolution_days, 2),
-            'active_companies_ranking': active_companies_ranking[:10],
-            'top_students_collective': top_students_collective,
-            'generated_at': timezone.now().isoformat()
-        })
-        
     except Exception as e:
         print(f"❌ [ADVANCED KPIS] Error: {str(e)}")
-        return JsonResponse({'error': str(e)}, status=500)
\ No newline at end of file
+        return JsonResponse({'error': str(e)}, status=500)
+
+@csrf_exempt
+@require_http_methods(["GET"])
+def api_admin_db_pool_stats(request):
+    """Métricas de los pools de conexiones de este proceso (core.connection_pool)."""
+    auth_header = request.headers.get('Authorization')
+    if not auth_header or not auth_header.startswith('Bearer '):
+        return JsonResponse({'error': 'Token requerido'}, status=401)
+
+    user = verify_token(auth_header.split(' ')[1])
+    if not user or user.role != 'admin':
+        return JsonResponse({'error': 'Acceso denegado'}, status=403)
+
+    return JsonResponse({
+        'pid': os.getpid(),
+        'pools': pool_stats(),
+        'generated_at': timezone.now().isoformat(),
+    })
@@ -3,13 +3,17 @@ Views para la app custom_admin.
 """
 
 import json
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.db.models import Q
 from core.views import verify_token
+from core.reference_data import reference_data
+from core.db_router import read_from_replica
+from core.streaming import ndjson_response, wants_ndjson
 from companies.models import Empresa
 from projects.models import Proyecto
+from projects.projections import ADMIN_PROJECTS_PROJECTION
 from evaluations.models import Evaluation
 from users.models import User
 from students.models import Estudiante
@@ -20,6 +24,7 @@ from students.models import Estudiante
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@read_from_replica
 def admin_projects_list(request):
     """Lista de proyectos para el admin"""
     try:
@@ -46,8 +51,14 @@ def admin_projects_list(request):
         api_level = request.GET.get('api_level', '')
         trl_level = request.GET.get('trl_level', '')
         
+        # Campos pedidos (?fields= / ?view=summary|full)
+        try:
+            fields = ADMIN_PROJECTS_PROJECTION.select(request)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        
         # Query base
-        queryset = Proyecto.objects.select_related('company', 'status', 'area', 'trl').all()
+        queryset = Proyecto.objects.all()
         
         # Aplicar filtros
         if search:
@@ -58,7 +69,7 @@ def admin_projects_list(request):
             )
         
         if status:
-            queryset = queryset.filter(status__name=status)
+            queryset = queryset.filter(status_id__in=reference_data.status_ids(status))
             
         if api_level:
             queryset = queryset.filter(api_level=api_level)
@@ -69,45 +80,11 @@ def admin_projects_list(request):
         # Contar total
         total_count = queryset.count()
         
-        # Paginar
-        projects = queryset[offset:offset + limit]
+        # Paginar (solo las columnas de los campos pedidos)
+        projects = ADMIN_PROJECTS_PROJECTION.apply(queryset, fields)[offset:offset + limit]
         
         # Serializar datos
-        projects_data = []
-        for project in projects:
-            projects_data.append({
-                'id': str(project.id),
-                'title': project.title,
-                'description': project.description,
-                'requirements': project.requirements,
-                'tipo': project.tipo,
-                'objetivo': project.objetivo,
-                'encargado': project.encargado,
-                'contacto': project.contacto,
-                'company_name': project.company.company_name if project.company else 'Sin empresa',
-                'status': project.status.name if project.status else 'Sin estado',
-                'status_id': project.status.id if project.status else None,
-                'area': project.area.name if project.area else 'Sin área',
-                'trl_level': project.trl.level if project.trl else 1,
-                'trl_id': project.trl.id if project.trl else None,
-                'api_level': project.api_level or 1,
-                'max_students': project.max_students,
-                'current_students': project.current_students,
-                'applications_count': project.applications_count,
-                'start_date': project.start_date.isoformat() if project.start_date else None,
-                'estimated_end_date': project.estimated_end_date.isoformat() if project.estimated_end_date else None,
-                'location': project.location or 'Remoto',
-                'modality': project.modality,
-    
-                'duration_weeks': project.duration_weeks,
-                'hours_per_week': project.hours_per_week,
-                'required_hours': project.required_hours,
-                'is_featured': project.is_featured,
-                'is_urgent': project.is_urgent,
-                'is_project_completion': project.is_project_completion,
-                'created_at': project.created_at.isoformat(),
-                'updated_at': project.updated_at.isoformat(),
-            })
+        projects_data = [ADMIN_PROJECTS_PROJECTION.serialize(project, fields) for project in projects]
         
         return JsonResponse({
             'success': True,
@@ -122,8 +99,29 @@ def admin_projects_list(request):
         return JsonResponse({'error': str(e)}, status=500)
 
 
+def _serialize_admin_evaluation(evaluation):
+    return {
+        'id': str(evaluation.id),
+        'project_id': str(evaluation.project.id) if evaluation.project else None,
+        'project_title': evaluation.project.title if evaluation.project else 'Sin proyecto',
+        'student_id': str(evaluation.student.id) if evaluation.student else None,
+        'student_name': evaluation.student.user.full_name if evaluation.student else 'Sin estudiante',
+        'evaluator_id': str(evaluation.evaluator.id) if evaluation.evaluator else None,
+        'evaluator_name': evaluation.evaluator.full_name if evaluation.evaluator else 'Sin evaluador',
+        'score': evaluation.score,
+        'comments': evaluation.comments,
+        'strengths': evaluation.strengths,
+        'areas_for_improvement': evaluation.areas_for_improvement,
+        'evaluator_type': evaluation.evaluator_type,
+        'status': evaluation.status,
+        'created_at': evaluation.created_at.isoformat(),
+        'updated_at': evaluation.updated_at.isoformat(),
+    }
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
+@read_from_replica
 def admin_evaluations_list(request):
     """Lista de evaluaciones para el admin"""
     try:
@@ -149,7 +147,7 @@ def admin_evaluations_list(request):
         type_filter = request.GET.get('type', '')
         
         # Query base
-        queryset = Evaluation.objects.select_related('project', 'student', 'evaluator').all()
+        queryset = Evaluation.objects.select_related('project', 'student', 'student__user', 'evaluator').all()
         
         # Aplicar filtros
         if status:
@@ -158,6 +156,10 @@ def admin_evaluations_list(request):
         if type_filter:
             queryset = queryset.filter(evaluator_type=type_filter)
         
+        # Volcado completo en streaming (Accept: application/x-ndjson o ?stream=1)
+        if wants_ndjson(request):
+            return ndjson_response(request, queryset, _serialize_admin_evaluation)
+        
         # Contar total
         total_count = queryset.count()
         
@@ -165,25 +167,7 @@ def admin_evaluations_list(request):
         evaluations = queryset[offset:offset + limit]
         
         # Serializar datos
-        evaluations_data = []
-        for evaluation in evaluations:
-            evaluations_data.append({
-                'id': str(evaluation.id),
-                'project_id': str(evaluation.project.id) if evaluation.project else None,
-                'project_title': evaluation.project.title if evaluation.project else 'Sin proyecto',
-                'student_id': str(evaluation.student.id) if evaluation.student else None,
-                'student_name': evaluation.student.user.full_name if evaluation.student else 'Sin estudiante',
-                'evaluator_id': str(evaluation.evaluator.id) if evaluation.evaluator else None,
-                'evaluator_name': evaluation.evaluator.full_name if evaluation.evaluator else 'Sin evaluador',
-                'score': evaluation.score,
-                'comments': evaluation.comments,
-                'strengths': evaluation.strengths,
-                'areas_for_improvement': evaluation.areas_for_improvement,
-                'evaluator_type': evaluation.evaluator_type,
-                'status': evaluation.status,
-                'created_at': evaluation.created_at.isoformat(),
-                'updated_at': evaluation.updated_at.isoformat(),
-            })
+        evaluations_data = [_serialize_admin_evaluation(evaluation) for evaluation in evaluations]
         
         return JsonResponse({
             'success': True,
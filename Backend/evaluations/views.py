@@ -3,14 +3,15 @@ Views para la app evaluations.
 """
 
 import json
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.db.models import Q
 from users.models import User
 from .models import Evaluation
 from core.views import verify_token
-from django.db import models
+from core.reference_data import reference_data
+from django.db import models, transaction
 from django.utils import timezone
 
 
@@ -691,40 +692,38 @@ def company_evaluate_student(request):
             if existing_evaluation:
                 return JsonResponse({'error': 'Ya has evaluado este estudiante para este proyecto'}, status=400)
             
-            # Crear la evaluación
-            evaluation = Evaluation.objects.create(
-                project=project,
-                student=student,
-                evaluator=user,
-                score=rating,
-                comments=data.get('comments', ''),
-                status='completed',
-                evaluation_type='company_to_student'
-            )
-            
-            # Si se incluye un strike, crearlo
+            # Si se incluye un strike, validar sus datos antes de guardar nada
             strike_data = data.get('strike')
-            strike_created = None
-            if strike_data:
-                # Validar datos del strike
-                if not strike_data.get('reason'):
-                    return JsonResponse({'error': 'Razón requerida para el strike'}, status=400)
-                
-                # Crear el strike
-                from strikes.models import Strike
-                strike_created = Strike.objects.create(
-                    student=student,
-                    company=project.company,
-                    project=project,
-                    reason=strike_data.get('reason'),
-                    description=strike_data.get('description', ''),
-                    severity=strike_data.get('severity', 'medium'),
-                    issued_by=user
-                )
-                
-                # Actualizar contador de strikes del estudiante
-                student.strikes = min(student.strikes + 1, 3)  # Máximo 3 strikes
-                student.save()
+            if strike_data and not strike_data.get('reason'):
+                return JsonResponse({'error': 'Razón requerida para el strike'}, status=400)
+            
+            from strikes.engine import StrikeLimitExceeded, issue_strike
+            try:
+                # La evaluación y el strike se guardan juntos (el strike toma un cupo del contador)
+                with transaction.atomic():
+                    evaluation = Evaluation.objects.create(
+                        project=project,
+                        student=student,
+                        evaluator=user,
+                        score=rating,
+                        comments=data.get('comments', ''),
+                        status='completed',
+                        evaluation_type='company_to_student'
+                    )
+                    
+                    strike_created = None
+                    if strike_data:
+                        strike_created = issue_strike(
+                            student,
+                            project.company,
+                            strike_data.get('reason'),
+                            project=project,
+                            description=strike_data.get('description', ''),
+                            severity=strike_data.get('severity', 'medium'),
+                            issued_by=user
+                        )
+            except StrikeLimitExceeded as e:
+                return JsonResponse({'error': str(e)}, status=400)
             
             # Actualizar GPA del estudiante
             student.actualizar_calificacion()
@@ -891,24 +890,11 @@ def company_students_to_evaluate(request):
         company = Empresa.objects.get(user=user)
         
         # Obtener proyectos completados de la empresa
-        from project_status.models import ProjectStatus
-        try:
-            status_completado = ProjectStatus.objects.get(name='Completado')
-            completed_projects = Proyecto.objects.filter(
-                company=company,
-                status=status_completado
-            )
-        except ProjectStatus.DoesNotExist:
-            # Si no existe el estado 'Completado', buscar por nombre alternativo
-            try:
-                status_completado = ProjectStatus.objects.get(name='completed')
-                completed_projects = Proyecto.objects.filter(
-                    company=company,
-                    status=status_completado
-                )
-            except ProjectStatus.DoesNotExist:
-                # Si no existe ningún estado de completado, usar lista vacía
-                completed_projects = Proyecto.objects.none()
+        # ('Completado' y 'completed' se resuelven a ids desde el registro; sin estados -> lista vacía)
+        completed_projects = Proyecto.objects.filter(
+            company=company,
+            status_id__in=reference_data.status_ids('completed')
+        )
         
         students_data = []
         print(f"[DEBUG] Proyectos completados encontrados: {completed_projects.count()}")
@@ -1135,7 +1121,6 @@ def student_companies_to_evaluate(request):
         from students.models import Estudiante
         from applications.models import Aplicacion
         from projects.models import Proyecto
-        from project_status.models import ProjectStatus
         from .models import Evaluation
         
         # Obtener el estudiante
@@ -1145,27 +1130,23 @@ def student_companies_to_evaluate(request):
         
         # Obtener proyectos completados del estudiante
         # Primero buscar el status de proyecto completado
-        try:
-            completed_status = ProjectStatus.objects.get(name='Completado')
-        except ProjectStatus.DoesNotExist:
-            try:
-                completed_status = ProjectStatus.objects.get(name='completed')
-            except ProjectStatus.DoesNotExist:
-                print("[DEBUG] No se encontró status de proyecto completado")
-                return JsonResponse({
-                    'success': True,
-                    'data': [],
-                    'total': 0,
-                    'student_name': student.user.full_name,
-                    'total_companies_to_evaluate': 0
-                })
+        completed_status_ids = reference_data.status_ids('completed')
+        if not completed_status_ids:
+            print("[DEBUG] No se encontró status de proyecto completado")
+            return JsonResponse({
+                'success': True,
+                'data': [],
+                'total': 0,
+                'student_name': student.user.full_name,
+                'total_companies_to_evaluate': 0
+            })
         
-        print(f"[DEBUG] Status completado encontrado: {completed_status.name} (ID: {completed_status.id})")
+        print(f"[DEBUG] Status completado encontrado (IDs: {completed_status_ids})")
         
         # Buscar TODAS las aplicaciones del estudiante en proyectos completados
         completed_applications = Aplicacion.objects.filter(
             student=student,
-            project__status=completed_status
+            project__status_id__in=completed_status_ids
         ).select_related('project__company')
         
         print(f"[DEBUG] Aplicaciones en proyectos completados: {completed_applications.count()}")
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 12:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(fields=['interviewer', 'interview_date'], name='interviews_agenda_idx'),
+        ),
+    ]
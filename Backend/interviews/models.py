@@ -51,6 +51,10 @@ class Interview(models.Model):
         verbose_name_plural = 'Entrevistas'
         db_table = 'interviews'
         ordering = ['-interview_date']
+        indexes = [
+            # Agenda del entrevistador por rango de fechas (ver calendar_events.scheduling)
+            models.Index(fields=['interviewer', 'interview_date'], name='interviews_agenda_idx'),
+        ]
 
     def __str__(self):
         return f"Entrevista {self.id} - {self.interview_date}"
@@ -6,8 +6,29 @@ import json
 from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.utils import timezone
+from datetime import timedelta
 from .models import Interview
 from users.models import User
+from calendar_events.scheduling import check_conflicts, interview_participants, lock_participants
+
+def check_interview_schedule(interview_date, duration_minutes, interviewer_id, application, exclude_interview=None):
+    """
+    Verifica que la entrevista no choque con la agenda del entrevistador ni
+    del estudiante. Lanza SchedulingConflict si hay choques. Debe llamarse
+    dentro de la transacción que guarda la entrevista: bloquea a los
+    participantes para que dos reservas simultáneas no pasen ambas la verificación.
+    """
+    if not interview_date:
+        return
+    participants = interview_participants(interviewer_id, application)
+    lock_participants(participants)
+    check_conflicts(
+        participants,
+        interview_date,
+        interview_date + timedelta(minutes=duration_minutes),
+        exclude_interview=exclude_interview,
+    )
+
 
 class InterviewSerializer:
     """Serializer para el modelo Interview"""
@@ -96,6 +117,10 @@ class InterviewSerializer:
     def create(data, user):
         """Crea una nueva entrevista"""
         with transaction.atomic():
+            if data.get('status', 'scheduled') == 'scheduled':
+                check_interview_schedule(
+                    data.get('interview_date'), data.get('duration_minutes', 60), user.id, data.get('application')
+                )
             interview = Interview.objects.create(
                 application=data.get('application'),
                 interviewer=user,
@@ -132,6 +157,14 @@ class InterviewSerializer:
             if 'feedback' in data and data['feedback']:
                 interview.status = 'completed'
             
+            # Verificar la agenda solo si cambia el horario de una entrevista programada
+            rescheduled = any(field in data for field in ('interview_date', 'duration_minutes', 'application', 'status'))
+            if rescheduled and interview.status == 'scheduled':
+                check_interview_schedule(
+                    interview.interview_date, interview.duration_minutes, interview.interviewer_id,
+                    interview.application, exclude_interview=interview.pk
+                )
+            
             interview.save()
             return interview
 
@@ -223,6 +256,9 @@ class InterviewScheduleSerializer:
     def create(data, user):
         """Crea una nueva entrevista programada"""
         with transaction.atomic():
+            check_interview_schedule(
+                data['interview_date'], data.get('duration_minutes', 60), user.id, data['application']
+            )
             interview = Interview.objects.create(
                 application=data['application'],
                 interviewer=user,
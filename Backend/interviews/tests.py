@@ -1,3 +1,141 @@
+from datetime import datetime, time, timedelta
+
+from django.contrib.auth import get_user_model
+from unittest import mock
+
+from django.db import connection
 from django.test import TestCase
+from django.utils import timezone
+
+from applications.models import Aplicacion
+from calendar_events.models import CalendarEvent
+from calendar_events.scheduling import (
+    Busy, BusyCalendar, SchedulingConflict, find_common_free_slots, load_busy_calendars
+)
+from companies.models import Empresa
+from core.views import generate_access_token
+from projects.models import Proyecto
+from students.models import Estudiante
+from teachers.models import TeacherSchedule
+from .models import Interview
+from .serializers import InterviewScheduleSerializer, InterviewSerializer
+
+User = get_user_model()
+
+
+class SchedulingEngineTest(TestCase):
+    def setUp(self):
+        self.company_user = User.objects.create_user(email='company@test.com', password='testpass123', role='company')
+        company = Empresa.objects.create(user=self.company_user, company_name='Test Company')
+        self.student_user = User.objects.create_user(email='student@test.com', password='testpass123', role='student')
+        self.student = Estudiante.objects.create(user=self.student_user)
+        self.teacher = User.objects.create_user(email='teacher@test.com', password='testpass123', role='teacher')
+        project = Proyecto.objects.create(title='Project', company=company, description='Test description')
+        self.application = Aplicacion.objects.create(project=project, student=self.student, status='pending')
+        # Un lunes futuro
+        today = timezone.localdate()
+        self.day = today + timedelta(days=7 - today.weekday())
+
+    def at(self, hour, minute=0):
+        return timezone.make_aware(datetime.combine(self.day, time(hour, minute)))
+
+    def schedule(self, hour, duration=60, interviewer=None):
+        return InterviewScheduleSerializer.create(
+            {'application': self.application, 'interview_date': self.at(hour), 'duration_minutes': duration},
+            interviewer or self.company_user,
+        )
+
+    def test_busy_calendar_merges_and_answers_overlaps(self):
+        calendar = BusyCalendar([
+            Busy(self.at(9), self.at(10), 'event', 1),
+            Busy(self.at(9, 30), self.at(11), 'event', 2),
+            Busy(self.at(14), self.at(15), 'event', 3),
+        ])
+        self.assertEqual(calendar.blocks(), [(self.at(9), self.at(11)), (self.at(14), self.at(15))])
+        self.assertTrue(calendar.is_free(self.at(11), self.at(14)))
+        self.assertEqual([busy.ref for busy in calendar.conflicts(self.at(10, 30), self.at(14, 30))], [2, 3])
+        self.assertEqual(
+            calendar.free_slots(self.at(9), self.at(18), timedelta(hours=2)),
+            [(self.at(11), self.at(14)), (self.at(15), self.at(18))],
+        )
+
+    def test_calendars_merge_all_sources_in_fixed_queries(self):
+        self.schedule(9)
+        event = CalendarEvent.objects.create(
+            title='Reunión', event_type='meeting', start_date=self.at(11), end_date=self.at(12),
+            created_by=self.company_user,
+        )
+        event.attendees.add(self.teacher)
+        CalendarEvent.objects.create(
+            title='Plazo', event_type='deadline', start_date=self.at(13), end_date=self.at(14),
+            created_by=self.student_user,
+        )
+        TeacherSchedule.objects.create(
+            teacher=self.teacher, day_of_week='monday', start_time=time(15), end_time=time(16), activity_type='class'
+        )
+        TeacherSchedule.objects.create(
+            teacher=self.teacher, day_of_week='monday', start_time=time(16), end_time=time(17)
+        )
+
+        users = {self.company_user.id, self.student_user.id, self.teacher.id}
+        company, student, teacher = (str(user_id) for user_id in (self.company_user.id, self.student_user.id, self.teacher.id))
+        with self.assertNumQueries(4):
+            calendars = load_busy_calendars(users, self.at(0), self.at(23))
+        self.assertEqual(calendars[company].blocks(), [(self.at(9), self.at(10)), (self.at(11), self.at(12))])
+        self.assertEqual(calendars[student].blocks(), [(self.at(9), self.at(10))])
+        self.assertEqual(calendars[teacher].blocks(), [(self.at(11), self.at(12)), (self.at(15), self.at(16))])
+
+        slots = find_common_free_slots(users, self.day, self.day, timedelta(minutes=60))
+        self.assertEqual(slots, [(self.at(10), self.at(11)), (self.at(12), self.at(15)), (self.at(16), self.at(18))])
+
+    def test_interview_conflicts_are_rejected_on_create_and_update(self):
+        first = self.schedule(10)
+        with self.assertRaises(SchedulingConflict) as context:
+            self.schedule(10, duration=30)
+        self.assertEqual(set(context.exception.conflicts), {str(self.company_user.id), str(self.student_user.id)})
+
+        # El estudiante está ocupado aunque el entrevistador sea otro
+        other_interviewer = User.objects.create_user(email='other@test.com', password='testpass123', role='company')
+        with self.assertRaises(SchedulingConflict):
+            self.schedule(10, interviewer=other_interviewer)
+
+        second = self.schedule(12)
+        with self.assertRaises(SchedulingConflict):
+            InterviewSerializer.update(second, {'interview_date': self.at(10, 30)})
+        # Mover la propia entrevista no choca consigo misma
+        InterviewSerializer.update(first, {'interview_date': self.at(10, 30)})
+        self.assertEqual(Interview.objects.filter(status='scheduled').count(), 2)
+
+    def test_booking_locks_participants_before_checking(self):
+        statements = []
+
+        def record(execute, sql, params, many, context):
+            statements.append(sql)
+            # SQLite no soporta FOR UPDATE: se registra la consulta y se ejecuta sin él
+            return execute(sql.replace(' FOR UPDATE', ''), params, many, context)
+
+        with mock.patch.object(connection.features, 'has_select_for_update', True), connection.execute_wrapper(record):
+            interview = self.schedule(10)
+            InterviewSerializer.update(interview, {'interview_date': self.at(11)})
+
+        locks = [index for index, sql in enumerate(statements) if sql.endswith('FOR UPDATE')]
+        self.assertEqual(len(locks), 2)
+        for index in locks:
+            self.assertIn('"users"', statements[index])
+            self.assertIn('ORDER BY', statements[index])
+            # El bloqueo va antes de leer las agendas
+            self.assertIn('interviews', statements[index + 1])
+
+    def test_common_free_slots_endpoint(self):
+        self.schedule(9, duration=480)
+        auth = {'HTTP_AUTHORIZATION': f'Bearer {generate_access_token(self.company_user)}'}
+        params = {'student_id': str(self.student.id), 'date_from': self.day.isoformat(), 'duration_minutes': 60}
+
+        response = self.client.get('/interviews/availability/', params, **auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['slots'], [{'start': self.at(17).isoformat(), 'end': self.at(18).isoformat()}])
 
-# Create your tests here.
+        response = self.client.get('/interviews/availability/', {**params, 'student_id': 'x'}, **auth)
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get('/interviews/availability/', {**params, 'date_from': 'mañana'}, **auth)
+        self.assertEqual(response.status_code, 400)
@@ -9,5 +9,6 @@ app_name = 'interviews'
 
 urlpatterns = [
     path('', views.interview_list, name='interview_list'),
+    path('availability/', views.common_free_slots, name='common_free_slots'),
     path('<int:interview_id>/', views.interview_detail, name='interview_detail'),
 ]
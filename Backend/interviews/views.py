@@ -3,12 +3,13 @@ Views para la app interviews.
 """
 
 import json
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.shortcuts import get_object_or_404
 from django.db.models import Q, Count, Avg
 from django.utils import timezone
+from django.core.exceptions import ValidationError
 from datetime import datetime, timedelta
 
 from .models import Interview
@@ -21,6 +22,21 @@ from applications.models import Aplicacion
 from projects.models import Proyecto
 from core.auth_utils import require_auth, require_admin, require_company, require_student
 from core.views import verify_token
+from calendar_events.scheduling import (
+    DEFAULT_DAY_END, DEFAULT_DAY_START, SchedulingConflict, find_common_free_slots
+)
+from students.models import Estudiante
+
+# Rango máximo de búsqueda de horarios libres
+MAX_AVAILABILITY_DAYS = 31
+
+
+def conflicts_to_dict(error):
+    """Serializa los choques de un SchedulingConflict por usuario"""
+    return {
+        str(user_id): [busy.to_dict() for busy in conflicts]
+        for user_id, conflicts in error.conflicts.items()
+    }
 
 
 @csrf_exempt
@@ -185,6 +201,12 @@ def interview_create(request):
             'success': False,
             'error': 'Datos JSON inválidos'
         }, status=400)
+    except SchedulingConflict as e:
+        return JsonResponse({
+            'success': False,
+            'error': str(e),
+            'conflicts': conflicts_to_dict(e)
+        }, status=409)
     except Exception as e:
         return JsonResponse({
             'success': False,
@@ -297,6 +319,12 @@ def interview_update(request, interview_id):
             'success': False,
             'error': 'Datos JSON inválidos'
         }, status=400)
+    except SchedulingConflict as e:
+        return JsonResponse({
+            'success': False,
+            'error': str(e),
+            'conflicts': conflicts_to_dict(e)
+        }, status=409)
     except Exception as e:
         return JsonResponse({
             'success': False,
@@ -657,3 +685,77 @@ def upcoming_interviews(request):
             'success': False,
             'error': f'Error al obtener próximas entrevistas: {str(e)}'
         }, status=500)
+
+
+@csrf_exempt
+@require_http_methods(["GET"])
+@require_auth
+def common_free_slots(request):
+    """
+    Horarios libres en común entre un entrevistador de la empresa, un
+    estudiante y opcionalmente un docente.
+    
+    Parámetros: student_id (perfil de estudiante), interviewer_id (por defecto
+    el usuario actual), teacher_id, date_from, date_to (AAAA-MM-DD),
+    duration_minutes (por defecto 60), day_start y day_end (HH:MM).
+    """
+    try:
+        user = request.user
+        if user.role not in ['admin', 'company', 'teacher']:
+            return JsonResponse({
+                'success': False,
+                'error': 'No tienes permisos para consultar disponibilidad'
+            }, status=403)
+        
+        try:
+            date_from = datetime.strptime(request.GET['date_from'], '%Y-%m-%d').date()
+            date_to = datetime.strptime(request.GET.get('date_to') or request.GET['date_from'], '%Y-%m-%d').date()
+            duration = timedelta(minutes=int(request.GET.get('duration_minutes', 60)))
+            day_start = datetime.strptime(request.GET['day_start'], '%H:%M').time() if request.GET.get('day_start') else DEFAULT_DAY_START
+            day_end = datetime.strptime(request.GET['day_end'], '%H:%M').time() if request.GET.get('day_end') else DEFAULT_DAY_END
+        except KeyError:
+            return JsonResponse({'success': False, 'error': 'date_from es requerido'}, status=400)
+        except ValueError:
+            return JsonResponse({'success': False, 'error': 'Parámetros de fecha u hora inválidos'}, status=400)
+        
+        if date_to < date_from or (date_to - date_from).days >= MAX_AVAILABILITY_DAYS:
+            return JsonResponse({
+                'success': False,
+                'error': f'El rango debe ser de 1 a {MAX_AVAILABILITY_DAYS} días'
+            }, status=400)
+        if duration <= timedelta(0) or day_end <= day_start:
+            return JsonResponse({'success': False, 'error': 'Duración u horario laboral inválidos'}, status=400)
+        
+        try:
+            student_user_id = Estudiante.objects.filter(
+                id=request.GET.get('student_id')
+            ).values_list('user_id', flat=True).first()
+        except ValidationError:
+            student_user_id = None
+        if not student_user_id:
+            return JsonResponse({'success': False, 'error': 'Estudiante no encontrado'}, status=404)
+        
+        participants = {student_user_id, request.GET.get('interviewer_id') or user.id}
+        if request.GET.get('teacher_id'):
+            participants.add(request.GET['teacher_id'])
+        if User.objects.filter(id__in=participants).count() != len(participants):
+            return JsonResponse({'success': False, 'error': 'Participante no encontrado'}, status=404)
+        
+        slots = find_common_free_slots(participants, date_from, date_to, duration, day_start, day_end)
+        
+        return JsonResponse({
+            'success': True,
+            'participants': sorted(str(user_id) for user_id in participants),
+            'duration_minutes': int(duration.total_seconds() // 60),
+            'slots': [
+                {'start': timezone.localtime(start).isoformat(), 'end': timezone.localtime(end).isoformat()}
+                for start, end in slots
+            ],
+            'count': len(slots)
+        })
+        
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'error': f'Error al buscar horarios libres: {str(e)}'
+        }, status=500)
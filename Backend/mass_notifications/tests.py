@@ -61,4 +61,40 @@ class NotificationTemplateModelTest(TestCase):
             body='Welcome message body'
         )
         
-        self.assertEqual(str(template), 'Welcome Template') 
\ No newline at end of file
+        self.assertEqual(str(template), 'Welcome Template') 
+
+class MassNotificationSendTemplateTest(TestCase):
+    def setUp(self):
+        from core.views import generate_access_token
+        admin = User.objects.create_user(email='admin@test.com', password='testpass123', role='admin')
+        self.student = User.objects.create_user(
+            email='student@test.com', password='testpass123', role='student', first_name='Ana',
+        )
+        self.auth = {'HTTP_AUTHORIZATION': f'Bearer {generate_access_token(admin)}'}
+        self.mass = MassNotification.objects.create(
+            title='Título base', message='Mensaje base', target_audience='students', sent_by=admin,
+        )
+
+    def send(self, template_id):
+        return self.client.post(
+            f'/api/mass-notifications/{self.mass.pk}/send/', {'template_id': template_id},
+            content_type='application/json', **self.auth,
+        )
+
+    def test_send_with_template_from_template_list(self):
+        self.client.post('/api/mass-notifications/templates/create/', {
+            'name': 'Bienvenida', 'subject': 'Hola {{first_name}}', 'content': 'Bienvenida, {{full_name}}',
+        }, content_type='application/json', **self.auth)
+        listed = self.client.get('/api/mass-notifications/templates/', **self.auth).json()
+        self.assertIn('first_name', listed['available_variables'])
+
+        response = self.send(listed['results'][0]['id'])
+        self.assertEqual(response.status_code, 200)
+        from notifications.models import Notification
+        notification = Notification.objects.get(user=self.student)
+        self.assertEqual(notification.title, 'Hola Ana')
+        self.assertTrue(notification.message.startswith('Bienvenida, Ana'))
+
+    def test_unknown_template_returns_404(self):
+        self.assertEqual(self.send(999).status_code, 404)
+        self.assertEqual(self.send('no-es-un-id').status_code, 404)
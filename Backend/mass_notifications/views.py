@@ -1,5 +1,5 @@
 from django.shortcuts import render, get_object_or_404
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.core.paginator import Paginator
@@ -225,12 +225,10 @@ def notification_send(request, pk):
         
         # Importar modelos necesarios
         from users.models import User
-        from students.models import Estudiante
-        from companies.models import Empresa
-        from notifications.models import Notification
+        from notifications.templating import send_personalized
         
         # Determinar destinatarios según target_audience
-        recipients = []
+        recipients = User.objects.none()
         if notification.target_audience == 'all':
             recipients = User.objects.filter(is_active=True).exclude(role='admin')
         elif notification.target_audience == 'students':
@@ -238,23 +236,27 @@ def notification_send(request, pk):
         elif notification.target_audience == 'companies':
             recipients = User.objects.filter(is_active=True, role='company')
         
-        # Crear notificaciones individuales para cada destinatario
-        notifications_created = 0
-        for recipient in recipients:
+        # El título y el mensaje son plantillas con variables por destinatario ({{first_name}}, {{career}}...)
+        title, message = notification.title, notification.message
+        data = json.loads(request.body) if request.body else {}
+        if data.get('template_id'):
+            # Las mismas plantillas que lista template_list (asunto y cuerpo con variables por destinatario)
             try:
-                Notification.objects.create(
-                    user=recipient,
-                    title=notification.title,
-                    message=notification.message,
-                    type=notification.notification_type,  # Usar el tipo real de la notificación masiva
-                    priority=notification.priority,        # Usar la prioridad real
-                    read=False,
-                    created_at=timezone.now()
-                )
-                notifications_created += 1
-            except Exception as e:
-                print(f"Error creando notificación para {recipient.email}: {e}")
-                continue
+                template = NotificationTemplate.objects.get(pk=data['template_id'])
+            except (NotificationTemplate.DoesNotExist, ValueError, TypeError):
+                return JsonResponse({'error': 'Plantilla no encontrada'}, status=404)
+            title, message = template.subject, template.content
+        
+        try:
+            notifications_created = send_personalized(
+                recipients,
+                title,
+                message,
+                type=notification.notification_type,  # Usar el tipo real de la notificación masiva
+                priority=notification.priority,        # Usar la prioridad real
+            )
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
         
         # Marcar la notificación masiva como enviada
         notification.is_sent = True
@@ -302,10 +304,13 @@ def template_list(request):
                 'created_at': template.created_at.isoformat(),
             })
         
+        from notifications.templating import RECIPIENT_VARIABLES
+        
         return JsonResponse({
             'success': True,
             'results': templates_data,
-            'count': len(templates_data)
+            'count': len(templates_data),
+            'available_variables': list(RECIPIENT_VARIABLES.fields)
         })
         
     except Exception as e:
@@ -0,0 +1,31 @@
+"""
+Contadores cacheados de notificaciones.
+
+El conteo de no leídas se consulta en cada carga de dashboard y en el badge
+del header, por lo que se guarda en cache y se invalida cuando cambian las
+notificaciones del usuario (signals de Notification y actualizaciones masivas).
+"""
+
+from django.core.cache import cache
+from .models import Notification
+
+UNREAD_COUNT_CACHE_TIMEOUT = 300  # 5 minutos
+
+
+def _unread_count_cache_key(user_id):
+    return f'notifications:unread_count:{user_id}'
+
+
+def get_unread_count(user):
+    """Obtiene el conteo de notificaciones no leídas del usuario (cacheado)"""
+    cache_key = _unread_count_cache_key(user.id)
+    unread = cache.get(cache_key)
+    if unread is None:
+        unread = Notification.objects.filter(user=user, read=False).count()
+        cache.set(cache_key, unread, UNREAD_COUNT_CACHE_TIMEOUT)
+    return unread
+
+
+def invalidate_unread_count(user_id):
+    """Invalida el conteo cacheado de no leídas del usuario"""
+    cache.delete(_unread_count_cache_key(user_id))
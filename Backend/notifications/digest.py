@@ -0,0 +1,230 @@
+"""
+Resúmenes (digest) de notificaciones según las preferencias del usuario.
+
+`NotificationPreference` define la frecuencia (`digest_frequency`), los tipos
+habilitados (`enabled_types`) y las horas silenciosas de cada usuario. Antes
+de guardar un lote, el outbox pasa sus notificaciones por `route()`:
+
+- Los tipos deshabilitados se descartan sin escribir nada.
+- Las de usuarios con frecuencia 'immediate' se guardan como siempre, salvo
+  en horas silenciosas, en que se retienen hasta que terminan.
+- Las de usuarios con frecuencia horaria, diaria o semanal se retienen en
+  `PendingDigestItem` hasta el próximo envío.
+
+`flush_due_digests()` (comando `flush_notification_digests`, pensado para
+cron cada hora o menos) junta las notificaciones retenidas vencidas de cada
+usuario en una sola notificación de resumen y las guarda en lote.
+
+Las preferencias se leen de un mapa cacheado por usuario que se invalida al
+guardar o borrar una `NotificationPreference`.
+"""
+
+from collections import namedtuple
+from datetime import datetime, time, timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Notification, NotificationPreference, PendingDigestItem
+
+PREFERENCES_CACHE_TIMEOUT = 600  # 10 minutos
+
+IMMEDIATE = 'immediate'
+HOURLY = 'hourly'
+DAILY = 'daily'
+WEEKLY = 'weekly'
+
+# Hora local de envío de los resúmenes diarios y semanales (estos, los lunes)
+DIGEST_HOUR = time(8, 0)
+
+# Tipo del resumen: el más severo de sus notificaciones
+TYPE_SEVERITY = ('info', 'success', 'warning', 'error')
+
+
+class DeliveryPreference(namedtuple(
+    'DeliveryPreference', ['frequency', 'enabled_types', 'quiet_start', 'quiet_end']
+)):
+    """Preferencias de entrega de un usuario (enabled_types vacío = todos los tipos)"""
+
+    def allows(self, notification_type):
+        return not self.enabled_types or notification_type in self.enabled_types
+
+    def quiet_until(self, moment):
+        """Fin de las horas silenciosas si `moment` cae dentro de ellas, o None"""
+        start, end = self.quiet_start, self.quiet_end
+        if not start or not end or start == end:
+            return None
+        local = timezone.localtime(moment)
+        current = local.time()
+        if start < end:
+            if not start <= current < end:
+                return None
+            end_date = local.date()
+        else:
+            # Horario que cruza la medianoche (p. ej. 22:00-07:00)
+            if end <= current < start:
+                return None
+            end_date = local.date() + timedelta(days=1) if current >= start else local.date()
+        return timezone.make_aware(datetime.combine(end_date, end))
+
+    def deliver_after(self, now):
+        """Momento de entrega de una notificación generada en `now` (None = inmediata)"""
+        if self.frequency == IMMEDIATE:
+            return self.quiet_until(now)
+        moment = next_digest_time(self.frequency, now)
+        return self.quiet_until(moment) or moment
+
+
+DEFAULT_PREFERENCE = DeliveryPreference(IMMEDIATE, (), None, None)
+
+
+def next_digest_time(frequency, now):
+    """Próximo envío de resúmenes para la frecuencia dada"""
+    local = timezone.localtime(now)
+    if frequency == HOURLY:
+        return local.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+
+    moment = timezone.make_aware(datetime.combine(local.date(), DIGEST_HOUR))
+    if frequency == WEEKLY:
+        moment += timedelta(days=-local.weekday() % 7)
+        if moment <= local:
+            moment += timedelta(days=7)
+    elif moment <= local:
+        moment += timedelta(days=1)
+    return moment
+
+
+# ===== MAPA DE PREFERENCIAS CACHEADO =====
+
+def _preference_cache_key(user_id):
+    return f'notifications:preferences:{user_id}'
+
+
+def get_preference_map(user_ids):
+    """
+    Preferencias de entrega por usuario: {user_id: DeliveryPreference}.
+    Lee el cache en bloque y busca los faltantes con una sola consulta.
+    """
+    user_ids = {str(user_id) for user_id in user_ids}
+    keys = {_preference_cache_key(user_id): user_id for user_id in user_ids}
+    cached = cache.get_many(keys)
+    preferences = {keys[key]: DeliveryPreference(*value) for key, value in cached.items()}
+
+    missing = user_ids - set(preferences)
+    if missing:
+        found = {user_id: DEFAULT_PREFERENCE for user_id in missing}
+        for preference in NotificationPreference.objects.filter(user_id__in=missing).only(
+            'user_id', 'digest_frequency', 'enabled_types', 'quiet_hours_start', 'quiet_hours_end'
+        ):
+            found[str(preference.user_id)] = DeliveryPreference(
+                preference.digest_frequency,
+                tuple(preference.get_enabled_types_list()),
+                preference.quiet_hours_start,
+                preference.quiet_hours_end,
+            )
+        cache.set_many(
+            {_preference_cache_key(user_id): tuple(value) for user_id, value in found.items()},
+            PREFERENCES_CACHE_TIMEOUT,
+        )
+        preferences.update(found)
+    return preferences
+
+
+def invalidate_preferences(user_id):
+    cache.delete(_preference_cache_key(user_id))
+
+
+# ===== ENRUTAMIENTO Y ENVÍO DE RESÚMENES =====
+
+def route(notifications, now=None):
+    """
+    Separa un lote según las preferencias de sus destinatarios.
+    Retorna (notificaciones inmediatas, PendingDigestItem a retener, descartadas).
+    """
+    now = now or timezone.now()
+    preferences = get_preference_map({notification.user_id for notification in notifications})
+
+    immediate, pending, dropped = [], [], 0
+    for notification in notifications:
+        preference = preferences[str(notification.user_id)]
+        notification_type = notification.type or notification.notification_type
+        if not preference.allows(notification_type):
+            dropped += 1
+            continue
+        deliver_after = preference.deliver_after(now)
+        if deliver_after is None:
+            immediate.append(notification)
+        else:
+            pending.append(PendingDigestItem(
+                user_id=notification.user_id,
+                title=notification.title,
+                message=notification.message,
+                notification_type=notification_type,
+                related_url=notification.related_url,
+                deliver_after=deliver_after,
+            ))
+    return immediate, pending, dropped
+
+
+def build_digest(user_id, items):
+    """Notificación de resumen con las notificaciones retenidas de un usuario"""
+    if len(items) == 1:
+        item = items[0]
+        return Notification(
+            user_id=user_id, title=item.title, message=item.message,
+            type=item.notification_type, related_url=item.related_url,
+        )
+
+    related_urls = {item.related_url for item in items}
+    return Notification(
+        user_id=user_id,
+        title=f"Resumen de notificaciones ({len(items)})",
+        message='\n'.join(f"• {item.title}: {item.message}" for item in items),
+        type=max((item.notification_type for item in items), key=_severity),
+        related_url=related_urls.pop() if len(related_urls) == 1 else None,
+    )
+
+
+def _severity(notification_type):
+    return TYPE_SEVERITY.index(notification_type) if notification_type in TYPE_SEVERITY else 0
+
+
+def due_digest_items(now=None):
+    return PendingDigestItem.objects.filter(deliver_after__lte=now or timezone.now())
+
+
+def flush_due_digests(now=None, batch_size=500):
+    """
+    Entrega en lotes de `batch_size` usuarios los resúmenes vencidos. Las
+    notificaciones cuyo tipo se deshabilitó mientras esperaban se descartan.
+    Retorna (resúmenes creados, notificaciones resumidas).
+    """
+    from .outbox import write_notifications
+
+    now = now or timezone.now()
+    user_ids = list(due_digest_items(now).order_by().values_list('user_id', flat=True).distinct())
+    digests_count = items_count = 0
+
+    for offset in range(0, len(user_ids), batch_size):
+        chunk = user_ids[offset:offset + batch_size]
+        preferences = get_preference_map(chunk)
+        with transaction.atomic():
+            items = list(
+                due_digest_items(now).filter(user_id__in=chunk)
+                .select_for_update(skip_locked=True)
+                .order_by('user_id', 'created_at')
+            )
+            by_user = {}
+            for item in items:
+                if preferences[str(item.user_id)].allows(item.notification_type):
+                    by_user.setdefault(item.user_id, []).append(item)
+
+            digests = [build_digest(user_id, user_items) for user_id, user_items in by_user.items()]
+            if digests and not write_notifications(digests, apply_preferences=False):
+                raise RuntimeError(f"No se pudieron guardar {len(digests)} resúmenes de notificaciones")
+            PendingDigestItem.objects.filter(pk__in=[item.pk for item in items]).delete()
+
+        digests_count += len(digests)
+        items_count += sum(len(user_items) for user_items in by_user.values())
+    return digests_count, items_count
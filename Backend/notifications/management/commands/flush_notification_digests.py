@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from core.db_router import replica_reads
+from notifications.digest import due_digest_items, flush_due_digests
+
+
+class Command(BaseCommand):
+    help = (
+        'Entrega los resúmenes de notificaciones vencidos (horarios, diarios, semanales y fin de '
+        'horas silenciosas); pensado para ejecutarse periódicamente, por ejemplo cada hora con cron'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Usuarios procesados por transacción (por defecto 500)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Mostrar cuántas notificaciones retenidas están vencidas sin entregarlas',
+        )
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            with replica_reads():
+                items = due_digest_items()
+                pending = items.count()
+                users = items.order_by().values('user_id').distinct().count()
+            self.stdout.write(f'🔍 {pending} notificaciones retenidas vencidas para {users} usuarios')
+            return
+
+        digests, items = flush_due_digests(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'✅ {digests} resúmenes entregados ({items} notificaciones agrupadas)'))
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-19 12:25
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingDigestItem',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=200)),
+                ('message', models.TextField()),
+                ('notification_type', models.CharField(choices=[('info', 'Información'), ('success', 'Éxito'), ('warning', 'Advertencia'), ('error', 'Error')], default='info', max_length=50)),
+                ('related_url', models.CharField(blank=True, max_length=500, null=True)),
+                ('deliver_after', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pending_digest_items', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Notificación pendiente de resumen',
+                'verbose_name_plural': 'Notificaciones pendientes de resumen',
+                'db_table': 'notification_digest_items',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['deliver_after'], name='digest_items_due_idx')],
+            },
+        ),
+    ]
@@ -57,19 +57,30 @@ class Notification(models.Model):
         verbose_name = 'Notificación'
         verbose_name_plural = 'Notificaciones'
         ordering = ['-created_at']
+        indexes = [
+            # Listado por usuario ordenado por fecha y contador de no leídas
+            models.Index(fields=['user', 'read', 'created_at'], name='notifications_user_read_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.email} - {self.title}"
     
-    def save(self, *args, **kwargs):
-        # Sincronizar campos para compatibilidad
-        if not self.notification_type:
+    def sync_compat_fields(self):
+        """
+        Copia type, read y related_url a sus campos de compatibilidad. La
+        llaman save() y el outbox antes de bulk_create (que no pasa por save()).
+        """
+        # notification_type nace en 'info' por defecto: solo se respeta si se fijó otro valor
+        if not self.notification_type or (self.notification_type == 'info' and self.type):
             self.notification_type = self.type
         if not self.is_read:
             self.is_read = self.read
         if not self.action_url:
             self.action_url = self.related_url
-        
+    
+    def save(self, *args, **kwargs):
+        # Sincronizar campos para compatibilidad
+        self.sync_compat_fields()
         super().save(*args, **kwargs)
     
     def marcar_como_leida(self):
@@ -77,14 +88,14 @@ class Notification(models.Model):
         self.read = True
         self.is_read = True
         self.read_at = timezone.now()
-        self.save(update_fields=['read', 'is_read', 'read_at'])
+        self.save(update_fields=['read', 'is_read', 'read_at', 'updated_at'])  # updated_at: versión de list_version
     
     def marcar_como_no_leida(self):
         """Marca la notificación como no leída"""
         self.read = False
         self.is_read = False
         self.read_at = None
-        self.save(update_fields=['read', 'is_read', 'read_at'])
+        self.save(update_fields=['read', 'is_read', 'read_at', 'updated_at'])  # updated_at: versión de list_version
 
 class NotificationTemplate(models.Model):
     """Plantillas para notificaciones automáticas"""
@@ -134,15 +145,12 @@ class NotificationTemplate(models.Model):
             self.available_variables = '[]'
     
     def render(self, context):
-        """Renderiza la plantilla con el contexto proporcionado"""
-        title = self.title_template
-        message = self.message_template
-        
-        for key, value in context.items():
-            title = title.replace(f"{{{{{key}}}}}", str(value))
-            message = message.replace(f"{{{{{key}}}}}", str(value))
-        
-        return title, message
+        """Renderiza la plantilla con el contexto proporcionado (compilada una vez, ver notifications.templating)"""
+        from .templating import compile_template
+        return (
+            compile_template(self.title_template).render(context),
+            compile_template(self.message_template).render(context),
+        )
 
 class NotificationPreference(models.Model):
     """Preferencias de notificación por usuario"""
@@ -210,3 +218,31 @@ class NotificationPreference(models.Model):
         
         now = timezone.now().time()
         return self.quiet_hours_start <= now <= self.quiet_hours_end
+
+
+class PendingDigestItem(models.Model):
+    """
+    Notificación retenida hasta el próximo resumen del usuario (frecuencia
+    horaria/diaria/semanal u horas silenciosas). Ver notifications.digest.
+    """
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='pending_digest_items')
+    title = models.CharField(max_length=200)
+    message = models.TextField()
+    notification_type = models.CharField(max_length=50, choices=Notification.TYPE_CHOICES, default='info')
+    related_url = models.CharField(max_length=500, null=True, blank=True)
+    deliver_after = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'notification_digest_items'
+        verbose_name = 'Notificación pendiente de resumen'
+        verbose_name_plural = 'Notificaciones pendientes de resumen'
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['deliver_after'], name='digest_items_due_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.user_id} - {self.title} ({self.deliver_after})"
@@ -0,0 +1,334 @@
+"""
+Outbox de notificaciones.
+
+Las notificaciones automáticas se generan dentro de signals y servicios, en
+medio de la transacción de quien las dispara. En lugar de un INSERT por
+destinatario, el outbox las acumula y las envía en lote:
+
+- Dentro de una transacción se guardan en un lote que se envía en su
+  `transaction.on_commit`; si la transacción se revierte, se descartan.
+- Durante una petición (`NotificationOutboxMiddleware` / `outbox.collect()`)
+  todo lo generado, incluidos los lotes ya confirmados, se envía al final
+  con un solo `bulk_create`.
+- Fuera de ambos casos se envían de inmediato.
+
+El envío puede ser síncrono (modo 'sync', por defecto) o diferido a un hilo
+de trabajo en segundo plano (modo 'deferred'), configurable con
+`NOTIFICATION_OUTBOX` en settings. Los tamaños de lote, la latencia de cada
+envío y los fallos quedan en `outbox.metrics`.
+
+Antes de escribir, cada lote pasa por las preferencias de sus destinatarios
+(ver notifications.digest): los tipos deshabilitados se descartan y las
+notificaciones de usuarios con resumen se retienen hasta el próximo envío.
+
+Un savepoint revertido dentro de la transacción no descarta las
+notificaciones ya agregadas al lote de la transacción externa.
+"""
+
+import logging
+import math
+import queue
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from .counters import invalidate_unread_count
+from .digest import route
+from .models import Notification, PendingDigestItem
+
+logger = logging.getLogger(__name__)
+
+SYNC = 'sync'
+DEFERRED = 'deferred'
+
+DEFAULT_OUTBOX_SETTINGS = {
+    'MODE': SYNC,
+    'BATCH_SIZE': 500,     # Filas por INSERT
+    'RETRIES': 3,          # Intentos por lote en el hilo de trabajo
+    'START_WORKER': True,  # Iniciar el hilo de trabajo al primer envío diferido
+}
+
+
+def outbox_setting(name):
+    return getattr(settings, 'NOTIFICATION_OUTBOX', {}).get(name, DEFAULT_OUTBOX_SETTINGS[name])
+
+
+def _percentile(values, percent):
+    if not values:
+        return 0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+class OutboxMetrics:
+    """Métricas de envío del outbox (por proceso)"""
+
+    SAMPLE_SIZE = 1000  # Últimos envíos considerados en los percentiles
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.flushes = 0
+            self.notifications = 0
+            self.failures = 0
+            self.failed_notifications = 0
+            self.dropped = 0
+            self.digested = 0
+            self.max_batch_size = 0
+            self.max_latency_ms = 0.0
+            self._batch_sizes = deque(maxlen=self.SAMPLE_SIZE)
+            self._latencies_ms = deque(maxlen=self.SAMPLE_SIZE)
+
+    def record(self, batch_size, latency_ms, failed=False):
+        with self._lock:
+            if failed:
+                self.failures += 1
+                self.failed_notifications += batch_size
+                return
+            self.flushes += 1
+            self.notifications += batch_size
+            self.max_batch_size = max(self.max_batch_size, batch_size)
+            self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+            self._batch_sizes.append(batch_size)
+            self._latencies_ms.append(latency_ms)
+
+    def record_routing(self, dropped, digested):
+        with self._lock:
+            self.dropped += dropped
+            self.digested += digested
+
+    def snapshot(self):
+        with self._lock:
+            sizes = list(self._batch_sizes)
+            latencies = list(self._latencies_ms)
+            return {
+                'flushes': self.flushes,
+                'notifications': self.notifications,
+                'failures': self.failures,
+                'failed_notifications': self.failed_notifications,
+                'dropped': self.dropped,
+                'digested': self.digested,
+                'batch_size': {
+                    'mean': round(sum(sizes) / len(sizes), 2) if sizes else 0,
+                    'p50': _percentile(sizes, 50),
+                    'p95': _percentile(sizes, 95),
+                    'max': self.max_batch_size,
+                },
+                'flush_latency_ms': {
+                    'mean': round(sum(latencies) / len(latencies), 3) if latencies else 0,
+                    'p50': round(_percentile(latencies, 50), 3),
+                    'p95': round(_percentile(latencies, 95), 3),
+                    'max': round(self.max_latency_ms, 3),
+                },
+            }
+
+
+metrics = OutboxMetrics()
+
+
+def write_notifications(notifications, attempts=1, apply_preferences=True):
+    """
+    Inserta el lote con bulk_create e invalida los contadores de no leídas.
+    Con `apply_preferences` descarta los tipos deshabilitados y retiene en
+    resúmenes las de usuarios que los eligieron antes de escribir.
+    Retorna True si se guardó; los fallos se registran en las métricas.
+    """
+    if apply_preferences:
+        notifications, pending, dropped = route(notifications)
+        if pending:
+            PendingDigestItem.objects.bulk_create(pending, batch_size=outbox_setting('BATCH_SIZE'))
+        metrics.record_routing(dropped, len(pending))
+        if not notifications:
+            return True
+
+    for attempt in range(1, attempts + 1):
+        start = time.perf_counter()
+        try:
+            # bulk_create no llama a save(): copiar los campos de compatibilidad a mano
+            for notification in notifications:
+                notification.sync_compat_fields()
+            Notification.objects.bulk_create(notifications, batch_size=outbox_setting('BATCH_SIZE'))
+        except Exception:
+            latency_ms = (time.perf_counter() - start) * 1000
+            metrics.record(len(notifications), latency_ms, failed=True)
+            logger.exception(
+                f"Error al guardar lote de {len(notifications)} notificaciones (intento {attempt}/{attempts})"
+            )
+            continue
+        metrics.record(len(notifications), (time.perf_counter() - start) * 1000)
+        # bulk_create no dispara post_save: invalidar los contadores a mano
+        for user_id in {notification.user_id for notification in notifications}:
+            invalidate_unread_count(user_id)
+        return True
+    return False
+
+
+class NotificationWorker:
+    """Hilo en segundo plano que guarda los lotes del modo diferido"""
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def pending(self):
+        return self._queue.qsize()
+
+    def submit(self, notifications):
+        self._queue.put(list(notifications))
+        if outbox_setting('START_WORKER'):
+            self._ensure_started()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='notification-outbox', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            try:
+                self._process(batch)
+            finally:
+                close_old_connections()
+
+    def _process(self, batch):
+        # Agrupar lo que ya esté en cola en un solo INSERT
+        max_size = outbox_setting('BATCH_SIZE')
+        while len(batch) < max_size:
+            try:
+                batch.extend(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        write_notifications(batch, attempts=outbox_setting('RETRIES'))
+
+    def drain(self):
+        """Procesa en el hilo actual los lotes pendientes (pruebas y apagado ordenado)"""
+        while True:
+            try:
+                batch = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            self._process(batch)
+
+
+class _TransactionBatch:
+    """
+    Notificaciones agregadas dentro de una transacción; se envían en su on_commit.
+
+    Solo la lista de on_commit de la conexión guarda una referencia fuerte al
+    lote: si la transacción (o el savepoint en que se creó) se revierte,
+    Django descarta el callback y el lote desaparece del registro del outbox.
+    """
+
+    def __init__(self, outbox, alias):
+        self.outbox = outbox
+        self.alias = alias
+        self.notifications = []
+
+    def __call__(self):
+        self.outbox._release_batch(self)
+        self.outbox.dispatch(self.notifications)
+
+
+class NotificationOutbox:
+    """Acumula notificaciones y las guarda en lote (una instancia por proceso)"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self.worker = NotificationWorker()
+        self.metrics = metrics
+
+    def add(self, user, title, message, notification_type='info', related_url=None, **fields):
+        """Agrega una notificación; retorna la instancia (se guarda al enviarse el lote)"""
+        notification = Notification(
+            user=user,
+            title=title,
+            message=message,
+            type=notification_type,
+            related_url=related_url,
+            **fields
+        )
+        self.enqueue([notification])
+        return notification
+
+    def enqueue(self, notifications):
+        notifications = list(notifications)
+        if not notifications:
+            return
+        connection = transaction.get_connection()
+        if connection.in_atomic_block:
+            self._transaction_batch(connection).notifications.extend(notifications)
+        else:
+            self.dispatch(notifications)
+
+    def _batches(self):
+        """Registro por hilo de los lotes abiertos: {alias de conexión: weakref al lote}"""
+        if not hasattr(self._local, 'batches'):
+            self._local.batches = {}
+        return self._local.batches
+
+    def _transaction_batch(self, connection):
+        batches = self._batches()
+        ref = batches.get(connection.alias)
+        batch = ref() if ref is not None else None
+        if batch is None:
+            batch = _TransactionBatch(self, connection.alias)
+            batches[connection.alias] = weakref.ref(batch)
+            transaction.on_commit(batch, using=connection.alias)
+        return batch
+
+    def _release_batch(self, batch):
+        batches = self._batches()
+        ref = batches.get(batch.alias)
+        if ref is not None and ref() is batch:
+            del batches[batch.alias]
+
+    def dispatch(self, notifications):
+        """Envía notificaciones ya confirmadas según el modo configurado"""
+        if not notifications:
+            return
+        scope = getattr(self._local, 'scope', None)
+        if scope is not None:
+            scope.extend(notifications)
+        elif outbox_setting('MODE') == DEFERRED:
+            self.worker.submit(notifications)
+        else:
+            write_notifications(notifications)
+
+    @contextmanager
+    def collect(self):
+        """Acumula todo lo generado en el bloque y lo envía en un solo lote al salir"""
+        if getattr(self._local, 'scope', None) is not None:
+            yield  # Bloque anidado: lo envía el bloque externo
+            return
+        self._local.scope = []
+        try:
+            yield
+        finally:
+            pending, self._local.scope = self._local.scope, None
+            self.dispatch(pending)
+
+
+outbox = NotificationOutbox()
+
+
+class NotificationOutboxMiddleware:
+    """Envía en un solo lote las notificaciones generadas durante la petición"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with outbox.collect():
+            return self.get_response(request)
@@ -1,6 +1,7 @@
 from django.db import transaction
 from django.utils import timezone
 from .models import Notification
+from .outbox import outbox
 from users.models import User
 from projects.models import Proyecto, AplicacionProyecto, MiembroProyecto
 from applications.models import Aplicacion
@@ -14,21 +15,36 @@ class NotificationService:
     
     @staticmethod
     def create_notification(user, title, message, notification_type='info', related_url=None):
-        """Crea una notificación para un usuario específico"""
-        try:
-            notification = Notification.objects.create(
+        """
+        Crea una notificación para un usuario específico. Se guarda en lote a
+        través del outbox al confirmarse la transacción o terminar la petición.
+        """
+        notification = outbox.add(
+            user,
+            title=title,
+            message=message,
+            notification_type=notification_type,
+            related_url=related_url
+        )
+        logger.info(f"Notificación encolada para {user.email}: {title}")
+        return notification
+    
+    @staticmethod
+    def create_bulk_notifications(users, title, message, notification_type='info', related_url=None):
+        """Crea la misma notificación para varios usuarios (un solo lote del outbox)"""
+        notifications = [
+            Notification(
                 user=user,
                 title=title,
                 message=message,
                 type=notification_type,
-                related_url=related_url,
-                created_at=timezone.now()
+                related_url=related_url
             )
-            logger.info(f"Notificación creada para {user.email}: {title}")
-            return notification
-        except Exception as e:
-            logger.error(f"Error al crear notificación para {user.email}: {str(e)}")
-            return None
+            for user in users
+        ]
+        outbox.enqueue(notifications)
+        logger.info(f"Notificación '{title}' encolada para {len(notifications)} usuarios")
+        return notifications
     
     @staticmethod
     def notify_project_application(application):
@@ -221,27 +237,20 @@ class NotificationService:
             logger.error(f"Error al notificar validación de horas: {str(e)}")
     
     @staticmethod
-    def notify_project_hours_validation(project, validated_count):
-        """Notifica cuando se validan las horas de finalización de un proyecto"""
+    def notify_project_hours_validation(project, students, hours):
+        """Notifica (en un solo INSERT) a los estudiantes cuyas horas de finalización fueron validadas"""
         try:
-            # Obtener todos los estudiantes del proyecto
-            project_members = MiembroProyecto.objects.filter(
-                proyecto=project,
-                rol='estudiante'
-            ).select_related('usuario')
-            
             title = "Horas de Proyecto Validadas"
-            message = f"Se han validado {validated_count} horas por la finalización del proyecto '{project.title}'. Estas horas han sido agregadas a tu total."
+            message = f"Se han validado {hours} horas por la finalización del proyecto '{project.title}'. Estas horas han sido agregadas a tu total."
             related_url = f"/dashboard/student/work-hours"
             
-            for member in project_members:
-                NotificationService.create_notification(
-                    user=member.usuario,
-                    title=title,
-                    message=message,
-                    notification_type='success',
-                    related_url=related_url
-                )
+            NotificationService.create_bulk_notifications(
+                [student.user for student in students],
+                title=title,
+                message=message,
+                notification_type='success',
+                related_url=related_url
+            )
                 
         except Exception as e:
             logger.error(f"Error al notificar validación de horas de proyecto: {str(e)}")
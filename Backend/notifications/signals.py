@@ -2,10 +2,14 @@ from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.utils import timezone
 from .services import NotificationService
+from .models import Notification, NotificationPreference
+from .counters import invalidate_unread_count
+from .digest import invalidate_preferences
 from applications.models import Aplicacion
 from projects.models import Proyecto, AplicacionProyecto, MiembroProyecto
 from work_hours.models import WorkHour
 from project_status.models import ProjectStatus
+from core.reference_data import reference_data
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,16 +31,13 @@ def notify_application_status_change(sender, instance, **kwargs):
     """Notifica cuando cambia el estado de una aplicación"""
     if not kwargs.get('created', False):  # Solo para actualizaciones
         try:
-            # Obtener el estado anterior
-            if instance.pk:
-                old_instance = Aplicacion.objects.get(pk=instance.pk)
-                old_status = old_instance.status
-                
+            # El estado anterior viene de la copia tomada al cargar la instancia (sin consulta)
+            if instance.has_changed('status'):
                 # Notificar cambios específicos
-                if instance.status == 'accepted' and old_status != 'accepted':
+                if instance.status == 'accepted':
                     logger.info(f"Aplicación aceptada: {instance.id}")
                     NotificationService.notify_application_accepted(instance)
-                elif instance.status == 'rejected' and old_status != 'rejected':
+                elif instance.status == 'rejected':
                     logger.info(f"Aplicación rechazada: {instance.id}")
                     NotificationService.notify_application_rejected(instance)
         except Exception as e:
@@ -57,16 +58,13 @@ def notify_project_application_status_change(sender, instance, **kwargs):
     """Notifica cuando cambia el estado de una aplicación de proyecto"""
     if not kwargs.get('created', False):  # Solo para actualizaciones
         try:
-            # Obtener el estado anterior
-            if instance.pk:
-                old_instance = AplicacionProyecto.objects.get(pk=instance.pk)
-                old_status = old_instance.estado
-                
+            # El estado anterior viene de la copia tomada al cargar la instancia (sin consulta)
+            if instance.has_changed('estado'):
                 # Notificar cambios específicos
-                if instance.estado == 'accepted' and old_status != 'accepted':
+                if instance.estado == 'accepted':
                     logger.info(f"Aplicación de proyecto aceptada: {instance.id}")
                     NotificationService.notify_application_accepted(instance)
-                elif instance.estado == 'rejected' and old_status != 'rejected':
+                elif instance.estado == 'rejected':
                     logger.info(f"Aplicación de proyecto rechazada: {instance.id}")
                     NotificationService.notify_application_rejected(instance)
         except Exception as e:
@@ -79,11 +77,12 @@ def notify_project_status_change(sender, instance, **kwargs):
     """Notifica cuando cambia el estado de un proyecto"""
     if not kwargs.get('created', False):  # Solo para actualizaciones
         try:
-            # Obtener el estado anterior
-            if instance.pk:
-                old_instance = Proyecto.objects.get(pk=instance.pk)
-                old_status = old_instance.status.name if old_instance.status else None
-                new_status = instance.status.name if instance.status else None
+            # El estado anterior viene de la copia tomada al cargar la instancia (sin consulta)
+            if instance.has_changed('status'):
+                old_status_obj = reference_data.status_by_id(instance.previous('status'))
+                new_status_obj = reference_data.status_by_id(instance.status_id)
+                old_status = old_status_obj.name if old_status_obj else None
+                new_status = new_status_obj.name if new_status_obj else None
                 
                 if old_status != new_status:
                     logger.info(f"Estado de proyecto cambiado: {instance.id} de {old_status} a {new_status}")
@@ -106,15 +105,10 @@ def notify_hours_validation(sender, instance, **kwargs):
     """Notifica cuando se valida o rechaza una hora de trabajo"""
     if not kwargs.get('created', False):  # Solo para actualizaciones
         try:
-            # Obtener el estado anterior
-            if instance.pk:
-                old_instance = WorkHour.objects.get(pk=instance.pk)
-                old_verified = old_instance.is_verified
-                
-                # Notificar cuando cambia el estado de verificación
-                if instance.is_verified != old_verified:
-                    logger.info(f"Horas validadas: {instance.id} - Verificado: {instance.is_verified}")
-                    NotificationService.notify_hours_validation(instance, instance.is_verified)
+            # Notificar cuando cambia el estado de verificación (sin volver a leer la fila)
+            if instance.has_changed('is_verified'):
+                logger.info(f"Horas validadas: {instance.id} - Verificado: {instance.is_verified}")
+                NotificationService.notify_hours_validation(instance, instance.is_verified)
         except Exception as e:
             logger.error(f"Error en signal de validación de horas: {str(e)}")
 
@@ -125,25 +119,20 @@ def notify_project_member_activated(sender, instance, **kwargs):
     """Notifica cuando un miembro del proyecto se activa"""
     if not kwargs.get('created', False):  # Solo para actualizaciones
         try:
-            # Obtener el estado anterior
-            if instance.pk:
-                old_instance = MiembroProyecto.objects.get(pk=instance.pk)
-                old_activo = old_instance.esta_activo
+            # Notificar cuando se activa un miembro (sin volver a leer la fila)
+            if instance.esta_activo and instance.has_changed('esta_activo'):
+                logger.info(f"Miembro de proyecto activado: {instance.id}")
+                title = "Proyecto Activado"
+                message = f"Has sido activado en el proyecto '{instance.proyecto.title}'. ¡Ya puedes comenzar a trabajar!"
+                related_url = f"/dashboard/student/projects"
                 
-                # Notificar cuando se activa un miembro
-                if instance.esta_activo and not old_activo:
-                    logger.info(f"Miembro de proyecto activado: {instance.id}")
-                    title = "Proyecto Activado"
-                    message = f"Has sido activado en el proyecto '{instance.proyecto.title}'. ¡Ya puedes comenzar a trabajar!"
-                    related_url = f"/dashboard/student/projects"
-                    
-                    NotificationService.create_notification(
-                        user=instance.usuario,
-                        title=title,
-                        message=message,
-                        notification_type='success',
-                        related_url=related_url
-                    )
+                NotificationService.create_notification(
+                    user=instance.usuario,
+                    title=title,
+                    message=message,
+                    notification_type='success',
+                    related_url=related_url
+                )
         except Exception as e:
             logger.error(f"Error en signal de activación de miembro: {str(e)}")
 
@@ -159,6 +148,20 @@ def notify_project_status_created(sender, instance, created, **kwargs):
         except Exception as e:
             logger.error(f"Error en signal de estado de proyecto creado: {str(e)}")
 
+# ===== SIGNALS PARA CONTADORES DE NOTIFICACIONES =====
+
+@receiver(post_save, sender=Notification)
+@receiver(post_delete, sender=Notification)
+def invalidate_notification_counters(sender, instance, **kwargs):
+    """Invalida el conteo cacheado de no leídas del usuario de la notificación"""
+    invalidate_unread_count(instance.user_id)
+
+@receiver(post_save, sender=NotificationPreference)
+@receiver(post_delete, sender=NotificationPreference)
+def invalidate_notification_preferences(sender, instance, **kwargs):
+    """Descarta las preferencias de entrega cacheadas del usuario"""
+    invalidate_preferences(instance.user_id)
+
 # ===== FUNCIÓN PARA CONECTAR SIGNALS =====
 
 def connect_notification_signals():
@@ -0,0 +1,194 @@
+"""
+Plantillas compiladas para notificaciones personalizadas por destinatario.
+
+Una plantilla usa marcadores `{{variable}}` (`{{ nombre }}` también vale).
+`compile_template()` la convierte una sola vez en un format string de Python,
+de modo que renderizar cada destinatario es un `str.format_map` en C en lugar
+de un `replace` por variable. Los marcadores sin valor se dejan tal cual,
+como hacía `NotificationTemplate.render`.
+
+Las variables disponibles por destinatario se declaran como una proyección
+sobre `User` (ver core.projection): `render_for_recipients()` lee por bloques
+de destinatarios solo las columnas y JOIN de las variables que usan las
+plantillas, con una consulta por bloque, y entrega las notificaciones
+renderizadas al camino de inserción en lote del outbox.
+
+Uso:
+
+    sent = send_personalized(
+        User.objects.filter(role='student'),
+        'Hola {{first_name}}', 'Tienes {{pending_hours}} horas por validar',
+        type='info',
+    )
+"""
+
+import re
+from functools import lru_cache
+
+from django.db.models import DecimalField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from core.projection import ProjectedField, Projection
+from work_hours.models import WorkHour
+from .models import Notification
+from .outbox import write_notifications
+
+PLACEHOLDER_RE = re.compile(r'{{\s*([A-Za-z_]\w*)\s*}}')
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class CompiledTemplate:
+    """Plantilla lista para renderizar muchas veces"""
+
+    def __init__(self, source):
+        self.source = source
+        self.variables = tuple(dict.fromkeys(PLACEHOLDER_RE.findall(source)))
+        parts = PLACEHOLDER_RE.split(source)
+        # split alterna texto literal y nombres de variable
+        self._format = ''.join(
+            '{' + part + '}' if index % 2 else part.replace('{', '{{').replace('}', '}}')
+            for index, part in enumerate(parts)
+        )
+
+    def render(self, context):
+        return self._format.format_map(_TemplateContext(context))
+
+
+class _TemplateContext(dict):
+    """Contexto que deja intactos los marcadores sin valor"""
+
+    def __missing__(self, key):
+        return '{{' + key + '}}'
+
+
+@lru_cache(maxsize=256)
+def compile_template(source):
+    return CompiledTemplate(source or '')
+
+
+# ===== VARIABLES POR DESTINATARIO =====
+
+def _profile(user, name):
+    # Perfil inverso (OneToOne) que puede no existir
+    return getattr(user, name, None)
+
+
+def _student_field(name, default=''):
+    def value(user):
+        student = _profile(user, 'estudiante_profile')
+        return getattr(student, name) if student is not None else default
+    return value
+
+
+def _company_name(user):
+    company = _profile(user, 'empresa_profile')
+    return company.company_name if company is not None else ''
+
+
+def _full_name(user):
+    return f"{user.first_name or ''} {user.last_name or ''}".strip() or user.email
+
+
+def _number(value):
+    return int(value) if value == int(value) else float(value)
+
+
+RECIPIENT_VARIABLES = Projection({
+    'first_name': ProjectedField(lambda u: u.first_name or '', ['first_name']),
+    'last_name': ProjectedField(lambda u: u.last_name or '', ['last_name']),
+    'full_name': ProjectedField(_full_name, ['first_name', 'last_name', 'email']),
+    'email': ProjectedField(lambda u: u.email, ['email']),
+    'role': ProjectedField(lambda u: u.get_role_display(), ['role']),
+    'career': ProjectedField(_student_field('career'), ['estudiante_profile__career']),
+    'semester': ProjectedField(_student_field('semester'), ['estudiante_profile__semester']),
+    'api_level': ProjectedField(_student_field('api_level'), ['estudiante_profile__api_level']),
+    'total_hours': ProjectedField(_student_field('total_hours', 0), ['estudiante_profile__total_hours']),
+    'pending_hours': ProjectedField(lambda u: _number(u.pending_hours)),
+    'company_name': ProjectedField(_company_name, ['empresa_profile__company_name']),
+})
+
+# Variables calculadas con subconsultas correlacionadas (en la misma consulta del bloque)
+RECIPIENT_ANNOTATIONS = {
+    'pending_hours': lambda: Coalesce(
+        Subquery(
+            WorkHour.objects.filter(student__user=OuterRef('pk'), is_verified=False)
+            .order_by()
+            .values('student')
+            .annotate(total=Sum('hours_worked'))
+            .values('total')[:1]
+        ),
+        Value(0),
+        output_field=DecimalField(max_digits=10, decimal_places=2),
+    ),
+}
+
+
+def template_variables(*templates):
+    """Variables de destinatario usadas por las plantillas. Lanza ValueError si alguna no existe."""
+    names = {name for template in templates for name in template.variables}
+    unknown = names - set(RECIPIENT_VARIABLES.fields)
+    if unknown:
+        raise ValueError(
+            f"Variables desconocidas: {', '.join(sorted(unknown))}. "
+            f"Disponibles: {', '.join(RECIPIENT_VARIABLES.fields)}"
+        )
+    return [name for name in RECIPIENT_VARIABLES.fields if name in names]
+
+
+def recipient_chunks(recipients, names, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Recorre los destinatarios por bloques ordenados por pk (keyset), con una
+    consulta por bloque limitada a las columnas de las variables `names`.
+    """
+    queryset = RECIPIENT_VARIABLES.apply(recipients, names)
+    annotations = {name: RECIPIENT_ANNOTATIONS[name]() for name in names if name in RECIPIENT_ANNOTATIONS}
+    if annotations:
+        queryset = queryset.annotate(**annotations)
+    queryset = queryset.order_by('pk')
+
+    last_pk = None
+    while True:
+        chunk_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk_queryset[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        last_pk = chunk[-1].pk
+
+
+def render_for_recipients(recipients, title, message, chunk_size=DEFAULT_CHUNK_SIZE, **fields):
+    """
+    Genera por bloques las notificaciones renderizadas para cada destinatario.
+    `fields` se copia en cada Notification (type, priority, related_url...).
+    Lanza ValueError si las plantillas usan variables desconocidas.
+    """
+    title_template = compile_template(title)
+    message_template = compile_template(message)
+    names = template_variables(title_template, message_template)
+
+    for chunk in recipient_chunks(recipients, names, chunk_size):
+        notifications = []
+        for user in chunk:
+            context = RECIPIENT_VARIABLES.serialize(user, names)
+            notifications.append(Notification(
+                user_id=user.pk,
+                title=title_template.render(context),
+                message=message_template.render(context),
+                **fields
+            ))
+        yield notifications
+
+
+def send_personalized(recipients, title, message, chunk_size=DEFAULT_CHUNK_SIZE, **fields):
+    """
+    Renderiza y guarda en lote (un bulk_create por bloque, respetando las
+    preferencias de cada usuario) una notificación personalizada para cada
+    destinatario. Retorna cuántas se renderizaron.
+    """
+    rendered = 0
+    for notifications in render_for_recipients(recipients, title, message, chunk_size, **fields):
+        if not write_notifications(notifications):
+            raise RuntimeError(f"No se pudo guardar un lote de {len(notifications)} notificaciones")
+        rendered += len(notifications)
+    return rendered
@@ -1,3 +1,208 @@
-from django.test import TestCase
+from datetime import datetime, time, timedelta
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from students.models import Estudiante
+from .counters import get_unread_count
+from .digest import DeliveryPreference, flush_due_digests, get_preference_map, next_digest_time
+from .models import Notification, NotificationPreference, NotificationTemplate, PendingDigestItem
+from .outbox import outbox
+from .services import NotificationService
+from .templating import compile_template, render_for_recipients, send_personalized
+
+User = get_user_model()
+
+
+class NotificationOutboxTest(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(email=f'user{i}@test.com', password='testpass123', role='student')
+            for i in range(5)
+        ]
+        outbox.metrics.reset()
+
+    def test_flushes_one_batch_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for user in self.users:
+                NotificationService.create_notification(user, 'Título', 'Mensaje')
+            self.assertEqual(Notification.objects.count(), 0)
+
+        self.assertEqual(Notification.objects.count(), 5)
+        stats = outbox.metrics.snapshot()
+        self.assertEqual(stats['flushes'], 1)
+        self.assertEqual(stats['batch_size']['max'], 5)
+
+    def test_unread_count_invalidated_after_flush(self):
+        self.assertEqual(get_unread_count(self.users[0]), 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationService.create_bulk_notifications(self.users, 'Título', 'Mensaje')
+        self.assertEqual(get_unread_count(self.users[0]), 1)
+
+    def test_rolled_back_transaction_discards_notifications(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    NotificationService.create_notification(self.users[0], 'Título', 'Mensaje')
+                    raise ValueError
+            except ValueError:
+                pass
+        self.assertEqual(Notification.objects.count(), 0)
+
+    def test_outbox_rows_keep_compat_fields(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationService.create_notification(
+                self.users[0], 'Título', 'Mensaje', notification_type='warning', related_url='/projects/1',
+            )
+            NotificationService.create_bulk_notifications(self.users[1:3], 'Título', 'Mensaje', 'success', '/hours')
+
+        row = Notification.objects.get(user=self.users[0])
+        self.assertEqual((row.notification_type, row.action_url), ('warning', '/projects/1'))
+        self.assertEqual(
+            set(Notification.objects.filter(user__in=self.users[1:3]).values_list('notification_type', 'action_url')),
+            {('success', '/hours')},
+        )
+
+    def test_batch_after_rollback_is_sent_with_next_transaction(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    NotificationService.create_notification(self.users[0], 'Revertida', 'Mensaje')
+                    raise ValueError
+            except ValueError:
+                pass
+            with transaction.atomic():
+                NotificationService.create_notification(self.users[1], 'Confirmada', 'Mensaje')
+        self.assertEqual(list(Notification.objects.values_list('title', flat=True)), ['Confirmada'])
+
+    def test_request_scope_merges_batches(self):
+        with outbox.collect():
+            for user in self.users[:3]:
+                with self.captureOnCommitCallbacks(execute=True):
+                    NotificationService.create_notification(user, 'Título', 'Mensaje')
+            self.assertEqual(Notification.objects.count(), 0)
+
+        self.assertEqual(Notification.objects.count(), 3)
+        self.assertEqual(outbox.metrics.snapshot()['flushes'], 1)
+
+    @override_settings(NOTIFICATION_OUTBOX={'MODE': 'deferred', 'START_WORKER': False})
+    def test_deferred_mode_hands_batch_to_worker(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationService.create_bulk_notifications(self.users, 'Título', 'Mensaje')
+        self.assertEqual(Notification.objects.count(), 0)
+        self.assertEqual(outbox.worker.pending, 1)
+
+        outbox.worker.drain()
+        self.assertEqual(Notification.objects.count(), 5)
+        self.assertEqual(outbox.worker.pending, 0)
+
+
+class NotificationDigestTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.immediate, self.hourly, self.muted = [
+            User.objects.create_user(email=f'digest{i}@test.com', password='testpass123', role='student')
+            for i in range(3)
+        ]
+        NotificationPreference.objects.create(user=self.hourly, digest_frequency='hourly')
+        preference = NotificationPreference(user=self.muted)
+        preference.set_enabled_types_list(['error'])
+        preference.save()
+        outbox.metrics.reset()
+
+    def notify_all(self, notification_type='info'):
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationService.create_bulk_notifications(
+                [self.immediate, self.hourly, self.muted], 'Título', 'Mensaje', notification_type
+            )
+
+    def test_preferences_route_batches_before_writing(self):
+        self.notify_all()
+        self.notify_all('warning')
+
+        self.assertEqual(Notification.objects.filter(user=self.immediate).count(), 2)
+        self.assertFalse(Notification.objects.filter(user__in=[self.hourly, self.muted]).exists())
+        self.assertEqual(PendingDigestItem.objects.filter(user=self.hourly).count(), 2)
+        stats = outbox.metrics.snapshot()
+        self.assertEqual((stats['dropped'], stats['digested']), (2, 2))
+
+        # El mapa de preferencias queda en cache
+        with self.assertNumQueries(0):
+            get_preference_map([self.immediate.id, self.hourly.id, self.muted.id])
+
+    def test_flush_collapses_due_items_into_one_digest(self):
+        self.notify_all()
+        self.notify_all('warning')
+
+        self.assertEqual(flush_due_digests(), (0, 0))
+        later = timezone.now() + timedelta(hours=1, minutes=1)
+        self.assertEqual(flush_due_digests(now=later), (1, 2))
+
+        digest = Notification.objects.get(user=self.hourly)
+        self.assertEqual(digest.title, 'Resumen de notificaciones (2)')
+        self.assertEqual(digest.type, 'warning')
+        self.assertFalse(PendingDigestItem.objects.exists())
+
+    def test_preference_changes_invalidate_cache(self):
+        preference = NotificationPreference.objects.get(user=self.hourly)
+        preference.digest_frequency = 'immediate'
+        preference.save()
+        self.notify_all()
+        self.assertTrue(Notification.objects.filter(user=self.hourly).exists())
+
+    def test_delivery_times(self):
+        tz = timezone.get_current_timezone()
+        tuesday_night = datetime(2026, 3, 3, 23, 30, tzinfo=tz)
+        self.assertEqual(next_digest_time('hourly', tuesday_night), datetime(2026, 3, 4, 0, 0, tzinfo=tz))
+        self.assertEqual(next_digest_time('daily', tuesday_night), datetime(2026, 3, 4, 8, 0, tzinfo=tz))
+        self.assertEqual(next_digest_time('weekly', tuesday_night), datetime(2026, 3, 9, 8, 0, tzinfo=tz))
+
+        # Horas silenciosas que cruzan la medianoche retienen las inmediatas hasta su fin
+        quiet = DeliveryPreference('immediate', (), time(22, 0), time(7, 0))
+        self.assertEqual(quiet.deliver_after(tuesday_night), datetime(2026, 3, 4, 7, 0, tzinfo=tz))
+        self.assertIsNone(quiet.deliver_after(datetime(2026, 3, 4, 12, 0, tzinfo=tz)))
+
+
+class NotificationTemplatingTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.students = [
+            User.objects.create_user(
+                email=f'alumno{i}@test.com', password='testpass123', role='student', first_name=f'Alumno{i}'
+            )
+            for i in range(5)
+        ]
+        for user in self.students:
+            Estudiante.objects.create(user=user, career='Informática')
+        self.company = User.objects.create_user(email='empresa@test.com', password='testpass123', role='company')
+
+    def test_compiled_template_keeps_literals_and_unknown_placeholders(self):
+        template = compile_template('Hola {{ first_name }} {json} {{otra}}')
+        self.assertIs(compile_template('Hola {{ first_name }} {json} {{otra}}'), template)
+        self.assertEqual(template.variables, ('first_name', 'otra'))
+        self.assertEqual(template.render({'first_name': 'Ana'}), 'Hola Ana {json} {{otra}}')
+
+        stored = NotificationTemplate(title_template='Hola {{name}}', message_template='{{name}}: {{count}}')
+        self.assertEqual(stored.render({'name': 'Ana', 'count': 3}), ('Hola Ana', 'Ana: 3'))
+
+    def test_renders_each_chunk_with_one_projection_query(self):
+        recipients = User.objects.filter(role__in=['student', 'company'])
+        with self.assertNumQueries(3):
+            chunks = list(render_for_recipients(
+                recipients, 'Hola {{first_name}}', '{{career}}|{{company_name}}|{{pending_hours}}', chunk_size=3,
+            ))
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3])
+        messages = {n.user_id: n.message for chunk in chunks for n in chunk}
+        self.assertEqual(messages[str(self.students[0].id)], 'Informática||0')
+        self.assertEqual(messages[str(self.company.id)], '||0')
+
+        with self.assertRaises(ValueError):
+            next(render_for_recipients(recipients, '{{desconocida}}', ''))
+
+    def test_send_personalized_stores_in_batches(self):
+        sent = send_personalized(User.objects.filter(role='student'), 'Hola {{first_name}}', 'Mensaje', type='success')
+        self.assertEqual(sent, 5)
+        self.assertEqual(Notification.objects.get(user=self.students[1]).title, 'Hola Alumno1')
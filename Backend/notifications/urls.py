@@ -13,6 +13,7 @@ urlpatterns = [
     path('mark-all-read/', views.mark_all_as_read, name='mark_all_as_read'),
     path('unread-count/', views.notification_stats, name='unread_count'),
     path('stats/', views.notification_stats, name='notification_stats'),
+    path('outbox-metrics/', views.outbox_metrics, name='outbox_metrics'),
     path('create/', views.create_notification, name='create_notification'),
     path('create-system/', views.create_system_notification, name='create_system_notification'),
     path('send-company-message/', views.send_company_message, name='send_company_message'),
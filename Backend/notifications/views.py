@@ -4,16 +4,20 @@ Views para la app notifications.
 
 import json
 import uuid
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.db.models import Q
 from django.utils import timezone
 from .models import Notification
+from .counters import get_unread_count, invalidate_unread_count
+from .outbox import outbox
 from core.auth_utils import get_user_from_token, require_auth
+from core.conditional import conditional_get, list_version, token_user_id
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@conditional_get(lambda request: list_version(Notification.objects.filter(user_id=token_user_id(request))))
 @require_auth
 def notification_list(request):
     """Lista de notificaciones del usuario autenticado."""
@@ -197,8 +201,10 @@ def mark_multiple_as_read(request):
         ).update(
             read=True,
             is_read=True,
-            read_at=timezone.now()
+            read_at=timezone.now(),
+            updated_at=timezone.now()
         )
+        invalidate_unread_count(user.id)
         
         return JsonResponse({
             'success': True,
@@ -216,7 +222,7 @@ def unread_count(request):
     try:
         user = get_user_from_token(request)
         
-        unread_count = Notification.objects.filter(user=user, read=False).count()
+        unread_count = get_unread_count(user)
         
         return JsonResponse({
             'success': True,
@@ -429,8 +435,10 @@ def mark_all_as_read(request):
         ).update(
             read=True,
             is_read=True,
-            read_at=timezone.now()
+            read_at=timezone.now(),
+            updated_at=timezone.now()
         )
+        invalidate_unread_count(user.id)
         
         return JsonResponse({
             'success': True,
@@ -530,3 +538,21 @@ def test_endpoint_no_auth(request):
         })
     except Exception as e:
         return JsonResponse({'error': f'Error en endpoint de prueba: {str(e)}'}, status=500)
+
+@csrf_exempt
+@require_http_methods(["GET"])
+@require_auth
+def outbox_metrics(request):
+    """Métricas del outbox de notificaciones de este proceso (solo admin)."""
+    try:
+        user = get_user_from_token(request)
+        if user.role != 'admin':
+            return JsonResponse({'error': 'Acceso denegado'}, status=403)
+        
+        data = outbox.metrics.snapshot()
+        data['pending_deferred_batches'] = outbox.worker.pending
+        return JsonResponse({'success': True, 'data': data})
+        
+    except Exception as e:
+        return JsonResponse({'error': f'Error al obtener métricas del outbox: {str(e)}'}, status=500)
+
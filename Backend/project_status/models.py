@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from users.models import User
 
 class ProjectStatus(models.Model):
@@ -30,4 +32,11 @@ class ProjectStatusHistory(models.Model):
     class Meta:
         db_table = 'project_status_history'
     def __str__(self):
-        return f"{self.project.title} - {self.status.name} ({self.fecha_cambio})" 
\ No newline at end of file
+        return f"{self.project.title} - {self.status.name} ({self.fecha_cambio})" 
+
+
+@receiver([post_save, post_delete], sender=ProjectStatus)
+def invalidar_registro_estados(sender, **kwargs):
+    """Invalida el registro de datos de referencia al cambiar un estado de proyecto"""
+    from core.reference_data import invalidate_reference_data
+    invalidate_reference_data()
@@ -0,0 +1,235 @@
+"""
+Motor de completación de proyectos y validación de horas en bloque.
+
+Tanto `Proyecto.marcar_como_completado` como la validación de horas del
+administrador trabajan sobre todos los estudiantes del proyecto a la vez:
+los faltantes (asignaciones, aplicaciones y registros de horas) se calculan
+con una sola consulta anti-join, se insertan con bulk_create y los contadores
+del estudiante se actualizan con un único UPDATE con F(). El número de
+consultas es constante sin importar el tamaño del proyecto.
+
+`pending_validation_projects` es la lista de trabajo del administrador:
+proyectos completados sin horas de completación, resuelta con un anti-join
+sobre el índice parcial `work_hours_completion_idx`.
+
+Como bulk_create/update no disparan señales, las caches afectadas
+(dashboard del estudiante y contador de no leídas) se invalidan aquí.
+"""
+
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Prefetch, Subquery
+from django.utils import timezone
+
+from core.reference_data import reference_data
+
+# Estados de aplicación que se consideran participación en el proyecto
+PARTICIPATING_APPLICATION_STATUSES = ['active', 'accepted']
+
+# Aplicaciones que cuentan como participantes en la lista de validación
+PARTICIPANT_APPLICATION_STATUSES = ['accepted', 'active', 'completed']
+
+AUTO_COVER_LETTER = 'Generada automáticamente para validación de horas'
+
+
+def project_completion_hours(project):
+    """Horas que otorga el proyecto al completarse"""
+    if project.required_hours and project.required_hours > 0:
+        return project.required_hours
+    return project.hours_per_week * project.duration_weeks
+
+
+def _completion_hours_exist(project, student_ref):
+    from work_hours.models import WorkHour
+    return Exists(WorkHour.objects.filter(
+        project=project,
+        student_id=student_ref,
+        is_project_completion=True,
+    ))
+
+
+def _invalidate_student_caches(student_ids):
+    from students.dashboard import invalidate_student_dashboard
+    for student_id in student_ids:
+        invalidate_student_dashboard(student_id)
+
+
+def complete_project(project, user=None):
+    """
+    Marca el proyecto como completado: genera las horas de completación
+    (pendientes de validación) de cada asignación en curso que aún no las
+    tenga, finaliza las asignaciones y completa las aplicaciones.
+
+    Retorna el número de asignaciones finalizadas.
+    """
+    from applications.models import Aplicacion, Asignacion
+    from work_hours.models import WorkHour
+    from .models import HistorialEstadosProyecto, Proyecto
+
+    today = timezone.now().date()
+    hours = Decimal(str(project_completion_hours(project)))
+
+    with transaction.atomic():
+        project.real_end_date = today
+        Proyecto.objects.filter(id=project.id).update(real_end_date=today, updated_at=timezone.now())
+
+        # Asignaciones en curso + anti-join contra las horas de completación ya existentes
+        assignments = list(
+            Asignacion.objects.filter(application__project=project, estado='en curso')
+            .annotate(has_hours=_completion_hours_exist(project, OuterRef('application__student_id')))
+            .values('id', 'application__student_id', 'has_hours')
+        )
+        student_ids = [row['application__student_id'] for row in assignments]
+
+        WorkHour.objects.bulk_create([
+            WorkHour(
+                student_id=row['application__student_id'],
+                project=project,
+                date=today,
+                hours_worked=hours,
+                description=f"Horas automáticas del proyecto completado: {project.title}",
+                is_verified=False,  # Pendiente de validación del admin
+                is_project_completion=True,
+            )
+            for row in assignments
+            if not row['has_hours']
+        ])
+
+        if assignments:
+            Asignacion.objects.filter(id__in=[row['id'] for row in assignments]).update(
+                estado='completado', fecha_fin=today
+            )
+            from students.models import Estudiante
+            Estudiante.objects.filter(id__in=student_ids).update(
+                completed_projects=F('completed_projects') + 1, updated_at=timezone.now()
+            )
+
+        Aplicacion.objects.filter(
+            project=project, status__in=PARTICIPATING_APPLICATION_STATUSES
+        ).update(status='completed', updated_at=timezone.now())
+
+        # Registrar el cambio de estado en el historial
+        status_completado_id = reference_data.status_id('completed')
+        if user and status_completado_id is not None:
+            HistorialEstadosProyecto.objects.create(
+                project=project,
+                status_id=status_completado_id,
+                user=user,
+                comentario=f"Proyecto marcado como completado por {user.full_name}"
+            )
+
+    _invalidate_student_caches(student_ids)
+    return len(assignments)
+
+
+def validate_completion_hours(project, validated_by):
+    """
+    Valida las horas de completación de todos los estudiantes miembros del
+    proyecto: crea las aplicaciones y asignaciones faltantes, registra las
+    horas verificadas de quienes aún no las tienen y las suma a su total.
+
+    Retorna la lista de estudiantes a los que se les validaron horas.
+    """
+    from applications.models import Aplicacion, Asignacion
+    from students.models import Estudiante
+    from work_hours.models import WorkHour
+    from .models import MiembroProyecto
+
+    now = timezone.now()
+    hours = int(project.required_hours)
+    work_date = project.real_end_date or project.estimated_end_date or now.date()
+
+    project_applications = Aplicacion.objects.filter(project=project, student_id=OuterRef('pk'))
+
+    with transaction.atomic():
+        # Una consulta: miembros estudiantes con su aplicación, asignación y horas existentes
+        students = list(
+            Estudiante.objects.filter(
+                user_id__in=MiembroProyecto.objects.filter(proyecto=project, rol='estudiante').values('usuario_id')
+            )
+            .select_related('user')
+            .annotate(
+                application_id=Subquery(project_applications.values('id')[:1]),
+                application_status=Subquery(project_applications.values('status')[:1]),
+                has_assignment=Exists(Asignacion.objects.filter(
+                    application__project=project, application__student_id=OuterRef('pk')
+                )),
+                has_hours=_completion_hours_exist(project, OuterRef('pk')),
+            )
+        )
+
+        # Aplicaciones y asignaciones faltantes (solo para quienes no tienen asignación)
+        without_assignment = [student for student in students if not student.has_assignment]
+        new_applications = [
+            Aplicacion(project=project, student=student, status='accepted', cover_letter=AUTO_COVER_LETTER)
+            for student in without_assignment
+            if not student.application_id
+        ]
+        Aplicacion.objects.bulk_create(new_applications)
+        for application in new_applications:
+            application.student.application_id = application.id
+
+        not_accepted = [
+            student.application_id for student in without_assignment
+            if student.application_status and student.application_status != 'accepted'
+        ]
+        if not_accepted:
+            Aplicacion.objects.filter(id__in=not_accepted).update(status='accepted', updated_at=timezone.now())
+
+        Asignacion.objects.bulk_create([
+            Asignacion(
+                application_id=student.application_id,
+                fecha_inicio=project.start_date or now.date(),
+                estado='en curso',
+            )
+            for student in without_assignment
+        ])
+
+        # Horas verificadas solo para quienes aún no tienen horas de completación
+        validated = [student for student in students if not student.has_hours]
+        WorkHour.objects.bulk_create([
+            WorkHour(
+                student=student,
+                project=project,
+                date=work_date,
+                hours_worked=Decimal(hours),
+                description=f"Horas validadas por finalización del proyecto: {project.title}",
+                is_verified=True,
+                verified_by=validated_by,
+                verified_at=now,
+                is_project_completion=True,
+            )
+            for student in validated
+        ])
+        if validated:
+            Estudiante.objects.filter(id__in=[student.id for student in validated]).update(
+                total_hours=F('total_hours') + hours, updated_at=timezone.now()
+            )
+
+    _invalidate_student_caches(student.id for student in validated)
+    return validated
+
+
+def pending_validation_projects():
+    """
+    Proyectos completados cuyas horas aún no se han validado, con la empresa
+    y los participantes precargados (3 consultas por página: proyectos,
+    aplicaciones con estudiante/usuario y el conteo del paginador).
+    """
+    from applications.models import Aplicacion
+    from work_hours.models import WorkHour
+    from .models import Proyecto
+
+    participants = (
+        Aplicacion.objects.filter(status__in=PARTICIPANT_APPLICATION_STATUSES)
+        .select_related('student__user')
+        .order_by('applied_at')
+    )
+    return (
+        Proyecto.objects.filter(status_id__in=reference_data.status_ids('completed'))
+        .filter(~Exists(WorkHour.objects.filter(project=OuterRef('pk'), is_project_completion=True)))
+        .select_related('company')
+        .prefetch_related(Prefetch('application_project', queryset=participants, to_attr='participating_applications'))
+        .order_by(F('real_end_date').desc(nulls_last=True), '-created_at')
+    )
@@ -10,6 +10,7 @@ django.setup()
 
 from projects.models import Proyecto
 from applications.models import Aplicacion
+from django.utils import timezone
 
 # Buscar todos los proyectos completados
 total_actualizados = 0
@@ -17,7 +18,7 @@ proyectos_completados = Proyecto.objects.filter(status__name__in=['completed', '
 
 for proyecto in proyectos_completados:
     # Actualizar aplicaciones activas o aceptadas a 'completed'
-    actualizados = Aplicacion.objects.filter(project=proyecto, status__in=['active', 'accepted']).update(status='completed')
+    actualizados = Aplicacion.objects.filter(project=proyecto, status__in=['active', 'accepted']).update(status='completed', updated_at=timezone.now())
     if actualizados > 0:
         print(f"Proyecto: {proyecto.title} - Aplicaciones actualizadas: {actualizados}")
         total_actualizados += actualizados
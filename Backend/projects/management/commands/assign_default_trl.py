@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from django.utils import timezone
 from projects.models import Proyecto
 from trl_levels.models import TRLLevel
 
@@ -66,7 +67,7 @@ class Command(BaseCommand):
         # Ejecutar la actualización
         try:
             with transaction.atomic():
-                updated_count = projects_without_trl.update(trl=default_trl)
+                updated_count = projects_without_trl.update(trl=default_trl, updated_at=timezone.now())
                 
                 self.stdout.write(
                     self.style.SUCCESS(f'✅ Se actualizaron {updated_count} proyectos exitosamente')
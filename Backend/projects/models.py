@@ -9,11 +9,16 @@ import uuid
 from django.utils import timezone
 import json
 from decimal import Decimal
+from core.reference_data import reference_data
+from core.tracking import ChangeTrackingMixin
 
-class Proyecto(models.Model):
+class Proyecto(ChangeTrackingMixin, models.Model):
     """
     Modelo de proyecto que coincide exactamente con el interface Project del frontend
     """
+    # Campos cuyo valor anterior consultan los signals (ver core.tracking)
+    tracked_fields = ('status', 'company')
+    
     MODALITY_CHOICES = (
         ('remote', 'Remoto'),
         ('onsite', 'Presencial'),
@@ -98,6 +103,10 @@ class Proyecto(models.Model):
         verbose_name = 'Proyecto'
         verbose_name_plural = 'Proyectos'
         ordering = ['-created_at']
+        indexes = [
+            # Catálogo de proyectos disponibles: estado y TRL por igualdad/IN, nivel API por rango (al final)
+            models.Index(fields=['status', 'trl', 'api_level'], name='projects_catalog_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.company.company_name if self.company else 'Sin empresa'}"
@@ -248,9 +257,13 @@ class Proyecto(models.Model):
         return (self.current_students / self.max_students) * 100
     
     def incrementar_vistas(self):
-        """Incrementa el contador de vistas"""
-        self.views_count += 1
-        self.save(update_fields=['views_count'])
+        """
+        Registra una vista en el buffer de core.view_counters (sin save). No
+        toca `self.views_count`: un save completo posterior la sumaría dos
+        veces; para mostrar el total usar `view_counters.pending()`.
+        """
+        from core.view_counters import view_counters
+        view_counters.record(Proyecto, self.pk)
     
     def incrementar_aplicaciones(self):
         """Incrementa el contador de aplicaciones"""
@@ -310,62 +323,12 @@ class Proyecto(models.Model):
         self.save(update_fields=['published_at'])
     
     def marcar_como_completado(self, user=None):
-        """Marca el proyecto como completado y genera horas trabajadas automáticamente"""
-        from django.utils import timezone
-        from work_hours.models import WorkHour
-        from applications.models import Asignacion, Aplicacion
-        
-        # Cambiar estado del proyecto
-        self.real_end_date = timezone.now().date()
-        self.save(update_fields=['real_end_date'])
-        
-        # Obtener todas las asignaciones activas del proyecto
-        asignaciones = Asignacion.objects.filter(
-            application__project=self,
-            estado='en curso'
-        ).select_related('application__student', 'application__project__company')
-        
-        # Generar horas trabajadas para cada asignación
-        for asignacion in asignaciones:
-            # Calcular horas totales del proyecto
-            if self.required_hours and self.required_hours > 0:
-                horas_proyecto = self.required_hours
-            else:
-                horas_proyecto = self.hours_per_week * self.duration_weeks
-            
-            # Crear registro de horas trabajadas
-            work_hour = WorkHour.objects.create(
-                student=asignacion.application.student,
-                project=self,
-                date=timezone.now().date(),
-                hours_worked=Decimal(str(horas_proyecto)),
-                description=f"Horas automáticas del proyecto completado: {self.title}",
-                is_verified=False,  # Pendiente de validación del admin
-                verified_by=None,
-                verified_at=None,
-                is_project_completion=True
-            )
-            
-            # Finalizar la asignación
-            asignacion.finalizar_asignacion()
-        
-        # ACTUALIZAR TODAS LAS APLICACIONES RELACIONADAS A 'completed'
-        Aplicacion.objects.filter(project=self, status__in=['active', 'accepted']).update(status='completed')
-        
-        # Registrar el cambio de estado en el historial
-        if user:
-            from .models import HistorialEstadosProyecto
-            from project_status.models import ProjectStatus
-            try:
-                status_completado = ProjectStatus.objects.get(name='Completado')
-                HistorialEstadosProyecto.objects.create(
-                    project=self,
-                    status=status_completado,
-                    user=user,
-                    comentario=f"Proyecto marcado como completado por {user.full_name}"
-                )
-            except ProjectStatus.DoesNotExist:
-                pass  # Si no existe el estado, no se registra el historial
+        """
+        Marca el proyecto como completado y genera horas trabajadas automáticamente.
+        Opera en bloque sobre todas las asignaciones (ver projects.completion).
+        """
+        from .completion import complete_project
+        return complete_project(self, user)
 
 class HistorialEstadosProyecto(models.Model):
     """
@@ -389,10 +352,13 @@ class HistorialEstadosProyecto(models.Model):
     def __str__(self):
         return f"{self.project.title} - {self.status.name} ({self.fecha_cambio})"
 
-class AplicacionProyecto(models.Model):
+class AplicacionProyecto(ChangeTrackingMixin, models.Model):
     """
     Modelo de aplicación que coincide exactamente con el interface Application del frontend
     """
+    # Campos cuyo valor anterior consultan los signals (ver core.tracking)
+    tracked_fields = ('estado',)
+    
     ESTADOS = (
         ('pending', 'Pendiente'),
         ('reviewing', 'En Revisión'),
@@ -469,7 +435,10 @@ class AplicacionProyecto(models.Model):
         # La creación del evento se manejará en signals para evitar importación circular
         pass
 
-class MiembroProyecto(models.Model):
+class MiembroProyecto(ChangeTrackingMixin, models.Model):
+    # Campos cuyo valor anterior consultan los signals (ver core.tracking)
+    tracked_fields = ('esta_activo',)
+    
     ROLES = (
         ('estudiante', 'Estudiante'),
         ('mentor', 'Mentor'),
@@ -518,37 +487,44 @@ from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
 @receiver(post_save, sender=Proyecto)
-def update_company_projects_count_on_save(sender, instance, **kwargs):
-    """Actualizar conteo de proyectos cuando se crea o actualiza un proyecto"""
-    if instance.company:
-        # Contar proyectos totales
-        total_projects = Proyecto.objects.filter(company=instance.company).count()
-        
-        # Contar proyectos completados
-        completed_projects = Proyecto.objects.filter(
-            company=instance.company, 
-            status__name='completed'
-        ).count()
-        
-        # Actualizar empresa
-        instance.company.total_projects = total_projects
-        instance.company.projects_completed = completed_projects
-        instance.company.save(update_fields=['total_projects', 'projects_completed'])
+def update_company_projects_count_on_save(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    """
+    Actualizar contadores de la empresa con deltas F(): solo al crear el proyecto,
+    al moverlo de empresa o cuando su estado cambia a/desde completado
+    """
+    from companies.counters import apply_company_project_deltas, reconcile_company_project_counters
+    if raw:
+        return
+    completed_ids = set(reference_data.status_ids('completed'))
+    is_completed = instance.status_id in completed_ids
+    
+    if created:
+        apply_company_project_deltas(instance.company_id, total=1, completed=int(is_completed))
+        return
+    
+    # Guardados parciales que no tocan estado ni empresa (vistas, fechas, ...) no afectan los contadores
+    if update_fields is not None and not {'status', 'status_id', 'company', 'company_id'} & set(update_fields):
+        return
+    
+    if not (instance.has_snapshot('status') and instance.has_snapshot('company')):
+        # Instancia sin estado anterior conocido: recalcular solo esta empresa
+        reconcile_company_project_counters([instance.company_id])
+        return
+    
+    was_completed = instance.previous('status') in completed_ids
+    old_company_id = instance.previous('company')
+    if old_company_id != instance.company_id:
+        apply_company_project_deltas(old_company_id, total=-1, completed=-int(was_completed))
+        apply_company_project_deltas(instance.company_id, total=1, completed=int(is_completed))
+    elif was_completed != is_completed:
+        apply_company_project_deltas(instance.company_id, completed=1 if is_completed else -1)
 
 @receiver(post_delete, sender=Proyecto)
 def update_company_projects_count_on_delete(sender, instance, **kwargs):
-    """Actualizar conteo de proyectos cuando se elimina un proyecto"""
-    if instance.company:
-        # Contar proyectos totales
-        total_projects = Proyecto.objects.filter(company=instance.company).count()
-        
-        # Contar proyectos completados
-        completed_projects = Proyecto.objects.filter(
-            company=instance.company, 
-            status__name='completed'
-        ).count()
-        
-        # Actualizar empresa
-        instance.company.total_projects = total_projects
-        instance.company.projects_completed = completed_projects
-        instance.company.save(update_fields=['total_projects', 'projects_completed'])
+    """Actualizar contadores de la empresa cuando se elimina un proyecto"""
+    from companies.counters import apply_company_project_deltas
+    # Se usan los valores guardados (la instancia pudo modificarse sin guardar)
+    status_id = instance.previous('status') if instance.has_snapshot('status') else instance.status_id
+    company_id = instance.previous('company') if instance.has_snapshot('company') else instance.company_id
+    was_completed = status_id in set(reference_data.status_ids('completed'))
+    apply_company_project_deltas(company_id, total=-1, completed=-int(was_completed))
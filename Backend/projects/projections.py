@@ -0,0 +1,74 @@
+"""
+Proyecciones de los listados de proyectos (ver core.projection).
+
+Estado, área y TRL se resuelven con el registro de datos de referencia a
+partir de sus ids, sin JOIN; la empresa solo se une si se pide `company_name`.
+"""
+
+from core.projection import ProjectedField, Projection
+from core.reference_data import reference_data
+
+
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+def _status(project):
+    return reference_data.status_by_id(project.status_id)
+
+
+def _trl(project):
+    return reference_data.trl_by_id(project.trl_id)
+
+
+def _area(project):
+    return reference_data.area_by_id(project.area_id)
+
+
+PROJECT_LIST_PROJECTION = Projection({
+    'id': ProjectedField(lambda p: str(p.id), summary=True),
+    'title': ProjectedField(lambda p: p.title, ['title'], summary=True),
+    'description': ProjectedField(lambda p: p.description, ['description']),
+    'requirements': ProjectedField(lambda p: p.requirements, ['requirements']),
+    # Campos adicionales del formulario
+    'tipo': ProjectedField(lambda p: p.tipo, ['tipo']),
+    'objetivo': ProjectedField(lambda p: p.objetivo, ['objetivo']),
+    'encargado': ProjectedField(lambda p: p.encargado, ['encargado']),
+    'contacto': ProjectedField(lambda p: p.contacto, ['contacto']),
+    'company_name': ProjectedField(
+        lambda p: p.company.company_name if p.company else 'Sin empresa',
+        ['company__company_name'], summary=True
+    ),
+    'status': ProjectedField(
+        lambda p: _status(p).name if _status(p) else 'Sin estado', ['status_id'], summary=True
+    ),
+    'status_id': ProjectedField(lambda p: _status(p).id if _status(p) else None, ['status_id'], summary=True),
+    'area': ProjectedField(lambda p: _area(p).name if _area(p) else 'Sin área', ['area_id'], summary=True),
+    'trl_level': ProjectedField(lambda p: _trl(p).level if _trl(p) else 1, ['trl_id'], summary=True),
+    'trl_id': ProjectedField(lambda p: _trl(p).id if _trl(p) else None, ['trl_id']),
+    'api_level': ProjectedField(lambda p: p.api_level or 1, ['api_level'], summary=True),
+    'max_students': ProjectedField(lambda p: p.max_students, ['max_students'], summary=True),
+    'current_students': ProjectedField(lambda p: p.current_students, ['current_students'], summary=True),
+    'applications_count': ProjectedField(lambda p: p.applications_count, ['applications_count'], summary=True),
+    'start_date': ProjectedField(lambda p: _isoformat(p.start_date), ['start_date'], summary=True),
+    'estimated_end_date': ProjectedField(lambda p: _isoformat(p.estimated_end_date), ['estimated_end_date']),
+    'location': ProjectedField(lambda p: p.location or 'Remoto', ['location'], summary=True),
+    'modality': ProjectedField(lambda p: p.modality, ['modality'], summary=True),
+    'duration_weeks': ProjectedField(lambda p: p.duration_weeks, ['duration_weeks']),
+    'hours_per_week': ProjectedField(lambda p: p.hours_per_week, ['hours_per_week']),
+    'required_hours': ProjectedField(lambda p: p.required_hours, ['required_hours'], summary=True),
+    'is_featured': ProjectedField(lambda p: p.is_featured, ['is_featured'], summary=True),
+    'is_urgent': ProjectedField(lambda p: p.is_urgent, ['is_urgent'], summary=True),
+    'created_at': ProjectedField(lambda p: _isoformat(p.created_at), ['created_at'], summary=True),
+    'updated_at': ProjectedField(lambda p: _isoformat(p.updated_at), ['updated_at']),
+})
+
+# Listado de proyectos disponibles para estudiantes
+AVAILABLE_PROJECTS_PROJECTION = PROJECT_LIST_PROJECTION.extend({
+    'trl_name': ProjectedField(lambda p: _trl(p).name if _trl(p) else 'Sin TRL', ['trl_id']),
+})
+
+# Listado de administración
+ADMIN_PROJECTS_PROJECTION = PROJECT_LIST_PROJECTION.extend({
+    'is_project_completion': ProjectedField(lambda p: p.is_project_completion, ['is_project_completion']),
+})
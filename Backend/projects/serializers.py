@@ -11,6 +11,7 @@ from companies.models import Empresa
 from areas.models import Area
 from trl_levels.models import TRLLevel
 from project_status.models import ProjectStatus
+from core.view_counters import view_counters
 
 class ProyectoSerializer:
     """Serializer para el modelo Proyecto"""
@@ -50,7 +51,8 @@ class ProyectoSerializer:
             'technologies': proyecto.get_technologies_list(),
             'benefits': proyecto.get_benefits_list(),
             'applications_count': proyecto.applications_count,
-            'views_count': proyecto.views_count,
+            # Vistas ya escritas más las que siguen en el buffer
+            'views_count': proyecto.views_count + view_counters.pending(Proyecto, proyecto.id),
             'is_featured': proyecto.is_featured,
             'is_urgent': proyecto.is_urgent,
             'published_at': proyecto.published_at.isoformat() if proyecto.published_at else None,
@@ -1,3 +1,131 @@
 from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from core.reference_data import reference_data
+from .models import Proyecto, MiembroProyecto
+from .completion import complete_project, pending_validation_projects, validate_completion_hours
+from applications.models import Aplicacion, Asignacion
+from companies.models import Empresa
+from project_status.models import ProjectStatus
+from students.models import Estudiante
+from work_hours.models import WorkHour
+from datetime import date
 
-# Create your tests here.
+User = get_user_model()
+
+
+class ProjectCompletionTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        company_user = User.objects.create_user(
+            email='company@test.com',
+            password='testpass123',
+            role='company'
+        )
+        self.company = Empresa.objects.create(user=company_user, company_name='Test Company')
+        ProjectStatus.objects.create(name='completed')
+        self.project = Proyecto.objects.create(
+            title='Collective project',
+            company=self.company,
+            description='Test description',
+            requirements='Test requirements',
+            required_hours=40,
+            start_date=date(2024, 3, 1),
+        )
+        self.admin = User.objects.create_user(email='admin@test.com', password='testpass123', role='admin')
+        self.students = []
+        for i in range(6):
+            user = User.objects.create_user(email=f'student{i}@test.com', password='testpass123', role='student')
+            self.students.append(Estudiante.objects.create(user=user, total_hours=10))
+            MiembroProyecto.objects.create(proyecto=self.project, usuario=user, rol='estudiante')
+        reference_data.load()
+
+    def add_members(self, count):
+        for i in range(count):
+            user = User.objects.create_user(email=f'extra{i}@test.com', password='testpass123', role='student')
+            Estudiante.objects.create(user=user)
+            MiembroProyecto.objects.create(proyecto=self.project, usuario=user, rol='estudiante')
+
+    def test_validate_creates_missing_rows_and_adds_hours(self):
+        # Uno ya tiene aplicación pendiente, otro ya tiene sus horas de completación
+        Aplicacion.objects.create(project=self.project, student=self.students[0], status='pending')
+        WorkHour.objects.create(
+            student=self.students[1], project=self.project, date=date(2024, 5, 1),
+            hours_worked=40, is_project_completion=True
+        )
+
+        validated = validate_completion_hours(self.project, self.admin)
+
+        self.assertEqual(len(validated), 5)
+        self.assertEqual(Aplicacion.objects.filter(project=self.project, status='accepted').count(), 6)
+        self.assertEqual(Asignacion.objects.filter(application__project=self.project).count(), 6)
+        self.assertEqual(WorkHour.objects.filter(project=self.project, is_verified=True).count(), 5)
+        self.assertEqual(Estudiante.objects.get(id=self.students[0].id).total_hours, 50)
+        self.assertEqual(Estudiante.objects.get(id=self.students[1].id).total_hours, 10)
+
+        # Idempotente: una segunda validación no suma horas
+        self.assertEqual(validate_completion_hours(self.project, self.admin), [])
+        self.assertEqual(Estudiante.objects.get(id=self.students[0].id).total_hours, 50)
+
+    def test_validate_constant_number_of_queries(self):
+        with self.assertNumQueries(7) as small:
+            validate_completion_hours(self.project, self.admin)
+
+        WorkHour.objects.all().delete()
+        Asignacion.objects.all().delete()
+        Aplicacion.objects.all().delete()
+        self.add_members(10)
+        with self.assertNumQueries(len(small.captured_queries)):
+            validated = validate_completion_hours(self.project, self.admin)
+        self.assertEqual(len(validated), 16)
+
+    def test_complete_project_finalizes_assignments(self):
+        validate_completion_hours(self.project, self.admin)
+        WorkHour.objects.all().delete()
+
+        finished = complete_project(self.project, self.admin)
+
+        self.assertEqual(finished, 6)
+        self.assertFalse(Asignacion.objects.filter(estado='en curso').exists())
+        self.assertEqual(Aplicacion.objects.filter(project=self.project, status='completed').count(), 6)
+        self.assertEqual(WorkHour.objects.filter(project=self.project, is_verified=False).count(), 6)
+        self.assertEqual(Estudiante.objects.get(id=self.students[0].id).completed_projects, 1)
+        self.assertEqual(self.project.historial_estados.count(), 1)
+
+
+class PendingValidationWorklistTest(TestCase):
+    def setUp(self):
+        company_user = User.objects.create_user(email='company@test.com', password='testpass123', role='company')
+        company = Empresa.objects.create(user=company_user, company_name='Test Company')
+        completed = ProjectStatus.objects.create(name='completed')
+        self.projects = []
+        for i in range(4):
+            project = Proyecto.objects.create(
+                title=f'Project {i}',
+                company=company,
+                description='Test description',
+                requirements='Test requirements',
+                status=completed,
+                required_hours=20,
+            )
+            self.projects.append(project)
+            for j in range(3):
+                user = User.objects.create_user(email=f'student{i}-{j}@test.com', password='testpass123', role='student')
+                student = Estudiante.objects.create(user=user)
+                Aplicacion.objects.create(project=project, student=student, status='accepted')
+        WorkHour.objects.create(
+            student=student, project=self.projects[3], date=date(2024, 5, 1),
+            hours_worked=20, is_project_completion=True
+        )
+        reference_data.load()
+
+    def test_only_unvalidated_projects_in_constant_queries(self):
+        with self.assertNumQueries(2):
+            projects = list(pending_validation_projects())
+            participants = [len(p.participating_applications) for p in projects]
+            companies = {p.company.company_name for p in projects}
+
+        self.assertEqual(len(projects), 3)
+        self.assertNotIn(self.projects[3], projects)
+        self.assertEqual(participants, [3, 3, 3])
+        self.assertEqual(companies, {'Test Company'})
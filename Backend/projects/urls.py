@@ -10,6 +10,7 @@ app_name = 'projects'
 urlpatterns = [
     path('', views.projects_list, name='projects_list'),
     path('create/', views.projects_create, name='projects_create'),
+    path('rankings/', views.projects_rankings, name='projects_rankings'),
     path('<uuid:project_id>/', views.projects_detail, name='projects_detail'),  # GET para detalles
     path('<uuid:project_id>/update/', views.projects_update, name='projects_update'),  # PUT/PATCH para actualizar
     path('<uuid:project_id>/delete/', views.projects_delete, name='projects_delete'),
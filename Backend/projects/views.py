@@ -4,13 +4,18 @@ Views para la app projects.
 
 import json
 from decimal import Decimal
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from django.db.models import Q
+from django.db.models import Count, Max, Q
 from users.models import User
 from .models import Proyecto, MiembroProyecto
+from .completion import pending_validation_projects, validate_completion_hours
+from .projections import AVAILABLE_PROJECTS_PROJECTION
 from core.views import verify_token
+from core.reference_data import reference_data
+from core.view_counters import view_counters
+from core.conditional import conditional_get, row_version
 from django.db.models import F
 from work_hours.models import WorkHour
 from django.utils import timezone
@@ -42,63 +47,49 @@ def projects_list(request):
         trl_max = estudiante.trl_permitido_segun_api
         api_level = estudiante.api_level
         
-        # Filtrar proyectos activos/publicados, con TRL y API permitidos
-        from project_status.models import ProjectStatus
-        estados_visibles = ProjectStatus.objects.filter(name__in=['Publicado', 'Activo', 'published', 'active'])
+        # Campos pedidos (?fields= / ?view=summary|full)
+        try:
+            fields = AVAILABLE_PROJECTS_PROJECTION.select(request)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        # Solo incluir trl_name si el usuario NO es una empresa
+        if current_user.role == 'company':
+            fields = [name for name in fields if name != 'trl_name']
+        
+        # Filtrar proyectos activos/publicados, con TRL y API permitidos (ids del registro, sin JOIN)
         proyectos = Proyecto.objects.filter(
-            status__in=estados_visibles,
-            trl__level__lte=trl_max,
+            status_id__in=reference_data.status_ids('published', 'active'),
+            trl_id__in=reference_data.trl_ids_up_to(trl_max),
             api_level__lte=api_level
         )
         
-        # Serializar proyectos
-        projects_data = []
-        for project in proyectos:
-            project_data = {
-                'id': str(project.id),
-                'title': project.title,
-                'description': project.description,
-                'requirements': project.requirements,
-                # Campos adicionales del formulario
-                'tipo': project.tipo,
-                'objetivo': project.objetivo,
-                'encargado': project.encargado,
-                'contacto': project.contacto,
-                'company_name': project.company.company_name if project.company else 'Sin empresa',
-                'status': project.status.name if project.status else 'Sin estado',
-                'status_id': project.status.id if project.status else None,
-                'area': project.area.name if project.area else 'Sin área',
-                'trl_level': project.trl.level if project.trl else 1,
-                'trl_id': project.trl.id if project.trl else None,
-                'api_level': project.api_level or 1,
-                'max_students': project.max_students,
-                'current_students': project.current_students,
-                'applications_count': project.applications_count,
-                'start_date': project.start_date.isoformat() if project.start_date else None,
-                'estimated_end_date': project.estimated_end_date.isoformat() if project.estimated_end_date else None,
-                'location': project.location or 'Remoto',
-                'modality': project.modality,
-                'duration_weeks': project.duration_weeks,
-                'hours_per_week': project.hours_per_week,
-                'required_hours': project.required_hours,
-                'is_featured': getattr(project, 'is_featured', False),
-                'is_urgent': getattr(project, 'is_urgent', False),
-                'created_at': project.created_at.isoformat() if project.created_at else None,
-                'updated_at': project.updated_at.isoformat() if project.updated_at else None,
-            }
-            
-            # Solo incluir trl_name si el usuario NO es una empresa
-            if current_user.role != 'company':
-                project_data['trl_name'] = project.trl.name if project.trl else 'Sin TRL'
-                
-            projects_data.append(project_data)
+        # Serializar solo las columnas de los campos pedidos
+        projects_data = [
+            AVAILABLE_PROJECTS_PROJECTION.serialize(project, fields)
+            for project in AVAILABLE_PROJECTS_PROJECTION.apply(proyectos, fields)
+        ]
         return JsonResponse({'results': projects_data, 'count': len(projects_data)})
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
 
+def _project_detail_version(request, project_id):
+    """Proyecto, su empresa y sus estudiantes participantes (una consulta)"""
+    participating = Q(application_project__status__in=['accepted', 'active', 'completed'])
+    return row_version(
+        Proyecto.objects, project_id, 'company__updated_at', 'company__user__updated_at',
+        students_updated_at=Max('application_project__updated_at', filter=participating),
+        students=Count('application_project', filter=participating),
+    )
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
+@conditional_get(
+    _project_detail_version,
+    # La visita cuenta aunque el cliente ya tenga el detalle
+    on_not_modified=lambda request, project_id: view_counters.record(Proyecto, project_id),
+)
 def projects_detail(request, project_id):
     """Detalle de un proyecto."""
     try:
@@ -118,6 +109,9 @@ def projects_detail(request, project_id):
         except Proyecto.DoesNotExist:
             return JsonResponse({'error': 'Proyecto no encontrado'}, status=404)
         
+        # Contar la vista (buffer en memoria, sin save ni cambio en project.views_count)
+        project.incrementar_vistas()
+        
         # Serializar datos
         project_data = {
             'id': str(project.id),
@@ -210,6 +204,30 @@ def projects_detail(request, project_id):
         return JsonResponse({'error': str(e)}, status=500)
 
 
+@csrf_exempt
+@require_http_methods(["GET"])
+def projects_rankings(request):
+    """Proyectos en tendencia y más vistos (desde el buffer de vistas)."""
+    try:
+        # Verificar autenticación
+        auth_header = request.headers.get('Authorization')
+        if not auth_header or not auth_header.startswith('Bearer '):
+            return JsonResponse({'error': 'Token requerido'}, status=401)
+        
+        token = auth_header.split(' ')[1]
+        current_user = verify_token(token)
+        if not current_user:
+            return JsonResponse({'error': 'Token inválido'}, status=401)
+        
+        limit = min(int(request.GET.get('limit', 10)), 50)
+        # Solo proyectos visibles en el catálogo
+        queryset = Proyecto.objects.filter(status_id__in=reference_data.status_ids('published', 'active'))
+        return JsonResponse(view_counters.rankings(Proyecto, limit=limit, queryset=queryset))
+    except ValueError:
+        return JsonResponse({'error': 'Parámetro limit inválido'}, status=400)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def projects_create(request):
@@ -430,8 +448,10 @@ def projects_update(request, project_id):
                 # Buscar el estado por nombre
                 status_name = data['status']
                 if status_name in ['published', 'active', 'completed', 'deleted', 'cancelled']:
-                    status_obj = ProjectStatus.objects.get(name=status_name)
-                    project.status = status_obj
+                    status_id = reference_data.status_id(status_name)
+                    if status_id is None:
+                        raise ProjectStatus.DoesNotExist
+                    project.status_id = status_id
                     # Si se está marcando como completado, ejecutar lógica especial
                     if status_name == 'completed':
                         project.marcar_como_completado(current_user)
@@ -523,20 +543,17 @@ def projects_delete(request, project_id):
         
         # Soft delete: marcar como deleted en lugar de borrar
         from project_status.models import ProjectStatus
-        try:
-            deleted_status = ProjectStatus.objects.get(name='deleted')
-            project.status = deleted_status
-            project.save()
-        except ProjectStatus.DoesNotExist:
+        deleted_status_id = reference_data.status_id('deleted')
+        if deleted_status_id is None:
             # Si no existe el estado 'deleted', crearlo
-            deleted_status = ProjectStatus.objects.create(
+            deleted_status_id = ProjectStatus.objects.create(
                 name='deleted',
                 description='Proyecto eliminado',
                 color='#dc3545',
                 is_active=False
-            )
-            project.status = deleted_status
-            project.save()
+            ).id
+        project.status_id = deleted_status_id
+        project.save()
         
         return JsonResponse({
             'message': 'Proyecto marcado como eliminado correctamente'
@@ -1059,8 +1076,10 @@ def activate_project(request, project_id):
         
         # Cambiar el estado del proyecto a 'active' (en inglés)
         from project_status.models import ProjectStatus
-        status_activo = ProjectStatus.objects.get(name='active')
-        project.status = status_activo
+        status_activo_id = reference_data.status_id('active')
+        if status_activo_id is None:
+            raise ProjectStatus.DoesNotExist("No existe el estado 'active'")
+        project.status_id = status_activo_id
         project.save(update_fields=['status'])
         
         # Actualizar el contador de estudiantes activos basado en aplicaciones aceptadas
@@ -1124,23 +1143,21 @@ def completed_pending_hours(request):
         current_user = verify_token(token)
         if not current_user or current_user.role != 'admin':
             return JsonResponse({'error': 'Acceso denegado'}, status=403)
-        # Buscar proyectos completados
-        proyectos = Proyecto.objects.filter(status__name__in=['completed', 'completado'])
+        # Parámetros de paginación
+        page = int(request.GET.get('page', 1))
+        limit = int(request.GET.get('limit', 20))
+        offset = (page - 1) * limit
+        
+        # Proyectos completados sin horas validadas (anti-join + participantes precargados)
+        queryset = pending_validation_projects()
+        total_count = queryset.count()
+        proyectos = queryset[offset:offset + limit]
+        
         data = []
         for p in proyectos:
-            # Verificar si ya hay horas validadas para este proyecto
-            horas_validadas = WorkHour.objects.filter(project=p, is_project_completion=True).exists()
-            if horas_validadas:
-                continue  # Ya validadas, no mostrar
             # Participantes basados en aplicaciones aceptadas (más confiable)
-            from applications.models import Aplicacion
-            aplicaciones_aceptadas = Aplicacion.objects.filter(
-                project=p,
-                status__in=['accepted', 'active', 'completed']
-            ).select_related('student__user')
-            
             participantes = []
-            for aplicacion in aplicaciones_aceptadas:
+            for aplicacion in p.participating_applications:
                 user = aplicacion.student.user
                 participantes.append({
                     'id': str(user.id),
@@ -1161,7 +1178,13 @@ def completed_pending_hours(request):
                 'student_email': primer_estudiante['email'] if primer_estudiante else '',
                 'date': p.real_end_date or p.estimated_end_date or p.created_at,
             })
-        return JsonResponse({'results': data, 'count': len(data)})
+        return JsonResponse({
+            'results': data,
+            'count': total_count,
+            'page': page,
+            'limit': limit,
+            'total_pages': (total_count + limit - 1) // limit
+        })
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
@@ -1185,67 +1208,15 @@ def validate_project_hours(request, project_id):
             return JsonResponse({'error': 'Proyecto no encontrado'}, status=404)
         if not proyecto.required_hours or proyecto.required_hours <= 0:
             return JsonResponse({'error': 'El proyecto no tiene horas ofrecidas definidas o son inválidas.'}, status=400)
-        # Participantes del proyecto (sin importar si esta_activo)
-        miembros = proyecto.miembros.filter(rol='estudiante').select_related('usuario')
-        count = 0
-        
-        # Usar transacción para mantener consistencia de datos
-        with transaction.atomic():
-            for miembro in miembros:
-                user = miembro.usuario
-                print(f"[VALIDAR HORAS] Proyecto: {proyecto.id} - {proyecto.title}")
-                print(f"[VALIDAR HORAS] Usuario: {user.id} - {user.email}")
-                # Obtener perfil de estudiante
-                estudiante = getattr(user, 'estudiante_profile', None)
-                if not estudiante:
-                    print(f"[VALIDAR HORAS] Usuario {user.email} sin perfil de estudiante, se omite.")
-                    continue  # Saltar si no hay perfil de estudiante
-                # Buscar asignación correctamente
-                from applications.models import Asignacion, Aplicacion
-                asignacion = Asignacion.objects.filter(application__student=estudiante, application__project=proyecto).first()
-                if not asignacion:
-                    # Crear aplicación y asignación si no existen
-                    print(f"[VALIDAR HORAS] No se encontró asignación para estudiante {estudiante.id} en proyecto {proyecto.id}, creando...")
-                    # Buscar o crear aplicación aceptada
-                    aplicacion, _ = Aplicacion.objects.get_or_create(
-                        student=estudiante,
-                        project=proyecto,
-                        defaults={'status': 'accepted', 'cover_letter': 'Generada automáticamente para validación de horas'}
-                    )
-                    if aplicacion.status != 'accepted':
-                        aplicacion.status = 'accepted'
-                        aplicacion.save(update_fields=['status'])
-                    # Crear asignación
-                    asignacion = Asignacion.objects.create(
-                        application=aplicacion,
-                        fecha_inicio=proyecto.start_date or timezone.now().date(),
-                        estado='en curso'
-                    )
-                # Evitar duplicados
-                if WorkHour.objects.filter(project=proyecto, student=estudiante, is_project_completion=True).exists():
-                    print(f"[VALIDAR HORAS] Ya existe WorkHour para estudiante {estudiante.id} en proyecto {proyecto.id}")
-                    continue
-                workhour = WorkHour.objects.create(
-                    student=estudiante,
-                    project=proyecto,
-                    date=proyecto.real_end_date or proyecto.estimated_end_date or timezone.now().date(),
-                    hours_worked=Decimal(str(proyecto.required_hours)),
-                    description=f"Horas validadas por finalización del proyecto: {proyecto.title}",
-                    is_verified=True,
-                    verified_by=current_user,
-                    verified_at=timezone.now(),
-                    is_project_completion=True
-                )
-                # Actualizar horas totales del estudiante
-                horas_a_sumar = int(proyecto.required_hours)
-                estudiante.actualizar_horas_totales(horas_a_sumar)
-                print(f"[VALIDAR HORAS] Se sumaron {horas_a_sumar} horas al estudiante {estudiante.id}. Total ahora: {estudiante.total_hours}")
-                count += 1
-        print(f"[VALIDAR HORAS] Total horas validadas: {count}")
-        
-        # Enviar notificación a todos los estudiantes del proyecto
+        # Participantes del proyecto (sin importar si esta_activo), procesados en bloque
+        validados = validate_completion_hours(proyecto, current_user)
+        count = len(validados)
+        print(f"[VALIDAR HORAS] Proyecto {proyecto.id}: horas validadas para {count} estudiantes")
+        
+        # Enviar una notificación (un solo INSERT) a los estudiantes validados
         try:
-            NotificationService.notify_project_hours_validation(proyecto, count)
+            if validados:
+                NotificationService.notify_project_hours_validation(proyecto, validados, int(proyecto.required_hours))
         except Exception as e:
             print(f"Error al enviar notificación de validación de horas: {str(e)}")
         
@@ -0,0 +1,139 @@
+"""
+Analítica de respuestas por cuestionario.
+
+`questionnaire_responses` solo paginaba las filas crudas. Aquí las métricas
+de todas las preguntas se calculan con consultas agrupadas (sin iterar
+respuestas en Python):
+
+- una agregación por pregunta: total de respuestas, media/mín/máx de las
+  numéricas y conteo de Sí/No de las booleanas;
+- la distribución de valores de las preguntas numéricas (GROUP BY valor);
+- la frecuencia de cada opción (GROUP BY opción sobre la tabla M2M).
+
+El resultado se cachea por cuestionario y se descarta al registrar un envío.
+"""
+
+from django.core.cache import cache
+from django.db.models import Avg, Count, Max, Min, Q
+
+from .models import Question, QuestionOption, QuestionnaireResponse, QuestionResponse
+
+QUESTIONNAIRE_ANALYTICS_CACHE_TIMEOUT = 600  # 10 minutos
+
+
+def _analytics_cache_key(questionnaire_id):
+    return f'questionnaire_analytics:{questionnaire_id}'
+
+
+def invalidate_analytics(questionnaire_id):
+    cache.delete(_analytics_cache_key(questionnaire_id))
+
+
+def _float(value):
+    return round(float(value), 2) if value is not None else None
+
+
+def _rate(part, total):
+    return round(part / total * 100, 2) if total > 0 else 0
+
+
+def build_questionnaire_analytics(questionnaire_id):
+    """Calcula las métricas de todas las preguntas del cuestionario"""
+    question_responses = QuestionResponse.objects.filter(question__questionnaire_id=questionnaire_id)
+
+    totals = {
+        row['question_id']: row
+        for row in question_responses.order_by().values('question_id').annotate(
+            answers=Count('id'),
+            text_answers=Count('id', filter=Q(text_response__isnull=False) & ~Q(text_response='')),
+            numeric_answers=Count('number_response'),
+            mean=Avg('number_response'),
+            minimum=Min('number_response'),
+            maximum=Max('number_response'),
+            yes=Count('id', filter=Q(boolean_response=True)),
+            no=Count('id', filter=Q(boolean_response=False)),
+        )
+    }
+
+    distributions = {}
+    numeric_rows = (
+        question_responses.filter(number_response__isnull=False, question__question_type='number')
+        .order_by()
+        .values('question_id', 'number_response')
+        .annotate(count=Count('id'))
+        .order_by('question_id', 'number_response')
+    )
+    for row in numeric_rows:
+        distributions.setdefault(row['question_id'], []).append({
+            'value': float(row['number_response']),
+            'count': row['count'],
+        })
+
+    options = {}
+    option_rows = (
+        QuestionOption.objects.filter(question__questionnaire_id=questionnaire_id)
+        .values('id', 'question_id', 'text')
+        .annotate(count=Count('questionresponse'))
+        .order_by('question_id', 'order', 'id')
+    )
+    for row in option_rows:
+        options.setdefault(row['question_id'], []).append(row)
+
+    questions = []
+    for question in Question.objects.filter(questionnaire_id=questionnaire_id).values(
+        'id', 'text', 'question_type', 'required'
+    ):
+        row = totals.get(question['id'], {})
+        answers = row.get('answers', 0)
+        data = {
+            'question_id': question['id'],
+            'text': question['text'],
+            'question_type': question['question_type'],
+            'required': question['required'],
+            'answers': answers,
+        }
+        question_type = question['question_type']
+        if question_type == 'number':
+            data.update({
+                'numeric_answers': row.get('numeric_answers', 0),
+                'mean': _float(row.get('mean')),
+                'min': _float(row.get('minimum')),
+                'max': _float(row.get('maximum')),
+                'distribution': distributions.get(question['id'], []),
+            })
+        elif question_type == 'boolean':
+            yes, no = row.get('yes', 0), row.get('no', 0)
+            data.update({
+                'yes': yes,
+                'no': no,
+                'yes_rate': _rate(yes, yes + no),
+            })
+        elif question_type in ('select', 'multiselect'):
+            data['options'] = [
+                {
+                    'option_id': option['id'],
+                    'text': option['text'],
+                    'count': option['count'],
+                    'rate': _rate(option['count'], answers),
+                }
+                for option in options.get(question['id'], [])
+            ]
+        else:
+            data['text_answers'] = row.get('text_answers', 0)
+        questions.append(data)
+
+    return {
+        'questionnaire_id': questionnaire_id,
+        'total_responses': QuestionnaireResponse.objects.filter(questionnaire_id=questionnaire_id).count(),
+        'questions': questions,
+    }
+
+
+def get_questionnaire_analytics(questionnaire_id):
+    """Obtiene la analítica del cuestionario (cacheada)"""
+    cache_key = _analytics_cache_key(questionnaire_id)
+    analytics = cache.get(cache_key)
+    if analytics is None:
+        analytics = build_questionnaire_analytics(questionnaire_id)
+        cache.set(cache_key, analytics, QUESTIONNAIRE_ANALYTICS_CACHE_TIMEOUT)
+    return analytics
@@ -0,0 +1,122 @@
+"""
+Envío de cuestionarios en bloque.
+
+Antes cada respuesta hacía un `get_object_or_404` por pregunta y por opción
+seleccionada, un INSERT por respuesta y un `add()` por opción. Aquí todas
+las preguntas y opciones se validan con dos consultas `IN` y las respuestas
+y filas M2M se escriben con `bulk_create`, dentro de una única transacción.
+"""
+
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+
+from .analytics import invalidate_analytics
+from .models import Question, QuestionOption, QuestionnaireResponse, QuestionResponse
+
+SelectedOption = QuestionResponse.selected_options.through
+
+# Tipos de pregunta que aceptan opciones y cuántas
+SINGLE_OPTION_TYPES = ('select',)
+OPTION_TYPES = ('select', 'multiselect')
+
+
+def _parse_number(value, question_id):
+    if value is None or value == '':
+        return None
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        raise ValueError(f"Respuesta numérica inválida para la pregunta {question_id}")
+
+
+def _parse_ids(values, label):
+    try:
+        return [int(value) for value in values]
+    except (TypeError, ValueError):
+        raise ValueError(f"Identificadores de {label} inválidos")
+
+
+def validate_answers(questionnaire, answers):
+    """
+    Valida las respuestas contra las preguntas y opciones del cuestionario
+    (dos consultas `IN`) y retorna [(pregunta, datos, [ids de opciones])].
+    Lanza ValueError si alguna referencia no es válida.
+    """
+    question_ids = _parse_ids([answer.get('question_id') for answer in answers], 'preguntas')
+    if len(set(question_ids)) != len(question_ids):
+        raise ValueError("Cada pregunta solo puede responderse una vez")
+
+    questions = Question.objects.filter(questionnaire=questionnaire, id__in=question_ids).in_bulk()
+    unknown = set(question_ids) - set(questions)
+    if unknown:
+        raise ValueError(
+            f"Preguntas que no pertenecen al cuestionario: {', '.join(map(str, sorted(unknown)))}"
+        )
+
+    selected = [
+        _parse_ids(answer.get('selected_options') or [], 'opciones') for answer in answers
+    ]
+    option_ids = {option_id for ids in selected for option_id in ids}
+    option_questions = dict(
+        QuestionOption.objects.filter(id__in=option_ids, question_id__in=question_ids)
+        .values_list('id', 'question_id')
+    ) if option_ids else {}
+
+    validated = []
+    for question_id, answer, ids in zip(question_ids, answers, selected):
+        question = questions[question_id]
+        if ids and question.question_type not in OPTION_TYPES:
+            raise ValueError(f"La pregunta {question_id} no admite opciones")
+        if len(ids) > 1 and question.question_type in SINGLE_OPTION_TYPES:
+            raise ValueError(f"La pregunta {question_id} admite una sola opción")
+        invalid = [option_id for option_id in ids if option_questions.get(option_id) != question_id]
+        if invalid:
+            raise ValueError(
+                f"Opciones inválidas para la pregunta {question_id}: {', '.join(map(str, invalid))}"
+            )
+        validated.append((question, answer, list(dict.fromkeys(ids))))
+    return validated
+
+
+@transaction.atomic
+def submit_questionnaire(questionnaire, student, project, answers):
+    """
+    Registra una respuesta completa del cuestionario con escrituras en bloque.
+    Lanza ValueError si las respuestas no son válidas.
+    """
+    validated = validate_answers(questionnaire, answers)
+
+    response = QuestionnaireResponse.objects.create(
+        questionnaire=questionnaire,
+        student=student,
+        project=project
+    )
+    question_responses = QuestionResponse.objects.bulk_create([
+        QuestionResponse(
+            questionnaire_response=response,
+            question=question,
+            text_response=answer.get('text_response'),
+            number_response=_parse_number(answer.get('number_response'), question.id),
+            boolean_response=answer.get('boolean_response'),
+        )
+        for question, answer, _ in validated
+    ])
+
+    if any(ids for _, _, ids in validated):
+        if any(question_response.pk is None for question_response in question_responses):
+            # Backends que no retornan los ids del INSERT en bloque
+            ids_by_question = dict(
+                response.question_responses.values_list('question_id', 'id')
+            )
+            for question_response in question_responses:
+                question_response.pk = ids_by_question[question_response.question_id]
+
+        SelectedOption.objects.bulk_create([
+            SelectedOption(questionresponse_id=question_response.pk, questionoption_id=option_id)
+            for question_response, (_, _, ids) in zip(question_responses, validated)
+            for option_id in ids
+        ])
+
+    transaction.on_commit(lambda: invalidate_analytics(questionnaire.id))
+    return response
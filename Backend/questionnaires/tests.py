@@ -0,0 +1,101 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from companies.models import Empresa
+from projects.models import Proyecto
+from students.models import Estudiante
+from .analytics import get_questionnaire_analytics
+from .models import Question, QuestionOption, Questionnaire, QuestionResponse
+from .submission import submit_questionnaire
+
+User = get_user_model()
+
+
+class QuestionnaireSubmissionTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='student@test.com', password='testpass123', role='student')
+        self.student = Estudiante.objects.create(user=self.user)
+        company_user = User.objects.create_user(email='company@test.com', password='testpass123', role='company')
+        company = Empresa.objects.create(user=company_user, company_name='Test Company')
+        self.project = Proyecto.objects.create(title='Project', company=company, description='Test description')
+
+        self.questionnaire = Questionnaire.objects.create(title='Encuesta', description='Descripción')
+        self.score = Question.objects.create(questionnaire=self.questionnaire, text='Nota', question_type='number')
+        self.liked = Question.objects.create(questionnaire=self.questionnaire, text='¿Le gustó?', question_type='boolean')
+        self.tools = Question.objects.create(questionnaire=self.questionnaire, text='Herramientas', question_type='multiselect')
+        self.python = QuestionOption.objects.create(question=self.tools, text='Python', order=1)
+        self.django = QuestionOption.objects.create(question=self.tools, text='Django', order=2)
+
+    def answers(self, score, liked, options):
+        return [
+            {'question_id': self.score.id, 'number_response': score},
+            {'question_id': self.liked.id, 'boolean_response': liked},
+            {'question_id': self.tools.id, 'selected_options': options},
+        ]
+
+    def submit(self, *args):
+        return submit_questionnaire(self.questionnaire, self.student, self.project, self.answers(*args))
+
+    def test_submission_uses_bulk_writes(self):
+        # 2 consultas de validación + respuesta + respuestas en bloque + M2M en bloque (+ savepoint)
+        with self.captureOnCommitCallbacks(execute=True), self.assertNumQueries(5 + 2):
+            response = self.submit(4, True, [self.python.id, self.django.id])
+
+        self.assertEqual(response.question_responses.count(), 3)
+        tools_response = QuestionResponse.objects.get(questionnaire_response=response, question=self.tools)
+        self.assertCountEqual(tools_response.selected_options.all(), [self.python, self.django])
+
+    def test_invalid_references_write_nothing(self):
+        other = Question.objects.create(
+            questionnaire=Questionnaire.objects.create(title='Otra', description=''), text='Otra'
+        )
+        foreign_option = QuestionOption.objects.create(question=other, text='Ajena')
+
+        for answers in (
+            [{'question_id': other.id, 'text_response': 'x'}],
+            [{'question_id': self.tools.id, 'selected_options': [foreign_option.id]}],
+            [{'question_id': self.score.id, 'selected_options': [self.python.id]}],
+            [{'question_id': self.score.id}, {'question_id': self.score.id}],
+        ):
+            with self.assertRaises(ValueError):
+                submit_questionnaire(self.questionnaire, self.student, self.project, answers)
+        self.assertFalse(self.questionnaire.responses.exists())
+
+    def test_analytics_are_grouped_and_cached(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.submit(4, True, [self.python.id])
+            self.submit(6, False, [self.python.id, self.django.id])
+
+        analytics = get_questionnaire_analytics(self.questionnaire.id)
+        score, liked, tools = analytics['questions']
+        self.assertEqual(analytics['total_responses'], 2)
+        self.assertEqual(score['mean'], 5.0)
+        self.assertEqual(score['distribution'], [{'value': 4.0, 'count': 1}, {'value': 6.0, 'count': 1}])
+        self.assertEqual((liked['yes'], liked['no'], liked['yes_rate']), (1, 1, 50.0))
+        self.assertEqual([(o['text'], o['count'], o['rate']) for o in tools['options']],
+                         [('Python', 2, 100.0), ('Django', 1, 50.0)])
+
+        with self.assertNumQueries(0):
+            get_questionnaire_analytics(self.questionnaire.id)
+
+        # Un nuevo envío descarta la analítica cacheada
+        with self.captureOnCommitCallbacks(execute=True):
+            self.submit(8, True, [])
+        self.assertEqual(get_questionnaire_analytics(self.questionnaire.id)['total_responses'], 3)
+
+    def test_take_and_analytics_endpoints(self):
+        self.client.force_login(self.user)
+        response = self.client.post(
+            f'/questionnaires/{self.questionnaire.id}/take/',
+            json.dumps({'project_id': str(self.project.id), 'responses': self.answers(5, True, [self.django.id])}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(f'/questionnaires/{self.questionnaire.id}/analytics/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['questions'][2]['options'][1]['count'], 1)
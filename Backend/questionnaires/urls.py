@@ -11,5 +11,6 @@ urlpatterns = [
     path('<int:pk>/delete/', views.questionnaire_delete, name='questionnaire_delete'),
     path('<int:pk>/take/', views.questionnaire_take, name='questionnaire_take'),
     path('<int:pk>/responses/', views.questionnaire_responses, name='questionnaire_responses'),
+    path('<int:pk>/analytics/', views.questionnaire_analytics, name='questionnaire_analytics'),
     path('response/<int:response_id>/', views.response_detail, name='response_detail'),
 ] 
\ No newline at end of file
@@ -1,10 +1,12 @@
 from django.shortcuts import render, get_object_or_404, redirect
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator
 import json
 from .models import Questionnaire, Question, QuestionOption, QuestionnaireResponse, QuestionResponse
+from .analytics import get_questionnaire_analytics
+from .submission import submit_questionnaire
 from students.models import Estudiante
 from projects.models import Proyecto
 
@@ -140,29 +142,8 @@ def questionnaire_take(request, pk):
             student = get_object_or_404(Estudiante, user=request.user)
             project = get_object_or_404(Proyecto, id=data['project_id'])
             
-            # Crear respuesta de cuestionario
-            response = QuestionnaireResponse.objects.create(
-                questionnaire=questionnaire,
-                student=student,
-                project=project
-            )
-            
-            # Crear respuestas individuales
-            for question_response_data in data.get('responses', []):
-                question = get_object_or_404(Question, id=question_response_data['question_id'])
-                
-                question_response = QuestionResponse.objects.create(
-                    questionnaire_response=response,
-                    question=question,
-                    text_response=question_response_data.get('text_response'),
-                    number_response=question_response_data.get('number_response'),
-                    boolean_response=question_response_data.get('boolean_response')
-                )
-                
-                # Agregar opciones seleccionadas si es necesario
-                for option_id in question_response_data.get('selected_options', []):
-                    option = get_object_or_404(QuestionOption, id=option_id)
-                    question_response.selected_options.add(option)
+            # Validación con consultas IN y escritura en bloque
+            response = submit_questionnaire(questionnaire, student, project, data.get('responses', []))
             
             return JsonResponse({
                 'success': True,
@@ -203,6 +184,22 @@ def questionnaire_responses(request, pk):
     return render(request, 'questionnaires/questionnaire_responses.html', context)
 
 
+@login_required
+def questionnaire_analytics(request, pk):
+    """Distribuciones, medias y frecuencias de opciones de un cuestionario"""
+    if request.method != 'GET':
+        return JsonResponse({'message': 'Método no permitido'}, status=405)
+    
+    questionnaire = get_object_or_404(Questionnaire, pk=pk)
+    analytics = get_questionnaire_analytics(questionnaire.id)
+    
+    return JsonResponse({
+        'success': True,
+        'questionnaire': {'id': questionnaire.id, 'title': questionnaire.title},
+        **analytics
+    })
+
+
 @login_required
 def response_detail(request, response_id):
     """Detalle de una respuesta"""
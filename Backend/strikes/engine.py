@@ -0,0 +1,159 @@
+"""
+Emisión y vencimiento de strikes.
+
+`Estudiante.strikes` es el contador de strikes activos del estudiante. Antes
+se validaba el tope contando filas y luego se insertaba, de modo que dos
+aprobaciones simultáneas podían superar los 3 strikes y el contador se
+desfasaba. Ahora cada strike activo ocupa un cupo que se toma con un UPDATE
+condicional sobre el contador (`WHERE strikes < MAX_ACTIVE_STRIKES`): la
+base de datos serializa las escrituras sobre la fila del estudiante, así que
+nunca se supera el tope.
+
+- `take_strike_slot` / `release_strike_slots` ajustan el contador; los usa
+  `Strike.save()` al crear un strike activo o al cambiar `is_active`.
+- `issue_strike` emite un strike en una transacción.
+- `expire_strikes` desactiva en lotes los strikes con `expires_at` vencido y
+  descuenta los contadores con UPDATE por lote (índice parcial
+  `strikes_active_expiry_idx`). Se ejecuta periódicamente con
+  `python manage.py expire_strikes`.
+- `reconcile_strike_counters` repara la deriva de los contadores.
+"""
+
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, Greatest, Now
+from django.utils import timezone
+
+from students.models import Estudiante
+
+MAX_ACTIVE_STRIKES = 3
+
+
+class StrikeLimitExceeded(ValueError):
+    """El estudiante ya tiene el máximo de strikes activos"""
+
+    def __init__(self, message=None):
+        super().__init__(
+            message or f"El estudiante ya tiene el máximo de {MAX_ACTIVE_STRIKES} strikes activos permitidos."
+        )
+
+
+def take_strike_slot(student_id):
+    """
+    Suma un strike al contador solo si está bajo el tope (UPDATE condicional).
+    Al llegar al tope el estudiante queda suspendido. Lanza StrikeLimitExceeded
+    si no hay cupo. Debe llamarse dentro de la transacción que crea el strike.
+    """
+    students = Estudiante.objects.filter(pk=student_id)
+    # updated_at a mano: .update() no pasa por auto_now y student_detail lo usa como versión
+    if not students.filter(strikes__lt=MAX_ACTIVE_STRIKES).update(strikes=F('strikes') + 1, updated_at=Now()):
+        raise StrikeLimitExceeded()
+    students.filter(strikes__gte=MAX_ACTIVE_STRIKES).exclude(status='suspended').update(
+        status='suspended', updated_at=Now()
+    )
+
+
+def release_strike_slots(counts):
+    """
+    Descuenta strikes de varios estudiantes ({student_id: n}) con un UPDATE y
+    levanta la suspensión de quienes quedan bajo el tope.
+    """
+    counts = {student_id: n for student_id, n in counts.items() if n}
+    if not counts:
+        return
+    students = Estudiante.objects.filter(pk__in=list(counts))
+    students.update(
+        strikes=Greatest(
+            F('strikes') - Case(
+                *[When(pk=student_id, then=Value(n)) for student_id, n in counts.items()],
+                default=Value(0),
+                output_field=IntegerField(),
+            ),
+            Value(0),
+        ),
+        updated_at=Now(),
+    )
+    students.filter(status='suspended', strikes__lt=MAX_ACTIVE_STRIKES).update(status='approved', updated_at=Now())
+
+
+def _refresh_counter(student):
+    student.refresh_from_db(fields=['strikes', 'status'])
+
+
+def issue_strike(student, company, reason, **fields):
+    """
+    Crea un strike activo tomando un cupo del contador del estudiante.
+    Lanza StrikeLimitExceeded si el estudiante ya está en el tope; el
+    contador de la instancia `student` queda actualizado.
+    """
+    from .models import Strike
+
+    with transaction.atomic():
+        strike = Strike.objects.create(student=student, company=company, reason=reason, **fields)
+    _refresh_counter(student)
+    return strike
+
+
+def expired_strikes(now=None):
+    """Strikes activos cuya fecha de expiración ya pasó"""
+    from .models import Strike
+
+    return Strike.objects.filter(is_active=True, expires_at__lte=now or timezone.now())
+
+
+def expire_strikes(now=None, batch_size=500):
+    """
+    Desactiva los strikes vencidos en lotes de `batch_size`. Por lote: una
+    lectura de los ids, un UPDATE de los strikes y los UPDATE de los
+    contadores, en una transacción. Retorna el número de strikes desactivados.
+    """
+    from .models import Strike
+
+    now = now or timezone.now()
+    expired = 0
+    while True:
+        with transaction.atomic():
+            batch = list(
+                expired_strikes(now).select_for_update(skip_locked=True)
+                .order_by('expires_at').values_list('id', 'student_id')[:batch_size]
+            )
+            if not batch:
+                return expired
+            ids = [strike_id for strike_id, _ in batch]
+            updated = Strike.objects.filter(id__in=ids, is_active=True).update(
+                is_active=False, resolved_at=now, updated_at=now,
+                resolution_notes=Coalesce('resolution_notes', Value('Expirado automáticamente')),
+            )
+            if updated == len(batch):
+                counts = {}
+                for _, student_id in batch:
+                    counts[student_id] = counts.get(student_id, 0) + 1
+            else:
+                # Otro proceso resolvió parte del lote: descontar solo lo que desactivó este UPDATE
+                counts = dict(
+                    Strike.objects.filter(id__in=ids, is_active=False, resolved_at=now)
+                    .order_by().values('student_id').annotate(n=Count('id')).values_list('student_id', 'n')
+                )
+            release_strike_slots(counts)
+        expired += updated
+        if len(batch) < batch_size:
+            return expired
+
+
+def _real_active_strikes():
+    from .models import Strike
+
+    active = Strike.objects.filter(student=OuterRef('pk'), is_active=True).order_by().values('student')
+    return Coalesce(Subquery(active.annotate(n=Count('id')).values('n')), Value(0))
+
+
+def drifted_students():
+    """Estudiantes cuyo contador no coincide con sus strikes activos"""
+    return Estudiante.objects.annotate(real_strikes=_real_active_strikes()).filter(~Q(strikes=F('real_strikes')))
+
+
+def reconcile_strike_counters():
+    """Recalcula los contadores desfasados en un solo UPDATE; retorna cuántos se corrigieron"""
+    return Estudiante.objects.filter(pk__in=drifted_students().values('pk')).update(
+        strikes=_real_active_strikes(), updated_at=Now()
+    )
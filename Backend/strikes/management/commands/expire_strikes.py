@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+
+from core.db_router import replica_reads
+from strikes.engine import drifted_students, expire_strikes, expired_strikes, reconcile_strike_counters
+
+
+class Command(BaseCommand):
+    help = (
+        'Desactiva en lotes los strikes vencidos (expires_at) y descuenta los contadores de los '
+        'estudiantes (pensado para ejecutarse periódicamente, por ejemplo con cron)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Strikes desactivados por transacción (por defecto 500)',
+        )
+        parser.add_argument(
+            '--reconcile',
+            action='store_true',
+            help='Además, recalcular los contadores de strikes desfasados',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Mostrar cuántos strikes vencidos y contadores desfasados hay sin modificarlos',
+        )
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            # Solo reporte: se puede leer de la réplica
+            with replica_reads():
+                expired = expired_strikes().count()
+                drifted = drifted_students().count()
+            self.stdout.write(f'🔍 {expired} strikes vencidos, {drifted} estudiantes con contador desfasado')
+            return
+
+        expired = expire_strikes(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'✅ {expired} strikes vencidos desactivados'))
+
+        if options['reconcile']:
+            fixed = reconcile_strike_counters()
+            self.stdout.write(self.style.SUCCESS(f'✅ Contadores de strikes corregidos en {fixed} estudiantes'))
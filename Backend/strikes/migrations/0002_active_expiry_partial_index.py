@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 12:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('strikes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='strike',
+            index=models.Index(condition=models.Q(('expires_at__isnull', False), ('is_active', True)), fields=['expires_at'], name='strikes_active_expiry_idx'),
+        ),
+    ]
@@ -1,10 +1,12 @@
 from projects.models import Proyecto
 from django.conf import settings
 from companies.models import Empresa
-from django.db import models
+from django.db import models, transaction
 from students.models import Estudiante
 import uuid
 from django.utils import timezone
+from core.tracking import ChangeTrackingMixin
+from .engine import issue_strike, release_strike_slots, take_strike_slot
 
 class StrikeReport(models.Model):
     """
@@ -47,32 +49,34 @@ class StrikeReport(models.Model):
         return f'Reporte de {self.company.company_name} sobre {self.student.user.full_name} - {self.status}'
     
     def approve(self, admin_user, notes=None):
-        """Aprueba el reporte y crea el strike"""
-        if self.status != 'pending':
-            raise ValueError('Solo se pueden aprobar reportes pendientes')
-        
-        # Verificar que el estudiante no tenga 3 strikes
-        if self.student.strikes >= 3:
-            raise ValueError('El estudiante ya tiene el máximo de 3 strikes permitidos')
-        
-        # Crear el strike
-        Strike.objects.create(
-            student=self.student,
-            project=self.project,
-            company=self.company,
-            reason=self.reason,
-            description=self.description,
-            issued_by=admin_user,
-            severity='medium'  # Por defecto medio
-        )
-        
-        # Marcar como aprobado
-        self.status = 'approved'
-        self.reviewed_by = admin_user
-        self.reviewed_at = timezone.now()
+        """
+        Aprueba el reporte y crea el strike. El reporte pasa a 'approved' con
+        un UPDATE condicional, así que una aprobación simultánea del mismo
+        reporte falla en lugar de emitir dos strikes; si el estudiante ya
+        está en el tope se lanza StrikeLimitExceeded y nada queda guardado.
+        """
+        reviewed_at = timezone.now()
+        review = {'status': 'approved', 'reviewed_by': admin_user, 'reviewed_at': reviewed_at}
         if notes:
-            self.admin_notes = notes
-        self.save()
+            review['admin_notes'] = notes
+
+        with transaction.atomic():
+            if not StrikeReport.objects.filter(pk=self.pk, status='pending').update(updated_at=reviewed_at, **review):
+                raise ValueError('Solo se pueden aprobar reportes pendientes')
+            strike = issue_strike(
+                self.student,
+                self.company,
+                self.reason,
+                project=self.project,
+                description=self.description,
+                issued_by=self.company.user,
+                severity='medium'  # Por defecto medio
+            )
+
+        for field, value in review.items():
+            setattr(self, field, value)
+        self.updated_at = reviewed_at
+        return strike
     
     def reject(self, admin_user, notes=None):
         """Rechaza el reporte"""
@@ -86,10 +90,13 @@ class StrikeReport(models.Model):
             self.admin_notes = notes
         self.save()
 
-class Strike(models.Model):
+class Strike(ChangeTrackingMixin, models.Model):
     """
     Modelo de strike que coincide exactamente con el interface Strike del frontend
     """
+    # is_active ocupa un cupo del contador del estudiante (ver strikes.engine)
+    tracked_fields = ('is_active',)
+    
     SEVERITY_CHOICES = (
         ('low', 'Bajo'),
         ('medium', 'Medio'),
@@ -128,24 +135,38 @@ class Strike(models.Model):
         verbose_name = 'Amonestación (Strike)'
         verbose_name_plural = 'Amonestaciones (Strikes)'
         ordering = ['-issued_at']
+        indexes = [
+            # Índice parcial: strikes activos con vencimiento (barrido de expirados)
+            models.Index(
+                fields=['expires_at'],
+                condition=models.Q(is_active=True, expires_at__isnull=False),
+                name='strikes_active_expiry_idx',
+            ),
+        ]
 
     def __str__(self):
         return f'Amonestación para {self.student.user.full_name} en {self.company.company_name} ({self.severity})'
     
     def save(self, *args, **kwargs):
-        is_new = not self.pk
-        # Validar antes de guardar: no permitir más de 3 strikes activos
-        if is_new and self.is_active:
-            active_strikes = Strike.objects.filter(student=self.student, is_active=True).count()
-            if active_strikes >= 3:
-                raise ValueError("El estudiante ya tiene el máximo de 3 strikes activos permitidos.")
-        super().save(*args, **kwargs)
-        # Incrementar strikes del estudiante después de guardar
-        if is_new and self.is_active:
-            try:
-                self.student.incrementar_strikes()
-            except Exception as e:
-                print(f"Error incrementando strikes para {self.student.user.full_name}: {e}")
+        # El pk es un UUID con default: un strike nuevo se reconoce por _state.adding
+        update_fields = kwargs.get('update_fields')
+        if self._state.adding:
+            delta = 1 if self.is_active else 0
+        elif (update_fields is None or 'is_active' in update_fields) and self.has_changed('is_active'):
+            delta = 1 if self.is_active else -1
+        else:
+            delta = 0
+
+        if not delta:
+            super().save(*args, **kwargs)
+            return
+        # El cupo del contador y la fila se guardan juntos: si el tope está lleno no se guarda nada
+        with transaction.atomic():
+            if delta > 0:
+                take_strike_slot(self.student_id)
+            else:
+                release_strike_slots({self.student_id: 1})
+            super().save(*args, **kwargs)
     
     def resolver(self, notas_resolucion=None):
         """Resuelve el strike"""
@@ -156,7 +177,7 @@ class Strike(models.Model):
         self.save(update_fields=['is_active', 'resolved_at', 'resolution_notes'])
     
     def reactivar(self):
-        """Reactiva el strike"""
+        """Reactiva el strike (lanza StrikeLimitExceeded si el estudiante ya está en el tope)"""
         self.is_active = True
         self.resolved_at = None
         self.save(update_fields=['is_active', 'resolved_at'])
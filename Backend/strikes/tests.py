@@ -1,3 +1,115 @@
+import time
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
+
+from companies.models import Empresa
+from project_status.models import ProjectStatus
+from projects.models import Proyecto
+from students.models import Estudiante
+from .engine import MAX_ACTIVE_STRIKES, StrikeLimitExceeded, drifted_students, expire_strikes, issue_strike
+from .models import Strike, StrikeReport
+
+User = get_user_model()
+
+
+class StrikeEngineTest(TestCase):
+    def setUp(self):
+        company_user = User.objects.create_user(email='company@test.com', password='testpass123', role='company')
+        self.company = Empresa.objects.create(user=company_user, company_name='Test Company')
+        self.project = Proyecto.objects.create(
+            title='Project',
+            company=self.company,
+            description='Test description',
+            requirements='Test requirements',
+            status=ProjectStatus.objects.create(name='published'),
+        )
+        self.student = self.create_student('student@test.com')
+
+    def create_student(self, email):
+        user = User.objects.create_user(email=email, password='testpass123', role='student')
+        return Estudiante.objects.create(user=user)
+
+    def issue(self, student=None, **fields):
+        return issue_strike(student or self.student, self.company, 'Motivo', project=self.project, **fields)
+
+    def counter(self, student=None):
+        return Estudiante.objects.values_list('strikes', 'status').get(pk=(student or self.student).pk)
+
+    def test_cap_is_enforced_by_the_counter_update(self):
+        for _ in range(MAX_ACTIVE_STRIKES):
+            self.issue()
+        self.assertEqual(self.counter(), (3, 'suspended'))
+        self.assertEqual(self.student.strikes, 3)
+
+        with self.assertRaises(StrikeLimitExceeded):
+            self.issue()
+        self.assertEqual(Strike.objects.filter(student=self.student).count(), 3)
+        self.assertEqual(self.counter(), (3, 'suspended'))
+
+    def test_report_cannot_be_approved_twice(self):
+        admin = User.objects.create_user(email='admin@test.com', password='testpass123', role='admin')
+        report = StrikeReport.objects.create(
+            company=self.company, student=self.student, project=self.project,
+            reason='Motivo', description='Descripción',
+        )
+        stale = StrikeReport.objects.get(pk=report.pk)  # Otra petición con el reporte aún pendiente
+
+        report.approve(admin, 'Notas')
+        with self.assertRaises(ValueError):
+            stale.approve(admin)
+        self.assertEqual(Strike.objects.filter(student=self.student).count(), 1)
+        self.assertEqual(self.counter(), (1, 'approved'))
+
+    def test_resolve_and_reactivate_move_the_counter(self):
+        strikes = [self.issue() for _ in range(MAX_ACTIVE_STRIKES)]
+        strikes[0].resolver('Resuelto')
+        self.assertEqual(self.counter(), (2, 'approved'))
+
+        self.issue()
+        with self.assertRaises(StrikeLimitExceeded):
+            strikes[0].reactivar()
+        self.assertFalse(Strike.objects.get(pk=strikes[0].pk).is_active)
+
+    def test_sweeper_expires_in_batches(self):
+        other = self.create_student('other@test.com')
+        past = timezone.now() - timedelta(days=1)
+        self.issue(expires_at=past)
+        self.issue(expires_at=past)
+        self.issue(expires_at=timezone.now() + timedelta(days=1))
+        self.issue(student=other, expires_at=past)
+
+        self.assertEqual(expire_strikes(batch_size=2), 3)
+        self.assertEqual(self.counter(), (1, 'approved'))
+        self.assertEqual(self.counter(other), (0, 'approved'))
+        self.assertEqual(Strike.objects.filter(is_active=True).count(), 1)
+        self.assertEqual(expire_strikes(), 0)
+
+    def test_command_reconciles_drifted_counters(self):
+        self.issue()
+        Estudiante.objects.filter(pk=self.student.pk).update(strikes=3)
+        self.assertEqual(drifted_students().count(), 1)
+
+        call_command('expire_strikes', '--reconcile', stdout=StringIO())
+        self.assertEqual(self.counter()[0], 1)
+        self.assertEqual(drifted_students().count(), 0)
+
+    def test_counter_updates_bump_student_version(self):
+        # student_detail valida con updated_at: cada cambio de strikes/status debe moverlo
+        def assert_bumps(action):
+            before = Estudiante.objects.values_list('updated_at', flat=True).get(pk=self.student.pk)
+            time.sleep(0.005)  # Now() de SQLite tiene precisión de milisegundos
+            action()
+            self.assertGreater(Estudiante.objects.values_list('updated_at', flat=True).get(pk=self.student.pk), before)
+
+        assert_bumps(lambda: self.issue(expires_at=timezone.now() - timedelta(days=1)))
+        assert_bumps(expire_strikes)
+        self.assertEqual(self.counter(), (0, 'approved'))
 
-# Create your tests here.
+        Estudiante.objects.filter(pk=self.student.pk).update(strikes=2)
+        assert_bumps(lambda: call_command('expire_strikes', '--reconcile', stdout=StringIO()))
+        self.assertEqual(self.counter(), (0, 'approved'))
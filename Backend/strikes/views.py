@@ -3,16 +3,43 @@ Views para la app strikes.
 """
 
 import json
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.db.models import Q
 from users.models import User
+from .engine import StrikeLimitExceeded
 from .models import Strike, StrikeReport
 from core.views import verify_token
+from core.streaming import ndjson_response, wants_ndjson
 from django.utils import timezone
 
 
+def _serialize_strike(strike):
+    return {
+        'id': str(strike.id),
+        'student_id': str(strike.student.id),
+        'student_name': strike.student.user.full_name,
+        'student_email': strike.student.user.email,
+        'company_id': str(strike.company.id),
+        'company_name': strike.company.company_name,
+        'project_id': str(strike.project.id) if strike.project else None,
+        'project_title': strike.project.title if strike.project else None,
+        'reason': strike.reason,
+        'description': strike.description,
+        'severity': strike.severity,
+        'issued_by_id': str(strike.issued_by.id) if strike.issued_by else None,
+        'issued_by_name': strike.issued_by.full_name if strike.issued_by else None,
+        'issued_at': strike.issued_at.isoformat(),
+        'expires_at': strike.expires_at.isoformat() if strike.expires_at else None,
+        'is_active': strike.is_active,
+        'resolved_at': strike.resolved_at.isoformat() if strike.resolved_at else None,
+        'resolution_notes': strike.resolution_notes,
+        'created_at': strike.created_at.isoformat(),
+        'updated_at': strike.updated_at.isoformat(),
+    }
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
 def strikes_list(request):
@@ -58,6 +85,10 @@ def strikes_list(request):
         if status:
             queryset = queryset.filter(is_active=(status == 'active'))
         
+        # Volcado completo en streaming (Accept: application/x-ndjson o ?stream=1)
+        if wants_ndjson(request):
+            return ndjson_response(request, queryset, _serialize_strike)
+        
         # Contar total
         total_count = queryset.count()
         
@@ -65,30 +96,7 @@ def strikes_list(request):
         strikes = queryset[offset:offset + limit]
         
         # Serializar datos
-        strikes_data = []
-        for strike in strikes:
-            strikes_data.append({
-                'id': str(strike.id),
-                'student_id': str(strike.student.id),
-                'student_name': strike.student.user.full_name,
-                'student_email': strike.student.user.email,
-                'company_id': str(strike.company.id),
-                'company_name': strike.company.company_name,
-                'project_id': str(strike.project.id) if strike.project else None,
-                'project_title': strike.project.title if strike.project else None,
-                'reason': strike.reason,
-                'description': strike.description,
-                'severity': strike.severity,
-                'issued_by_id': str(strike.issued_by.id) if strike.issued_by else None,
-                'issued_by_name': strike.issued_by.full_name if strike.issued_by else None,
-                'issued_at': strike.issued_at.isoformat(),
-                'expires_at': strike.expires_at.isoformat() if strike.expires_at else None,
-                'is_active': strike.is_active,
-                'resolved_at': strike.resolved_at.isoformat() if strike.resolved_at else None,
-                'resolution_notes': strike.resolution_notes,
-                'created_at': strike.created_at.isoformat(),
-                'updated_at': strike.updated_at.isoformat(),
-            })
+        strikes_data = [_serialize_strike(strike) for strike in strikes]
         
         return JsonResponse({
             'results': strikes_data,
@@ -353,29 +361,13 @@ def strike_report_approve(request, report_id):
         data = json.loads(request.body) if request.body else {}
         admin_notes = data.get('admin_notes', '')
         
-        # Actualizar reporte
-        report.status = 'approved'
-        report.reviewed_by = current_user
-        report.reviewed_at = timezone.now()
-        report.admin_notes = admin_notes
-        report.save()
-        
-        # Crear el strike real
-        from strikes.models import Strike
-        strike = Strike.objects.create(
-            student=report.student,
-            company=report.company,
-            project=report.project,
-            reason=report.reason,
-            description=report.description,
-            severity='medium',  # Por defecto
-            issued_by=report.company.user,
-            is_active=True
-        )
-        
-        # Actualizar contador de strikes del estudiante
-        report.student.strikes = min(report.student.strikes + 1, 3)  # Máximo 3 strikes
-        report.student.save()
+        # Aprobar el reporte y emitir el strike (el contador se actualiza de forma atómica)
+        try:
+            strike = report.approve(current_user, admin_notes)
+        except StrikeLimitExceeded as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except ValueError:
+            return JsonResponse({'error': 'El reporte ya ha sido procesado'}, status=400)
         
         return JsonResponse({
             'message': 'Strike aprobado correctamente',
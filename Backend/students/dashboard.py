@@ -0,0 +1,172 @@
+"""
+Estadísticas agregadas del dashboard de estudiante.
+
+Todas las métricas se calculan con consultas agrupadas (una por fuente de datos)
+en lugar de un conteo por estado o por mes. El resultado agregado se cachea por
+estudiante con un TTL corto y se invalida cuando cambian sus aplicaciones,
+horas de trabajo o evaluaciones (ver signals en students/models.py).
+"""
+
+from datetime import datetime
+
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from core.reference_data import canonical_status_name, reference_data
+
+STUDENT_DASHBOARD_CACHE_TIMEOUT = 60  # 1 minuto
+
+# Estados de aplicación que vinculan al estudiante con un proyecto
+STUDENT_PROJECT_APPLICATION_STATUSES = ['accepted', 'active', 'completed']
+
+APPLICATION_STATUS_LABELS = {
+    'pending': 'Pendientes',
+    'accepted': 'Aceptadas',
+    'rejected': 'Rechazadas',
+    'completed': 'Completadas',
+    'withdrawn': 'Retiradas',
+}
+
+MONTHLY_ACTIVITY_MONTHS = 6
+
+
+def _student_dashboard_cache_key(student_id):
+    return f'student_dashboard:{student_id}'
+
+
+def invalidate_student_dashboard(student_id):
+    """Invalida las estadísticas cacheadas del dashboard de un estudiante"""
+    if student_id:
+        cache.delete(_student_dashboard_cache_key(student_id))
+
+
+def _month_starts(months):
+    """Retorna el primer día de los últimos `months` meses (del más antiguo al actual)"""
+    now = timezone.localtime(timezone.now())
+    year, month = now.year, now.month
+    starts = []
+    for _ in range(months):
+        starts.append(datetime(year, month, 1, tzinfo=now.tzinfo))
+        month -= 1
+        if month == 0:
+            month = 12
+            year -= 1
+    starts.reverse()
+    return starts
+
+
+def _month_key(value):
+    """Normaliza la salida de TruncMonth (date o datetime) a (año, mes)"""
+    return (value.year, value.month) if value else None
+
+
+def build_student_dashboard_stats(student):
+    """
+    Calcula las estadísticas agregadas del dashboard del estudiante.
+
+    No incluye campos propios del estudiante (api_level, horas, strikes, GPA)
+    ni el conteo de notificaciones, que se leen en vivo al armar la respuesta.
+    """
+    from applications.models import Aplicacion
+    from projects.models import Proyecto
+    from work_hours.models import WorkHour
+
+    # 1. Conteo de aplicaciones por estado (una consulta)
+    status_counts = {
+        row['status']: row['count']
+        for row in Aplicacion.objects.filter(student=student)
+        .order_by()
+        .values('status')
+        .annotate(count=Count('id'))
+    }
+    total_applications = sum(status_counts.values())
+
+    application_distribution = [
+        {'name': APPLICATION_STATUS_LABELS.get(status, status), 'count': count}
+        for status, count in sorted(status_counts.items(), key=lambda item: -item[1])
+    ]
+
+    # 2. Proyectos del estudiante (por aplicación aceptada o membresía activa) por estado
+    project_counts = {}
+    for row in (
+        Proyecto.objects.filter(
+            Q(
+                application_project__student=student,
+                application_project__status__in=STUDENT_PROJECT_APPLICATION_STATUSES,
+            ) | Q(
+                miembros__usuario_id=student.user_id,
+                miembros__esta_activo=True,
+                miembros__rol='estudiante',
+            )
+        )
+        .order_by()
+        .values('status_id')
+        .annotate(count=Count('id', distinct=True))
+    ):
+        # El nombre se resuelve desde el registro (sin JOIN) y se agrupa por nombre canónico
+        status = reference_data.status_by_id(row['status_id'])
+        name = canonical_status_name(status.name) if status else None
+        project_counts[name] = project_counts.get(name, 0) + row['count']
+
+    # 3. Proyectos publicados disponibles (no postulados y dentro del nivel API)
+    available_projects = Proyecto.objects.filter(
+        status_id__in=reference_data.status_ids('published'),
+        min_api_level__lte=student.api_level,
+    ).exclude(
+        id__in=Aplicacion.objects.filter(student=student).values('project_id')
+    ).count()
+
+    # 4. Actividad mensual: una consulta agrupada por mes para cada fuente
+    month_starts = _month_starts(MONTHLY_ACTIVITY_MONTHS)
+    since = month_starts[0]
+
+    applications_by_month = {
+        _month_key(row['month']): row['count']
+        for row in Aplicacion.objects.filter(student=student, applied_at__gte=since)
+        .annotate(month=TruncMonth('applied_at'))
+        .order_by()
+        .values('month')
+        .annotate(count=Count('id'))
+    }
+    hours_by_month = {
+        _month_key(row['month']): row['total']
+        for row in WorkHour.objects.filter(student=student, date__gte=since.date())
+        .annotate(month=TruncMonth('date'))
+        .order_by()
+        .values('month')
+        .annotate(total=Sum('hours_worked'))
+    }
+
+    monthly_activity = []
+    for month_start in month_starts:
+        key = (month_start.year, month_start.month)
+        month_hours = hours_by_month.get(key)
+        monthly_activity.append({
+            'month': month_start.strftime('%B %Y'),
+            'applications': applications_by_month.get(key, 0),
+            'hours': float(month_hours) if month_hours else 0,
+        })
+
+    return {
+        'total_applications': total_applications,
+        'pending_applications': status_counts.get('pending', 0),
+        'accepted_applications': status_counts.get('accepted', 0),
+        'total_projects': sum(project_counts.values()),
+        'active_projects': project_counts.get('active', 0),
+        'completed_projects': project_counts.get('completed', 0),
+        'available_projects': available_projects,
+        'application_distribution': application_distribution,
+        'monthly_activity': monthly_activity,
+    }
+
+
+def get_student_dashboard_stats(student):
+    """Obtiene las estadísticas agregadas del dashboard (cacheadas por estudiante)"""
+    cache_key = _student_dashboard_cache_key(student.id)
+    stats = cache.get(cache_key)
+    if stats is None:
+        stats = build_student_dashboard_stats(student)
+        cache.set(cache_key, stats, STUDENT_DASHBOARD_CACHE_TIMEOUT)
+    return stats
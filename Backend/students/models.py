@@ -5,11 +5,16 @@ import uuid
 import json
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+from django.utils import timezone
+from core.tracking import ChangeTrackingMixin
 
-class Estudiante(models.Model):
+class Estudiante(ChangeTrackingMixin, models.Model):
     """
     Modelo de estudiante que coincide exactamente con el interface Student del frontend
     """
+    # Campos cuyo valor anterior necesita save() (ver core.tracking)
+    tracked_fields = ('api_level', 'api_level_approved_by_admin')
+    
     STATUS_CHOICES = (
         ('pending', 'Pendiente'),
         ('approved', 'Aprobado'),
@@ -329,17 +334,19 @@ class Estudiante(models.Model):
     def save(self, *args, **kwargs):
         """Sobrescribir save para proteger el nivel API"""
         # Si el estudiante ya tiene un nivel API aprobado por admin, NO permitir cambios
-        if self.pk:  # Solo para estudiantes existentes
-            try:
-                old_instance = Estudiante.objects.get(pk=self.pk)
-                if (old_instance.api_level_approved_by_admin and 
-                    old_instance.api_level > 1 and 
-                    self.api_level != old_instance.api_level):
-                    # Revertir el cambio del nivel API
-                    self.api_level = old_instance.api_level
-                    print(f"⚠️ [PROTECCIÓN] Intento de cambiar nivel API de {old_instance.api_level} a {self.api_level} bloqueado para estudiante {self.user.email}")
-            except Estudiante.DoesNotExist:
-                pass
+        if self.pk and not self._state.adding and self.has_changed('api_level'):  # Solo para estudiantes existentes
+            if self.has_snapshot('api_level') and self.has_snapshot('api_level_approved_by_admin'):
+                old_api_level = self.previous('api_level')
+                old_approved = self.previous('api_level_approved_by_admin')
+            else:
+                # Instancia construida sin cargarse de la base de datos: no hay copia del estado anterior
+                old = Estudiante.objects.filter(pk=self.pk).values('api_level', 'api_level_approved_by_admin').first()
+                old_api_level = old['api_level'] if old else None
+                old_approved = old['api_level_approved_by_admin'] if old else False
+            if old_approved and old_api_level > 1:
+                # Revertir el cambio del nivel API
+                print(f"⚠️ [PROTECCIÓN] Intento de cambiar nivel API de {old_api_level} a {self.api_level} bloqueado para estudiante {self.user.email}")
+                self.api_level = old_api_level
         
         super().save(*args, **kwargs)
 
@@ -548,7 +555,9 @@ def actualizar_trl_automaticamente(sender, instance, **kwargs):
     if (kwargs.get('update_fields') and 'api_level' in kwargs['update_fields'] and 
         'trl_level' not in kwargs.get('update_fields', [])):
         # Usar update() para evitar disparar signals nuevamente
-        Estudiante.objects.filter(id=instance.id).update(trl_level=instance.trl_permitido_segun_api)
+        Estudiante.objects.filter(id=instance.id).update(
+            trl_level=instance.trl_permitido_segun_api, updated_at=timezone.now()
+        )
 
 # SIGNAL ELIMINADO: actualizar_api_level_automaticamente
 # Este signal causaba el reseteo automático de niveles de API
@@ -571,3 +580,15 @@ def actualizar_gpa_estudiante_post_delete(sender, instance, **kwargs):
     except Exception as e:
         print(f"Error actualizando GPA: {e}")
         pass
+
+
+@receiver(post_save, sender='applications.Aplicacion')
+@receiver(post_delete, sender='applications.Aplicacion')
+@receiver(post_save, sender='work_hours.WorkHour')
+@receiver(post_delete, sender='work_hours.WorkHour')
+@receiver(post_save, sender='evaluations.Evaluation')
+@receiver(post_delete, sender='evaluations.Evaluation')
+def invalidar_cache_dashboard_estudiante(sender, instance, **kwargs):
+    """Invalida el dashboard cacheado del estudiante cuando cambian sus aplicaciones, horas o evaluaciones"""
+    from students.dashboard import invalidate_student_dashboard
+    invalidate_student_dashboard(instance.student_id)
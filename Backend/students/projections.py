@@ -0,0 +1,84 @@
+"""
+Proyección del listado de estudiantes (ver core.projection).
+
+El usuario solo se une si algún campo pedido lo usa; el bloque `user_data`
+(que incluye `bio`) queda fuera de la vista resumen.
+"""
+
+from core.projection import ProjectedField, Projection
+
+# Columnas del usuario que usa User.full_name
+FULL_NAME_COLUMNS = ['user__first_name', 'user__last_name', 'user__email']
+
+USER_DATA_COLUMNS = FULL_NAME_COLUMNS + [
+    'user__username', 'user__phone', 'user__avatar', 'user__bio', 'user__is_active',
+    'user__is_verified', 'user__date_joined', 'user__last_login',
+]
+
+
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+def _display_name(student):
+    # Usar email si no hay nombre
+    full_name = student.user.full_name
+    if not full_name or full_name.strip() == '':
+        return student.user.email
+    return full_name
+
+
+def _user_data(student):
+    user = student.user
+    return {
+        'id': str(user.id),
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'username': user.username,
+        'phone': user.phone,
+        'avatar': user.avatar,
+        'bio': user.bio,
+        'is_active': user.is_active,
+        'is_verified': user.is_verified,
+        'date_joined': user.date_joined.isoformat(),
+        'last_login': _isoformat(user.last_login),
+        'full_name': user.full_name,
+    }
+
+
+STUDENT_LIST_PROJECTION = Projection({
+    'id': ProjectedField(lambda s: str(s.id), summary=True),
+    'user': ProjectedField(lambda s: str(s.user_id), ['user'], summary=True),
+    'name': ProjectedField(_display_name, FULL_NAME_COLUMNS, summary=True),
+    'email': ProjectedField(lambda s: s.user.email, ['user__email'], summary=True),
+    'last_activity': ProjectedField(lambda s: _isoformat(s.user.last_login), ['user__last_login'], summary=True),
+    'career': ProjectedField(lambda s: s.career, ['career'], summary=True),
+    'semester': ProjectedField(lambda s: s.semester, ['semester'], summary=True),
+    'status': ProjectedField(lambda s: s.status, ['status'], summary=True),
+    'api_level': ProjectedField(lambda s: s.api_level, ['api_level'], summary=True),
+    'trl_level': ProjectedField(lambda s: s.trl_permitido_segun_api, ['api_level'], summary=True),
+    'strikes': ProjectedField(lambda s: s.strikes, ['strikes'], summary=True),
+    'gpa': ProjectedField(lambda s: float(s.gpa), ['gpa'], summary=True),
+    'completed_projects': ProjectedField(lambda s: s.completed_projects, ['completed_projects'], summary=True),
+    'total_hours': ProjectedField(lambda s: s.total_hours, ['total_hours'], summary=True),
+    'experience_years': ProjectedField(lambda s: s.experience_years, ['experience_years']),
+    'portfolio_url': ProjectedField(lambda s: s.portfolio_url, ['portfolio_url']),
+    'github_url': ProjectedField(lambda s: s.github_url, ['github_url']),
+    'linkedin_url': ProjectedField(lambda s: s.linkedin_url, ['linkedin_url']),
+    'cv_link': ProjectedField(lambda s: s.cv_link, ['cv_link']),
+    'certificado_link': ProjectedField(lambda s: s.certificado_link, ['certificado_link']),
+    'availability': ProjectedField(lambda s: s.availability, ['availability']),
+    'location': ProjectedField(lambda s: s.location, ['location']),
+    'hours_per_week': ProjectedField(lambda s: s.hours_per_week, ['hours_per_week']),
+    'area': ProjectedField(lambda s: s.area, ['area']),
+    'skills': ProjectedField(lambda s: s.get_skills_list(), ['skills']),
+    'languages': ProjectedField(lambda s: s.get_languages_list()),
+    'created_at': ProjectedField(lambda s: s.created_at.isoformat(), ['created_at'], summary=True),
+    'updated_at': ProjectedField(lambda s: s.updated_at.isoformat(), ['updated_at']),
+    # Datos adicionales calculados
+    'horas_permitidas': ProjectedField(lambda s: s.horas_permitidas_segun_api, ['api_level']),
+    'trl_permitido': ProjectedField(lambda s: s.trl_permitido_segun_api, ['api_level']),
+    # Datos del usuario
+    'user_data': ProjectedField(_user_data, USER_DATA_COLUMNS),
+})
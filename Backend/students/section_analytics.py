@@ -0,0 +1,188 @@
+"""
+Analítica por sección para los KPIs de administración.
+
+Las métricas por sección (tasa de completación, volumen de aplicaciones y
+participación en proyectos colectivos) se calculan en una sola consulta
+agrupada por `Estudiante.section`. Los resultados se cachean por período
+académico y el detalle de cada sección se sirve paginado.
+"""
+
+from datetime import datetime
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .models import Estudiante
+
+SECTION_ANALYTICS_CACHE_TIMEOUT = 600  # 10 minutos
+
+# Período académico "todo el historial"
+ALL_PERIODS = 'all'
+
+# Un proyecto es colectivo cuando admite más de un estudiante
+COLLECTIVE_PROJECT_FILTER = Q(aplicaciones__project__max_students__gt=1)
+
+
+class AcademicPeriod:
+    """
+    Período académico semestral identificado como 'AAAA-S' (S = 1 ó 2).
+
+    El primer semestre va de enero a junio y el segundo de julio a diciembre.
+    El período 'all' no aplica filtro de fechas y 'current' equivale al
+    semestre en curso.
+    """
+
+    def __init__(self, key, start=None, end=None):
+        self.key = key
+        self.start = start
+        self.end = end
+
+    @classmethod
+    def current(cls):
+        now = timezone.localtime(timezone.now())
+        return cls.parse(f"{now.year}-{1 if now.month <= 6 else 2}")
+
+    @classmethod
+    def parse(cls, value):
+        """Construye el período desde 'AAAA-S', 'current' o 'all'. Lanza ValueError si es inválido."""
+        if not value or value == ALL_PERIODS:
+            return cls(ALL_PERIODS)
+        if value == 'current':
+            return cls.current()
+
+        try:
+            year, semester = (int(part) for part in value.split('-'))
+        except (TypeError, ValueError):
+            raise ValueError(f"Período académico inválido: {value}. Formato esperado: AAAA-S")
+        if semester not in (1, 2):
+            raise ValueError(f"Semestre inválido en el período {value}. Debe ser 1 ó 2")
+
+        tz = timezone.get_current_timezone()
+        if semester == 1:
+            start = datetime(year, 1, 1, tzinfo=tz)
+            end = datetime(year, 7, 1, tzinfo=tz)
+        else:
+            start = datetime(year, 7, 1, tzinfo=tz)
+            end = datetime(year + 1, 1, 1, tzinfo=tz)
+        return cls(f"{year}-{semester}", start, end)
+
+    def applications_filter(self):
+        """Filtro Q (desde Estudiante) sobre la fecha de postulación para este período"""
+        if self.key == ALL_PERIODS:
+            return Q()
+        return Q(aplicaciones__applied_at__gte=self.start, aplicaciones__applied_at__lt=self.end)
+
+
+def _section_stats_cache_key(period):
+    return f'section_analytics:{period.key}'
+
+
+def _rate(part, total):
+    return round(part / total * 100, 2) if total > 0 else 0
+
+
+def _section_annotations(period):
+    """Agregados por estudiante/sección filtrados por período"""
+    in_period = period.applications_filter()
+    return {
+        'total_applications': Count('aplicaciones', filter=in_period),
+        'accepted_applications': Count(
+            'aplicaciones', filter=in_period & Q(aplicaciones__status='accepted')
+        ),
+        'completed_applications': Count(
+            'aplicaciones', filter=in_period & Q(aplicaciones__status='completed')
+        ),
+        'collective_applications': Count(
+            'aplicaciones', filter=in_period & COLLECTIVE_PROJECT_FILTER
+        ),
+    }
+
+
+def build_section_stats(period):
+    """Calcula las métricas de todas las secciones con un único GROUP BY section"""
+    rows = (
+        Estudiante.objects.filter(section__isnull=False)
+        .order_by()
+        .values('section')
+        .annotate(
+            students=Count('id', distinct=True),
+            collective_participants=Count(
+                'id', distinct=True, filter=period.applications_filter() & COLLECTIVE_PROJECT_FILTER
+            ),
+            **_section_annotations(period),
+        )
+        .order_by('section')
+    )
+
+    sections = []
+    for row in rows:
+        sections.append({
+            'section': row['section'],
+            'students': row['students'],
+            'total_projects': row['total_applications'],
+            'completed_projects': row['completed_applications'],
+            'completion_rate': _rate(row['completed_applications'], row['total_applications']),
+            'collective_applications': row['collective_applications'],
+            'collective_participants': row['collective_participants'],
+            'collective_participation_rate': _rate(row['collective_participants'], row['students']),
+        })
+    return sections
+
+
+def get_section_stats(period):
+    """Obtiene las métricas por sección del período (cacheadas)"""
+    cache_key = _section_stats_cache_key(period)
+    sections = cache.get(cache_key)
+    if sections is None:
+        sections = build_section_stats(period)
+        cache.set(cache_key, sections, SECTION_ANALYTICS_CACHE_TIMEOUT)
+    return sections
+
+
+def section_students_queryset(period, section=None):
+    """Estudiantes (opcionalmente de una sola sección) con sus agregados de aplicaciones del período"""
+    queryset = Estudiante.objects.all()
+    if section:
+        queryset = queryset.filter(section=section)
+    return (
+        queryset.select_related('user')
+        .annotate(**_section_annotations(period))
+        .order_by('section', 'user__first_name', 'id')
+    )
+
+
+def serialize_section_student(student):
+    return {
+        'id': str(student.id),
+        'name': student.user.full_name,
+        'rut': student.rut or 'No disponible',
+        'email': student.user.email,
+        'section': student.section or 'Sin sección',
+        'career': student.career or 'No especificada',
+        'semester': student.semester,
+        'status': student.status,
+        'applied_projects': student.total_applications,
+        'current_projects': student.accepted_applications,
+        'completed_projects': student.completed_applications,
+        'collective_projects': student.collective_applications,
+        'api_level': student.api_level,
+        'gpa': float(student.gpa),
+    }
+
+
+def get_section_students_page(period, section=None, page=1, limit=50):
+    """
+    Detalle paginado de estudiantes (opcionalmente de una sola sección) con
+    sus agregados de aplicaciones para el período.
+
+    Retorna (estudiantes, total).
+    """
+    queryset = Estudiante.objects.all()
+    if section:
+        queryset = queryset.filter(section=section)
+
+    total = queryset.count()
+    offset = (page - 1) * limit
+    students = section_students_queryset(period, section)[offset:offset + limit]
+    return [serialize_section_student(student) for student in students], total
@@ -1,3 +1,151 @@
 from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from core.reference_data import reference_data
+from core.views import generate_access_token
+from .models import Estudiante
+from .dashboard import get_student_dashboard_stats, build_student_dashboard_stats
+from .section_analytics import AcademicPeriod, build_section_stats, get_section_students_page
+from applications.models import Aplicacion
+from companies.models import Empresa
+from projects.models import Proyecto
+from project_status.models import ProjectStatus
+from work_hours.models import WorkHour
+from datetime import date
 
-# Create your tests here.
+User = get_user_model()
+
+
+class StudentDashboardStatsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email='student@test.com',
+            password='testpass123',
+            role='student'
+        )
+        self.student = Estudiante.objects.create(user=self.user, api_level=2)
+
+        company_user = User.objects.create_user(
+            email='company@test.com',
+            password='testpass123',
+            role='company'
+        )
+        self.company = Empresa.objects.create(user=company_user, company_name='Test Company')
+        self.published = ProjectStatus.objects.create(name='published')
+        self.active = ProjectStatus.objects.create(name='active')
+
+        self.projects = [
+            Proyecto.objects.create(
+                title=f'Project {i}',
+                company=self.company,
+                description='Test description',
+                requirements='Test requirements',
+                status=self.published,
+            )
+            for i in range(3)
+        ]
+        Aplicacion.objects.create(project=self.projects[0], student=self.student, status='pending')
+        Aplicacion.objects.create(project=self.projects[1], student=self.student, status='accepted')
+        Proyecto.objects.filter(id=self.projects[1].id).update(status=self.active)
+
+    def test_aggregated_stats(self):
+        stats = build_student_dashboard_stats(self.student)
+
+        self.assertEqual(stats['total_applications'], 2)
+        self.assertEqual(stats['pending_applications'], 1)
+        self.assertEqual(stats['accepted_applications'], 1)
+        self.assertEqual(stats['total_projects'], 1)
+        self.assertEqual(stats['active_projects'], 1)
+        self.assertEqual(stats['available_projects'], 1)
+        self.assertEqual(len(stats['monthly_activity']), 6)
+        self.assertEqual(stats['monthly_activity'][-1]['applications'], 2)
+
+    def test_constant_number_of_queries(self):
+        reference_data.load()
+        with self.assertNumQueries(5):
+            build_student_dashboard_stats(self.student)
+
+    def test_cache_invalidated_on_work_hours(self):
+        stats = get_student_dashboard_stats(self.student)
+        self.assertEqual(stats['monthly_activity'][-1]['hours'], 0)
+
+        with self.assertNumQueries(0):
+            get_student_dashboard_stats(self.student)
+
+        WorkHour.objects.create(
+            student=self.student,
+            project=self.projects[1],
+            date=date.today(),
+            hours_worked=4
+        )
+        stats = get_student_dashboard_stats(self.student)
+        self.assertEqual(stats['monthly_activity'][-1]['hours'], 4.0)
+
+
+class SectionAnalyticsTest(TestCase):
+    def setUp(self):
+        company_user = User.objects.create_user(
+            email='company@test.com',
+            password='testpass123',
+            role='company'
+        )
+        company = Empresa.objects.create(user=company_user, company_name='Test Company')
+        collective = Proyecto.objects.create(
+            title='Collective',
+            company=company,
+            description='Test description',
+            requirements='Test requirements',
+            max_students=5,
+        )
+        individual = Proyecto.objects.create(
+            title='Individual',
+            company=company,
+            description='Test description',
+            requirements='Test requirements',
+        )
+        for i, section in enumerate(['A', 'A', 'B']):
+            user = User.objects.create_user(email=f'student{i}@test.com', password='testpass123')
+            student = Estudiante.objects.create(user=user, section=section)
+            Aplicacion.objects.create(project=collective, student=student, status='completed')
+            if section == 'A':
+                Aplicacion.objects.create(project=individual, student=student, status='pending')
+
+    def test_section_stats_single_query(self):
+        with self.assertNumQueries(1):
+            sections = build_section_stats(AcademicPeriod.parse('all'))
+
+        by_section = {row['section']: row for row in sections}
+        self.assertEqual(by_section['A']['students'], 2)
+        self.assertEqual(by_section['A']['total_projects'], 4)
+        self.assertEqual(by_section['A']['completed_projects'], 2)
+        self.assertEqual(by_section['A']['completion_rate'], 50.0)
+        self.assertEqual(by_section['A']['collective_participants'], 2)
+        self.assertEqual(by_section['B']['completion_rate'], 100.0)
+
+    def test_past_period_has_no_applications(self):
+        sections = build_section_stats(AcademicPeriod.parse('2000-1'))
+        self.assertTrue(all(row['total_projects'] == 0 for row in sections))
+
+    def test_invalid_period(self):
+        with self.assertRaises(ValueError):
+            AcademicPeriod.parse('2024-3')
+
+    def test_section_drilldown_is_paginated(self):
+        students, total = get_section_students_page(AcademicPeriod.parse('all'), section='A', page=1, limit=1)
+        self.assertEqual(total, 2)
+        self.assertEqual(len(students), 1)
+        self.assertEqual(students[0]['applied_projects'], 2)
+
+    def test_section_endpoint_validates_pagination(self):
+        admin = User.objects.create_user(email='admin@test.com', password='testpass123', role='admin')
+        auth = {'HTTP_AUTHORIZATION': f'Bearer {generate_access_token(admin)}'}
+        path = '/api/admin/students-by-section/'
+
+        response = self.client.get(path, {'section': 'A', 'limit': 0}, **auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['pagination'], {'page': 1, 'limit': 1, 'total': 2, 'pages': 2})
+        self.assertEqual(len(self.client.get(path, {'section': 'A', 'limit': -5}, **auth).json()['students']), 1)
+
+        for params in ({'limit': 'abc'}, {'page': '1.5'}):
+            self.assertEqual(self.client.get(path, params, **auth).status_code, 400)
@@ -3,15 +3,17 @@ Views para la app students.
 """
 
 import json
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.db.models import Q
 from users.models import User
 from .models import Estudiante, ApiLevelRequest
+from .projections import STUDENT_LIST_PROJECTION
 from core.views import verify_token
 from django.utils import timezone
 from core.auth_utils import require_admin
+from core.conditional import conditional_get, row_version
 
 
 def get_hours_per_week_value(student):
@@ -61,8 +63,14 @@ def student_list(request):
         api_level = request.GET.get('api_level', '')
         status = request.GET.get('status', '')
         
+        # Campos pedidos (?fields= / ?view=summary|full)
+        try:
+            fields = STUDENT_LIST_PROJECTION.select(request)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        
         # Query base
-        queryset = Estudiante.objects.select_related('user').all()
+        queryset = Estudiante.objects.all()
         
         # Aplicar filtros
         if search:
@@ -86,69 +94,11 @@ def student_list(request):
         # Contar total
         total_count = queryset.count()
         
-        # Paginar
-        students = queryset[offset:offset + limit]
+        # Paginar (solo las columnas y el JOIN con usuario de los campos pedidos)
+        students = STUDENT_LIST_PROJECTION.apply(queryset, fields)[offset:offset + limit]
         
         # Serializar datos
-        students_data = []
-        for student in students:
-            # Determinar el nombre a mostrar
-            full_name = student.user.full_name
-            if not full_name or full_name.strip() == '':
-                full_name = student.user.email  # Usar email si no hay nombre
-            
-            # Debug log
-            print(f"🔍 Estudiante {student.id}: full_name='{student.user.full_name}', email='{student.user.email}', name_to_show='{full_name}'")
-            
-            students_data.append({
-                'id': str(student.id),
-                'user': str(student.user.id),
-                'name': full_name,
-                'email': student.user.email,
-                'last_activity': student.user.last_login.isoformat() if student.user.last_login else None,
-                'career': student.career,
-                'semester': student.semester,
-                'status': student.status,
-                'api_level': student.api_level,
-                'trl_level': student.trl_permitido_segun_api,  # <-- Usar TRL calculado
-                'strikes': student.strikes,
-                'gpa': float(student.gpa),
-                'completed_projects': student.completed_projects,
-                'total_hours': student.total_hours,
-                'experience_years': student.experience_years,
-                'portfolio_url': student.portfolio_url,
-                'github_url': student.github_url,
-                'linkedin_url': student.linkedin_url,
-                'cv_link': student.cv_link,
-                'certificado_link': student.certificado_link,
-                'availability': student.availability,
-                'location': student.location,
-                'hours_per_week': student.hours_per_week,
-                'area': student.area,
-                'skills': student.get_skills_list(),
-                'languages': student.get_languages_list(),
-                'created_at': student.created_at.isoformat(),
-                'updated_at': student.updated_at.isoformat(),
-                # Datos adicionales calculados
-                'horas_permitidas': student.horas_permitidas_segun_api,
-                'trl_permitido': student.trl_permitido_segun_api,
-                # Datos del usuario
-                'user_data': {
-                    'id': str(student.user.id),
-                    'email': student.user.email,
-                    'first_name': student.user.first_name,
-                    'last_name': student.user.last_name,
-                    'username': student.user.username,
-                    'phone': student.user.phone,
-                    'avatar': student.user.avatar,
-                    'bio': student.user.bio,
-                    'is_active': student.user.is_active,
-                    'is_verified': student.user.is_verified,
-                    'date_joined': student.user.date_joined.isoformat(),
-                    'last_login': student.user.last_login.isoformat() if student.user.last_login else None,
-                    'full_name': student.user.full_name,
-                }
-            })
+        students_data = [STUDENT_LIST_PROJECTION.serialize(student, fields) for student in students]
         
         return JsonResponse({
             'results': students_data,
@@ -164,6 +114,9 @@ def student_list(request):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@conditional_get(lambda request, student_id: row_version(
+    Estudiante.objects, student_id, 'user__updated_at', 'user__last_login'
+))
 def student_detail(request, student_id):
     """Detalle de un estudiante."""
     try:
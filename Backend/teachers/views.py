@@ -4,7 +4,7 @@
 Este archivo contiene endpoints específicos para las funcionalidades del docente.
 """
 
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.core.paginator import Paginator
@@ -12,10 +12,12 @@ from django.db.models import Q
 import json
 from datetime import datetime, date
 from core.views import verify_token
+from core.db_router import read_from_replica
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@read_from_replica
 def api_teacher_students(request):
     """API endpoint para obtener estudiantes supervisados por el docente."""
     try:
@@ -98,6 +100,7 @@ def api_teacher_students(request):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@read_from_replica
 def api_teacher_projects(request):
     """API endpoint para obtener proyectos supervisados por el docente."""
     try:
@@ -179,6 +182,7 @@ def api_teacher_projects(request):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@read_from_replica
 def api_teacher_evaluations(request):
     """API endpoint para obtener evaluaciones realizadas por el docente."""
     try:
@@ -267,6 +271,7 @@ def api_teacher_evaluations(request):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@read_from_replica
 def api_teacher_reports(request):
     """API endpoint para obtener reportes generados por el docente."""
     try:
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 
@@ -39,3 +41,10 @@ class TRLLevel(models.Model):
     @property
     def full_name(self):
         return f"TRL {self.level} - {self.name}"
+
+
+@receiver([post_save, post_delete], sender=TRLLevel)
+def invalidar_registro_trl(sender, **kwargs):
+    """Invalida el registro de datos de referencia al cambiar un nivel TRL"""
+    from core.reference_data import invalidate_reference_data
+    invalidate_reference_data()
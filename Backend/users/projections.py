@@ -0,0 +1,39 @@
+"""
+Proyección del listado de usuarios (ver core.projection).
+"""
+
+from core.projection import ProjectedField, Projection
+
+
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+def _full_name(user):
+    return user.full_name or f"{user.first_name or ''} {user.last_name or ''}".strip()
+
+
+USER_LIST_PROJECTION = Projection({
+    'id': ProjectedField(lambda u: str(u.id), summary=True),
+    'email': ProjectedField(lambda u: u.email, ['email'], summary=True),
+    'first_name': ProjectedField(lambda u: u.first_name or '', ['first_name'], summary=True),
+    'last_name': ProjectedField(lambda u: u.last_name or '', ['last_name'], summary=True),
+    'username': ProjectedField(lambda u: u.username or '', ['username'], summary=True),
+    'role': ProjectedField(lambda u: u.role, ['role'], summary=True),
+    'is_active': ProjectedField(lambda u: u.is_active, ['is_active'], summary=True),
+    'is_verified': ProjectedField(lambda u: u.is_verified, ['is_verified'], summary=True),
+    'is_staff': ProjectedField(lambda u: u.is_staff, ['is_staff']),
+    'is_superuser': ProjectedField(lambda u: u.is_superuser, ['is_superuser']),
+    'date_joined': ProjectedField(lambda u: u.date_joined.isoformat(), ['date_joined'], summary=True),
+    'last_login': ProjectedField(lambda u: _isoformat(u.last_login), ['last_login'], summary=True),
+    'created_at': ProjectedField(lambda u: u.created_at.isoformat(), ['created_at']),
+    'updated_at': ProjectedField(lambda u: u.updated_at.isoformat(), ['updated_at']),
+    'full_name': ProjectedField(_full_name, ['first_name', 'last_name', 'email'], summary=True),
+    'phone': ProjectedField(lambda u: u.phone or '', ['phone']),
+    'avatar': ProjectedField(lambda u: u.avatar or '', ['avatar']),
+    'bio': ProjectedField(lambda u: u.bio or '', ['bio']),
+    'position': ProjectedField(lambda u: u.position or '', ['position']),
+    'department': ProjectedField(lambda u: u.department or '', ['department']),
+    'career': ProjectedField(lambda u: u.career or '', ['career']),
+    'company_name': ProjectedField(lambda u: u.company_name or '', ['company_name'], summary=True),
+})
@@ -3,12 +3,14 @@ Views para la app users.
 """
 
 import json
-from django.http import JsonResponse
+from core.responses import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.contrib.auth import authenticate
 from .models import User
+from .projections import USER_LIST_PROJECTION
 from core.views import verify_token
+from core.streaming import ndjson_response, wants_ndjson
 from django.utils import timezone
 from django.core.mail import send_mail
 from .models import PasswordResetCode, User
@@ -36,6 +38,12 @@ def user_list(request):
         if current_user.role not in ['admin', 'company']:
             return JsonResponse({'error': 'Acceso denegado'}, status=403)
         
+        # Campos pedidos (?fields= / ?view=summary|full)
+        try:
+            fields = USER_LIST_PROJECTION.select(request)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        
         # Filtros por parámetros GET
         is_active = request.GET.get('is_active')
         is_verified = request.GET.get('is_verified')
@@ -61,41 +69,32 @@ def user_list(request):
         if role:
             users = users.filter(role=role)
         
-        users_data = []
+        # Volcado completo en streaming (Accept: application/x-ndjson o ?stream=1)
+        if wants_ndjson(request):
+            return ndjson_response(
+                request,
+                USER_LIST_PROJECTION.apply(users.order_by('-date_joined'), fields),
+                lambda user: USER_LIST_PROJECTION.serialize(user, fields),
+            )
         
-        for user in users:
-            users_data.append({
-                'id': str(user.id),
-                'email': user.email,
-                'first_name': user.first_name or '',
-                'last_name': user.last_name or '',
-                'username': user.username or '',
-                'role': user.role,
-                'is_active': user.is_active,
-                'is_verified': user.is_verified,
-                'is_staff': user.is_staff,
-                'is_superuser': user.is_superuser,
-                'date_joined': user.date_joined.isoformat(),
-                'last_login': user.last_login.isoformat() if user.last_login else None,
-                'created_at': user.created_at.isoformat(),
-                'updated_at': user.updated_at.isoformat(),
-                'full_name': user.full_name or f"{user.first_name or ''} {user.last_name or ''}".strip(),
-                'phone': user.phone or '',
-                'avatar': user.avatar or '',
-                'bio': user.bio or '',
-                'position': user.position or '',
-                'department': user.department or '',
-                'career': user.career or '',
-                'company_name': user.company_name or '',
-            })
+        # Paginación opcional: sin page/limit se retorna la lista completa (la UI de admin pagina en el cliente)
+        total_count = users.count()
+        page = int(request.GET.get('page', 1))
+        limit = int(request.GET.get('limit', 0)) or max(total_count, 1)
+        offset = (page - 1) * limit
+        
+        # Serializar solo las columnas de los campos pedidos
+        users = USER_LIST_PROJECTION.apply(users.order_by('-date_joined'), fields)[offset:offset + limit]
+        users_data = [USER_LIST_PROJECTION.serialize(user, fields) for user in users]
         
         return JsonResponse({
             'success': True,
             'data': users_data,
             'pagination': {
-                'total': len(users_data),
-                'page': 1,
-                'limit': len(users_data)
+                'total': total_count,
+                'page': page,
+                'limit': limit,
+                'total_pages': (total_count + limit - 1) // limit
             }
         })
         
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('work_hours', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='workhour',
+            index=models.Index(condition=models.Q(('is_project_completion', True)), fields=['project', 'student'], name='work_hours_completion_idx'),
+        ),
+    ]
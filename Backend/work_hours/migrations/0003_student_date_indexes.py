@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-19 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('work_hours', '0002_completion_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='workhour',
+            index=models.Index(fields=['student', 'date'], name='work_hours_student_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workhour',
+            index=models.Index(fields=['project', 'is_project_completion'], name='work_hours_project_compl_idx'),
+        ),
+    ]
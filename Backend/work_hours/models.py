@@ -2,10 +2,13 @@ from django.db import models
 from django.conf import settings
 from projects.models import Proyecto
 from students.models import Estudiante
+from core.tracking import ChangeTrackingMixin
 
 
-class WorkHour(models.Model):
+class WorkHour(ChangeTrackingMixin, models.Model):
     """Modelo para registrar horas de trabajo de estudiantes en proyectos"""
+    # Campos cuyo valor anterior consultan los signals (ver core.tracking)
+    tracked_fields = ('is_verified',)
     
     student = models.ForeignKey(
         Estudiante, 
@@ -49,6 +52,18 @@ class WorkHour(models.Model):
         verbose_name = 'Hora de trabajo'
         verbose_name_plural = 'Horas de trabajo'
         ordering = ['-date', '-created_at']
+        indexes = [
+            # Índice parcial: solo las horas de completación de proyecto (anti-join de la lista de validación)
+            models.Index(
+                fields=['project', 'student'],
+                condition=models.Q(is_project_completion=True),
+                name='work_hours_completion_idx',
+            ),
+            # Horas del estudiante por fecha (listado, actividad mensual)
+            models.Index(fields=['student', 'date'], name='work_hours_student_date_idx'),
+            # SQL Server no usa el índice filtrado con el parámetro de is_project_completion
+            models.Index(fields=['project', 'is_project_completion'], name='work_hours_project_compl_idx'),
+        ]
         
     def __str__(self):
         return f"{self.student} - {self.project} - {self.date} ({self.hours_worked}h)" 
\ No newline at end of file